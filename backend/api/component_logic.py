@@ -26,6 +26,7 @@ from services.component_logic.ai_research_logic import AIResearchLogic
 from services.component_logic.personalization_logic import PersonalizationLogic
 from services.component_logic.research_utilities import ResearchUtilities
 from services.component_logic.style_detection_logic import StyleDetectionLogic
+from services.component_logic.style_detection_pipeline import get_style_detection_pipeline
 from services.component_logic.web_crawler_logic import WebCrawlerLogic
 from services.research_preferences_service import ResearchPreferencesService
 from services.database import get_db
@@ -484,7 +485,6 @@ async def complete_style_detection(request: StyleDetectionRequest):
         
         # Initialize services
         crawler_logic = WebCrawlerLogic()
-        style_logic = StyleDetectionLogic()
         analysis_service = WebsiteAnalysisService(db_session)
         
         # Get session ID (for now using a default, in production this would come from user session)
@@ -517,8 +517,15 @@ async def complete_style_detection(request: StyleDetectionRequest):
                 timestamp=datetime.now().isoformat()
             )
         
-        # Step 2: Analyze style
-        style_analysis = style_logic.analyze_content_style(crawl_result['content'])
+        # Steps 2-4: Analyze style + patterns concurrently, then guidelines (off the event loop,
+        # memoized per site and content fingerprint)
+        pipeline_result = await get_style_detection_pipeline().run(
+            crawl_result['content'],
+            request.url or "text_sample",
+            include_patterns=request.include_patterns,
+            include_guidelines=request.include_guidelines
+        )
+        style_analysis = pipeline_result['style_analysis']
         
         if not style_analysis or not style_analysis.get('success'):
             # Check if it's an API key issue
@@ -538,19 +545,8 @@ async def complete_style_detection(request: StyleDetectionRequest):
                     timestamp=datetime.now().isoformat()
                 )
         
-        # Step 3: Analyze patterns (optional)
-        style_patterns = None
-        if request.include_patterns:
-            patterns_result = style_logic.analyze_style_patterns(crawl_result['content'])
-            if patterns_result and patterns_result.get('success'):
-                style_patterns = patterns_result.get('patterns')
-        
-        # Step 4: Generate guidelines (optional)
-        style_guidelines = None
-        if request.include_guidelines:
-            guidelines_result = style_logic.generate_style_guidelines(style_analysis.get('analysis', {}))
-            if guidelines_result and guidelines_result.get('success'):
-                style_guidelines = guidelines_result.get('guidelines')
+        style_patterns = pipeline_result['style_patterns']
+        style_guidelines = pipeline_result['style_guidelines']
         
         # Check if there's a warning about fallback data
         warning = None
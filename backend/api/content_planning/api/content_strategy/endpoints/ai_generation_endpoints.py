@@ -3,8 +3,11 @@ AI Generation Endpoints
 Handles AI-powered strategy generation endpoints.
 """
 
+import asyncio
+import json
 from typing import Dict, Any, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from loguru import logger
 from datetime import datetime
@@ -13,7 +16,7 @@ from datetime import datetime
 from services.database import get_db_session
 
 # Import services
-from ....services.content_strategy.ai_generation import AIStrategyGenerator, StrategyGenerationConfig
+from ....services.content_strategy.ai_generation import AIStrategyGenerator, StrategyGenerationConfig, STRATEGY_SECTIONS
 from ....services.enhanced_strategy_service import EnhancedStrategyService
 from ....services.enhanced_strategy_db_service import EnhancedStrategyDBService
 
@@ -23,6 +26,7 @@ from .content_strategy.educational_content import EducationalContentManager
 # Import utilities
 from ....utils.error_handlers import ContentPlanningErrorHandler
 from ....utils.response_builders import ResponseBuilder
+from ....utils.conditional_responses import ResourceValidators
 from ....utils.constants import ERROR_MESSAGES, SUCCESS_MESSAGES
 
 router = APIRouter(tags=["AI Strategy Generation"])
@@ -38,6 +42,29 @@ def get_db():
 # Global storage for latest strategies (more persistent than task status)
 _latest_strategies = {}
 
+# Educational step shown for each strategy section
+SECTION_STEPS = {
+    "strategic_insights": 3,
+    "competitive_analysis": 4,
+    "performance_predictions": 5,
+    "implementation_roadmap": 6,
+    "risk_assessment": 7,
+}
+
+# Per-task events set on every status update (wakes SSE subscribers)
+_task_status_events: Dict[str, asyncio.Event] = {}
+
+def _update_task_status(task_id: str, changes: Dict[str, Any]) -> None:
+    """Update a polling task's status, bump its version and wake stream subscribers."""
+    task_status = generate_comprehensive_strategy_polling._task_status.get(task_id)
+    if task_status is None:
+        return
+    task_status.update(changes)
+    task_status["version"] = task_status.get("version", 0) + 1
+    event = _task_status_events.pop(task_id, None)
+    if event is not None:
+        event.set()
+
 @router.post("/generate-comprehensive-strategy")
 async def generate_comprehensive_strategy(
     user_id: int,
@@ -367,6 +394,9 @@ async def generate_comprehensive_strategy_polling(
             "estimated_completion": None,
             "strategy": None,
             "error": None,
+            "sections": {},
+            "completed_sections": [],
+            "version": 0,
             "educational_content": EducationalContentManager.get_initialization_content()
         }
         
@@ -382,7 +412,7 @@ async def generate_comprehensive_strategy_polling(
                 logger.info(f"🔄 Starting background strategy generation for task: {task_id}")
                 
                 # Step 1: Get user context
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
+                _update_task_status(task_id, {
                     "step": 1,
                     "progress": 10,
                     "message": "Getting user context...",
@@ -390,100 +420,44 @@ async def generate_comprehensive_strategy_polling(
                 })
                 
                 # Step 2: Generate base strategy fields
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
+                _update_task_status(task_id, {
                     "step": 2,
                     "progress": 20,
                     "message": "Generating base strategy fields...",
                     "educational_content": EducationalContentManager.get_step_content(2)
                 })
                 
-                # Step 3: Generate strategic insights
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
+                # Steps 3-7: Generate the strategy sections concurrently, publishing
+                # each one to the task status as soon as it lands
+                _update_task_status(task_id, {
                     "step": 3,
                     "progress": 30,
-                    "message": "Generating strategic insights...",
+                    "message": "Generating strategy sections...",
                     "educational_content": EducationalContentManager.get_step_content(3)
                 })
                 
-                strategic_insights = await strategy_generator._generate_strategic_insights({}, context)
-                
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 3,
-                    "progress": 35,
-                    "message": "Strategic insights generated successfully",
-                    "educational_content": EducationalContentManager.get_step_completion_content(3, strategic_insights)
-                })
-                
-                # Step 4: Generate competitive analysis
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 4,
-                    "progress": 40,
-                    "message": "Generating competitive analysis...",
-                    "educational_content": EducationalContentManager.get_step_content(4)
-                })
-                
-                competitive_analysis = await strategy_generator._generate_competitive_analysis({}, context)
-                
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 4,
-                    "progress": 45,
-                    "message": "Competitive analysis generated successfully",
-                    "educational_content": EducationalContentManager.get_step_completion_content(4, competitive_analysis)
-                })
-                
-                # Step 5: Generate performance predictions
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 5,
-                    "progress": 50,
-                    "message": "Generating performance predictions...",
-                    "educational_content": EducationalContentManager.get_step_content(5)
-                })
-                
-                performance_predictions = await strategy_generator._generate_performance_predictions({}, context)
-                
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 5,
-                    "progress": 55,
-                    "message": "Performance predictions generated successfully",
-                    "educational_content": EducationalContentManager.get_step_completion_content(5, performance_predictions)
-                })
-                
-                # Step 6: Generate implementation roadmap
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 6,
-                    "progress": 60,
-                    "message": "Generating implementation roadmap...",
-                    "educational_content": EducationalContentManager.get_step_content(6)
-                })
-                
-                implementation_roadmap = await strategy_generator._generate_implementation_roadmap({}, context)
-                
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 6,
-                    "progress": 65,
-                    "message": "Implementation roadmap generated successfully",
-                    "educational_content": EducationalContentManager.get_step_completion_content(6, implementation_roadmap)
-                })
-                
-                # Step 7: Generate risk assessment
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 7,
-                    "progress": 70,
-                    "message": "Generating risk assessment...",
-                    "educational_content": EducationalContentManager.get_step_content(7)
-                })
-                
-                risk_assessment = await strategy_generator._generate_risk_assessment({}, context)
-                
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
-                    "step": 7,
-                    "progress": 75,
-                    "message": "Risk assessment generated successfully",
-                    "educational_content": EducationalContentManager.get_step_completion_content(7, risk_assessment)
-                })
+                def publish_section(section_name: str, section_result: Dict[str, Any]) -> None:
+                    task_status = generate_comprehensive_strategy_polling._task_status[task_id]
+                    completed_sections = task_status.get("completed_sections", []) + [section_name]
+                    step = SECTION_STEPS[section_name]
+                    _update_task_status(task_id, {
+                        "step": step,
+                        "progress": 30 + round(45 * len(completed_sections) / len(STRATEGY_SECTIONS)),
+                        "message": f"{section_name.replace('_', ' ').capitalize()} generated successfully",
+                        "sections": {**task_status.get("sections", {}), section_name: section_result},
+                        "completed_sections": completed_sections,
+                        "educational_content": EducationalContentManager.get_step_completion_content(step, section_result)
+                    })
+                
+                sections = await strategy_generator.generate_strategy_sections({}, context, on_section_complete=publish_section)
+                strategic_insights = sections["strategic_insights"]
+                competitive_analysis = sections["competitive_analysis"]
+                performance_predictions = sections["performance_predictions"]
+                implementation_roadmap = sections["implementation_roadmap"]
+                risk_assessment = sections["risk_assessment"]
                 
                 # Step 8: Compile comprehensive strategy
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
+                _update_task_status(task_id, {
                     "step": 8,
                     "progress": 80,
                     "message": "Compiling comprehensive strategy...",
@@ -564,7 +538,7 @@ async def generate_comprehensive_strategy_polling(
                     "educational_content": completion_content
                 }
                 
-                generate_comprehensive_strategy_polling._task_status[task_id].update(final_status)
+                _update_task_status(task_id, final_status)
                 
                 logger.info(f"🎯 Final status update for task {task_id}: {final_status}")
                 logger.info(f"🎯 Task status after update: {generate_comprehensive_strategy_polling._task_status[task_id]}")
@@ -581,7 +555,7 @@ async def generate_comprehensive_strategy_polling(
                 
             except Exception as e:
                 logger.error(f"❌ Error in background strategy generation for task {task_id}: {str(e)}")
-                generate_comprehensive_strategy_polling._task_status[task_id].update({
+                _update_task_status(task_id, {
                     "status": "failed",
                     "error": str(e),
                     "message": f"Strategy generation failed: {str(e)}",
@@ -645,12 +619,68 @@ async def get_strategy_generation_status_by_task(
         logger.error(f"❌ Error getting strategy generation status: {str(e)}")
         raise ContentPlanningErrorHandler.handle_general_error(e, "get_strategy_generation_status_by_task")
 
+@router.get("/strategy-generation-stream/{task_id}")
+async def stream_strategy_generation_status(task_id: str):
+    """
+    Push strategy generation status for a task as Server-Sent Events.
+    
+    Emits the same status payload as /strategy-generation-status/{task_id}
+    on every update (including each strategy section as it lands), heartbeat
+    comments while idle, and closes once the task completes or fails.
+    """
+    task_store = getattr(generate_comprehensive_strategy_polling, '_task_status', {})
+    if task_id not in task_store:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Task {task_id} not found. It may have expired or never existed."
+        )
+    
+    async def event_stream():
+        sent_version = None
+        while True:
+            # Register for the next update before reading the version, so an
+            # update that lands in between (e.g. while a yield is pending) sets
+            # this event instead of being missed until the heartbeat
+            event = _task_status_events.setdefault(task_id, asyncio.Event())
+            task_status = task_store.get(task_id)
+            if task_status is None:
+                break
+            if task_status.get("version") != sent_version:
+                sent_version = task_status.get("version")
+                # The status dict is updated in place; decide on the snapshot sent
+                finished = task_status.get("status") in ("completed", "failed")
+                yield f"data: {json.dumps(task_status, default=str)}\n\n"
+                if finished:
+                    break
+                continue
+            try:
+                await asyncio.wait_for(event.wait(), timeout=15)
+            except asyncio.TimeoutError:
+                yield ": heartbeat\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive"
+        }
+    )
+
 @router.get("/latest-strategy")
 async def get_latest_generated_strategy(
+    request: Request,
+    response: Response,
     user_id: int = Query(1, description="User ID"),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
-    """Get the latest generated strategy from the polling system or database."""
+    """
+    Get the latest generated strategy from the polling system or database.
+    
+    Polled by the frontend: the candidate strategy is found with a projected
+    query on id and timestamps, and its JSON payload is only loaded when the
+    client's ETag no longer matches (otherwise 304).
+    """
     try:
         logger.info(f"🔍 Getting latest generated strategy for user: {user_id}")
         
@@ -659,66 +689,60 @@ async def get_latest_generated_strategy(
             from models.enhanced_strategy_models import EnhancedContentStrategy
             from sqlalchemy import desc
             
-            logger.info(f"🔍 Querying database for strategies with user_id: {user_id}")
-            
-            # Query for the most recent strategy with comprehensive AI analysis
-            # First, let's see all strategies for this user
-            all_strategies = db.query(EnhancedContentStrategy).filter(
-                EnhancedContentStrategy.user_id == user_id
-            ).order_by(desc(EnhancedContentStrategy.created_at)).all()
-            
-            logger.info(f"🔍 Found {len(all_strategies)} total strategies for user {user_id}")
-            for i, strategy in enumerate(all_strategies):
-                logger.info(f"   Strategy {i+1}: ID={strategy.id}, name={strategy.name}, created_at={strategy.created_at}, has_comprehensive_ai_analysis={strategy.comprehensive_ai_analysis is not None}")
-            
-            # Now query for the most recent strategy with comprehensive AI analysis
-            latest_db_strategy = db.query(EnhancedContentStrategy).filter(
-                EnhancedContentStrategy.user_id == user_id,
-                EnhancedContentStrategy.comprehensive_ai_analysis.isnot(None)
-            ).order_by(desc(EnhancedContentStrategy.created_at)).first()
-            
-            logger.info(f"🔍 Database query result: {latest_db_strategy}")
-            
-            if latest_db_strategy and latest_db_strategy.comprehensive_ai_analysis:
-                logger.info(f"✅ Found latest strategy in database: {latest_db_strategy.id}")
-                logger.info(f"🔍 Strategy comprehensive_ai_analysis keys: {list(latest_db_strategy.comprehensive_ai_analysis.keys()) if isinstance(latest_db_strategy.comprehensive_ai_analysis, dict) else 'Not a dict'}")
-                return ResponseBuilder.create_success_response(
-                    message="Latest generated strategy retrieved successfully from database",
-                    data={
-                        "user_id": user_id,
-                        "strategy": latest_db_strategy.comprehensive_ai_analysis,
-                        "completed_at": latest_db_strategy.created_at.isoformat(),
-                        "strategy_id": latest_db_strategy.id
-                    }
+            # Most recent strategy with comprehensive AI analysis; otherwise the
+            # most recent strategy, served from its ai_recommendations
+            candidates = (
+                (
+                    EnhancedContentStrategy.comprehensive_ai_analysis,
+                    (EnhancedContentStrategy.comprehensive_ai_analysis.isnot(None),),
+                    "Latest generated strategy retrieved successfully from database"
+                ),
+                (
+                    EnhancedContentStrategy.ai_recommendations,
+                    (),
+                    "Latest generated strategy retrieved successfully from database (fallback)"
                 )
-            else:
-                logger.info(f"⚠️ No strategy with comprehensive_ai_analysis found in database for user: {user_id}")
-                
-                # Fallback: Try to get the most recent strategy regardless of comprehensive_ai_analysis
-                fallback_strategy = db.query(EnhancedContentStrategy).filter(
-                    EnhancedContentStrategy.user_id == user_id
+            )
+            
+            for source_column, extra_filters, message in candidates:
+                latest_db_strategy = db.query(
+                    EnhancedContentStrategy.id,
+                    EnhancedContentStrategy.created_at,
+                    EnhancedContentStrategy.updated_at
+                ).filter(
+                    EnhancedContentStrategy.user_id == user_id,
+                    *extra_filters
                 ).order_by(desc(EnhancedContentStrategy.created_at)).first()
                 
-                if fallback_strategy:
-                    logger.info(f"🔍 Found fallback strategy: ID={fallback_strategy.id}, name={fallback_strategy.name}")
-                    logger.info(f"🔍 Fallback strategy has ai_recommendations: {fallback_strategy.ai_recommendations is not None}")
-                    
-                    # Try to use ai_recommendations as the strategy data
-                    if fallback_strategy.ai_recommendations:
-                        logger.info(f"✅ Using ai_recommendations as strategy data for fallback strategy {fallback_strategy.id}")
-                        return ResponseBuilder.create_success_response(
-                            message="Latest generated strategy retrieved successfully from database (fallback)",
-                            data={
-                                "user_id": user_id,
-                                "strategy": fallback_strategy.ai_recommendations,
-                                "completed_at": fallback_strategy.created_at.isoformat(),
-                                "strategy_id": fallback_strategy.id
-                            }
-                        )
-                    else:
-                        logger.info(f"⚠️ Fallback strategy has no ai_recommendations either")
-                else:
-                    logger.info(f"🔍 No strategy record found at all for user: {user_id}")
+                if not latest_db_strategy:
+                    logger.info(f"⚠️ No strategy with {source_column.key} found in database for user: {user_id}")
+                    continue
+                
+                validators = ResourceValidators.for_version(
+                    "latest-strategy", user_id, source_column.key, latest_db_strategy.id, latest_db_strategy.updated_at,
+                    last_modified=latest_db_strategy.updated_at or latest_db_strategy.created_at
+                )
+                if validators.is_not_modified(request):
+                    return validators.not_modified_response()
+                
+                # Load only the JSON column being returned
+                strategy_data = db.query(source_column).filter(
+                    EnhancedContentStrategy.id == latest_db_strategy.id
+                ).scalar()
+                
+                if strategy_data:
+                    logger.info(f"✅ Found latest strategy in database: {latest_db_strategy.id} ({source_column.key})")
+                    validators.apply(response)
+                    return ResponseBuilder.create_success_response(
+                        message=message,
+                        data={
+                            "user_id": user_id,
+                            "strategy": strategy_data,
+                            "completed_at": latest_db_strategy.created_at.isoformat(),
+                            "strategy_id": latest_db_strategy.id
+                        }
+                    )
+                logger.info(f"⚠️ Strategy {latest_db_strategy.id} has no {source_column.key}")
         except Exception as db_error:
             logger.warning(f"⚠️ Database query failed: {str(db_error)}")
             logger.error(f"❌ Database error details: {type(db_error).__name__}: {str(db_error)}")
@@ -731,39 +755,34 @@ async def get_latest_generated_strategy(
                 data={"user_id": user_id, "strategy": None}
             )
         
-        # Debug: Log all task statuses
-        logger.info(f"📊 Total tasks in storage: {len(generate_comprehensive_strategy_polling._task_status)}")
-        for task_id, task_status in generate_comprehensive_strategy_polling._task_status.items():
-            logger.info(f"   Task {task_id}: user_id={task_status.get('user_id')}, status={task_status.get('status')}, has_strategy={bool(task_status.get('strategy'))}")
-        
         # Find the most recent completed strategy for this user
-        latest_strategy = None
-        latest_completion_time = None
+        latest_task_id = None
+        latest_task_status = None
         
-        for task_id, task_status in generate_comprehensive_strategy_polling._task_status.items():
-            logger.info(f"🔍 Checking task {task_id}: user_id={task_status.get('user_id')} vs requested {user_id}")
-            
+        for task_id, task_status in list(generate_comprehensive_strategy_polling._task_status.items()):
             if (task_status.get("user_id") == user_id and 
                 task_status.get("status") == "completed" and 
                 task_status.get("strategy")):
                 
                 completion_time = task_status.get("completed_at")
-                logger.info(f"✅ Found completed strategy for user {user_id} at {completion_time}")
-                logger.info(f"🔍 Strategy keys: {list(task_status.get('strategy', {}).keys())}")
-                
-                if completion_time and (latest_completion_time is None or completion_time > latest_completion_time):
-                    latest_strategy = task_status.get("strategy")
-                    latest_completion_time = completion_time
-                    logger.info(f"🔄 Updated latest strategy with completion time: {completion_time}")
-        
-        if latest_strategy:
-            logger.info(f"✅ Found latest generated strategy for user: {user_id}")
+                if completion_time and (latest_task_status is None or completion_time > latest_task_status.get("completed_at")):
+                    latest_task_id = task_id
+                    latest_task_status = task_status
+        
+        if latest_task_status:
+            logger.info(f"✅ Found latest generated strategy for user: {user_id} (task {latest_task_id})")
+            validators = ResourceValidators.for_version(
+                "latest-strategy", user_id, "task", latest_task_id, latest_task_status.get("version", 0)
+            )
+            if validators.is_not_modified(request):
+                return validators.not_modified_response()
+            validators.apply(response)
             return ResponseBuilder.create_success_response(
                 message="Latest generated strategy retrieved successfully from memory",
                 data={
                     "user_id": user_id,
-                    "strategy": latest_strategy,
-                    "completed_at": latest_completion_time
+                    "strategy": latest_task_status.get("strategy"),
+                    "completed_at": latest_task_status.get("completed_at")
                 }
             )
         else:
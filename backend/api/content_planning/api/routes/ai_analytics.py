@@ -3,7 +3,7 @@ AI Analytics Routes for Content Planning API
 Extracted from the main content_planning.py file for better organization.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -25,6 +25,7 @@ from ..models.responses import AIAnalyticsResponse
 # Import utilities
 from ...utils.error_handlers import ContentPlanningErrorHandler
 from ...utils.response_builders import ResponseBuilder
+from ...utils.conditional_responses import ResourceValidators
 from ...utils.constants import ERROR_MESSAGES, SUCCESS_MESSAGES
 
 # Import services
@@ -126,6 +127,8 @@ async def generate_strategic_intelligence(request: StrategicIntelligenceRequest)
 
 @router.get("/", response_model=Dict[str, Any])
 async def get_ai_analytics(
+    request: Request,
+    response: Response,
     user_id: Optional[int] = Query(None, description="User ID"),
     strategy_id: Optional[int] = Query(None, description="Strategy ID"),
     force_refresh: bool = Query(False, description="Force refresh AI analysis")
@@ -134,7 +137,22 @@ async def get_ai_analytics(
     try:
         logger.info(f"🚀 Starting AI analytics for user: {user_id}, strategy: {strategy_id}, force_refresh: {force_refresh}")
         
+        # Polled endpoint: an unchanged cached analysis costs one projected lookup and a 304
+        validators = None
+        if not force_refresh:
+            version = await ai_analytics_service.get_ai_analytics_version(user_id, strategy_id)
+            if version:
+                validators = ResourceValidators.for_version(
+                    "ai-analytics", user_id, strategy_id, version["id"], version["updated_at"],
+                    last_modified=version["updated_at"] or version["created_at"]
+                )
+                if validators.is_not_modified(request):
+                    return validators.not_modified_response()
+        
         result = await ai_analytics_service.get_ai_analytics(user_id, strategy_id, force_refresh)
+        # Only the cached analysis is described by the stored version; fresh runs are revalidated next poll
+        if validators and isinstance(result, dict) and result.get("data_source") == "database_cache":
+            validators.apply(response)
         return result
         
     except Exception as e:
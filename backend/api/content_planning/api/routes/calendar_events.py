@@ -3,7 +3,7 @@ Calendar Events Routes for Content Planning API
 Extracted from the main content_planning.py file for better organization.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -20,6 +20,7 @@ from ..models.responses import CalendarEventResponse
 # Import utilities
 from ...utils.error_handlers import ContentPlanningErrorHandler
 from ...utils.response_builders import ResponseBuilder
+from ...utils.conditional_responses import ResourceValidators
 from ...utils.constants import ERROR_MESSAGES, SUCCESS_MESSAGES
 
 # Import services
@@ -53,14 +54,25 @@ async def create_calendar_event(
 
 @router.get("/", response_model=List[CalendarEventResponse])
 async def get_calendar_events(
+    request: Request,
+    response: Response,
     strategy_id: Optional[int] = Query(None, description="Filter by strategy ID"),
     db: Session = Depends(get_db)
 ):
-    """Get calendar events, optionally filtered by strategy."""
+    """Get calendar events, optionally filtered by strategy. Answers 304 while the list is unchanged."""
     try:
         logger.info("Fetching calendar events")
         
+        version = await calendar_service.get_calendar_events_version(strategy_id, db)
+        # ETag only: deletions change the count but not the latest update time
+        validators = ResourceValidators.for_version(
+            "calendar-events", strategy_id, version["count"], version["max_id"], version["last_updated"]
+        )
+        if validators.is_not_modified(request):
+            return validators.not_modified_response()
+        
         events = await calendar_service.get_calendar_events(strategy_id, db)
+        validators.apply(response)
         return [CalendarEventResponse(**event) for event in events]
         
     except Exception as e:
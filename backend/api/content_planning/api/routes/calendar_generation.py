@@ -3,11 +3,13 @@ Calendar Generation Routes for Content Planning API
 Extracted from the main content_planning.py file for better organization.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from loguru import logger
+import json
 import time
 import asyncio
 import random
@@ -31,11 +33,13 @@ from ..models.responses import (
 # Import utilities
 from ...utils.error_handlers import ContentPlanningErrorHandler
 from ...utils.response_builders import ResponseBuilder
+from ...utils.conditional_responses import ResourceValidators
 from ...utils.constants import ERROR_MESSAGES, SUCCESS_MESSAGES
 
 # Import services
 # Removed old service import - using orchestrator only
 from ...services.calendar_generation_service import CalendarGenerationService
+from ...services.calendar_session_store import get_calendar_session_store
 
 # Create router
 router = APIRouter(prefix="/calendar-generation", tags=["calendar-generation"])
@@ -290,43 +294,92 @@ async def calendar_generation_health_check(db: Session = Depends(get_db)):
             "error": str(e)
         }
 
+def _progress_payload(session_id: str, orchestrator_progress: Dict[str, Any]) -> Dict[str, Any]:
+    """Progress response body shared by the polling and streaming endpoints."""
+    return {
+        "session_id": session_id,
+        "status": orchestrator_progress.get("status", "initializing"),
+        "current_step": orchestrator_progress.get("current_step", 0),
+        "step_progress": orchestrator_progress.get("step_progress", 0),
+        "overall_progress": orchestrator_progress.get("overall_progress", 0),
+        "step_results": orchestrator_progress.get("step_results", {}),
+        "quality_scores": orchestrator_progress.get("quality_scores", {}),
+        "transparency_messages": orchestrator_progress.get("transparency_messages", []),
+        "educational_content": orchestrator_progress.get("educational_content", []),
+        "errors": orchestrator_progress.get("errors", []),
+        "warnings": orchestrator_progress.get("warnings", []),
+        "error": orchestrator_progress.get("error"),
+        "estimated_completion": orchestrator_progress.get("estimated_completion"),
+        "last_updated": orchestrator_progress.get("last_updated")
+    }
+
 @router.get("/progress/{session_id}")
-async def get_calendar_generation_progress(session_id: str, db: Session = Depends(get_db)):
+async def get_calendar_generation_progress(session_id: str, request: Request, response: Response):
     """
     Get real-time progress of calendar generation for a specific session.
-    This endpoint is polled by the frontend modal to show progress updates.
+    Snapshot endpoint; /progress/{session_id}/stream pushes the same payload on every update.
+    Reads the session store only and answers 304 while the session version is unchanged.
     """
     try:
-        # Initialize service with database session for active strategy access
-        calendar_service = CalendarGenerationService(db)
+        session_store = get_calendar_session_store()
+        session = await asyncio.to_thread(session_store.get, session_id)
+        if session and session_store.is_stale(session):
+            session = await asyncio.to_thread(session_store.fail_if_stale, session_id)
         
-        # Get progress from orchestrator only - no fallbacks
-        orchestrator_progress = calendar_service.get_orchestrator_progress(session_id)
-        
-        if not orchestrator_progress:
+        if not session:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        # Return orchestrator progress (data is already in the correct format)
-        return {
-            "session_id": session_id,
-            "status": orchestrator_progress.get("status", "initializing"),
-            "current_step": orchestrator_progress.get("current_step", 0),
-            "step_progress": orchestrator_progress.get("step_progress", 0),
-            "overall_progress": orchestrator_progress.get("overall_progress", 0),
-            "step_results": orchestrator_progress.get("step_results", {}),
-            "quality_scores": orchestrator_progress.get("quality_scores", {}),
-            "transparency_messages": orchestrator_progress.get("transparency_messages", []),
-            "educational_content": orchestrator_progress.get("educational_content", []),
-            "errors": orchestrator_progress.get("errors", []),
-            "warnings": orchestrator_progress.get("warnings", []),
-            "estimated_completion": orchestrator_progress.get("estimated_completion"),
-            "last_updated": orchestrator_progress.get("last_updated")
-        }
+        validators = ResourceValidators.for_version("calendar-progress", session_id, session.get("version", 0))
+        if validators.is_not_modified(request):
+            return validators.not_modified_response()
         
+        orchestrator_progress = CalendarGenerationService.format_progress(session)
+        validators.apply(response)
+        return _progress_payload(session_id, orchestrator_progress)
+        
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting calendar generation progress: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to get progress")
 
+@router.get("/progress/{session_id}/stream")
+async def stream_calendar_generation_progress(session_id: str):
+    """
+    Push calendar generation progress as Server-Sent Events.
+    
+    Emits a ``progress`` event immediately and after every update (from any
+    worker), a comment heartbeat while idle, and closes once the session
+    completes, fails or is cancelled. Reads the session store only, so no
+    database session is held open for the stream.
+    """
+    session_store = get_calendar_session_store()
+    if not await asyncio.to_thread(session_store.get, session_id):
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    async def event_stream():
+        try:
+            async for session in session_store.watch(session_id):
+                if session is None:
+                    yield ": heartbeat\n\n"
+                    continue
+                orchestrator_progress = CalendarGenerationService.format_progress(session)
+                payload = {"type": "progress", **_progress_payload(session_id, orchestrator_progress)}
+                yield f"data: {json.dumps(payload, default=str)}\n\n"
+            yield f"data: {json.dumps({'type': 'complete', 'session_id': session_id})}\n\n"
+        except Exception as e:
+            logger.error(f"Error streaming calendar generation progress: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive"
+        }
+    )
+
 @router.post("/start")
 async def start_calendar_generation(request: CalendarGenerationRequest, db: Session = Depends(get_db)):
     """
@@ -339,7 +392,7 @@ async def start_calendar_generation(request: CalendarGenerationRequest, db: Sess
         
         # Check if user already has an active session
         user_id = request.user_id
-        existing_session = calendar_service._get_active_session_for_user(user_id)
+        existing_session = await asyncio.to_thread(calendar_service._get_active_session_for_user, user_id)
         
         if existing_session:
             logger.info(f"🔄 User {user_id} already has active session: {existing_session}")
@@ -354,7 +407,7 @@ async def start_calendar_generation(request: CalendarGenerationRequest, db: Sess
         session_id = f"calendar-session-{int(time.time())}-{random.randint(1000, 9999)}"
         
         # Initialize orchestrator session
-        success = calendar_service.initialize_orchestrator_session(session_id, request.dict())
+        success = await asyncio.to_thread(calendar_service.initialize_orchestrator_session, session_id, request.dict())
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to initialize orchestrator session")
@@ -384,11 +437,7 @@ async def cancel_calendar_generation(session_id: str, db: Session = Depends(get_
         calendar_service = CalendarGenerationService(db)
         
         # Cancel orchestrator session
-        if session_id in calendar_service.orchestrator_sessions:
-            calendar_service.orchestrator_sessions[session_id]["status"] = "cancelled"
-            success = True
-        else:
-            success = False
+        success = await asyncio.to_thread(calendar_service.cancel_orchestrator_session, session_id)
         
         if not success:
             raise HTTPException(status_code=404, detail="Session not found")
@@ -470,12 +519,12 @@ async def list_active_sessions(db: Session = Depends(get_db)):
         calendar_service = CalendarGenerationService(db)
         
         sessions = []
-        for session_id, session_data in calendar_service.orchestrator_sessions.items():
+        for session_data in await asyncio.to_thread(calendar_service.list_orchestrator_sessions):
             sessions.append({
-                "session_id": session_id,
+                "session_id": session_data.get("session_id"),
                 "user_id": session_data.get("user_id"),
                 "status": session_data.get("status"),
-                "start_time": session_data.get("start_time").isoformat() if session_data.get("start_time") else None,
+                "start_time": session_data.get("start_time"),
                 "progress": session_data.get("progress", {})
             })
         
@@ -499,29 +548,12 @@ async def cleanup_old_sessions(db: Session = Depends(get_db)):
         calendar_service = CalendarGenerationService(db)
         
         # Clean up old sessions for all users
-        current_time = datetime.now()
-        sessions_to_remove = []
-        
-        for session_id, session_data in list(calendar_service.orchestrator_sessions.items()):
-            start_time = session_data.get("start_time")
-            if start_time:
-                # Remove sessions older than 1 hour
-                if (current_time - start_time).total_seconds() > 3600:  # 1 hour
-                    sessions_to_remove.append(session_id)
-                # Also remove completed/error sessions older than 10 minutes
-                elif session_data.get("status") in ["completed", "error", "cancelled"]:
-                    if (current_time - start_time).total_seconds() > 600:  # 10 minutes
-                        sessions_to_remove.append(session_id)
-        
-        # Remove the sessions
-        for session_id in sessions_to_remove:
-            del calendar_service.orchestrator_sessions[session_id]
-            logger.info(f"🧹 Cleaned up old session: {session_id}")
+        cleaned_count = await asyncio.to_thread(calendar_service._cleanup_old_sessions)
         
         return {
             "status": "success",
-            "message": f"Cleaned up {len(sessions_to_remove)} old sessions",
-            "cleaned_count": len(sessions_to_remove)
+            "message": f"Cleaned up {cleaned_count} old sessions",
+            "cleaned_count": cleaned_count
         }
         
     except Exception as e:
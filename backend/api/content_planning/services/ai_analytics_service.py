@@ -136,6 +136,18 @@ class ContentPlanningAIAnalyticsService:
             logger.error(f"Error generating strategic intelligence: {str(e)}")
             raise ContentPlanningErrorHandler.handle_general_error(e, "generate_strategic_intelligence")
     
+    async def get_ai_analytics_version(self, user_id: Optional[int] = None, strategy_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Version of the cached AI analytics served when not refreshing (None if there is none)."""
+        try:
+            return await self.ai_analysis_db_service.get_latest_ai_analysis_version(
+                user_id=user_id or 1,
+                analysis_type="comprehensive_analysis",
+                strategy_id=strategy_id
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not look up AI analytics version: {str(e)}")
+            return None
+    
     async def get_ai_analytics(self, user_id: Optional[int] = None, strategy_id: Optional[int] = None, force_refresh: bool = False) -> Dict[str, Any]:
         """Get AI analytics with real personalized insights - FORCE FRESH AI GENERATION."""
         try:
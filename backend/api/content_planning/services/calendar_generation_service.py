@@ -7,6 +7,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from loguru import logger
 from sqlalchemy.orm import Session
+import asyncio
+import random
 import time
 
 # Import database service
@@ -18,8 +20,10 @@ from services.calendar_generation_datasource_framework.prompt_chaining.orchestra
 # Import validation service
 from services.validation import check_all_api_keys
 
-# Global session store to persist across requests
-_global_orchestrator_sessions = {}
+# Session store shared across requests and workers
+from .calendar_session_store import (
+    get_calendar_session_store, CALENDAR_SESSION_HEARTBEAT_SECONDS
+)
 
 # Import utilities
 from ..utils.error_handlers import ContentPlanningErrorHandler
@@ -31,12 +35,12 @@ class CalendarGenerationService:
     
     def __init__(self, db_session: Optional[Session] = None):
         self.db_session = db_session
+        # Sessions persist across requests, restarts and workers
+        self.session_store = get_calendar_session_store()
         
         # Initialize orchestrator for 12-step calendar generation
         try:
             self.orchestrator = PromptChainOrchestrator(db_session=db_session)
-            # Use global session store to persist across requests
-            self.orchestrator_sessions = _global_orchestrator_sessions
             logger.info("✅ 12-step orchestrator initialized successfully with database session")
         except Exception as e:
             logger.error(f"❌ Failed to initialize orchestrator: {e}")
@@ -62,7 +66,7 @@ class CalendarGenerationService:
                 "business_size": business_size
             }
             
-            success = self.initialize_orchestrator_session(session_id, request_data)
+            success = await asyncio.to_thread(self.initialize_orchestrator_session, session_id, request_data)
             if not success:
                 raise Exception("Failed to initialize orchestrator session")
             
@@ -75,14 +79,14 @@ class CalendarGenerationService:
             elapsed_time = 0
             
             while elapsed_time < max_wait_time:
-                progress = self.get_orchestrator_progress(session_id)
+                progress = await asyncio.to_thread(self.get_orchestrator_progress, session_id)
                 if progress and progress.get("status") == "completed":
                     calendar_data = progress.get("step_results", {}).get("step_12", {}).get("result", {})
                     processing_time = time.time() - start_time
                     logger.info(f"✅ Calendar generated successfully in {processing_time:.2f}s")
                     return calendar_data
-                elif progress and progress.get("status") == "failed":
-                    raise Exception(f"Calendar generation failed: {progress.get('errors', ['Unknown error'])}")
+                elif progress and progress.get("status") in ("error", "failed", "cancelled"):
+                    raise Exception(f"Calendar generation {progress['status']}: {progress.get('error') or progress.get('errors') or 'Unknown error'}")
                 
                 await asyncio.sleep(wait_interval)
                 elapsed_time += wait_interval
@@ -368,11 +372,11 @@ class CalendarGenerationService:
                 return False
             
             # Store session data
-            self.orchestrator_sessions[session_id] = {
+            self.session_store.create(session_id, {
                 "request_data": request_data,
                 "user_id": user_id,
                 "status": "initializing",
-                "start_time": datetime.now(),
+                "start_time": datetime.now().isoformat(),
                 "progress": {
                     "current_step": 0,
                     "overall_progress": 0,
@@ -381,7 +385,7 @@ class CalendarGenerationService:
                     "errors": [],
                     "warnings": []
                 }
-            }
+            })
             
             logger.info(f"✅ Orchestrator session {session_id} initialized for user {user_id}")
             return True
@@ -390,46 +394,52 @@ class CalendarGenerationService:
             logger.error(f"❌ Failed to initialize orchestrator session: {e}")
             return False
     
-    def _cleanup_old_sessions(self, user_id: int) -> None:
-        """Clean up old sessions for a user."""
+    def _cleanup_old_sessions(self, user_id: Optional[int] = None) -> int:
+        """Clean up old sessions for a user (or for all users when user_id is None)."""
         try:
             current_time = datetime.now()
             sessions_to_remove = []
             
             # Collect sessions to remove first, then remove them
-            for session_id, session_data in self.orchestrator_sessions.items():
-                if session_data.get("user_id") == user_id:
-                    start_time = session_data.get("start_time")
-                    if start_time:
-                        # Remove sessions older than 1 hour
-                        if (current_time - start_time).total_seconds() > 3600:  # 1 hour
-                            sessions_to_remove.append(session_id)
-                        # Also remove completed/error sessions older than 10 minutes
-                        elif session_data.get("status") in ["completed", "error", "cancelled"]:
-                            if (current_time - start_time).total_seconds() > 600:  # 10 minutes
-                                sessions_to_remove.append(session_id)
+            for session_data in self.session_store.list(user_id=user_id):
+                start_time = session_data.get("start_time")
+                if start_time:
+                    age_seconds = (current_time - datetime.fromisoformat(start_time)).total_seconds()
+                    # Remove sessions older than 1 hour
+                    if age_seconds > 3600:  # 1 hour
+                        sessions_to_remove.append(session_data["session_id"])
+                    # Also remove completed/error sessions older than 10 minutes
+                    elif session_data.get("status") in ["completed", "error", "cancelled"]:
+                        if age_seconds > 600:  # 10 minutes
+                            sessions_to_remove.append(session_data["session_id"])
             
             # Remove the sessions
             for session_id in sessions_to_remove:
-                if session_id in self.orchestrator_sessions:
-                    del self.orchestrator_sessions[session_id]
+                if self.session_store.delete(session_id):
                     logger.info(f"🧹 Cleaned up old session: {session_id}")
+            return len(sessions_to_remove)
                 
         except Exception as e:
             logger.error(f"❌ Error cleaning up old sessions: {e}")
+            return 0
     
     def _get_active_session_for_user(self, user_id: int) -> Optional[str]:
-        """Get active session for a user."""
+        """Get active session for a user (sessions orphaned by a restarted worker do not count)."""
         try:
-            for session_id, session_data in self.orchestrator_sessions.items():
-                if (session_data.get("user_id") == user_id and 
-                    session_data.get("status") in ["initializing", "running"]):
-                    return session_id
-            return None
+            active_sessions = self.session_store.list_active(user_id=user_id)
+            return active_sessions[0]["session_id"] if active_sessions else None
         except Exception as e:
             logger.error(f"❌ Error getting active session for user: {e}")
             return None
     
+    def list_orchestrator_sessions(self) -> List[Dict[str, Any]]:
+        """All stored orchestrator sessions."""
+        return self.session_store.list()
+    
+    def cancel_orchestrator_session(self, session_id: str) -> bool:
+        """Mark a session as cancelled; returns False if it does not exist."""
+        return self.session_store.update(session_id, {"status": "cancelled"}) is not None
+    
     async def start_orchestrator_generation(self, session_id: str, request_data: Dict[str, Any]) -> None:
         """Start the 12-step calendar generation process."""
         try:
@@ -437,83 +447,114 @@ class CalendarGenerationService:
                 logger.error("❌ Orchestrator not initialized")
                 return
             
-            session = self.orchestrator_sessions.get(session_id)
+            session = await asyncio.to_thread(self.session_store.update, session_id, {"status": "running"}, heartbeat=True)
             if not session:
                 logger.error(f"❌ Session {session_id} not found")
                 return
             
-            # Update session status
-            session["status"] = "running"
+            # The orchestrator reports progress synchronously on the event loop; store
+            # writes happen in a worker thread, and only the latest snapshot is kept
+            pending_progress: Dict[str, Any] = {}
+            progress_writer: Optional[asyncio.Task] = None
             
-            # Start the 12-step process
-            result = await self.orchestrator.generate_calendar(
-                user_id=request_data.get("user_id", 1),
-                strategy_id=request_data.get("strategy_id"),
-                calendar_type=request_data.get("calendar_type", "monthly"),
-                industry=request_data.get("industry"),
-                business_size=request_data.get("business_size", "sme"),
-                progress_callback=lambda progress: self._update_session_progress(session_id, progress)
-            )
+            async def write_progress():
+                while pending_progress:
+                    progress = pending_progress.pop("latest")
+                    await asyncio.to_thread(self._update_session_progress, session_id, progress)
+            
+            def on_progress(progress: Dict[str, Any]):
+                nonlocal progress_writer
+                pending_progress["latest"] = progress
+                if progress_writer is None or progress_writer.done():
+                    progress_writer = asyncio.create_task(write_progress())
+            
+            # Keep the session's heartbeat fresh so other workers do not treat it as orphaned
+            heartbeat_task = asyncio.create_task(self._heartbeat_session(session_id))
+            try:
+                # Start the 12-step process
+                result = await self.orchestrator.generate_calendar(
+                    user_id=request_data.get("user_id", 1),
+                    strategy_id=request_data.get("strategy_id"),
+                    calendar_type=request_data.get("calendar_type", "monthly"),
+                    industry=request_data.get("industry"),
+                    business_size=request_data.get("business_size", "sme"),
+                    progress_callback=on_progress
+                )
+            finally:
+                heartbeat_task.cancel()
+                if progress_writer is not None:
+                    await progress_writer
             
             # Update session with final result
-            session["status"] = "completed"
-            session["result"] = result
-            session["end_time"] = datetime.now()
+            await asyncio.to_thread(self.session_store.update, session_id, {
+                "status": "completed",
+                "result": result,
+                "end_time": datetime.now().isoformat()
+            })
             
             logger.info(f"✅ Orchestrator generation completed for session {session_id}")
             
         except Exception as e:
             logger.error(f"❌ Orchestrator generation failed for session {session_id}: {e}")
-            if session_id in self.orchestrator_sessions:
-                self.orchestrator_sessions[session_id]["status"] = "error"
-                self.orchestrator_sessions[session_id]["error"] = str(e)
+            await asyncio.to_thread(self.session_store.update, session_id, {"status": "error", "error": str(e)})
+    
+    async def _heartbeat_session(self, session_id: str) -> None:
+        """Refresh the session heartbeat until cancelled or the session leaves the active states."""
+        while True:
+            await asyncio.sleep(CALENDAR_SESSION_HEARTBEAT_SECONDS)
+            try:
+                session = await asyncio.to_thread(self.session_store.heartbeat, session_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Heartbeat failed for session {session_id}: {e}")
+                continue
+            if session is None or session.get("status") != "running":
+                return
     
     def get_orchestrator_progress(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get progress for an orchestrator session."""
         try:
-            logger.info(f"🔍 Looking for session {session_id}")
-            logger.info(f"📊 Available sessions: {list(self.orchestrator_sessions.keys())}")
-            
-            session = self.orchestrator_sessions.get(session_id)
+            session = self.session_store.get(session_id)
             if not session:
                 logger.warning(f"❌ Session {session_id} not found")
                 return None
             
-            logger.info(f"✅ Found session {session_id} with status: {session['status']}")
-            
-            # Ensure all required fields are present with default values
-            progress_data = session.get("progress", {})
-            
-            return {
-                "status": session["status"],
-                "current_step": progress_data.get("current_step", 0),
-                "step_progress": progress_data.get("step_progress", 0),  # Ensure this field is present
-                "overall_progress": progress_data.get("overall_progress", 0),
-                "step_results": progress_data.get("step_results", {}),
-                "quality_scores": progress_data.get("quality_scores", {}),
-                "errors": progress_data.get("errors", []),
-                "warnings": progress_data.get("warnings", []),
-                "transparency_messages": session.get("transparency_messages", []),
-                "educational_content": session.get("educational_content", []),
-                "estimated_completion": session.get("estimated_completion"),
-                "last_updated": session.get("last_updated", datetime.now().isoformat())
-            }
+            return self.format_progress(session)
             
         except Exception as e:
             logger.error(f"❌ Error getting orchestrator progress: {e}")
             return None
     
+    @staticmethod
+    def format_progress(session: Dict[str, Any]) -> Dict[str, Any]:
+        """Progress view of a stored session, with all required fields defaulted."""
+        progress_data = session.get("progress", {})
+        
+        return {
+            "status": session["status"],
+            "current_step": progress_data.get("current_step", 0),
+            "step_progress": progress_data.get("step_progress", 0),  # Ensure this field is present
+            "overall_progress": progress_data.get("overall_progress", 0),
+            "step_results": progress_data.get("step_results", {}),
+            "quality_scores": progress_data.get("quality_scores", {}),
+            "errors": progress_data.get("errors", []),
+            "warnings": progress_data.get("warnings", []),
+            "transparency_messages": session.get("transparency_messages", []),
+            "educational_content": session.get("educational_content", []),
+            "error": session.get("error"),
+            "estimated_completion": session.get("estimated_completion"),
+            "last_updated": session.get("last_updated", datetime.now().isoformat())
+        }
+    
     def _update_session_progress(self, session_id: str, progress: Dict[str, Any]) -> None:
         """Update session progress from orchestrator callback."""
         try:
-            session = self.orchestrator_sessions.get(session_id)
-            if session:
-                # Convert progress tracker format to service format
-                current_step = progress.get("current_step", 0)
-                total_steps = progress.get("total_steps", 12)
-                step_progress = progress.get("step_progress", 0)  # Get step-specific progress
-                
-                session["progress"] = {
+            # Convert progress tracker format to service format
+            current_step = progress.get("current_step", 0)
+            total_steps = progress.get("total_steps", 12)
+            step_progress = progress.get("step_progress", 0)  # Get step-specific progress
+            
+            session = self.session_store.update(session_id, {
+                "progress": {
                     "current_step": current_step,
                     "step_progress": step_progress,  # Add step_progress field
                     "overall_progress": progress.get("progress_percentage", 0),
@@ -521,9 +562,11 @@ class CalendarGenerationService:
                     "quality_scores": {step: data.get("quality_score", 0.0) for step, data in progress.get("step_details", {}).items()},
                     "errors": [],
                     "warnings": []
-                }
-                session["last_updated"] = datetime.now().isoformat()
-                
+                },
+                "last_updated": datetime.now().isoformat()
+            }, heartbeat=True)
+            
+            if session:
                 logger.info(f"📊 Updated progress for session {session_id}: step {current_step}/{total_steps} (step progress: {step_progress}%)")
                 
         except Exception as e:
@@ -59,6 +59,13 @@ class CalendarService:
             logger.error(f"Error getting calendar events: {str(e)}")
             raise ContentPlanningErrorHandler.handle_general_error(e, "get_calendar_events")
     
+    async def get_calendar_events_version(self, strategy_id: Optional[int] = None, db: Session = None) -> Dict[str, Any]:
+        """Version of the event list get_calendar_events returns, without loading the events."""
+        if not strategy_id:
+            return {"count": 0, "max_id": None, "last_updated": None}
+        db_service = ContentPlanningDBService(db)
+        return await db_service.get_strategy_calendar_events_version(strategy_id)
+    
     async def get_calendar_event_by_id(self, event_id: int, db: Session) -> Dict[str, Any]:
         """Get a specific calendar event by ID."""
         try:
@@ -0,0 +1,471 @@
+"""
+Calendar Generation Session Store
+Shared store for 12-step calendar generation sessions.
+
+Sessions used to live in a module-global dict, so they vanished on restart
+and were invisible to other uvicorn workers. The store keeps them in a
+pluggable backend:
+
+- memory: single process (development, tests)
+- sqlite: shared by all workers on one host, survives restarts (default)
+- redis: shared across hosts
+
+Every write bumps a per-session version inside one atomic read-merge-write in
+the backend, so concurrent writers in different workers never lose each
+other's changes. ``wait_for_update`` wakes waiters in the same process
+immediately and re-reads the backend on a short interval to pick up writes
+made by other workers; ``watch`` builds on it to drive the SSE progress
+channel.
+
+Active sessions record the worker that owns them and a heartbeat timestamp.
+A session whose owner stopped heartbeating (e.g. the worker was restarted) is
+stale: it is marked failed instead of being reported as still running.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import asyncio
+import threading
+from typing import Dict, Any, List, Optional, Iterable, Set, Tuple, AsyncIterator, Callable
+from loguru import logger
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Session store configuration
+CALENDAR_SESSION_BACKEND = os.getenv('CALENDAR_SESSION_BACKEND', 'sqlite')  # memory | sqlite | redis
+CALENDAR_SESSION_SQLITE_PATH = os.getenv('CALENDAR_SESSION_SQLITE_PATH', './calendar_sessions.db')
+CALENDAR_SESSION_REDIS_URL = os.getenv('CALENDAR_SESSION_REDIS_URL', 'redis://localhost:6379/0')
+CALENDAR_SESSION_TTL_SECONDS = int(os.getenv('CALENDAR_SESSION_TTL_SECONDS', '86400'))
+CALENDAR_SESSION_POLL_INTERVAL = float(os.getenv('CALENDAR_SESSION_POLL_INTERVAL', '1.0'))
+CALENDAR_SESSION_HEARTBEAT_SECONDS = float(os.getenv('CALENDAR_SESSION_HEARTBEAT_SECONDS', '30'))
+CALENDAR_SESSION_STALE_SECONDS = float(os.getenv('CALENDAR_SESSION_STALE_SECONDS', '120'))
+
+ACTIVE_SESSION_STATUSES = ("initializing", "running")
+TERMINAL_SESSION_STATUSES = ("completed", "error", "failed", "cancelled")
+
+# Receives the stored session and returns the session to write, or None to leave it unchanged
+SessionMutator = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class SessionBackend:
+    """Interface for calendar session persistence. Sessions are JSON-serializable dicts."""
+
+    name = "base"
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def put(self, session_id: str, session: Dict[str, Any]):
+        raise NotImplementedError
+
+    def update(self, session_id: str, mutate: SessionMutator) -> Optional[Dict[str, Any]]:
+        """
+        Atomically read a session, apply ``mutate`` and write the result.
+
+        Returns the stored session afterwards, or None if it does not exist.
+        """
+        raise NotImplementedError
+
+    def delete(self, session_id: str) -> bool:
+        raise NotImplementedError
+
+    def list(self) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class MemorySessionBackend(SessionBackend):
+    """Per-process sessions (the previous behaviour)."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._sessions: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            raw = self._sessions.get(session_id)
+        return json.loads(raw) if raw else None
+
+    def put(self, session_id: str, session: Dict[str, Any]):
+        with self._lock:
+            self._sessions[session_id] = json.dumps(session, default=str)
+
+    def update(self, session_id: str, mutate: SessionMutator) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            raw = self._sessions.get(session_id)
+            if raw is None:
+                return None
+            session = json.loads(raw)
+            updated = mutate(session)
+            if updated is None:
+                return session
+            self._sessions[session_id] = json.dumps(updated, default=str)
+            return updated
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            raws = list(self._sessions.values())
+        return [json.loads(raw) for raw in raws]
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """Sessions in a SQLite table shared by all workers on the host."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = CALENDAR_SESSION_SQLITE_PATH, ttl_seconds: int = CALENDAR_SESSION_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS calendar_generation_sessions (
+                session_id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_calendar_sessions_updated ON calendar_generation_sessions (updated_at)"
+        )
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM calendar_generation_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, session_id: str, session: Dict[str, Any]):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO calendar_generation_sessions (session_id, data, updated_at) VALUES (?, ?, ?)",
+                (session_id, json.dumps(session, default=str), now),
+            )
+            # Sessions nobody has touched for a day are dropped
+            self._conn.execute(
+                "DELETE FROM calendar_generation_sessions WHERE updated_at <= ?", (now - self.ttl_seconds,)
+            )
+
+    def update(self, session_id: str, mutate: SessionMutator) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock before the read, so writers in
+            # other processes wait for (or retry after) this read-merge-write
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT data FROM calendar_generation_sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("ROLLBACK")
+                    return None
+                session = json.loads(row[0])
+                updated = mutate(session)
+                if updated is None:
+                    self._conn.execute("ROLLBACK")
+                    return session
+                self._conn.execute(
+                    "UPDATE calendar_generation_sessions SET data = ?, updated_at = ? WHERE session_id = ?",
+                    (json.dumps(updated, default=str), time.time(), session_id),
+                )
+                self._conn.execute("COMMIT")
+                return updated
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM calendar_generation_sessions WHERE session_id = ?", (session_id,)
+            )
+        return cursor.rowcount > 0
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM calendar_generation_sessions").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+
+class RedisSessionBackend(SessionBackend):
+    """Sessions in Redis (expiry handled by Redis TTLs)."""
+
+    name = "redis"
+    key_prefix = "alwrity:calendar_session:"
+
+    def __init__(self, url: str = CALENDAR_SESSION_REDIS_URL, ttl_seconds: int = CALENDAR_SESSION_TTL_SECONDS):
+        if redis is None:
+            raise RuntimeError("redis library not available. Install with: pip install redis")
+        self.ttl_seconds = ttl_seconds
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        raw = self._client.get(self.key_prefix + session_id)
+        return json.loads(raw) if raw else None
+
+    def put(self, session_id: str, session: Dict[str, Any]):
+        self._client.setex(self.key_prefix + session_id, self.ttl_seconds, json.dumps(session, default=str))
+
+    def update(self, session_id: str, mutate: SessionMutator) -> Optional[Dict[str, Any]]:
+        key = self.key_prefix + session_id
+        with self._client.pipeline() as pipe:
+            while True:
+                try:
+                    # WATCH/MULTI: the write is discarded (and retried) if another
+                    # writer changed the session after we read it
+                    pipe.watch(key)
+                    raw = pipe.get(key)
+                    if not raw:
+                        pipe.unwatch()
+                        return None
+                    session = json.loads(raw)
+                    updated = mutate(session)
+                    if updated is None:
+                        pipe.unwatch()
+                        return session
+                    pipe.multi()
+                    pipe.setex(key, self.ttl_seconds, json.dumps(updated, default=str))
+                    pipe.execute()
+                    return updated
+                except redis.WatchError:
+                    continue
+
+    def delete(self, session_id: str) -> bool:
+        return bool(self._client.delete(self.key_prefix + session_id))
+
+    def list(self) -> List[Dict[str, Any]]:
+        sessions = []
+        for key in self._client.scan_iter(self.key_prefix + "*"):
+            raw = self._client.get(key)
+            if raw:
+                sessions.append(json.loads(raw))
+        return sessions
+
+
+class CalendarSessionStore:
+    """
+    Versioned calendar generation sessions with change notification.
+
+    Each stored session carries ``session_id`` and ``version``; ``update``
+    merges top-level fields, bumps the version and wakes local waiters.
+    Sessions created here are owned by this store's ``owner_id`` and carry a
+    ``heartbeat_at`` timestamp that the owner refreshes while generating.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[SessionBackend] = None,
+        poll_interval: float = CALENDAR_SESSION_POLL_INTERVAL,
+        stale_after_seconds: float = CALENDAR_SESSION_STALE_SECONDS
+    ):
+        self.backend = backend or MemorySessionBackend()
+        self.poll_interval = poll_interval
+        self.stale_after_seconds = stale_after_seconds
+        self.owner_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self.backend.get(session_id)
+        except Exception as e:
+            logger.error(f"❌ Calendar session store read failed for {session_id}: {e}")
+            return None
+
+    def create(self, session_id: str, session: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a new session (replacing any previous one with the same id)."""
+        stored = {
+            **session,
+            "session_id": session_id,
+            "version": 1,
+            "owner": self.owner_id,
+            "heartbeat_at": time.time()
+        }
+        self.backend.put(session_id, stored)
+        self._notify(session_id)
+        return stored
+
+    def update(self, session_id: str, changes: Dict[str, Any], heartbeat: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Merge ``changes`` into a session; returns the updated session or None if it does not exist.
+
+        The owning worker passes ``heartbeat=True`` to also refresh the session heartbeat.
+        """
+        def merge(session: Dict[str, Any]) -> Dict[str, Any]:
+            session.update(changes)
+            if heartbeat:
+                session["owner"] = self.owner_id
+                session["heartbeat_at"] = time.time()
+            session["version"] = session.get("version", 0) + 1
+            return session
+
+        session = self.backend.update(session_id, merge)
+        if session is not None:
+            self._notify(session_id)
+        return session
+
+    def heartbeat(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Refresh the heartbeat of an active session owned by this worker (terminal sessions are left alone)."""
+        def touch(session: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            if session.get("status") not in ACTIVE_SESSION_STATUSES:
+                return None
+            session["owner"] = self.owner_id
+            session["heartbeat_at"] = time.time()
+            return session
+
+        # Heartbeats do not bump the version: nothing a watcher shows has changed
+        return self.backend.update(session_id, touch)
+
+    def is_stale(self, session: Dict[str, Any]) -> bool:
+        """True for an active session whose owner stopped heartbeating."""
+        if session.get("status") not in ACTIVE_SESSION_STATUSES:
+            return False
+        heartbeat_at = session.get("heartbeat_at")
+        return heartbeat_at is None or time.time() - heartbeat_at > self.stale_after_seconds
+
+    def fail_if_stale(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Mark an orphaned active session as failed; returns the current session."""
+        def fail(session: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            # Re-checked under the backend's write lock so a live owner is never failed
+            if not self.is_stale(session):
+                return None
+            logger.warning(f"⚠️ Calendar session {session_id} orphaned by worker {session.get('owner')}; marking failed")
+            session["status"] = "failed"
+            session["error"] = "Generation worker stopped responding"
+            session["version"] = session.get("version", 0) + 1
+            return session
+
+        session = self.backend.update(session_id, fail)
+        if session is not None and session.get("status") == "failed":
+            self._notify(session_id)
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        deleted = self.backend.delete(session_id)
+        self._notify(session_id)
+        return deleted
+
+    def list(self, user_id: Optional[int] = None, statuses: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Sessions, optionally filtered by user and status."""
+        try:
+            sessions = self.backend.list()
+        except Exception as e:
+            logger.error(f"❌ Calendar session store list failed: {e}")
+            return []
+        status_filter = set(statuses) if statuses is not None else None
+        return [
+            session for session in sessions
+            if (user_id is None or session.get("user_id") == user_id)
+            and (status_filter is None or session.get("status") in status_filter)
+        ]
+
+    def list_active(self, user_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Active sessions whose owner is still alive; orphaned ones are marked failed on the way."""
+        active = []
+        for session in self.list(user_id=user_id, statuses=ACTIVE_SESSION_STATUSES):
+            if self.is_stale(session):
+                self.fail_if_stale(session["session_id"])
+                continue
+            active.append(session)
+        return active
+
+    async def wait_for_update(self, session_id: str, version: int, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        Wait until the session's version moves past ``version`` (or ``timeout`` elapses).
+
+        Returns the current session, or None if it no longer exists. Backend
+        reads run in a worker thread so SQLite/Redis I/O never blocks the loop.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        with self._lock:
+            self._waiters.setdefault(session_id, set()).add(waiter)
+        try:
+            deadline = loop.time() + timeout
+            while True:
+                session = await asyncio.to_thread(self.get, session_id)
+                if session is None or session.get("version", 0) != version:
+                    return session
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return session
+                event.clear()
+                try:
+                    # Local writes set the event; writes from other workers are seen on the next poll
+                    await asyncio.wait_for(event.wait(), timeout=min(self.poll_interval, remaining))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            with self._lock:
+                waiters = self._waiters.get(session_id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[session_id]
+
+    async def watch(self, session_id: str, heartbeat_seconds: float = 15.0) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Yield a session now and after every change until it reaches a terminal status or disappears.
+
+        None is yielded when nothing changed for ``heartbeat_seconds``. A session
+        orphaned by its worker is marked failed, which ends the watch.
+        """
+        session = await asyncio.to_thread(self.get, session_id)
+        while session is not None:
+            yield session
+            if session.get("status") in TERMINAL_SESSION_STATUSES:
+                return
+            version = session.get("version", 0)
+            while True:
+                session = await self.wait_for_update(session_id, version, timeout=heartbeat_seconds)
+                if session is not None and self.is_stale(session):
+                    session = await asyncio.to_thread(self.fail_if_stale, session_id)
+                if session is None or session.get("version", 0) != version:
+                    break
+                yield None
+
+    def _notify(self, session_id: str):
+        with self._lock:
+            waiters = list(self._waiters.get(session_id, ()))
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # loop already closed
+
+
+def _build_backend() -> SessionBackend:
+    backend_name = CALENDAR_SESSION_BACKEND.lower()
+    try:
+        if backend_name == 'redis':
+            return RedisSessionBackend()
+        if backend_name == 'sqlite':
+            return SQLiteSessionBackend()
+    except Exception as e:
+        logger.warning(f"Calendar session backend '{backend_name}' unavailable ({e}); using in-memory sessions")
+    return MemorySessionBackend()
+
+
+def get_calendar_session_store() -> CalendarSessionStore:
+    """Get the process-wide calendar session store."""
+    if not hasattr(get_calendar_session_store, '_instance'):
+        get_calendar_session_store._instance = CalendarSessionStore(_build_backend())
+        logger.info(f"Calendar session store initialized (backend: {get_calendar_session_store._instance.backend.name})")
+    return get_calendar_session_store._instance
@@ -3,6 +3,6 @@ AI Generation Module
 AI-powered content strategy generation with comprehensive insights and recommendations.
 """
 
-from .strategy_generator import AIStrategyGenerator, StrategyGenerationConfig
+from .strategy_generator import AIStrategyGenerator, StrategyGenerationConfig, STRATEGY_SECTIONS
 
-__all__ = ["AIStrategyGenerator", "StrategyGenerationConfig"] 
\ No newline at end of file
+__all__ = ["AIStrategyGenerator", "StrategyGenerationConfig", "STRATEGY_SECTIONS"] 
\ No newline at end of file
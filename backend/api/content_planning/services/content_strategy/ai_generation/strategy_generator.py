@@ -3,9 +3,12 @@ AI-Powered Strategy Generation Service
 Generates comprehensive content strategies using AI with enhanced insights and recommendations.
 """
 
+import asyncio
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -14,6 +17,20 @@ from ..autofill.ai_structured_autofill import AIStructuredAutofillService
 
 logger = logging.getLogger(__name__)
 
+# Strategy sections generated concurrently at most this many at a time
+AI_STRATEGY_MAX_PARALLEL_SECTIONS = int(os.getenv('AI_STRATEGY_MAX_PARALLEL_SECTIONS', '5'))
+
+# Sections that depend only on the base strategy and context, in output order
+STRATEGY_SECTIONS = [
+    "strategic_insights",
+    "competitive_analysis",
+    "performance_predictions",
+    "implementation_roadmap",
+    "risk_assessment",
+]
+
+SectionCallback = Callable[[str, Dict[str, Any]], Union[None, Awaitable[None]]]
+
 @dataclass
 class StrategyGenerationConfig:
     """Configuration for strategy generation."""
@@ -24,6 +41,7 @@ class StrategyGenerationConfig:
     include_risk_assessment: bool = True
     max_content_pieces: int = 50
     timeline_months: int = 12
+    max_parallel_sections: int = AI_STRATEGY_MAX_PARALLEL_SECTIONS
 
 class AIStrategyGenerator:
     """
@@ -68,36 +86,20 @@ class AIStrategyGenerator:
         try:
             self.logger.info(f"🚀 Generating comprehensive AI strategy for user: {user_id}")
             
-            # Track which components failed during generation
-            failed_components = []
-            
             # Step 1: Generate base strategy fields (using existing autofill system)
             base_strategy = await self._generate_base_strategy_fields(user_id, context)
             
-            # Step 2: Generate strategic insights and recommendations
-            strategic_insights = await self._generate_strategic_insights(base_strategy, context)
-            if strategic_insights.get("ai_generation_failed"):
-                failed_components.append("strategic_insights")
-            
-            # Step 3: Generate competitive analysis
-            competitive_analysis = await self._generate_competitive_analysis(base_strategy, context)
-            if competitive_analysis.get("ai_generation_failed"):
-                failed_components.append("competitive_analysis")
-            
-            # Step 4: Generate performance predictions
-            performance_predictions = await self._generate_performance_predictions(base_strategy, context)
-            if performance_predictions.get("ai_generation_failed"):
-                failed_components.append("performance_predictions")
-            
-            # Step 5: Generate implementation roadmap
-            implementation_roadmap = await self._generate_implementation_roadmap(base_strategy, context)
-            if implementation_roadmap.get("ai_generation_failed"):
-                failed_components.append("implementation_roadmap")
-            
-            # Step 6: Generate risk assessment
-            risk_assessment = await self._generate_risk_assessment(base_strategy, context)
-            if risk_assessment.get("ai_generation_failed"):
-                failed_components.append("risk_assessment")
+            # Steps 2-6: Generate insights, competitive analysis, predictions, roadmap
+            # and risk assessment concurrently (each only needs the base strategy)
+            sections = await self.generate_strategy_sections(base_strategy, context)
+            failed_components = [
+                name for name in STRATEGY_SECTIONS if sections[name].get("ai_generation_failed")
+            ]
+            strategic_insights = sections["strategic_insights"]
+            competitive_analysis = sections["competitive_analysis"]
+            performance_predictions = sections["performance_predictions"]
+            implementation_roadmap = sections["implementation_roadmap"]
+            risk_assessment = sections["risk_assessment"]
             
             # Step 7: Compile comprehensive strategy (NO CONTENT CALENDAR)
             comprehensive_strategy = {
@@ -140,6 +142,49 @@ class AIStrategyGenerator:
             self.logger.error(f"❌ Error generating comprehensive strategy: {str(e)}")
             raise RuntimeError(f"Failed to generate comprehensive strategy: {str(e)}")
 
+    async def generate_strategy_sections(
+        self,
+        base_strategy: Dict[str, Any],
+        context: Dict[str, Any],
+        on_section_complete: Optional[SectionCallback] = None,
+        max_parallel: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate the independent strategy sections concurrently.
+        
+        At most ``max_parallel`` (default: config.max_parallel_sections) AI
+        calls run at once. ``on_section_complete(name, result)`` (sync or
+        async) is called as soon as each section lands, in completion order.
+        
+        Returns:
+            Section results keyed by name, in STRATEGY_SECTIONS order
+        """
+        limit = max(1, max_parallel or self.config.max_parallel_sections)
+        semaphore = asyncio.Semaphore(limit)
+        generators = {
+            "strategic_insights": self._generate_strategic_insights,
+            "competitive_analysis": self._generate_competitive_analysis,
+            "performance_predictions": self._generate_performance_predictions,
+            "implementation_roadmap": self._generate_implementation_roadmap,
+            "risk_assessment": self._generate_risk_assessment,
+        }
+        
+        async def run_section(name: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await generators[name](base_strategy, context)
+            if on_section_complete is not None:
+                try:
+                    published = on_section_complete(name, result)
+                    if inspect.isawaitable(published):
+                        await published
+                except Exception as e:
+                    self.logger.warning(f"⚠️ Section callback failed for {name}: {str(e)}")
+            return result
+        
+        self.logger.info(f"⚡ Generating {len(STRATEGY_SECTIONS)} strategy sections (max {limit} in parallel)")
+        results = await asyncio.gather(*(run_section(name) for name in STRATEGY_SECTIONS))
+        return dict(zip(STRATEGY_SECTIONS, results))
+
     async def _generate_base_strategy_fields(
         self, 
         user_id: int, 
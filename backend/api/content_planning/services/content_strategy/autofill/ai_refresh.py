@@ -79,7 +79,7 @@ class AutoFillRefreshService:
         if use_ai:
             logger.info("AutoFillRefreshService: FORCING AI-only generation for refresh to ensure real AI values")
             try:
-                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context)
+                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context, force_refresh=True)
                 meta = ai_payload.get('meta') or {}
                 logger.info("AI-only payload meta: ai_used=%s overrides=%s", meta.get('ai_used'), meta.get('ai_overrides_count'))
                 
@@ -189,7 +189,7 @@ class AutoFillRefreshService:
                 await yield_callback(self.transparency.generate_phase_message('autofill_field_generation'))
             
             try:
-                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context)
+                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context, force_refresh=True)
                 meta = ai_payload.get('meta') or {}
                 
                 # 🚨 VALIDATION: Ensure we have real AI-generated data
@@ -258,7 +258,7 @@ class AutoFillRefreshService:
                 await yield_callback(self.transparency.generate_phase_message('autofill_field_generation'))
             
             try:
-                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context)
+                ai_payload = await self.structured_ai.generate_autofill_fields(user_id, base_context, force_refresh=True)
                 meta = ai_payload.get('meta') or {}
                 
                 # 🚨 VALIDATION: Ensure we have real AI-generated data
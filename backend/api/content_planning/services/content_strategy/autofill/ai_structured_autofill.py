@@ -1,7 +1,8 @@
 import json
+import asyncio
 import logging
 import traceback
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from services.ai_service_manager import AIServiceManager, AIServiceType
@@ -49,12 +50,64 @@ SELECT_FIELD_OPTIONS = {
     'brand_voice': ['Professional', 'Casual', 'Friendly', 'Authoritative', 'Innovative']
 }
 
+# Simplified field definitions - avoid complex constraints that cause 400 errors
+FIELD_DEFINITIONS = {
+    # Core business fields (simplified)
+    'business_objectives': {"type": "STRING", "description": "Business goals and objectives"},
+    'target_metrics': {"type": "STRING", "description": "KPIs and success metrics"},
+    'content_budget': {"type": "NUMBER", "description": "Monthly content budget in dollars"},
+    'team_size': {"type": "NUMBER", "description": "Number of people in content team"},
+    'implementation_timeline': {"type": "STRING", "description": "Strategy implementation timeline"},
+    'market_share': {"type": "STRING", "description": "Current market share percentage"},
+    'competitive_position': {"type": "STRING", "description": "Market competitive position"},
+    'performance_metrics': {"type": "STRING", "description": "Current performance data"},
+    
+    # Audience fields (simplified)
+    'content_preferences': {"type": "STRING", "description": "Content format and topic preferences"},
+    'consumption_patterns': {"type": "STRING", "description": "When and how audience consumes content"},
+    'audience_pain_points': {"type": "STRING", "description": "Key audience challenges and pain points"},
+    'buying_journey': {"type": "STRING", "description": "Customer journey stages and touchpoints"},
+    'seasonal_trends': {"type": "STRING", "description": "Seasonal content patterns and trends"},
+    'engagement_metrics': {"type": "STRING", "description": "Current engagement data and metrics"},
+    
+    # Competitive fields (simplified)
+    'top_competitors': {"type": "STRING", "description": "Main competitors"},
+    'competitor_content_strategies': {"type": "STRING", "description": "Analysis of competitor content approaches"},
+    'market_gaps': {"type": "STRING", "description": "Market opportunities and gaps"},
+    'industry_trends': {"type": "STRING", "description": "Current industry trends"},
+    'emerging_trends': {"type": "STRING", "description": "Upcoming trends and opportunities"},
+    
+    # Content strategy fields (simplified)
+    'preferred_formats': {"type": "STRING", "description": "Preferred content formats"},
+    'content_mix': {"type": "STRING", "description": "Content mix distribution"},
+    'content_frequency': {"type": "STRING", "description": "Content publishing frequency"},
+    'optimal_timing': {"type": "STRING", "description": "Best times for publishing content"},
+    'quality_metrics': {"type": "STRING", "description": "Content quality standards and metrics"},
+    'editorial_guidelines': {"type": "STRING", "description": "Style and tone guidelines"},
+    'brand_voice': {"type": "STRING", "description": "Brand voice and tone"},
+    
+    # Performance fields (simplified)
+    'traffic_sources': {"type": "STRING", "description": "Primary traffic sources"},
+    'conversion_rates': {"type": "STRING", "description": "Target conversion rates and metrics"},
+    'content_roi_targets': {"type": "STRING", "description": "ROI goals and targets for content"},
+    'ab_testing_capabilities': {"type": "BOOLEAN", "description": "Whether A/B testing capabilities are available"}
+}
+
+# Independent field groups; repairs request each group separately and concurrently
+FIELD_GROUPS = {
+    'business_context': ['business_objectives', 'target_metrics', 'content_budget', 'team_size', 'implementation_timeline', 'market_share', 'competitive_position', 'performance_metrics'],
+    'audience_intelligence': ['content_preferences', 'consumption_patterns', 'audience_pain_points', 'buying_journey', 'seasonal_trends', 'engagement_metrics'],
+    'competitive_intelligence': ['top_competitors', 'competitor_content_strategies', 'market_gaps', 'industry_trends', 'emerging_trends'],
+    'content_strategy': ['preferred_formats', 'content_mix', 'content_frequency', 'optimal_timing', 'quality_metrics', 'editorial_guidelines', 'brand_voice'],
+    'performance_analytics': ['traffic_sources', 'conversion_rates', 'content_roi_targets', 'ab_testing_capabilities']
+}
+
 class AIStructuredAutofillService:
     """Generate the complete Strategy Builder fields strictly from AI using onboarding context only."""
 
     def __init__(self) -> None:
         self.ai = AIServiceManager()
-        self.max_retries = 2  # Maximum retry attempts for malformed JSON
+        self.max_retries = 2  # Retries for failed calls / repair rounds for missing fields
 
     def _build_context_summary(self, context: Dict[str, Any]) -> Dict[str, Any]:
         website = context.get('website_analysis') or {}
@@ -159,58 +212,17 @@ class AIStructuredAutofillService:
         
         return list(set(services))  # Remove duplicates
 
-    def _build_schema(self) -> Dict[str, Any]:
+    def _build_schema(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Build the response schema for ``fields`` (all core fields by default)."""
         # Simplified schema following Gemini best practices
         # Reduce complexity by flattening nested structures and simplifying constraints
+        field_ids = list(fields) if fields else CORE_FIELDS
         properties: Dict[str, Any] = {}
         
-        # Simplified field definitions - avoid complex constraints that cause 400 errors
-        field_definitions = {
-            # Core business fields (simplified)
-            'business_objectives': {"type": "STRING", "description": "Business goals and objectives"},
-            'target_metrics': {"type": "STRING", "description": "KPIs and success metrics"},
-            'content_budget': {"type": "NUMBER", "description": "Monthly content budget in dollars"},
-            'team_size': {"type": "NUMBER", "description": "Number of people in content team"},
-            'implementation_timeline': {"type": "STRING", "description": "Strategy implementation timeline"},
-            'market_share': {"type": "STRING", "description": "Current market share percentage"},
-            'competitive_position': {"type": "STRING", "description": "Market competitive position"},
-            'performance_metrics': {"type": "STRING", "description": "Current performance data"},
-            
-            # Audience fields (simplified)
-            'content_preferences': {"type": "STRING", "description": "Content format and topic preferences"},
-            'consumption_patterns': {"type": "STRING", "description": "When and how audience consumes content"},
-            'audience_pain_points': {"type": "STRING", "description": "Key audience challenges and pain points"},
-            'buying_journey': {"type": "STRING", "description": "Customer journey stages and touchpoints"},
-            'seasonal_trends': {"type": "STRING", "description": "Seasonal content patterns and trends"},
-            'engagement_metrics': {"type": "STRING", "description": "Current engagement data and metrics"},
-            
-            # Competitive fields (simplified)
-            'top_competitors': {"type": "STRING", "description": "Main competitors"},
-            'competitor_content_strategies': {"type": "STRING", "description": "Analysis of competitor content approaches"},
-            'market_gaps': {"type": "STRING", "description": "Market opportunities and gaps"},
-            'industry_trends': {"type": "STRING", "description": "Current industry trends"},
-            'emerging_trends': {"type": "STRING", "description": "Upcoming trends and opportunities"},
-            
-            # Content strategy fields (simplified)
-            'preferred_formats': {"type": "STRING", "description": "Preferred content formats"},
-            'content_mix': {"type": "STRING", "description": "Content mix distribution"},
-            'content_frequency': {"type": "STRING", "description": "Content publishing frequency"},
-            'optimal_timing': {"type": "STRING", "description": "Best times for publishing content"},
-            'quality_metrics': {"type": "STRING", "description": "Content quality standards and metrics"},
-            'editorial_guidelines': {"type": "STRING", "description": "Style and tone guidelines"},
-            'brand_voice': {"type": "STRING", "description": "Brand voice and tone"},
-            
-            # Performance fields (simplified)
-            'traffic_sources': {"type": "STRING", "description": "Primary traffic sources"},
-            'conversion_rates': {"type": "STRING", "description": "Target conversion rates and metrics"},
-            'content_roi_targets': {"type": "STRING", "description": "ROI goals and targets for content"},
-            'ab_testing_capabilities': {"type": "BOOLEAN", "description": "Whether A/B testing capabilities are available"}
-        }
-        
         # Build properties from field definitions
-        for field_id in CORE_FIELDS:
-            if field_id in field_definitions:
-                properties[field_id] = field_definitions[field_id]
+        for field_id in field_ids:
+            if field_id in FIELD_DEFINITIONS:
+                properties[field_id] = FIELD_DEFINITIONS[field_id]
             else:
                 # Fallback for any missing fields
                 properties[field_id] = {"type": "STRING", "description": f"Value for {field_id}"}
@@ -219,16 +231,16 @@ class AIStructuredAutofillService:
         schema = {
             "type": "OBJECT",
             "properties": properties,
-            "required": CORE_FIELDS,  # Make all fields required
-            "propertyOrdering": CORE_FIELDS,  # Critical for consistent JSON output
+            "required": field_ids,  # Make all fields required
+            "propertyOrdering": field_ids,  # Critical for consistent JSON output
             "description": "Content strategy fields with simplified constraints"
         }
         
-        logger.debug("AI Structured Autofill: simplified schema built with %d properties and property ordering", len(CORE_FIELDS))
+        logger.debug("AI Structured Autofill: simplified schema built with %d properties and property ordering", len(field_ids))
         return schema
 
-    def _build_prompt(self, context_summary: Dict[str, Any]) -> str:
-        # Build personalized prompt using actual user data
+    def _build_personalization_context(self, context_summary: Dict[str, Any]) -> str:
+        """Describe the user's business, content and audience for the prompts."""
         user_profile = context_summary.get('user_profile', {})
         content_analysis = context_summary.get('content_analysis', {})
         audience_insights = context_summary.get('audience_insights', {})
@@ -236,7 +248,6 @@ class AIStructuredAutofillService:
         research_config = context_summary.get('research_config', {})
         api_capabilities = context_summary.get('api_capabilities', {})
         
-        # Extract specific personalization data
         website_url = user_profile.get('website_url', 'your website')
         writing_tone = content_analysis.get('writing_style', {}).get('tone', 'professional')
         target_demographics = audience_insights.get('demographics', ['professionals'])
@@ -247,7 +258,7 @@ class AIStructuredAutofillService:
         available_services = api_capabilities.get('available_services', [])
         
         # Build personalized context description
-        personalization_context = f"""
+        return f"""
 PERSONALIZED CONTEXT FOR {website_url.upper()}:
 
 🎯 YOUR BUSINESS PROFILE:
@@ -284,6 +295,24 @@ PERSONALIZED CONTEXT FOR {website_url.upper()}:
 - API Providers: {', '.join(api_capabilities.get('providers', [])) if api_capabilities.get('providers') else 'Manual tracking'}
 """
 
+    def _build_prompt(self, context_summary: Dict[str, Any]) -> str:
+        # Build personalized prompt using actual user data
+        user_profile = context_summary.get('user_profile', {})
+        content_analysis = context_summary.get('content_analysis', {})
+        audience_insights = context_summary.get('audience_insights', {})
+        research_config = context_summary.get('research_config', {})
+        
+        # Extract specific personalization data
+        website_url = user_profile.get('website_url', 'your website')
+        writing_tone = content_analysis.get('writing_style', {}).get('tone', 'professional')
+        target_demographics = audience_insights.get('demographics', ['professionals'])
+        industry_focus = audience_insights.get('industry_focus', 'general')
+        expertise_level = audience_insights.get('expertise_level', 'intermediate')
+        primary_content_type = content_analysis.get('content_type', {}).get('primary_type', 'blog')
+        research_depth = research_config.get('research_depth', 'Standard')
+        
+        personalization_context = self._build_personalization_context(context_summary)
+
         # Personalized prompt with specific instructions
         prompt = f"""
 You are a content strategy expert analyzing {website_url}. Based on the detailed analysis of this website and user's onboarding data, generate a personalized content strategy with exactly 30 fields.
@@ -333,6 +362,38 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
         logger.debug("AI Structured Autofill: personalized prompt (%d chars)", len(prompt))
         return prompt
 
+    def _build_repair_prompt(self, context_summary: Dict[str, Any], fields: List[str]) -> str:
+        """Narrowed prompt that asks only for ``fields`` (missing or invalid in an earlier response)."""
+        website_url = context_summary.get('user_profile', {}).get('website_url') or 'your website'
+        personalization_context = self._build_personalization_context(context_summary)
+        
+        field_lines = []
+        for key in fields:
+            definition = FIELD_DEFINITIONS.get(key, {"type": "STRING", "description": f"Value for {key}"})
+            line = f"- {key} ({definition['type']}): {definition['description']}"
+            if key in SELECT_FIELD_OPTIONS:
+                line += f" - one of: {', '.join(SELECT_FIELD_OPTIONS[key])}"
+            elif key in ARRAY_FIELDS:
+                line += " - comma-separated list"
+            field_lines.append(line)
+        field_list = "\n".join(field_lines)
+        
+        prompt = f"""
+You are a content strategy expert analyzing {website_url}. Complete the personalized content strategy by generating ONLY the {len(fields)} fields listed below.
+
+{personalization_context}
+
+IMPORTANT: Make each field specific to {website_url} and the user's actual data. Avoid generic placeholder values.
+
+FIELDS TO GENERATE:
+{field_list}
+
+Generate a JSON object with exactly these {len(fields)} fields:
+"""
+        
+        logger.debug("AI Structured Autofill: repair prompt for %d fields (%d chars)", len(fields), len(prompt))
+        return prompt
+
     def _normalize_value(self, key: str, value: Any) -> Any:
         if value is None:
             return None
@@ -456,39 +517,7 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
         
         return (filled_fields / len(CORE_FIELDS)) * 100
 
-    def _should_retry(self, result: Dict[str, Any], attempt: int) -> bool:
-        """Determine if we should retry based on success rate and attempt count."""
-        if attempt >= self.max_retries:
-            return False
-        
-        # Check if result has error
-        if 'error' in result:
-            logger.info(f"Retry attempt {attempt + 1} due to error: {result.get('error')}")
-            return True
-        
-        # Check success rate - stop immediately if we have 100% success
-        success_rate = self._calculate_success_rate(result)
-        logger.info(f"Success rate: {success_rate:.1f}% (attempt {attempt + 1})")
-        
-        # If we have 100% success, don't retry
-        if success_rate >= 100.0:
-            logger.info(f"Perfect success rate achieved: {success_rate:.1f}% - no retry needed")
-            return False
-        
-        # Retry if success rate is below 80% (more aggressive than 50%)
-        if success_rate < 80.0:
-            logger.info(f"Retry attempt {attempt + 1} due to low success rate: {success_rate:.1f}% (need 80%+)")
-            return True
-        
-        # Also retry if we're missing more than 6 fields (20% of 30 fields)
-        missing_count = len([k for k in CORE_FIELDS if not result.get(k) or result.get(k) == "" or result.get(k) == []])
-        if missing_count > 6:
-            logger.info(f"Retry attempt {attempt + 1} due to too many missing fields: {missing_count} missing (max 6)")
-            return True
-        
-        return False
-
-    async def generate_autofill_fields(self, user_id: int, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_autofill_fields(self, user_id: int, context: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         context_summary = self._build_context_summary(context)
         schema = self._build_schema()
         prompt = self._build_prompt(context_summary)
@@ -508,62 +537,33 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
         logger.info("AIStructuredAutofillService: prompt length=%d chars | user=%s", len(prompt), user_id)
         
         last_result = None
+        attempts = 0
+        # Full generation is only repeated when the call itself fails; incomplete
+        # responses are completed by the field-level repair below
         for attempt in range(self.max_retries + 1):
+            attempts += 1
             try:
                 logger.info(f"AI structured call attempt {attempt + 1}/{self.max_retries + 1} | user=%s", user_id)
                 result = await self.ai.execute_structured_json_call(
                     service_type=AIServiceType.STRATEGIC_INTELLIGENCE,
                     prompt=prompt,
-                    schema=schema
+                    schema=schema,
+                    force_refresh=force_refresh
                 )
-                last_result = result
-                
-                # Log AI response details
                 logger.info(f"AI response received | attempt={attempt + 1} | user=%s", user_id)
-                if isinstance(result, dict):
-                    logger.info(f"  - Response keys: {list(result.keys())}")
-                    logger.info(f"  - Response type: dict with {len(result)} items")
-                    
-                    # Handle wrapped response from AI service manager
-                    if 'data' in result and 'success' in result:
-                        # This is a wrapped response from AI service manager
-                        if result.get('success'):
-                            # Extract the actual AI response from the 'data' field
-                            ai_response = result.get('data', {})
-                            logger.info(f"  - Extracted AI response from wrapped response")
-                            logger.info(f"  - AI response keys: {list(ai_response.keys()) if isinstance(ai_response, dict) else 'N/A'}")
-                            last_result = ai_response
-                        else:
-                            # AI service failed
-                            error_msg = result.get('error', 'Unknown AI service error')
-                            logger.error(f"  - AI service failed: {error_msg}")
-                            last_result = {'error': error_msg}
-                    elif 'error' in result:
-                        logger.error(f"  - AI returned error: {result['error']}")
-                else:
-                    logger.warning(f"  - Response type: {type(result)}")
-                
-                # Check if we should retry
-                if not self._should_retry(last_result, attempt):
-                    logger.info(f"Retry not needed | attempt={attempt + 1} | user=%s", user_id)
-                    break
-                    
-                # Add a small delay before retry
-                if attempt < self.max_retries:
-                    import asyncio
-                    await asyncio.sleep(1)
-                    
+                last_result = self._unwrap_ai_response(result)
             except Exception as e:
                 logger.error(f"AI structured call failed (attempt {attempt + 1}) | user=%s | err=%s", user_id, repr(e))
                 logger.error("Traceback:\n%s", traceback.format_exc())
                 last_result = {
                     'error': str(e)
                 }
-                if attempt < self.max_retries:
-                    import asyncio
-                    await asyncio.sleep(1)
-                    continue
+
+            if isinstance(last_result, dict) and 'error' not in last_result:
                 break
+            if attempt < self.max_retries:
+                logger.info(f"Retry attempt {attempt + 1} due to error: {last_result.get('error') if isinstance(last_result, dict) else type(last_result)}")
+                await asyncio.sleep(1)
 
         # Process the final result
         if not isinstance(last_result, dict):
@@ -576,7 +576,7 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
                     'ai_overrides_count': 0,
                     'missing_fields': CORE_FIELDS,
                     'error': f"AI returned {type(last_result)} instead of dict",
-                    'attempts': self.max_retries + 1
+                    'attempts': attempts
                 }
             }
 
@@ -591,7 +591,7 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
                     'ai_overrides_count': 0,
                     'missing_fields': CORE_FIELDS,
                     'error': last_result.get('error', 'Unknown AI error'),
-                    'attempts': self.max_retries + 1
+                    'attempts': attempts
                 }
             }
 
@@ -609,6 +609,21 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
         except Exception:
             pass
 
+        # Re-request only the fields that are still missing or invalid
+        repaired_fields: List[str] = []
+        repair_rounds = 0
+        for repair_round in range(self.max_retries):
+            missing = self._missing_fields(last_result)
+            if not missing:
+                break
+            repair_rounds += 1
+            logger.info(f"Repair round {repair_round + 1}/{self.max_retries}: {len(missing)} missing fields | user=%s", user_id)
+            # Later rounds repeat identical narrowed prompts, so bypass the response cache
+            repaired = await self._repair_fields(missing, context_summary, force_refresh=force_refresh or repair_round > 0)
+            last_result = {**last_result, **repaired}
+            repaired_fields.extend(repaired)
+        attempts += repair_rounds
+
         # Build UI fields map using only non-null normalized values
         fields: Dict[str, Any] = {}
         sources: Dict[str, str] = {}
@@ -638,23 +653,14 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
         logger.info("✅ Generated fields (%d): %s", len(non_null_keys), non_null_keys)
         logger.info("❌ Missing fields (%d): %s", len(missing_fields), missing_fields)
         
-        # Categorize missing fields
-        field_categories = {
-            'business_context': ['business_objectives', 'target_metrics', 'content_budget', 'team_size', 'implementation_timeline', 'market_share', 'competitive_position', 'performance_metrics'],
-            'audience_intelligence': ['content_preferences', 'consumption_patterns', 'audience_pain_points', 'buying_journey', 'seasonal_trends', 'engagement_metrics'],
-            'competitive_intelligence': ['top_competitors', 'competitor_content_strategies', 'market_gaps', 'industry_trends', 'emerging_trends'],
-            'content_strategy': ['preferred_formats', 'content_mix', 'content_frequency', 'optimal_timing', 'quality_metrics', 'editorial_guidelines', 'brand_voice'],
-            'performance_analytics': ['traffic_sources', 'conversion_rates', 'content_roi_targets', 'ab_testing_capabilities']
-        }
-        
         # Log category-wise success rates
-        for category, category_fields in field_categories.items():
+        for category, category_fields in FIELD_GROUPS.items():
             generated_count = len([f for f in category_fields if f in non_null_keys])
             missing_count = len([f for f in category_fields if f in missing_fields])
             logger.info(f"📊 {category.upper()}: {generated_count}/{len(category_fields)} fields generated ({missing_count} missing: {[f for f in category_fields if f in missing_fields]})")
         
         success_rate = self._calculate_success_rate(last_result)
-        logger.info(f"AI structured autofill completed | non_null_fields={len(non_null_keys)} missing={len(missing_fields)} success_rate={success_rate:.1f}% attempts={self.max_retries + 1}")
+        logger.info(f"AI structured autofill completed | non_null_fields={len(non_null_keys)} missing={len(missing_fields)} success_rate={success_rate:.1f}% attempts={attempts} repaired={len(repaired_fields)}")
 
         return {
             'fields': fields,
@@ -664,7 +670,9 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
                 'ai_overrides_count': len(non_null_keys),
                 'missing_fields': missing_fields,
                 'success_rate': success_rate,
-                'attempts': self.max_retries + 1,
+                'attempts': attempts,
+                'repair_rounds': repair_rounds,
+                'repaired_fields': repaired_fields,
                 'personalization_level': 'high',
                 'data_sources_used': list(set(sources.values())),
                 'website_analyzed': context_summary.get('user_profile', {}).get('website_url'),
@@ -672,6 +680,83 @@ Generate the complete JSON with all 30 fields personalized for {website_url}:
             }
         }
 
+    def _unwrap_ai_response(self, result: Any) -> Any:
+        """Extract the AI payload from an AI service manager response."""
+        if not isinstance(result, dict):
+            logger.warning(f"  - Response type: {type(result)}")
+            return result
+        
+        logger.info(f"  - Response keys: {list(result.keys())}")
+        # Handle wrapped response from AI service manager
+        if 'data' in result and 'success' in result:
+            if result.get('success'):
+                ai_response = result.get('data', {})
+                logger.info(f"  - AI response keys: {list(ai_response.keys()) if isinstance(ai_response, dict) else 'N/A'}")
+                return ai_response
+            error_msg = result.get('error', 'Unknown AI service error')
+            logger.error(f"  - AI service failed: {error_msg}")
+            return {'error': error_msg}
+        if 'error' in result:
+            logger.error(f"  - AI returned error: {result['error']}")
+        return result
+
+    def _missing_fields(self, result: Dict[str, Any]) -> List[str]:
+        """Core fields whose value is absent or does not normalize to a usable value."""
+        missing = []
+        for key in CORE_FIELDS:
+            norm_value = self._normalize_value(key, result.get(key))
+            if norm_value is None or norm_value == "" or norm_value == []:
+                missing.append(key)
+        return missing
+
+    async def _request_fields(self, fields: List[str], context_summary: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
+        """Request a subset of fields with a schema and prompt narrowed to them."""
+        result = await self.ai.execute_structured_json_call(
+            service_type=AIServiceType.STRATEGIC_INTELLIGENCE,
+            prompt=self._build_repair_prompt(context_summary, fields),
+            schema=self._build_schema(fields),
+            force_refresh=force_refresh
+        )
+        result = self._unwrap_ai_response(result)
+        if not isinstance(result, dict):
+            raise ValueError(f"AI returned {type(result)} instead of dict")
+        if 'error' in result:
+            raise ValueError(result['error'])
+        return result
+
+    async def _repair_fields(self, fields: List[str], context_summary: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Re-generate ``fields``, one narrowed request per field group, run concurrently.
+
+        Returns only the values that are now valid, ready to merge into the prior result.
+        """
+        wanted = set(fields)
+        groups = [
+            (category, [key for key in category_fields if key in wanted])
+            for category, category_fields in FIELD_GROUPS.items()
+        ]
+        grouped = {key for _, group_fields in groups for key in group_fields}
+        groups.append(('other', [key for key in fields if key not in grouped]))
+        groups = [(category, group_fields) for category, group_fields in groups if group_fields]
+        
+        results = await asyncio.gather(
+            *(self._request_fields(group_fields, context_summary, force_refresh) for _, group_fields in groups),
+            return_exceptions=True
+        )
+        
+        repaired: Dict[str, Any] = {}
+        for (category, group_fields), result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Repair of {category} fields failed: {result}")
+                continue
+            for key in group_fields:
+                norm_value = self._normalize_value(key, result.get(key))
+                if norm_value is not None and norm_value != "" and norm_value != []:
+                    repaired[key] = result[key]
+        
+        logger.info("Repaired %d/%d fields: %s", len(repaired), len(fields), list(repaired.keys()))
+        return repaired
+
     def _add_personalization_metadata(self, field_key: str, value: Any, context_summary: Dict[str, Any]) -> Dict[str, Any]:
         """Add personalization metadata to explain how the value was personalized."""
         user_profile = context_summary.get('user_profile', {})
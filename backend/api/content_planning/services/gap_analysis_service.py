@@ -57,6 +57,18 @@ class GapAnalysisService:
             logger.error(f"Error creating content gap analysis: {str(e)}")
             raise ContentPlanningErrorHandler.handle_general_error(e, "create_gap_analysis")
     
+    async def get_gap_analyses_version(self, user_id: Optional[int] = None, strategy_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Version of the cached gap analysis served when not refreshing (None if there is none)."""
+        try:
+            return await self.ai_analysis_db_service.get_latest_ai_analysis_version(
+                user_id=user_id or 1,
+                analysis_type="gap_analysis",
+                strategy_id=strategy_id
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not look up gap analysis version: {str(e)}")
+            return None
+    
     async def get_gap_analyses(self, user_id: Optional[int] = None, strategy_id: Optional[int] = None, force_refresh: bool = False) -> Dict[str, Any]:
         """Get content gap analysis with real AI insights - Database first approach."""
         try:
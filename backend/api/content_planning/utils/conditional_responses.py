@@ -0,0 +1,82 @@
+"""
+Conditional Responses for Content Planning API
+ETag / Last-Modified validators for endpoints the frontend polls.
+
+A polled endpoint first looks up a cheap resource version (a projected,
+indexed query on the row's id and ``updated_at``, or an in-memory version
+counter) and builds validators from it. When the client's ``If-None-Match``
+(or ``If-Modified-Since``) still matches, a bodiless 304 is returned without
+loading or serializing the resource.
+"""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+# Browsers revalidate on every poll but may reuse the cached body after a 304
+POLLED_CACHE_CONTROL = "private, no-cache"
+
+
+class ResourceValidators:
+    """ETag and Last-Modified for one version of a resource."""
+
+    def __init__(self, etag: str, last_modified: Optional[datetime] = None):
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def for_version(cls, resource: str, *version: Any, last_modified: Optional[datetime] = None) -> "ResourceValidators":
+        """Build validators from a resource name and the values that identify its version."""
+        fingerprint = "|".join([resource, *(str(part) for part in version)])
+        digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:20]
+        # Weak: the body may differ cosmetically (timestamps) for the same version
+        return cls(f'W/"{digest}"', last_modified)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": POLLED_CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(self.last_modified).replace(microsecond=0), usegmt=True)
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        """
+        Whether the client's cached copy is current.
+
+        If-None-Match takes precedence; If-Modified-Since is only consulted
+        when no entity tag was sent (RFC 9110 section 13.2.2).
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            return _opaque(self.etag) in {_opaque(tag) for tag in if_none_match.split(",") if tag.strip()}
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return _as_utc(self.last_modified).replace(microsecond=0) <= _as_utc(since)
+        return False
+
+    def not_modified_response(self) -> Response:
+        return Response(status_code=304, headers=self.headers())
+
+    def apply(self, response: Response):
+        """Attach the validators to the response FastAPI will send."""
+        response.headers.update(self.headers())
+
+
+def _opaque(tag: str) -> str:
+    # Weak comparison: W/"x" and "x" match
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Model timestamps are naive UTC (datetime.utcnow)
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
@@ -121,7 +121,7 @@ async def generate_facebook_post(request: FacebookPostRequest):
     """Generate a Facebook post with engagement optimization."""
     try:
         logger.info(f"Generating Facebook post for business: {request.business_type}")
-        response = post_service.generate_post(request)
+        response = await post_service.run_async(post_service.generate_post, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -138,7 +138,7 @@ async def generate_facebook_story(request: FacebookStoryRequest):
     """Generate a Facebook story with visual suggestions."""
     try:
         logger.info(f"Generating Facebook story for business: {request.business_type}")
-        response = story_service.generate_story(request)
+        response = await story_service.run_async(story_service.generate_story, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -155,7 +155,7 @@ async def generate_facebook_reel(request: FacebookReelRequest):
     """Generate a Facebook reel script with music suggestions."""
     try:
         logger.info(f"Generating Facebook reel for business: {request.business_type}")
-        response = reel_service.generate_reel(request)
+        response = await reel_service.run_async(reel_service.generate_reel, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -172,7 +172,7 @@ async def generate_facebook_carousel(request: FacebookCarouselRequest):
     """Generate a Facebook carousel post with multiple slides."""
     try:
         logger.info(f"Generating Facebook carousel for business: {request.business_type}")
-        response = carousel_service.generate_carousel(request)
+        response = await carousel_service.run_async(carousel_service.generate_carousel, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -190,7 +190,7 @@ async def generate_facebook_event(request: FacebookEventRequest):
     """Generate a Facebook event description."""
     try:
         logger.info(f"Generating Facebook event: {request.event_name}")
-        response = event_service.generate_event(request)
+        response = await event_service.run_async(event_service.generate_event, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -207,7 +207,7 @@ async def generate_facebook_group_post(request: FacebookGroupPostRequest):
     """Generate a Facebook group post following community guidelines."""
     try:
         logger.info(f"Generating Facebook group post for: {request.group_name}")
-        response = group_post_service.generate_group_post(request)
+        response = await group_post_service.run_async(group_post_service.generate_group_post, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -224,7 +224,7 @@ async def generate_facebook_page_about(request: FacebookPageAboutRequest):
     """Generate a Facebook page about section."""
     try:
         logger.info(f"Generating Facebook page about for: {request.business_name}")
-        response = page_about_service.generate_page_about(request)
+        response = await page_about_service.run_async(page_about_service.generate_page_about, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -242,7 +242,7 @@ async def generate_facebook_ad_copy(request: FacebookAdCopyRequest):
     """Generate Facebook ad copy with targeting suggestions."""
     try:
         logger.info(f"Generating Facebook ad copy for: {request.business_type}")
-        response = ad_copy_service.generate_ad_copy(request)
+        response = await ad_copy_service.generate_ad_copy_async(request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -259,7 +259,7 @@ async def generate_facebook_hashtags(request: FacebookHashtagRequest):
     """Generate relevant hashtags for Facebook content."""
     try:
         logger.info(f"Generating Facebook hashtags for: {request.content_topic}")
-        response = hashtag_service.generate_hashtags(request)
+        response = await hashtag_service.run_async(hashtag_service.generate_hashtags, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
@@ -276,7 +276,7 @@ async def analyze_facebook_engagement(request: FacebookEngagementRequest):
     """Analyze Facebook content for engagement optimization."""
     try:
         logger.info(f"Analyzing Facebook engagement for {request.content_type.value}")
-        response = engagement_service.analyze_engagement(request)
+        response = await engagement_service.run_async(engagement_service.analyze_engagement, request)
         
         if not response.success:
             raise HTTPException(status_code=400, detail=response.error)
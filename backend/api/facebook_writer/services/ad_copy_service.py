@@ -24,10 +24,7 @@ class FacebookAdCopyService(FacebookWriterBaseService):
             FacebookAdCopyResponse with the generated content
         """
         try:
-            # Determine actual values
-            actual_objective = request.custom_objective if request.ad_objective.value == "Custom" else request.ad_objective.value
-            actual_budget = request.custom_budget if request.budget_range.value == "Custom" else request.budget_range.value
-            actual_age = request.targeting_options.custom_age if request.targeting_options.age_group.value == "Custom" else request.targeting_options.age_group.value
+            actual_objective, actual_budget, actual_age = self._resolve_request_values(request)
             
             # Generate primary ad copy
             primary_copy = self._generate_primary_ad_copy(request, actual_objective, actual_age)
@@ -35,32 +32,38 @@ class FacebookAdCopyService(FacebookWriterBaseService):
             # Generate variations for A/B testing
             variations = self._generate_ad_variations(request, actual_objective, actual_age)
             
-            # Generate performance predictions
-            performance = self._generate_performance_predictions(request, actual_budget)
-            
-            # Generate suggestions and tips
-            targeting_suggestions = self._generate_targeting_suggestions(request)
-            creative_suggestions = self._generate_creative_suggestions(request)
-            optimization_tips = self._generate_optimization_tips(request)
-            compliance_notes = self._generate_compliance_notes(request)
-            budget_recommendations = self._generate_budget_recommendations(request, actual_budget)
+            return self._build_ad_copy_response(request, actual_objective, actual_budget, primary_copy, variations)
             
+        except Exception as e:
             return FacebookAdCopyResponse(
-                success=True,
-                primary_ad_copy=primary_copy,
-                ad_variations=variations,
-                targeting_suggestions=targeting_suggestions,
-                creative_suggestions=creative_suggestions,
-                performance_predictions=performance,
-                optimization_tips=optimization_tips,
-                compliance_notes=compliance_notes,
-                budget_recommendations=budget_recommendations,
-                metadata={
-                    "business_type": request.business_type,
-                    "objective": actual_objective,
-                    "format": request.ad_format.value,
-                    "budget": actual_budget
-                }
+                **self._handle_error(e, "Facebook ad copy generation")
+            )
+    
+    async def generate_ad_copy_async(self, request: FacebookAdCopyRequest) -> FacebookAdCopyResponse:
+        """
+        Generate Facebook ad copy with the primary copy and the A/B variations
+        produced concurrently.
+        
+        Args:
+            request: FacebookAdCopyRequest containing all the parameters
+            
+        Returns:
+            FacebookAdCopyResponse with the generated content
+        """
+        try:
+            actual_objective, actual_budget, actual_age = self._resolve_request_values(request)
+            
+            sections = await self._generate_sections(
+                {
+                    "primary_ad_copy": lambda: self._generate_primary_ad_copy(request, actual_objective, actual_age),
+                    "ad_variations": lambda: self._generate_ad_variations(request, actual_objective, actual_age)
+                },
+                fallbacks={"ad_variations": self._create_default_variations}
+            )
+            
+            return self._build_ad_copy_response(
+                request, actual_objective, actual_budget,
+                sections["primary_ad_copy"], sections["ad_variations"]
             )
             
         except Exception as e:
@@ -68,6 +71,50 @@ class FacebookAdCopyService(FacebookWriterBaseService):
                 **self._handle_error(e, "Facebook ad copy generation")
             )
     
+    def _resolve_request_values(self, request: FacebookAdCopyRequest):
+        """Resolve 'Custom' selections to the user-provided values (objective, budget, age group)."""
+        actual_objective = request.custom_objective if request.ad_objective.value == "Custom" else request.ad_objective.value
+        actual_budget = request.custom_budget if request.budget_range.value == "Custom" else request.budget_range.value
+        actual_age = request.targeting_options.custom_age if request.targeting_options.age_group.value == "Custom" else request.targeting_options.age_group.value
+        return actual_objective, actual_budget, actual_age
+    
+    def _build_ad_copy_response(
+        self,
+        request: FacebookAdCopyRequest,
+        actual_objective: str,
+        actual_budget: str,
+        primary_copy: Dict[str, str],
+        variations: AdCopyVariations
+    ) -> FacebookAdCopyResponse:
+        """Merge the generated sections with the rule-based suggestions into the response model."""
+        # Generate performance predictions
+        performance = self._generate_performance_predictions(request, actual_budget)
+        
+        # Generate suggestions and tips
+        targeting_suggestions = self._generate_targeting_suggestions(request)
+        creative_suggestions = self._generate_creative_suggestions(request)
+        optimization_tips = self._generate_optimization_tips(request)
+        compliance_notes = self._generate_compliance_notes(request)
+        budget_recommendations = self._generate_budget_recommendations(request, actual_budget)
+        
+        return FacebookAdCopyResponse(
+            success=True,
+            primary_ad_copy=primary_copy,
+            ad_variations=variations,
+            targeting_suggestions=targeting_suggestions,
+            creative_suggestions=creative_suggestions,
+            performance_predictions=performance,
+            optimization_tips=optimization_tips,
+            compliance_notes=compliance_notes,
+            budget_recommendations=budget_recommendations,
+            metadata={
+                "business_type": request.business_type,
+                "objective": actual_objective,
+                "format": request.ad_format.value,
+                "budget": actual_budget
+            }
+        )
+    
     def _generate_primary_ad_copy(self, request: FacebookAdCopyRequest, objective: str, age_group: str) -> Dict[str, str]:
         """Generate the primary ad copy."""
         prompt = f"""
@@ -2,8 +2,9 @@
 
 import os
 import sys
+import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from loguru import logger
 
 # Add the backend path to sys.path to import services
@@ -12,6 +13,9 @@ sys.path.append(str(backend_path))
 
 from services.llm_providers.gemini_provider import gemini_text_response, gemini_structured_json_response
 
+# Upper bound on sections generated at once by a single fan-out
+FACEBOOK_WRITER_MAX_PARALLEL_SECTIONS = int(os.getenv('FACEBOOK_WRITER_MAX_PARALLEL_SECTIONS', '4'))
+
 
 class FacebookWriterBaseService:
     """Base service class for Facebook Writer functionality."""
@@ -80,6 +84,55 @@ class FacebookWriterBaseService:
             self.logger.error(f"Error generating structured response: {e}")
             raise
     
+    async def _generate_sections(
+        self,
+        sections: Dict[str, Callable[[], Any]],
+        fallbacks: Optional[Dict[str, Callable[[], Any]]] = None,
+        max_parallel: int = FACEBOOK_WRITER_MAX_PARALLEL_SECTIONS
+    ) -> Dict[str, Any]:
+        """
+        Generate independent sections concurrently.
+        
+        Each section is a zero-argument callable (usually a bound ``_generate_*``
+        method wrapped in a lambda) that runs on a worker thread, so the blocking
+        Gemini calls never stall the event loop and the fan-out takes about as
+        long as its slowest section.
+        
+        Args:
+            sections: Mapping of section name to the callable producing it
+            fallbacks: Optional mapping of section name to a callable used when
+                that section raises; sections without a fallback re-raise
+            max_parallel: Maximum number of sections running at once
+            
+        Returns:
+            Mapping of section name to its result
+        """
+        fallbacks = fallbacks or {}
+        semaphore = asyncio.Semaphore(max(1, max_parallel))
+        
+        async def run_section(name: str, func: Callable[[], Any]) -> Any:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(func)
+                except Exception as e:
+                    if name not in fallbacks:
+                        raise
+                    self.logger.warning(f"Section '{name}' failed, using fallback: {e}")
+                    return fallbacks[name]()
+        
+        names = list(sections)
+        results = await asyncio.gather(*(run_section(name, sections[name]) for name in names))
+        return dict(zip(names, results))
+    
+    async def run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a synchronous generation method on a worker thread.
+        
+        Used by async routes for single-call generators so they do not block
+        the event loop.
+        """
+        return await asyncio.to_thread(func, *args, **kwargs)
+    
     def _build_base_prompt(self, business_type: str, target_audience: str, purpose: str) -> str:
         """
         Build a base prompt for Facebook content generation.
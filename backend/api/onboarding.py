@@ -281,6 +281,9 @@ async def save_api_key(request: APIKeyRequest):
         success = api_manager.save_api_key(request.provider, request.api_key)
         
         if success:
+            # Refresh the cached keys/clients used by LLM generation
+            from services.llm_providers.llm_gateway import get_llm_gateway
+            get_llm_gateway().reload_keys()
             return {
                 "message": f"API key for {request.provider} saved successfully",
                 "provider": request.provider,
@@ -1,6 +1,7 @@
 """SEO Dashboard API endpoints for ALwrity."""
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import APIRouter, FastAPI, HTTPException, Depends, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -12,13 +13,23 @@ import time
 # Import existing services
 from services.api_key_manager import APIKeyManager
 from services.validation import check_all_api_keys
-from services.seo_analyzer import ComprehensiveSEOAnalyzer, SEOAnalysisResult, SEOAnalysisService
+from services.seo_analyzer import ComprehensiveSEOAnalyzer, SEOAnalysisResult, SEOAnalysisService, BatchSEOAnalyzer
 from services.user_data_service import UserDataService
 from services.database import get_db_session
 
+router = APIRouter(prefix="/api/seo-dashboard", tags=["seo-dashboard"])
+
 # Initialize the SEO analyzer
 seo_analyzer = ComprehensiveSEOAnalyzer()
 
+# Concurrent batch engine sharing the analyzer (and its connection pool)
+batch_seo_analyzer = BatchSEOAnalyzer(seo_analyzer)
+
+
+def shutdown_seo_dashboard():
+    """Stop the batch engine's worker threads (called on app shutdown)."""
+    batch_seo_analyzer.shutdown()
+
 # Pydantic models for SEO Dashboard
 class SEOHealthScore(BaseModel):
     score: int
@@ -511,6 +522,9 @@ async def batch_analyze_urls(urls: List[str]) -> Dict[str, Any]:
     """
     Analyze multiple URLs in batch
     
+    URLs are analyzed concurrently (bounded globally and per host) off the
+    event loop; results are returned in input order.
+    
     Args:
         urls: List of URLs to analyze
         
@@ -520,45 +534,7 @@ async def batch_analyze_urls(urls: List[str]) -> Dict[str, Any]:
     try:
         logger.info(f"Starting batch analysis for {len(urls)} URLs")
         
-        results = []
-        
-        for url in urls:
-            try:
-                # Ensure URL has protocol
-                if not url.startswith(('http://', 'https://')):
-                    url = f"https://{url}"
-                
-                # Perform analysis
-                result = seo_analyzer.analyze_url_progressive(url)
-                
-                # Add to results
-                results.append({
-                    "url": result.url,
-                    "overall_score": result.overall_score,
-                    "health_status": result.health_status,
-                    "critical_issues_count": len(result.critical_issues),
-                    "warnings_count": len(result.warnings),
-                    "success": True
-                })
-                
-            except Exception as e:
-                # Add error result
-                results.append({
-                    "url": url,
-                    "overall_score": 0,
-                    "health_status": "error",
-                    "critical_issues_count": 0,
-                    "warnings_count": 0,
-                    "success": False,
-                    "error": str(e)
-                })
-        
-        batch_result = {
-            "total_urls": len(urls),
-            "successful_analyses": len([r for r in results if r['success']]),
-            "failed_analyses": len([r for r in results if not r['success']]),
-            "results": results
-        }
+        batch_result = await batch_seo_analyzer.analyze(urls)
         
         logger.info(f"Batch analysis completed. Success: {batch_result['successful_analyses']}/{len(urls)}")
         return batch_result
@@ -568,4 +544,102 @@ async def batch_analyze_urls(urls: List[str]) -> Dict[str, Any]:
         raise HTTPException(
             status_code=500,
             detail=f"Error in batch analysis: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+
+def stream_batch_analyze_urls(urls: List[str]) -> StreamingResponse:
+    """
+    Analyze multiple URLs in batch, streaming each result as Server-Sent Events
+    
+    Emits one ``result`` event per URL as soon as it finishes (with its
+    ``index`` in the request), then a ``complete`` event with the totals.
+    
+    Args:
+        urls: List of URLs to analyze
+        
+    Returns:
+        StreamingResponse (text/event-stream)
+    """
+    async def event_stream():
+        logger.info(f"Starting streaming batch analysis for {len(urls)} URLs")
+        successful = 0
+        try:
+            async for summary in batch_seo_analyzer.iter_results(urls):
+                successful += 1 if summary['success'] else 0
+                yield f"data: {json.dumps({'type': 'result', **summary})}\n\n"
+            
+            yield f"data: {json.dumps({'type': 'complete', 'total_urls': len(urls), 'successful_analyses': successful, 'failed_analyses': len(urls) - successful})}\n\n"
+            logger.info(f"Streaming batch analysis completed. Success: {successful}/{len(urls)}")
+        except Exception as e:
+            logger.error(f"Error in streaming batch analysis: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive"
+        }
+    )
+
+# SEO Dashboard endpoints
+@router.get("/data")
+async def seo_dashboard_data():
+    """Get complete SEO dashboard data."""
+    return await get_seo_dashboard_data()
+
+@router.get("/health-score")
+async def seo_health_score():
+    """Get SEO health score."""
+    return await get_seo_health_score()
+
+@router.get("/metrics")
+async def seo_metrics():
+    """Get SEO metrics."""
+    return await get_seo_metrics()
+
+@router.get("/platforms")
+async def seo_platforms():
+    """Get platform status."""
+    return await get_platform_status()
+
+@router.get("/insights")
+async def seo_insights():
+    """Get AI insights."""
+    return await get_ai_insights()
+
+@router.get("/health")
+async def seo_dashboard_health():
+    """Health check for SEO dashboard."""
+    return await seo_dashboard_health_check()
+
+# Comprehensive SEO Analysis endpoints
+@router.post("/analyze-comprehensive")
+async def analyze_seo_comprehensive_endpoint(request: SEOAnalysisRequest):
+    """Analyze a URL for comprehensive SEO performance."""
+    return await analyze_seo_comprehensive(request)
+
+@router.post("/analyze-full")
+async def analyze_seo_full_endpoint(request: SEOAnalysisRequest):
+    """Analyze a URL for comprehensive SEO performance."""
+    return await analyze_seo_full(request)
+
+@router.get("/metrics-detailed")
+async def seo_metrics_detailed(url: str):
+    """Get detailed SEO metrics for a URL."""
+    return await get_seo_metrics_detailed(url)
+
+@router.get("/analysis-summary")
+async def seo_analysis_summary(url: str):
+    """Get a quick summary of SEO analysis for a URL."""
+    return await get_analysis_summary(url)
+
+@router.post("/batch-analyze")
+async def batch_analyze_urls_endpoint(urls: List[str]):
+    """Analyze multiple URLs in batch."""
+    return await batch_analyze_urls(urls)
+
+@router.post("/batch-analyze/stream")
+async def batch_analyze_urls_stream_endpoint(urls: List[str]):
+    """Analyze multiple URLs in batch, streaming results as they finish."""
+    return stream_batch_analyze_urls(urls)
@@ -7,12 +7,13 @@ from fastapi.responses import FileResponse, JSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import os
+import sys
 import time
 from collections import defaultdict
 from loguru import logger
 from dotenv import load_dotenv
 import asyncio
-from middleware.monitoring_middleware import monitoring_middleware
+from middleware.monitoring_middleware import monitoring_middleware, start_request_telemetry, stop_request_telemetry
 
 # Load environment variables
 load_dotenv()
@@ -45,44 +46,13 @@ from api.onboarding import (
     APIKeyRequest
 )
 
-# Import component logic endpoints
-from api.component_logic import router as component_logic_router
-
-# Import SEO tools router
-from routers.seo_tools import router as seo_tools_router
-# Import Facebook Writer endpoints
-from api.facebook_writer.routers import facebook_router
-# Import LinkedIn content generation router
-from routers.linkedin import router as linkedin_router
-# Import LinkedIn image generation router
-from api.linkedin_image_generation import router as linkedin_image_router
-
-# Import user data endpoints
-# Import content planning endpoints
-from api.content_planning.api.router import router as content_planning_router
-from api.user_data import router as user_data_router
-
-# Import strategy copilot endpoints
-from api.content_planning.strategy_copilot import router as strategy_copilot_router
+# Routers are mounted lazily: each is imported on its first request (see services/lazy_routers.py)
+from services.lazy_routers import mount_router, warm_up, WARM_UP_ROUTERS
 
 # Import database service
 from services.database import init_database, close_database
 
-# Import SEO Dashboard endpoints
-from api.seo_dashboard import (
-    get_seo_dashboard_data,
-    get_seo_health_score,
-    get_seo_metrics,
-    get_platform_status,
-    get_ai_insights,
-    seo_dashboard_health_check,
-    analyze_seo_comprehensive,
-    analyze_seo_full,
-    get_seo_metrics_detailed,
-    get_analysis_summary,
-    batch_analyze_urls,
-    SEOAnalysisRequest
-)
+from services.http_client_registry import get_http_client_registry
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -368,84 +338,22 @@ async def research_preferences_data():
         logger.error(f"Error in research_preferences_data: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-# Include component logic router
-app.include_router(component_logic_router)
-
-# Include SEO tools router
-app.include_router(seo_tools_router)
-# Include Facebook Writer router
-app.include_router(facebook_router)
-# Include LinkedIn content generation router
-app.include_router(linkedin_router)
-# Include LinkedIn image generation router
-app.include_router(linkedin_image_router)
-
-# Include user data router
-# Include content planning router
-app.include_router(content_planning_router)
-app.include_router(user_data_router)
-app.include_router(strategy_copilot_router)
-
-# Include persona router
-from api.persona_routes import router as persona_router
-app.include_router(persona_router)
-
-# SEO Dashboard endpoints
-@app.get("/api/seo-dashboard/data")
-async def seo_dashboard_data():
-    """Get complete SEO dashboard data."""
-    return await get_seo_dashboard_data()
-
-@app.get("/api/seo-dashboard/health-score")
-async def seo_health_score():
-    """Get SEO health score."""
-    return await get_seo_health_score()
-
-@app.get("/api/seo-dashboard/metrics")
-async def seo_metrics():
-    """Get SEO metrics."""
-    return await get_seo_metrics()
-
-@app.get("/api/seo-dashboard/platforms")
-async def seo_platforms():
-    """Get platform status."""
-    return await get_platform_status()
-
-@app.get("/api/seo-dashboard/insights")
-async def seo_insights():
-    """Get AI insights."""
-    return await get_ai_insights()
-
-@app.get("/api/seo-dashboard/health")
-async def seo_dashboard_health():
-    """Health check for SEO dashboard."""
-    return await seo_dashboard_health_check()
-
-# Comprehensive SEO Analysis endpoints
-@app.post("/api/seo-dashboard/analyze-comprehensive")
-async def analyze_seo_comprehensive_endpoint(request: SEOAnalysisRequest):
-    """Analyze a URL for comprehensive SEO performance."""
-    return await analyze_seo_comprehensive(request)
-
-@app.post("/api/seo-dashboard/analyze-full")
-async def analyze_seo_full_endpoint(request: SEOAnalysisRequest):
-    """Analyze a URL for comprehensive SEO performance."""
-    return await analyze_seo_full(request)
-
-@app.get("/api/seo-dashboard/metrics-detailed")
-async def seo_metrics_detailed(url: str):
-    """Get detailed SEO metrics for a URL."""
-    return await get_seo_metrics_detailed(url)
-
-@app.get("/api/seo-dashboard/analysis-summary")
-async def seo_analysis_summary(url: str):
-    """Get a quick summary of SEO analysis for a URL."""
-    return await get_analysis_summary(url)
-
-@app.post("/api/seo-dashboard/batch-analyze")
-async def batch_analyze_urls_endpoint(urls: list[str]):
-    """Analyze multiple URLs in batch."""
-    return await batch_analyze_urls(urls)
+# Router table: import path and the path prefixes it serves, in routing order
+ROUTERS = [
+    ("api.component_logic:router", ["/api/onboarding"]),
+    ("routers.seo_tools:router", ["/api/seo"]),
+    ("api.facebook_writer.routers:facebook_router", ["/api/facebook-writer"]),
+    ("routers.linkedin:router", ["/api/linkedin"]),
+    ("api.linkedin_image_generation:router", ["/api/linkedin"]),
+    ("api.content_planning.api.router:router", ["/api/content-planning"]),
+    ("api.user_data:router", ["/api/user-data"]),
+    ("api.content_planning.strategy_copilot:router", ["/api/content-planning/strategy"]),
+    ("api.persona_routes:router", ["/api/personas"]),
+    ("api.seo_dashboard:router", ["/api/seo-dashboard"]),
+]
+
+for router_target, router_prefixes in ROUTERS:
+    mount_router(app, router_target, router_prefixes)
 
 # Serve React frontend (for production)
 @app.get("/")
@@ -475,6 +383,15 @@ try:
 except Exception as e:
     logger.info(f"Could not mount static files: {e}")
 
+async def warm_up_backend():
+    """Load every lazily mounted router and resolve LLM provider keys in the background."""
+    try:
+        await warm_up(app)
+        from services.llm_providers.llm_gateway import get_llm_gateway
+        await asyncio.to_thread(get_llm_gateway().reload_keys)
+    except Exception as e:
+        logger.error(f"Error during warm-up: {e}")
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -482,6 +399,11 @@ async def startup_event():
     try:
         # Initialize database
         init_database()
+        # Background writer for API request telemetry
+        await start_request_telemetry()
+        # Optionally import routers and resolve LLM keys now instead of on first use
+        if WARM_UP_ROUTERS:
+            app.state.warm_up_task = asyncio.create_task(warm_up_backend())
         logger.info("ALwrity backend started successfully")
     except Exception as e:
         logger.error(f"Error during startup: {e}")
@@ -491,8 +413,24 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown."""
     try:
+        # Write out buffered request telemetry before closing the database
+        await stop_request_telemetry()
+        # Write out queued SEO tool JSONL logs (loaded with the SEO tools router)
+        logging_middleware_module = sys.modules.get("middleware.logging_middleware")
+        if logging_middleware_module is not None:
+            await logging_middleware_module.stop_log_writer()
+        # Stop the SEO batch engine's worker threads (only if the dashboard was loaded)
+        seo_dashboard_module = sys.modules.get("api.seo_dashboard")
+        if seo_dashboard_module is not None:
+            seo_dashboard_module.shutdown_seo_dashboard()
         # Close database connections
         close_database()
+        # The LLM gateway is only imported once something used it
+        llm_gateway_module = sys.modules.get("services.llm_providers.llm_gateway")
+        if llm_gateway_module is not None:
+            await llm_gateway_module.get_llm_gateway().aclose()
+        # Release pooled outbound HTTP connections
+        await get_http_client_registry().close()
         logger.info("ALwrity backend shutdown successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {e}") 
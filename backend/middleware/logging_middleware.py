@@ -3,19 +3,29 @@ Intelligent Logging Middleware for AI SEO Tools
 
 Provides structured logging, file saving, and monitoring capabilities
 for all SEO tool operations with performance tracking.
+
+JSONL records are queued in memory and appended by a background writer in
+per-file batches, so log I/O never runs on the request path. Files are
+rotated by size and age, and rotated segments can be gzip-compressed.
 """
 
 import json
+import gzip
+import shutil
+import atexit
 import asyncio
+import threading
 import aiofiles
 from datetime import datetime
 from functools import wraps
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List, Tuple
 from pathlib import Path
 from loguru import logger
 import os
 import time
 
+from middleware.write_behind_buffer import WriteBehindBuffer
+
 # Logging configuration
 LOG_BASE_DIR = "/workspace/backend/logs"
 os.makedirs(LOG_BASE_DIR, exist_ok=True)
@@ -49,28 +59,122 @@ class PerformanceLogger:
 
 performance_logger = PerformanceLogger()
 
+# Buffered JSONL writer configuration
+LOG_BUFFER_SIZE = int(os.getenv('LOG_BUFFER_SIZE', '10000'))
+LOG_FLUSH_BATCH_SIZE = int(os.getenv('LOG_FLUSH_BATCH_SIZE', '1000'))
+LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv('LOG_FLUSH_INTERVAL_SECONDS', '2'))
+LOG_ROTATE_MAX_BYTES = int(os.getenv('LOG_ROTATE_MAX_BYTES', str(50 * 1024 * 1024)))
+LOG_ROTATE_INTERVAL_SECONDS = float(os.getenv('LOG_ROTATE_INTERVAL_SECONDS', str(24 * 3600)))
+LOG_COMPRESS_ROTATED = os.getenv('LOG_COMPRESS_ROTATED', 'true').lower() == 'true'
+
+
+class JSONLLogWriter(WriteBehindBuffer):
+    """
+    Bounded queue of JSONL records with a background writer.
+    
+    ``write()`` serializes the record and appends it to memory. The writer
+    groups queued lines by file and appends each group with a single open
+    and write, every ``flush_interval`` seconds or as soon as ``batch_size``
+    lines are waiting. Before appending, a file that has reached
+    ``max_bytes`` or is older than ``rotate_interval`` seconds is renamed to
+    a timestamped segment (gzip-compressed when ``compress`` is set). When
+    the queue is full the oldest record is dropped and counted.
+    """
+    
+    name = "JSONL log queue"
+    pending_stats_key = "queued"
+    
+    def __init__(self, max_size: int = LOG_BUFFER_SIZE,
+                 batch_size: int = LOG_FLUSH_BATCH_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+                 max_bytes: int = LOG_ROTATE_MAX_BYTES,
+                 rotate_interval: float = LOG_ROTATE_INTERVAL_SECONDS,
+                 compress: bool = LOG_COMPRESS_ROTATED):
+        super().__init__(max_size, batch_size, flush_interval)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.compress = compress
+        # Serializes file writes between the flusher thread and atexit/shutdown drains
+        self._write_lock = threading.Lock()
+        self._segment_started: Dict[str, float] = {}
+        self.stats.update({'written': 0, 'rotations': 0})
+    
+    def write(self, filepath: str, data: Dict[str, Any]):
+        """Queue one record for ``filepath`` (no file I/O on the caller's path)."""
+        self._append((filepath, json.dumps(data, default=str) + "\n"))
+    
+    def _write_batch(self, batch: List[Tuple[str, str]]):
+        """Append each file's lines with one open/write, rotating first when due."""
+        lines_by_file: Dict[str, List[str]] = {}
+        for filepath, line in batch:
+            lines_by_file.setdefault(filepath, []).append(line)
+        
+        with self._write_lock:
+            for filepath, lines in lines_by_file.items():
+                try:
+                    Path(filepath).parent.mkdir(parents=True, exist_ok=True)
+                    self._rotate_if_due(filepath)
+                    with open(filepath, "a", encoding="utf-8") as file:
+                        file.write("".join(lines))
+                    self._count('written', len(lines))
+                except Exception as e:
+                    self._count('write_errors', len(lines))
+                    logger.error(f"Failed to save {len(lines)} log records to {filepath}: {e}")
+    
+    def _rotate_if_due(self, filepath: str):
+        try:
+            file_stat = os.stat(filepath)
+        except FileNotFoundError:
+            self._segment_started[filepath] = time.time()
+            return
+        
+        # A file from a previous run is aged from its last write
+        started = self._segment_started.setdefault(filepath, file_stat.st_mtime)
+        too_big = self.max_bytes > 0 and file_stat.st_size >= self.max_bytes
+        too_old = self.rotate_interval > 0 and time.time() - started >= self.rotate_interval
+        if not (file_stat.st_size and (too_big or too_old)):
+            return
+        
+        path = Path(filepath)
+        rotated = path.with_name(f"{path.stem}.{datetime.utcnow().strftime('%Y%m%d-%H%M%S-%f')}{path.suffix}")
+        os.replace(path, rotated)
+        self._segment_started[filepath] = time.time()
+        self._count('rotations')
+        
+        if self.compress:
+            try:
+                with open(rotated, "rb") as source, gzip.open(f"{rotated}.gz", "wb") as target:
+                    shutil.copyfileobj(source, target)
+                os.remove(rotated)
+            except Exception as e:
+                logger.error(f"Failed to compress rotated log {rotated}: {e}")
+    
+
+# Process-wide JSONL writer shared by all SEO tool loggers
+jsonl_log_writer = JSONLLogWriter()
+atexit.register(jsonl_log_writer.flush_sync)
+
+
 async def save_to_file(filepath: str, data: Dict[str, Any]) -> None:
     """
-    Asynchronously save structured data to a JSONL file
+    Queue structured data for a JSONL file
+    
+    The record is written by the background JSONL writer; see JSONLLogWriter.
     
     Args:
         filepath: Path to the log file
         data: Dictionary data to save
     """
     try:
-        # Ensure directory exists
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Convert data to JSON string
-        json_line = json.dumps(data, default=str) + "\n"
-        
-        # Write asynchronously
-        async with aiofiles.open(filepath, "a", encoding="utf-8") as file:
-            await file.write(json_line)
-            
+        jsonl_log_writer.write(filepath, data)
     except Exception as e:
         logger.error(f"Failed to save log to {filepath}: {e}")
 
+
+async def stop_log_writer():
+    """Flush queued JSONL records and stop the writer (application shutdown)."""
+    await jsonl_log_writer.stop()
+
 def log_api_call(func: Callable) -> Callable:
     """
     Decorator for logging API calls with performance tracking
@@ -1,10 +1,15 @@
 """
 Enhanced FastAPI Monitoring Middleware
 Database-backed monitoring for API calls, errors, and performance metrics.
+
+Requests are recorded into an in-memory buffer on the request path and
+written to the database in batches by a background flusher (write-behind),
+so monitoring never holds a DB transaction open while serving a request.
 """
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
+import os
 import time
 import json
 from datetime import datetime, timedelta
@@ -14,9 +19,119 @@ import asyncio
 from loguru import logger
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
+from sqlalchemy.exc import IntegrityError
 
 from models.api_monitoring import APIRequest, APIEndpointStats, SystemHealth, CachePerformance
-from services.database import get_db
+from services.database import get_db, get_db_session
+from middleware.write_behind_buffer import WriteBehindBuffer
+
+# Write-behind telemetry configuration
+MONITORING_BUFFER_SIZE = int(os.getenv('MONITORING_BUFFER_SIZE', '10000'))
+MONITORING_FLUSH_BATCH_SIZE = int(os.getenv('MONITORING_FLUSH_BATCH_SIZE', '500'))
+MONITORING_FLUSH_INTERVAL_SECONDS = float(os.getenv('MONITORING_FLUSH_INTERVAL_SECONDS', '5'))
+
+
+class RequestTelemetryBuffer(WriteBehindBuffer):
+    """
+    Bounded ring buffer of API request records with a background flusher.
+    
+    ``record()`` only appends to memory. The flusher bulk-inserts
+    ``APIRequest`` rows and upserts aggregated ``APIEndpointStats`` every
+    ``flush_interval`` seconds or as soon as ``batch_size`` records are
+    waiting. When the buffer is full the oldest record is dropped and
+    counted.
+    """
+    
+    name = "API telemetry buffer"
+    
+    def __init__(self, max_size: int = MONITORING_BUFFER_SIZE,
+                 batch_size: int = MONITORING_FLUSH_BATCH_SIZE,
+                 flush_interval: float = MONITORING_FLUSH_INTERVAL_SECONDS):
+        super().__init__(max_size, batch_size, flush_interval)
+        self.stats['flushed'] = 0
+    
+    def record(self, **request_data):
+        """Buffer one request (no I/O on the request path)."""
+        request_data.setdefault('timestamp', datetime.utcnow())
+        self._append(request_data)
+    
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """Bulk-insert request rows and upsert per-endpoint aggregates in one transaction."""
+        aggregates: Dict[str, Dict[str, Any]] = {}
+        for record in batch:
+            endpoint_key = f"{record['method']} {record['path']}"
+            agg = aggregates.setdefault(endpoint_key, {
+                'requests': 0, 'errors': 0, 'duration': 0.0, 'min': None, 'max': None,
+                'last_called': None, 'cache_hits': 0, 'cache_misses': 0
+            })
+            duration = record['duration']
+            agg['requests'] += 1
+            agg['duration'] += duration
+            agg['min'] = duration if agg['min'] is None else min(agg['min'], duration)
+            agg['max'] = duration if agg['max'] is None else max(agg['max'], duration)
+            agg['last_called'] = max(agg['last_called'] or record['timestamp'], record['timestamp'])
+            if record['status_code'] >= 400:
+                agg['errors'] += 1
+            if record.get('cache_hit') is not None:
+                if record['cache_hit']:
+                    agg['cache_hits'] += 1
+                else:
+                    agg['cache_misses'] += 1
+        
+        # A concurrent worker may create the same endpoint row; retry once against it
+        for attempt in range(2):
+            db = get_db_session()
+            if db is None:
+                raise RuntimeError("Database session unavailable")
+            try:
+                db.bulk_insert_mappings(APIRequest, batch)
+                
+                existing = {
+                    stats.endpoint: stats
+                    for stats in db.query(APIEndpointStats).filter(
+                        APIEndpointStats.endpoint.in_(list(aggregates.keys()))
+                    ).all()
+                }
+                for endpoint_key, agg in aggregates.items():
+                    endpoint_stats = existing.get(endpoint_key)
+                    if endpoint_stats is None:
+                        endpoint_stats = APIEndpointStats(endpoint=endpoint_key)
+                        db.add(endpoint_stats)
+                    
+                    endpoint_stats.total_requests = (endpoint_stats.total_requests or 0) + agg['requests']
+                    endpoint_stats.total_duration = (endpoint_stats.total_duration or 0.0) + agg['duration']
+                    endpoint_stats.avg_duration = endpoint_stats.total_duration / endpoint_stats.total_requests
+                    endpoint_stats.total_errors = (endpoint_stats.total_errors or 0) + agg['errors']
+                    if endpoint_stats.last_called is None or agg['last_called'] > endpoint_stats.last_called:
+                        endpoint_stats.last_called = agg['last_called']
+                    if endpoint_stats.min_duration is None or agg['min'] < endpoint_stats.min_duration:
+                        endpoint_stats.min_duration = agg['min']
+                    if endpoint_stats.max_duration is None or agg['max'] > endpoint_stats.max_duration:
+                        endpoint_stats.max_duration = agg['max']
+                    
+                    if agg['cache_hits'] or agg['cache_misses']:
+                        endpoint_stats.cache_hits = (endpoint_stats.cache_hits or 0) + agg['cache_hits']
+                        endpoint_stats.cache_misses = (endpoint_stats.cache_misses or 0) + agg['cache_misses']
+                        total_cache_requests = endpoint_stats.cache_hits + endpoint_stats.cache_misses
+                        endpoint_stats.cache_hit_rate = (endpoint_stats.cache_hits / total_cache_requests) * 100
+                
+                db.commit()
+                self._count('flushed', len(batch))
+                return
+            except IntegrityError:
+                db.rollback()
+                if attempt == 1:
+                    raise
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+
+# Process-wide telemetry buffer shared by all monitors
+request_telemetry = RequestTelemetryBuffer()
+
 
 class DatabaseAPIMonitor:
     """Database-backed API monitoring."""
@@ -28,14 +143,18 @@ class DatabaseAPIMonitor:
             'hit_rate': 0.0
         }
     
-    async def add_request(self, db: Session, path: str, method: str, status_code: int, 
+    async def add_request(self, db: Optional[Session], path: str, method: str, status_code: int, 
                          duration: float, user_id: str = None, cache_hit: bool = None,
                          request_size: int = None, response_size: int = None,
                          user_agent: str = None, ip_address: str = None):
-        """Add a request to database monitoring."""
+        """
+        Add a request to database monitoring.
+        
+        The request is buffered and written by the background flusher; ``db``
+        is no longer used and only kept for existing callers.
+        """
         try:
-            # Store individual request
-            api_request = APIRequest(
+            request_telemetry.record(
                 path=path,
                 method=method,
                 status_code=status_code,
@@ -47,44 +166,6 @@ class DatabaseAPIMonitor:
                 user_agent=user_agent,
                 ip_address=ip_address
             )
-            db.add(api_request)
-            
-            # Update endpoint stats
-            endpoint_key = f"{method} {path}"
-            endpoint_stats = db.query(APIEndpointStats).filter(
-                APIEndpointStats.endpoint == endpoint_key
-            ).first()
-            
-            if not endpoint_stats:
-                endpoint_stats = APIEndpointStats(endpoint=endpoint_key)
-                db.add(endpoint_stats)
-            
-            # Update statistics - handle None values
-            endpoint_stats.total_requests = (endpoint_stats.total_requests or 0) + 1
-            endpoint_stats.total_duration = (endpoint_stats.total_duration or 0.0) + duration
-            endpoint_stats.avg_duration = endpoint_stats.total_duration / endpoint_stats.total_requests
-            endpoint_stats.last_called = datetime.utcnow()
-            
-            if status_code >= 400:
-                endpoint_stats.total_errors = (endpoint_stats.total_errors or 0) + 1
-            
-            if cache_hit is not None:
-                if cache_hit:
-                    endpoint_stats.cache_hits = (endpoint_stats.cache_hits or 0) + 1
-                else:
-                    endpoint_stats.cache_misses = (endpoint_stats.cache_misses or 0) + 1
-                
-                total_cache_requests = endpoint_stats.cache_hits + endpoint_stats.cache_misses
-                if total_cache_requests > 0:
-                    endpoint_stats.cache_hit_rate = (endpoint_stats.cache_hits / total_cache_requests) * 100
-            
-            # Update min/max duration
-            if endpoint_stats.min_duration is None or duration < endpoint_stats.min_duration:
-                endpoint_stats.min_duration = duration
-            if endpoint_stats.max_duration is None or duration > endpoint_stats.max_duration:
-                endpoint_stats.max_duration = duration
-            
-            db.commit()
             
             # Update cache stats
             if cache_hit is not None:
@@ -98,8 +179,7 @@ class DatabaseAPIMonitor:
                     self.cache_stats['hit_rate'] = (self.cache_stats['hits'] / total_cache_requests) * 100
             
         except Exception as e:
-            logger.error(f"❌ Error storing API request: {str(e)}")
-            db.rollback()
+            logger.error(f"❌ Error recording API request: {str(e)}")
     
     async def get_stats(self, db: Session, minutes: int = 5) -> Dict[str, Any]:
         """Get current monitoring statistics from database."""
@@ -149,6 +229,7 @@ class DatabaseAPIMonitor:
                     'recent_errors': recent_errors
                 },
                 'cache_performance': self.cache_stats,
+                'telemetry': request_telemetry.get_stats(),
                 'top_endpoints': [
                     {
                         'endpoint': endpoint.endpoint,
@@ -268,9 +349,6 @@ async def monitoring_middleware(request: Request, call_next):
     except:
         pass
     
-    # Get database session
-    db = next(get_db())
-    
     try:
         response = await call_next(request)
         status_code = response.status_code
@@ -283,9 +361,9 @@ async def monitoring_middleware(request: Request, call_next):
             if cache_header:
                 cache_hit = cache_header.lower() == 'hit'
         
-        # Store in database
+        # Buffer for the background flusher
         await api_monitor.add_request(
-            db=db,
+            db=None,
             path=request.url.path,
             method=request.method,
             status_code=status_code,
@@ -306,9 +384,9 @@ async def monitoring_middleware(request: Request, call_next):
         duration = time.time() - start_time
         status_code = 500
         
-        # Store error in database
+        # Buffer error for the background flusher
         await api_monitor.add_request(
-            db=db,
+            db=None,
             path=request.url.path,
             method=request.method,
             status_code=status_code,
@@ -325,8 +403,6 @@ async def monitoring_middleware(request: Request, call_next):
             status_code=500,
             content={"error": "Internal server error", "monitor_id": int(time.time())}
         )
-    finally:
-        db.close()
 
 async def get_monitoring_stats(minutes: int = 5) -> Dict[str, Any]:
     """Get current monitoring statistics."""
@@ -343,3 +419,11 @@ async def get_lightweight_stats() -> Dict[str, Any]:
         return await api_monitor.get_lightweight_stats(db)
     finally:
         db.close()
+
+async def start_request_telemetry():
+    """Start the background telemetry flusher (application startup)."""
+    request_telemetry.start()
+
+async def stop_request_telemetry():
+    """Flush buffered telemetry and stop the flusher (application shutdown)."""
+    await request_telemetry.stop()
@@ -0,0 +1,172 @@
+"""
+Write-Behind Buffer
+Bounded in-memory ring buffer drained by a background flusher.
+
+Shared by the API request telemetry (database) and the JSONL log writer
+(files): callers append records without doing any I/O, and a flusher task
+on the running event loop writes them out in batches every
+``flush_interval`` seconds or as soon as ``batch_size`` records are
+waiting. When the buffer is full the oldest record is dropped and counted.
+"""
+
+import asyncio
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+
+class WriteBehindBuffer:
+    """
+    Base class for write-behind buffers.
+
+    Subclasses implement ``_write_batch(batch)``, which runs in a worker
+    thread (or on the calling thread from ``flush_sync``) and may raise; a
+    failed batch is counted in ``write_errors``. Counters touched from the
+    writer go through ``_count`` so they are updated under ``_lock``.
+    """
+
+    # Label used in log messages
+    name = "buffer"
+    # Key under which get_stats() reports the number of records waiting
+    pending_stats_key = "buffered"
+
+    def __init__(self, max_size: int, batch_size: int, flush_interval: float):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: deque = deque(maxlen=max_size)
+        self._lock = threading.Lock()
+        # Created on the loop that flushes (buffers are module-level singletons)
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._reported_drops = 0
+        self.stats = {
+            'recorded': 0,
+            'dropped': 0,
+            'flushes': 0,
+            'write_errors': 0,
+            'last_flush': None
+        }
+
+    def _append(self, item: Any):
+        """Buffer one record and wake the flusher once a batch is waiting."""
+        with self._lock:
+            if len(self._buffer) >= self.max_size:
+                self.stats['dropped'] += 1
+            self._buffer.append(item)
+            self.stats['recorded'] += 1
+            pending = len(self._buffer)
+
+        self._ensure_flusher()
+        if pending >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+
+    def _ensure_flusher(self):
+        if self._stopping:
+            return  # stop() drains whatever arrives meanwhile
+        if self._flusher_task is not None and not self._flusher_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (scripts/tests); records are written by flush()/flush_sync()
+        self._wakeup = asyncio.Event()
+        self._flusher_task = loop.create_task(self._run_flusher())
+
+    def start(self):
+        """Start the background flusher on the running event loop."""
+        self._ensure_flusher()
+
+    async def stop(self):
+        """Stop the background flusher and write out everything still buffered."""
+        task = self._flusher_task
+        if task is not None and not task.done():
+            # Ask the flusher to finish its current batch and exit rather than
+            # cancelling it: a batch already taken from the buffer would be lost
+            self._stopping = True
+            self._wakeup.set()
+            try:
+                await task
+            except Exception as e:
+                logger.error(f"Error stopping {self.name} flusher: {e}")
+        self._flusher_task = None
+        try:
+            while await self.flush():
+                pass
+        finally:
+            self._stopping = False
+
+    async def _run_flusher(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            try:
+                while await self.flush() >= self.batch_size and not self._stopping:
+                    pass
+            except Exception as e:
+                logger.error(f"Error flushing {self.name}: {e}")
+
+    async def flush(self) -> int:
+        """Write up to one batch; returns the number of records taken."""
+        async with self._get_flush_lock():
+            batch = self._take_batch()
+            if batch:
+                await asyncio.to_thread(self._write_batch_safely, batch)
+            return len(batch)
+
+    def _get_flush_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._flush_lock is None or self._flush_lock_loop is not loop:
+            self._flush_lock = asyncio.Lock()
+            self._flush_lock_loop = loop
+        return self._flush_lock
+
+    def flush_sync(self):
+        """Write out everything buffered from the calling thread (interpreter exit)."""
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            self._write_batch_safely(batch)
+
+    def _take_batch(self) -> List[Any]:
+        with self._lock:
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            dropped = self.stats['dropped']
+        if dropped > self._reported_drops:
+            logger.warning(f"{self.name} full, dropped {dropped - self._reported_drops} records (total {dropped})")
+            self._reported_drops = dropped
+        return batch
+
+    def _write_batch_safely(self, batch: List[Any]):
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            self._count('write_errors', len(batch))
+            logger.error(f"Error writing {len(batch)} records from {self.name}: {e}")
+        with self._lock:
+            self.stats['flushes'] += 1
+            self.stats['last_flush'] = datetime.utcnow().isoformat()
+
+    def _count(self, key: str, amount: int = 1):
+        """Add to a ``stats`` counter from the writer thread."""
+        with self._lock:
+            self.stats[key] += amount
+
+    def _write_batch(self, batch: List[Any]):
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats[self.pending_stats_key] = len(self._buffer)
+        stats['capacity'] = self.max_size
+        return stats
@@ -3,7 +3,7 @@ Content Planning Database Models
 Defines the database schema for content strategy, calendar events, and analytics.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -29,6 +29,11 @@ class ContentStrategy(Base):
     calendar_events = relationship("CalendarEvent", back_populates="strategy")
     analytics = relationship("ContentAnalytics", back_populates="strategy")
     
+    # Indexes for per-user dashboard queries
+    __table_args__ = (
+        Index('idx_content_strategies_user_id', 'user_id'),
+    )
+    
     def __repr__(self):
         return f"<ContentStrategy(id={self.id}, name='{self.name}', industry='{self.industry}')>"
     
@@ -67,6 +72,11 @@ class CalendarEvent(Base):
     strategy = relationship("ContentStrategy", back_populates="calendar_events")
     analytics = relationship("ContentAnalytics", back_populates="event")
     
+    # Index for per-strategy event listing and its polling version lookup
+    __table_args__ = (
+        Index('idx_calendar_events_strategy_updated', 'strategy_id', 'updated_at'),
+    )
+    
     def __repr__(self):
         return f"<CalendarEvent(id={self.id}, title='{self.title}', status='{self.status}')>"
     
@@ -103,6 +113,11 @@ class ContentAnalytics(Base):
     event = relationship("CalendarEvent", back_populates="analytics")
     strategy = relationship("ContentStrategy", back_populates="analytics")
     
+    # Indexes for per-strategy aggregates and time-range rollups
+    __table_args__ = (
+        Index('idx_content_analytics_strategy_recorded', 'strategy_id', 'recorded_at'),
+    )
+    
     def __repr__(self):
         return f"<ContentAnalytics(id={self.id}, platform='{self.platform}', score={self.performance_score})>"
     
@@ -218,6 +233,11 @@ class AIAnalysisResult(Base):
     # Relationships
     strategy = relationship("ContentStrategy")
     
+    # Index for latest-analysis lookups by user and type
+    __table_args__ = (
+        Index('idx_ai_analysis_results_user_type_created', 'user_id', 'analysis_type', 'created_at'),
+    )
+    
     def __repr__(self):
         return f"<AIAnalysisResult(id={self.id}, type='{self.analysis_type}', user_id={self.user_id})>"
     
@@ -3,7 +3,7 @@ Enhanced Strategy Database Models
 Defines the enhanced database schema for content strategy with 30+ strategic inputs.
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, JSON, ForeignKey, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -90,6 +90,11 @@ class EnhancedContentStrategy(Base):
     performance_metrics = relationship("StrategyPerformanceMetrics", back_populates="strategy", cascade="all, delete-orphan")
     activation_status = relationship("StrategyActivationStatus", back_populates="strategy", cascade="all, delete-orphan")
     
+    # Index for latest-strategy lookups per user
+    __table_args__ = (
+        Index('idx_enhanced_strategies_user_created', 'user_id', 'created_at'),
+    )
+    
     def __repr__(self):
         return f"<EnhancedContentStrategy(id={self.id}, name='{self.name}', industry='{self.industry}')>"
     
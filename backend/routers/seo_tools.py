@@ -28,7 +28,8 @@ from services.seo_tools.on_page_seo_service import OnPageSEOService
 from services.seo_tools.technical_seo_service import TechnicalSEOService
 from services.seo_tools.enterprise_seo_service import EnterpriseSEOService
 from services.seo_tools.content_strategy_service import ContentStrategyService
-from middleware.logging_middleware import log_api_call, save_to_file
+from services.http_client_registry import get_http_client_registry
+from middleware.logging_middleware import log_api_call, save_to_file, jsonl_log_writer
 
 router = APIRouter(prefix="/api/seo", tags=["AI SEO Tools"])
 
@@ -648,6 +649,8 @@ async def get_tools_status() -> BaseResponse:
         data={
             "overall_healthy": overall_healthy,
             "tools": tools_status,
+            "http_pool": get_http_client_registry().get_metrics(),
+            "log_writer": jsonl_log_writer.get_stats(),
             "timestamp": datetime.utcnow().isoformat()
         }
     )
\ No newline at end of file
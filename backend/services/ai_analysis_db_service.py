@@ -4,7 +4,7 @@ Handles database operations for AI analysis results including storage and retrie
 """
 
 from typing import Dict, Any, List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, defer
 from sqlalchemy import and_, desc
 from datetime import datetime, timedelta
 from loguru import logger
@@ -61,6 +61,35 @@ class AIAnalysisDBService:
             self.db.rollback()
             raise
     
+    async def get_latest_ai_analysis_version(
+        self,
+        user_id: int,
+        analysis_type: str,
+        strategy_id: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Id and timestamps of the row get_latest_ai_analysis would return.
+        
+        Projects only those columns (served by the user/type/created_at index),
+        so polling endpoints can validate a cached copy without loading JSON.
+        """
+        query = self.db.query(
+            AIAnalysisResult.id,
+            AIAnalysisResult.created_at,
+            AIAnalysisResult.updated_at
+        ).filter(
+            AIAnalysisResult.user_id == user_id,
+            AIAnalysisResult.analysis_type == analysis_type
+        )
+        
+        if strategy_id:
+            query = query.filter(AIAnalysisResult.strategy_id == strategy_id)
+        
+        row = query.order_by(AIAnalysisResult.created_at.desc()).first()
+        if not row:
+            return None
+        return {"id": row.id, "created_at": row.created_at, "updated_at": row.updated_at}
+    
     async def get_latest_ai_analysis(
         self, 
         user_id: int, 
@@ -74,8 +103,10 @@ class AIAnalysisDBService:
         try:
             logger.info(f"🔍 Retrieving latest AI analysis for user {user_id}, type: {analysis_type}")
             
-            # Build query
-            query = self.db.query(AIAnalysisResult).filter(
+            # Build query (performance_metrics is not part of the result)
+            query = self.db.query(AIAnalysisResult).options(
+                defer(AIAnalysisResult.performance_metrics)
+            ).filter(
                 AIAnalysisResult.user_id == user_id,
                 AIAnalysisResult.analysis_type == analysis_type
             )
@@ -114,7 +145,7 @@ class AIAnalysisDBService:
                 
                 # Log results structure
                 results = result_dict.get("results", {})
-                logger.info(f"   - Results Keys: {list(results.keys())}")
+                logger.info(f"   - Results Keys: {list(results.keys()) if isinstance(results, dict) else f'{len(results)} items'}")
                 logger.info(f"   - Results Type: {type(results)}")
                 
                 # Log recommendations
@@ -123,7 +154,7 @@ class AIAnalysisDBService:
                 logger.info(f"   - Recommendations Type: {type(recommendations)}")
                 
                 # Log specific data if available
-                if results:
+                if isinstance(results, dict) and results:
                     logger.info("🔍 RESULTS DATA BREAKDOWN:")
                     for key, value in results.items():
                         if isinstance(value, list):
@@ -11,6 +11,7 @@ import asyncio
 from sqlalchemy.orm import Session
 
 from services.database import get_db_session
+from services.content_planning_db import ContentPlanningDBService
 from models.content_planning import ContentAnalytics, ContentStrategy, CalendarEvent
 from services.content_gap_analyzer.ai_engine_service import AIEngineService
 
@@ -41,8 +42,8 @@ class AIAnalyticsService:
         try:
             logger.info(f"Analyzing content evolution for strategy {strategy_id}")
             
-            # Get analytics data for the strategy
-            analytics_data = await self._get_analytics_data(strategy_id, time_period)
+            # Get aggregated analytics for the strategy
+            analytics_data = await self._get_analytics_summary(strategy_id, time_period)
             
             # Analyze content performance trends
             performance_trends = await self._analyze_performance_trends(analytics_data)
@@ -213,10 +214,10 @@ class AIAnalyticsService:
             raise
     
     # Helper methods for data retrieval and analysis
-    async def _get_analytics_data(self, strategy_id: int, time_period: str) -> List[Dict[str, Any]]:
-        """Get analytics data for the specified strategy and time period."""
+    async def _get_analytics_summary(self, strategy_id: int, time_period: str) -> Dict[str, Any]:
+        """Get aggregated analytics for the specified strategy and time period."""
         try:
-            session = self._get_db_session()
+            db_service = ContentPlanningDBService(self._get_db_session())
             
             # Calculate date range
             end_date = datetime.utcnow()
@@ -231,28 +232,29 @@ class AIAnalyticsService:
             else:
                 start_date = end_date - timedelta(days=30)
             
-            # Query analytics data
-            analytics = session.query(ContentAnalytics).filter(
-                ContentAnalytics.strategy_id == strategy_id,
-                ContentAnalytics.recorded_at >= start_date,
-                ContentAnalytics.recorded_at <= end_date
-            ).all()
-            
-            return [analytics.to_dict() for analytics in analytics]
+            # Aggregate in the database instead of materializing every row
+            summary = await db_service.get_strategy_analytics_summary(strategy_id, start_date, end_date)
+            summary['content_types'] = await db_service.get_analytics_breakdown(
+                strategy_id, 'content_type', start_date, end_date
+            )
+            summary['platforms'] = await db_service.get_analytics_breakdown(
+                strategy_id, 'platform', start_date, end_date
+            )
+            return summary
             
         except Exception as e:
             logger.error(f"Error getting analytics data: {str(e)}")
-            return []
+            return {'analytics_count': 0, 'average_performance': 0.0, 'content_types': {}, 'platforms': {}}
     
-    async def _analyze_performance_trends(self, analytics_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze performance trends from analytics data."""
+    async def _analyze_performance_trends(self, analytics_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analyze performance trends from aggregated analytics."""
         try:
-            if not analytics_data:
+            total_analytics = analytics_data.get('analytics_count', 0)
+            if not total_analytics:
                 return {'trend': 'stable', 'growth_rate': 0, 'insights': 'No data available'}
             
             # Calculate trend metrics
-            total_analytics = len(analytics_data)
-            avg_performance = sum(item.get('performance_score', 0) for item in analytics_data) / total_analytics
+            avg_performance = analytics_data.get('average_performance', 0)
             
             # Determine trend direction
             if avg_performance > 0.7:
@@ -273,29 +275,17 @@ class AIAnalyticsService:
             logger.error(f"Error analyzing performance trends: {str(e)}")
             return {'trend': 'unknown', 'error': str(e)}
     
-    async def _analyze_content_type_evolution(self, analytics_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_content_type_evolution(self, analytics_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze how content types have evolved over time."""
         try:
-            content_types = {}
-            for data in analytics_data:
-                content_type = data.get('content_type', 'unknown')
-                if content_type not in content_types:
-                    content_types[content_type] = {
-                        'count': 0,
-                        'total_performance': 0,
-                        'avg_performance': 0
-                    }
-                
-                content_types[content_type]['count'] += 1
-                content_types[content_type]['total_performance'] += data.get('performance_score', 0)
-            
-            # Calculate averages
-            for content_type in content_types:
-                if content_types[content_type]['count'] > 0:
-                    content_types[content_type]['avg_performance'] = (
-                        content_types[content_type]['total_performance'] / 
-                        content_types[content_type]['count']
-                    )
+            content_types = {
+                content_type: {
+                    'count': group['count'],
+                    'total_performance': group['average_performance'] * group['count'],
+                    'avg_performance': group['average_performance']
+                }
+                for content_type, group in analytics_data.get('content_types', {}).items()
+            }
             
             return {
                 'content_types': content_types,
@@ -307,35 +297,22 @@ class AIAnalyticsService:
             logger.error(f"Error analyzing content type evolution: {str(e)}")
             return {'error': str(e)}
     
-    async def _analyze_engagement_patterns(self, analytics_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_engagement_patterns(self, analytics_data: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze audience engagement patterns."""
         try:
-            if not analytics_data:
+            platforms = analytics_data.get('platforms', {})
+            if not platforms:
                 return {'patterns': {}, 'insights': 'No engagement data available'}
             
-            # Analyze engagement by platform
-            platform_engagement = {}
-            for data in analytics_data:
-                platform = data.get('platform', 'unknown')
-                if platform not in platform_engagement:
-                    platform_engagement[platform] = {
-                        'total_engagement': 0,
-                        'count': 0,
-                        'avg_engagement': 0
-                    }
-                
-                metrics = data.get('metrics', {})
-                engagement = metrics.get('engagement_rate', 0)
-                platform_engagement[platform]['total_engagement'] += engagement
-                platform_engagement[platform]['count'] += 1
-            
-            # Calculate averages
-            for platform in platform_engagement:
-                if platform_engagement[platform]['count'] > 0:
-                    platform_engagement[platform]['avg_engagement'] = (
-                        platform_engagement[platform]['total_engagement'] / 
-                        platform_engagement[platform]['count']
-                    )
+            # Engagement by platform
+            platform_engagement = {
+                platform: {
+                    'total_engagement': group['average_engagement'] * group['count'],
+                    'count': group['count'],
+                    'avg_engagement': group['average_engagement']
+                }
+                for platform, group in platforms.items()
+            }
             
             return {
                 'platform_engagement': platform_engagement,
@@ -0,0 +1,283 @@
+"""
+AI Response Cache
+Content-addressed cache for structured LLM responses.
+
+Responses are keyed on a hash of (provider, model, prompt, system prompt,
+schema, temperature), so identical requests within the TTL are served without
+another provider round trip. There are two tiers:
+
+- an in-process LRU tier (bounded, per worker)
+- an optional persistent tier shared across workers/restarts
+  (SQLite by default, Redis when configured)
+"""
+
+import os
+import copy
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from loguru import logger
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Persistent tier configuration
+AI_CACHE_BACKEND = os.getenv('AI_CACHE_BACKEND', 'sqlite')  # sqlite | redis | none
+# Relative paths resolve against the backend directory, not the process working directory
+AI_CACHE_SQLITE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.getenv('AI_CACHE_SQLITE_PATH', 'ai_response_cache.db')
+)
+AI_CACHE_REDIS_URL = os.getenv('AI_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+AI_CACHE_MAX_MEMORY_ENTRIES = int(os.getenv('AI_CACHE_MAX_MEMORY_ENTRIES', '512'))
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    prompt: str,
+    system_prompt: Optional[str],
+    schema: Optional[Dict[str, Any]],
+    temperature: Optional[float]
+) -> str:
+    """Build the content-addressed cache key for an LLM request."""
+    payload = json.dumps(
+        {
+            'provider': provider,
+            'model': model,
+            'prompt': prompt,
+            'system_prompt': system_prompt,
+            'schema': schema,
+            'temperature': temperature,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class CacheBackend:
+    """Interface for the persistent cache tier."""
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Persistent tier stored in a single SQLite table."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str = AI_CACHE_SQLITE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_response_cache (
+                cache_key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ai_response_cache_expires ON ai_response_cache (expires_at)"
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM ai_response_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= time.time():
+                self._conn.execute("DELETE FROM ai_response_cache WHERE cache_key = ?", (key,))
+                return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_response_cache (cache_key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, default=str), time.time() + ttl_seconds),
+            )
+            # Opportunistically purge expired rows so the table stays small
+            self._conn.execute("DELETE FROM ai_response_cache WHERE expires_at <= ?", (time.time(),))
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_response_cache WHERE cache_key = ?", (key,))
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM ai_response_cache")
+
+
+class RedisCacheBackend(CacheBackend):
+    """Persistent tier stored in Redis (expiry handled by Redis TTLs)."""
+
+    name = "redis"
+    key_prefix = "alwrity:ai_cache:"
+
+    def __init__(self, url: str = AI_CACHE_REDIS_URL):
+        if redis is None:
+            raise RuntimeError("redis library not available. Install with: pip install redis")
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self._client.get(self.key_prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        self._client.setex(self.key_prefix + key, ttl_seconds, json.dumps(value, default=str))
+
+    def delete(self, key: str):
+        self._client.delete(self.key_prefix + key)
+
+    def clear(self):
+        for key in self._client.scan_iter(self.key_prefix + "*"):
+            self._client.delete(key)
+
+
+class AIResponseCache:
+    """Two-tier (LRU + persistent) cache for AI responses with hit/miss counters."""
+
+    def __init__(self, max_memory_entries: int = AI_CACHE_MAX_MEMORY_ENTRIES, backend: Optional[CacheBackend] = None):
+        self.max_memory_entries = max_memory_entries
+        self.backend = backend
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'memory_hits': 0,
+            'persistent_hits': 0,
+            'misses': 0,
+            'bypassed': 0,
+            'stores': 0,
+            'evictions': 0,
+            'backend_errors': 0,
+        }
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response, promoting persistent hits into memory."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats['hits'] += 1
+                    self.stats['memory_hits'] += 1
+                    # Callers may mutate the response; never hand out the cached object
+                    return copy.deepcopy(value)
+                del self._memory[key]
+
+        if self.backend is not None:
+            try:
+                value = self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"AI cache backend read failed: {e}")
+                self.stats['backend_errors'] += 1
+                value = None
+            if value is not None:
+                # Expiry is owned by the persistent tier; keep a short memory copy
+                self._store_memory(key, copy.deepcopy(value), now + 60)
+                with self._lock:
+                    self.stats['hits'] += 1
+                    self.stats['persistent_hits'] += 1
+                return value
+
+        with self._lock:
+            self.stats['misses'] += 1
+        return None
+
+    def set(self, key: str, value: Dict[str, Any], ttl_seconds: int):
+        """Store a response in both tiers."""
+        if ttl_seconds <= 0:
+            return
+        self._store_memory(key, copy.deepcopy(value), time.time() + ttl_seconds)
+        with self._lock:
+            self.stats['stores'] += 1
+        if self.backend is not None:
+            try:
+                self.backend.set(key, value, ttl_seconds)
+            except Exception as e:
+                logger.warning(f"AI cache backend write failed: {e}")
+                self.stats['backend_errors'] += 1
+
+    def record_bypass(self):
+        """Count a lookup deliberately skipped for a fresh run."""
+        with self._lock:
+            self.stats['bypassed'] += 1
+
+    def invalidate(self, key: str):
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.backend is not None:
+            try:
+                self.backend.delete(key)
+            except Exception as e:
+                logger.warning(f"AI cache backend delete failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+        if self.backend is not None:
+            self.backend.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] / lookups) * 100 if lookups > 0 else 0
+        stats['backend'] = self.backend.name if self.backend else None
+        return stats
+
+    def _store_memory(self, key: str, value: Dict[str, Any], expires_at: float):
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+                self.stats['evictions'] += 1
+
+
+def _create_backend() -> Optional[CacheBackend]:
+    """Create the configured persistent backend, degrading to memory-only."""
+    try:
+        if AI_CACHE_BACKEND == 'redis':
+            return RedisCacheBackend()
+        if AI_CACHE_BACKEND == 'sqlite':
+            return SQLiteCacheBackend()
+    except Exception as e:
+        logger.warning(f"AI cache persistent tier unavailable ({AI_CACHE_BACKEND}), using memory only: {e}")
+    return None
+
+
+def get_ai_response_cache() -> AIResponseCache:
+    """Get the process-wide AI response cache instance."""
+    if not hasattr(get_ai_response_cache, '_instance'):
+        get_ai_response_cache._instance = AIResponseCache(backend=_create_backend())
+    return get_ai_response_cache._instance
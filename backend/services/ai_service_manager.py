@@ -13,6 +13,7 @@ from enum import Enum
 
 # Import AI providers
 from services.llm_providers.main_text_generation import llm_text_gen
+from services.ai_response_cache import get_ai_response_cache, make_cache_key
 # Prefer the extended gemini provider if available; fallback to base
 try:
     from services.llm_providers.gemini_provider import gemini_structured_json_response as _gemini_fn
@@ -39,6 +40,7 @@ class AIServiceMetrics:
     success: bool
     error_message: Optional[str] = None
     timestamp: datetime = None
+    cached: bool = False
     
     def __post_init__(self):
         if self.timestamp is None:
@@ -54,6 +56,7 @@ class AIServiceManager:
         self.prompts = self._load_centralized_prompts()
         self.schemas = self._load_centralized_schemas()
         self.config = self._load_ai_configuration()
+        self.cache = get_ai_response_cache()
         
         logger.info("AIServiceManager initialized")
     
@@ -66,8 +69,20 @@ class AIServiceManager:
             'top_p': 0.9,
             'top_k': 40,
             'max_tokens': 8192,  # increased from 4096 to prevent JSON truncation
-            'enable_caching': False,  # 🚨 CRITICAL: Disabled caching to ensure fresh AI responses
-            'cache_duration_minutes': 0,  # 🚨 CRITICAL: Zero cache duration
+            'enable_caching': True,  # Content-addressed cache; pass force_refresh=True for fresh runs
+            'cache_duration_minutes': 0,  # Caching is opt-in: service types without a policy are not cached
+            'cache_ttl_minutes': {  # Per-service TTL policies (0 disables caching for that service)
+                # Refresh flows (autofill refresh, gap analysis) pass force_refresh=True
+                AIServiceType.CONTENT_GAP_ANALYSIS.value: 60,
+                AIServiceType.STRATEGIC_INTELLIGENCE.value: 60,
+                AIServiceType.MARKET_POSITION_ANALYSIS.value: 60,
+                AIServiceType.KEYWORD_ANALYSIS.value: 60,
+                AIServiceType.PERFORMANCE_PREDICTION.value: 30,
+                AIServiceType.CONTENT_QUALITY_ASSESSMENT.value: 30,
+                AIServiceType.CONTENT_SCHEDULE_GENERATION.value: 15,
+            },
+            'provider': 'gemini',
+            'model': 'gemini-2.5-flash',
             'performance_monitoring': True,
             'fallback_enabled': False  # Disabled fallback to prevent false positives
         } 
@@ -437,7 +452,16 @@ Format as structured JSON with detailed assessment and optimization guidance.
             }
         }
     
-    async def _execute_ai_call(self, service_type: AIServiceType, prompt: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_cache_ttl_seconds(self, service_type: AIServiceType) -> int:
+        """Resolve the cache TTL for a service type (0 means do not cache)."""
+        if not self.config.get('enable_caching'):
+            return 0
+        ttl_minutes = self.config.get('cache_ttl_minutes', {}).get(
+            service_type.value, self.config.get('cache_duration_minutes', 0)
+        )
+        return int(ttl_minutes * 60)
+
+    async def _execute_ai_call(self, service_type: AIServiceType, prompt: str, schema: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Execute AI call with comprehensive error handling and monitoring.
         
@@ -445,6 +469,7 @@ Format as structured JSON with detailed assessment and optimization guidance.
             service_type: Type of AI service being called
             prompt: The prompt to send to AI
             schema: Expected response schema
+            force_refresh: Skip the response cache lookup (fresh result is still cached)
             
         Returns:
             Dictionary with AI response or error information
@@ -453,6 +478,33 @@ Format as structured JSON with detailed assessment and optimization guidance.
         success = False
         error_message = None
         
+        ttl_seconds = self._get_cache_ttl_seconds(service_type)
+        cache_key = None
+        if ttl_seconds > 0:
+            cache_key = make_cache_key(
+                self.config['provider'],
+                self.config['model'],
+                prompt,
+                None,
+                schema,
+                self.config['temperature'],
+            )
+            if force_refresh:
+                self.cache.record_bypass()
+            else:
+                cached_response = self.cache.get(cache_key)
+                if cached_response is not None:
+                    processing_time = (datetime.utcnow() - start_time).total_seconds()
+                    logger.info(f"✅ Cache HIT for {service_type.value} | Hash: {cache_key[:8]}...")
+                    self._record_metrics(service_type, processing_time, True, None, cached=True)
+                    return {
+                        "data": cached_response,
+                        "processing_time": processing_time,
+                        "service_type": service_type.value,
+                        "success": True,
+                        "cached": True
+                    }
+        
         try:
             logger.info(f"🤖 Executing AI call for {service_type.value}")
             
@@ -486,6 +538,9 @@ Format as structured JSON with detailed assessment and optimization guidance.
             success = True
             processing_time = (datetime.utcnow() - start_time).total_seconds()
             
+            if cache_key:
+                self.cache.set(cache_key, response, ttl_seconds)
+            
             # Emit success educational content
             await self._emit_educational_content(service_type, "success", processing_time=processing_time)
             
@@ -539,16 +594,17 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.debug("Falling back to base gemini provider signature (prompt, schema)")
             return _gemini_fn(prompt, schema)
 
-    async def execute_structured_json_call(self, service_type: AIServiceType, prompt: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_structured_json_call(self, service_type: AIServiceType, prompt: str, schema: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """Public wrapper to execute a structured JSON AI call with a provided schema."""
-        return await self._execute_ai_call(service_type, prompt, schema)
+        return await self._execute_ai_call(service_type, prompt, schema, force_refresh=force_refresh)
     
-    async def generate_content_gap_analysis(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_content_gap_analysis(self, analysis_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate content gap analysis using centralized AI service.
         
         Args:
             analysis_data: Analysis data
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Content gap analysis results
@@ -571,7 +627,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.CONTENT_GAP_ANALYSIS,
                 prompt,
-                self.schemas['content_gap_analysis']
+                self.schemas['content_gap_analysis'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -580,12 +637,13 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.error(f"Error in content gap analysis: {str(e)}")
             raise Exception(f"Failed to generate content gap analysis: {str(e)}")
     
-    async def generate_market_position_analysis(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_market_position_analysis(self, market_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate market position analysis using centralized AI service.
         
         Args:
             market_data: Market analysis data
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Market position analysis results
@@ -604,7 +662,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.MARKET_POSITION_ANALYSIS,
                 prompt,
-                self.schemas['market_position_analysis']
+                self.schemas['market_position_analysis'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -613,12 +672,13 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.error(f"Error in market position analysis: {str(e)}")
             raise Exception(f"Failed to generate market position analysis: {str(e)}")
     
-    async def generate_keyword_analysis(self, keyword_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_keyword_analysis(self, keyword_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate keyword analysis using centralized AI service.
         
         Args:
             keyword_data: Keyword analysis data
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Keyword analysis results
@@ -637,7 +697,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.KEYWORD_ANALYSIS,
                 prompt,
-                self.schemas['keyword_analysis']
+                self.schemas['keyword_analysis'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -646,12 +707,13 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.error(f"Error in keyword analysis: {str(e)}")
             raise Exception(f"Failed to generate keyword analysis: {str(e)}")
     
-    async def generate_performance_prediction(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_performance_prediction(self, content_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate performance prediction using centralized AI service.
         
         Args:
             content_data: Content data for prediction
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Performance prediction results
@@ -669,7 +731,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.PERFORMANCE_PREDICTION,
                 prompt,
-                self.schemas['performance_prediction']
+                self.schemas['performance_prediction'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -678,12 +741,13 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.error(f"Error in performance prediction: {str(e)}")
             raise Exception(f"Failed to generate performance prediction: {str(e)}")
     
-    async def generate_strategic_intelligence(self, analysis_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_strategic_intelligence(self, analysis_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate strategic intelligence using centralized AI service.
         
         Args:
             analysis_data: Analysis data for strategic insights
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Strategic intelligence results
@@ -702,7 +766,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.STRATEGIC_INTELLIGENCE,
                 prompt,
-                self.schemas['strategic_intelligence']
+                self.schemas['strategic_intelligence'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -711,12 +776,13 @@ Format as structured JSON with detailed assessment and optimization guidance.
             logger.error(f"Error in strategic intelligence: {str(e)}")
             raise Exception(f"Failed to generate strategic intelligence: {str(e)}")
     
-    async def generate_content_quality_assessment(self, content_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def generate_content_quality_assessment(self, content_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate content quality assessment using centralized AI service.
         
         Args:
             content_data: Content data for assessment
+            force_refresh: Bypass the response cache for a deliberately fresh run
             
         Returns:
             Content quality assessment results
@@ -735,7 +801,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
             result = await self._execute_ai_call(
                 AIServiceType.CONTENT_QUALITY_ASSESSMENT,
                 prompt,
-                self.schemas['content_quality_assessment']
+                self.schemas['content_quality_assessment'],
+                force_refresh=force_refresh
             )
             
             return result if result else {}
@@ -799,7 +866,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
                 'total_calls': 0,
                 'success_rate': 0,
                 'average_response_time': 0,
-                'service_breakdown': {}
+                'service_breakdown': {},
+                'cache': self.cache.get_stats()
             }
         
         total_calls = len(self.metrics)
@@ -815,7 +883,8 @@ Format as structured JSON with detailed assessment and optimization guidance.
                 service_breakdown[service_type.value] = {
                     'total_calls': len(service_metrics),
                     'success_rate': (len([m for m in service_metrics if m.success]) / len(service_metrics)) * 100,
-                    'average_response_time': sum(m.response_time for m in service_metrics) / len(service_metrics)
+                    'average_response_time': sum(m.response_time for m in service_metrics) / len(service_metrics),
+                    'cache_hits': len([m for m in service_metrics if m.cached])
                 }
         
         return {
@@ -823,6 +892,7 @@ Format as structured JSON with detailed assessment and optimization guidance.
             'success_rate': success_rate,
             'average_response_time': average_response_time,
             'service_breakdown': service_breakdown,
+            'cache': self.cache.get_stats(),
             'last_updated': datetime.utcnow().isoformat()
         }
     
@@ -1008,7 +1078,7 @@ Format as structured JSON with detailed assessment and optimization guidance.
         
         return base_content
 
-    def _record_metrics(self, service_type: AIServiceType, processing_time: float, success: bool, error_message: str = None):
+    def _record_metrics(self, service_type: AIServiceType, processing_time: float, success: bool, error_message: str = None, cached: bool = False):
         """
         Record metrics for AI service calls.
         
@@ -1017,13 +1087,15 @@ Format as structured JSON with detailed assessment and optimization guidance.
             processing_time: Time taken for the call
             success: Whether the call was successful
             error_message: Error message if applicable
+            cached: Whether the response was served from the response cache
         """
         try:
             metrics = AIServiceMetrics(
                 service_type=service_type,
                 response_time=processing_time,
                 success=success,
-                error_message=error_message
+                error_message=error_message,
+                cached=cached
             )
             self.metrics.append(metrics)
             
@@ -9,6 +9,7 @@ NO MOCK DATA - Only real data sources allowed.
 """
 
 import time
+import asyncio
 from typing import Dict, Any, Optional, List
 from loguru import logger
 
@@ -37,94 +38,101 @@ class ComprehensiveUserDataProcessor:
         self.active_strategy_service = ActiveStrategyService(db_session)
         self.content_planning_db_service = None  # Will be injected
     
+    # Sources gathered for every calendar generation. All of them are required
+    # (NO FALLBACKS); independent sources are fetched concurrently.
+    DATA_SOURCES = [
+        "onboarding_data",
+        "ai_analysis_results",
+        "gap_analysis",
+        "strategy_data",
+        "recommendations_data",
+        "performance_data",
+    ]
+    
     async def get_comprehensive_user_data(self, user_id: int, strategy_id: Optional[int]) -> Dict[str, Any]:
         """Get comprehensive user data from all database sources."""
         try:
             logger.info(f"Getting comprehensive user data for user {user_id}")
+            gather_start = time.time()
+            source_reports: Dict[str, Dict[str, Any]] = {}
             
-            # Get onboarding data (not async)
-            onboarding_data = self.onboarding_service.get_personalized_ai_inputs(user_id)
-            
-            if not onboarding_data:
-                raise ValueError(f"No onboarding data found for user_id: {user_id}")
-            
-            # Add missing posting preferences and posting days for Step 4
-            if onboarding_data:
-                # Add default posting preferences if missing
-                if "posting_preferences" not in onboarding_data:
-                    onboarding_data["posting_preferences"] = {
-                        "daily": 2,  # 2 posts per day
-                        "weekly": 10,  # 10 posts per week
-                        "monthly": 40   # 40 posts per month
+            async def timed(source_name: str, coro):
+                start = time.time()
+                try:
+                    result = await coro
+                    source_reports[source_name] = {
+                        "status": "success",
+                        "duration_seconds": round(time.time() - start, 3)
                     }
-                
-                # Add default posting days if missing
-                if "posting_days" not in onboarding_data:
-                    onboarding_data["posting_days"] = [
-                        "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
-                    ]
-                
-                # Add optimal posting times if missing
-                if "optimal_times" not in onboarding_data:
-                    onboarding_data["optimal_times"] = [
-                        "09:00", "12:00", "15:00", "18:00", "20:00"
-                    ]
-            
-            # Get AI analysis results from the working endpoint
-            try:
-                ai_analytics = AIAnalyticsService()
-                ai_analysis_results = await ai_analytics.generate_strategic_intelligence(strategy_id or 1)
-                
-                if not ai_analysis_results:
-                    raise ValueError("AI analysis service returned no results")
-                    
-            except Exception as e:
-                logger.error(f"AI analysis service failed: {str(e)}")
-                raise ValueError(f"Failed to get AI analysis results: {str(e)}")
+                    return result
+                except asyncio.CancelledError:
+                    source_reports.setdefault(source_name, {
+                        "status": "cancelled",
+                        "duration_seconds": round(time.time() - start, 3)
+                    })
+                    raise
+                except Exception as e:
+                    source_reports[source_name] = {
+                        "status": "failed",
+                        "duration_seconds": round(time.time() - start, 3),
+                        "error": str(e)
+                    }
+                    raise
             
-            # Get gap analysis data from the working endpoint
-            try:
-                ai_engine = AIEngineService()
-                gap_analysis_data = await ai_engine.generate_content_recommendations(onboarding_data)
-                
-                if not gap_analysis_data:
-                    raise ValueError("AI engine service returned no gap analysis data")
-                    
-            except Exception as e:
-                logger.error(f"AI engine service failed: {str(e)}")
-                raise ValueError(f"Failed to get gap analysis data: {str(e)}")
+            # Onboarding data feeds the gap analysis; everything else is independent
+            onboarding_task = asyncio.ensure_future(
+                timed("onboarding_data", self._get_onboarding_data(user_id))
+            )
             
-            # Get active strategy data with 3-tier caching for Phase 1 and Phase 2
-            strategy_data = {}
-            active_strategy = await self.active_strategy_service.get_active_strategy(user_id)
+            async def gap_analysis_after_onboarding():
+                try:
+                    onboarding = await onboarding_task
+                except Exception:
+                    source_reports["gap_analysis"] = {"status": "skipped", "reason": "onboarding_data failed"}
+                    raise
+                return await timed("gap_analysis", self._get_gap_analysis_data(onboarding))
             
-            if active_strategy:
-                strategy_data = active_strategy
-                logger.info(f"🎯 Retrieved ACTIVE strategy {active_strategy.get('id')} with {len(active_strategy)} fields for user {user_id}")
-                logger.info(f"📊 Strategy activation status: {active_strategy.get('activation_status', {}).get('activation_date', 'Not activated')}")
-            elif strategy_id:
-                # Fallback to specific strategy ID if provided
-                from .strategy_data import StrategyDataProcessor
-                strategy_processor = StrategyDataProcessor()
-                
-                # Inject database service if available
-                if self.content_planning_db_service:
-                    strategy_processor.content_planning_db_service = self.content_planning_db_service
-                
-                strategy_data = await strategy_processor.get_strategy_data(strategy_id)
-                
-                if not strategy_data:
-                    raise ValueError(f"No strategy data found for strategy_id: {strategy_id}")
-                    
-                logger.warning(f"⚠️ No active strategy found, using fallback strategy {strategy_id}")
-            else:
-                raise ValueError("No active strategy found and no strategy ID provided")
+            tasks = [
+                onboarding_task,
+                asyncio.ensure_future(timed("ai_analysis_results", self._get_ai_analysis_results(strategy_id))),
+                asyncio.ensure_future(gap_analysis_after_onboarding()),
+                asyncio.ensure_future(timed("strategy_data", self._get_strategy_data(user_id, strategy_id))),
+                asyncio.ensure_future(timed("recommendations_data", self._get_recommendations_data(user_id, strategy_id))),
+                asyncio.ensure_future(timed("performance_data", self._get_performance_data(user_id, strategy_id))),
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException as e:
+                # Every source is required: the first failure cancels the rest
+                # (including the AI-backed ones) instead of letting them finish
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                failed_sources = {
+                    name: report for name, report in source_reports.items() if report["status"] == "failed"
+                }
+                details = "; ".join(
+                    f"{name}: {report.get('error')}" for name, report in failed_sources.items()
+                ) or str(e)
+                statuses = {
+                    name: source_reports.get(name, {}).get("status", "cancelled") for name in self.DATA_SOURCES
+                }
+                logger.error(f"❌ Data sources failed for user {user_id}: {details} | sources: {statuses}")
+                raise ValueError(f"Failed data sources ({len(failed_sources)}/{len(self.DATA_SOURCES)}): {details}")
             
-            # Get content recommendations
-            recommendations_data = await self._get_recommendations_data(user_id, strategy_id)
+            (onboarding_data, ai_analysis_results, gap_analysis_data,
+             strategy_data, recommendations_data, performance_data) = results
             
-            # Get performance metrics
-            performance_data = await self._get_performance_data(user_id, strategy_id)
+            data_sources = {
+                "total_duration_seconds": round(time.time() - gather_start, 3),
+                "sources": {name: source_reports.get(name, {}) for name in self.DATA_SOURCES}
+            }
+            logger.info(
+                f"⏱️ Gathered {len(self.DATA_SOURCES)} data sources for user {user_id} "
+                f"in {data_sources['total_duration_seconds']}s"
+            )
             
             # Build comprehensive response with enhanced strategy data
             comprehensive_data = {
@@ -153,7 +161,10 @@ class ComprehensiveUserDataProcessor:
                 "quality_indicators": strategy_data.get("quality_indicators", {}),
                 
                 # Add platform preferences for Step 6
-                "platform_preferences": self._generate_platform_preferences(strategy_data, onboarding_data)
+                "platform_preferences": self._generate_platform_preferences(strategy_data, onboarding_data),
+                
+                # Per-source status and timing of the concurrent data gather
+                "data_sources": data_sources
             }
             
             logger.info(f"✅ Comprehensive user data prepared for user {user_id}")
@@ -193,6 +204,94 @@ class ComprehensiveUserDataProcessor:
             logger.error(f"❌ Error in cached method: {str(e)}")
             raise Exception(f"Failed to get comprehensive user data: {str(e)}")
     
+    async def _get_onboarding_data(self, user_id: int) -> Dict[str, Any]:
+        """Get onboarding data with posting defaults for Step 4."""
+        # Synchronous DB lookup - keep it off the event loop
+        onboarding_data = await asyncio.to_thread(self.onboarding_service.get_personalized_ai_inputs, user_id)
+        
+        if not onboarding_data:
+            raise ValueError(f"No onboarding data found for user_id: {user_id}")
+        
+        # Add default posting preferences if missing
+        if "posting_preferences" not in onboarding_data:
+            onboarding_data["posting_preferences"] = {
+                "daily": 2,  # 2 posts per day
+                "weekly": 10,  # 10 posts per week
+                "monthly": 40   # 40 posts per month
+            }
+        
+        # Add default posting days if missing
+        if "posting_days" not in onboarding_data:
+            onboarding_data["posting_days"] = [
+                "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+            ]
+        
+        # Add optimal posting times if missing
+        if "optimal_times" not in onboarding_data:
+            onboarding_data["optimal_times"] = [
+                "09:00", "12:00", "15:00", "18:00", "20:00"
+            ]
+        
+        return onboarding_data
+    
+    async def _get_ai_analysis_results(self, strategy_id: Optional[int]) -> Dict[str, Any]:
+        """Get AI analysis results from the working endpoint."""
+        try:
+            ai_analytics = AIAnalyticsService()
+            ai_analysis_results = await ai_analytics.generate_strategic_intelligence(strategy_id or 1)
+            
+            if not ai_analysis_results:
+                raise ValueError("AI analysis service returned no results")
+            
+            return ai_analysis_results
+            
+        except Exception as e:
+            logger.error(f"AI analysis service failed: {str(e)}")
+            raise ValueError(f"Failed to get AI analysis results: {str(e)}")
+    
+    async def _get_gap_analysis_data(self, onboarding_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Get gap analysis data from the working endpoint."""
+        try:
+            ai_engine = AIEngineService()
+            gap_analysis_data = await ai_engine.generate_content_recommendations(onboarding_data)
+            
+            if not gap_analysis_data:
+                raise ValueError("AI engine service returned no gap analysis data")
+            
+            return gap_analysis_data
+            
+        except Exception as e:
+            logger.error(f"AI engine service failed: {str(e)}")
+            raise ValueError(f"Failed to get gap analysis data: {str(e)}")
+    
+    async def _get_strategy_data(self, user_id: int, strategy_id: Optional[int]) -> Dict[str, Any]:
+        """Get active strategy data with 3-tier caching for Phase 1 and Phase 2."""
+        active_strategy = await self.active_strategy_service.get_active_strategy(user_id)
+        
+        if active_strategy:
+            logger.info(f"🎯 Retrieved ACTIVE strategy {active_strategy.get('id')} with {len(active_strategy)} fields for user {user_id}")
+            logger.info(f"📊 Strategy activation status: {active_strategy.get('activation_status', {}).get('activation_date', 'Not activated')}")
+            return active_strategy
+        
+        if strategy_id:
+            # Fallback to specific strategy ID if provided
+            from .strategy_data import StrategyDataProcessor
+            strategy_processor = StrategyDataProcessor()
+            
+            # Inject database service if available
+            if self.content_planning_db_service:
+                strategy_processor.content_planning_db_service = self.content_planning_db_service
+            
+            strategy_data = await strategy_processor.get_strategy_data(strategy_id)
+            
+            if not strategy_data:
+                raise ValueError(f"No strategy data found for strategy_id: {strategy_id}")
+            
+            logger.warning(f"⚠️ No active strategy found, using fallback strategy {strategy_id}")
+            return strategy_data
+        
+        raise ValueError("No active strategy found and no strategy ID provided")
+    
     async def _get_recommendations_data(self, user_id: int, strategy_id: Optional[int]) -> List[Dict[str, Any]]:
         """Get content recommendations data."""
         try:
@@ -62,10 +62,42 @@ class PromptChainOrchestrator:
     - Context management across steps
     - Error handling and recovery
     - Progress tracking and monitoring
+    
+    Steps run as a dependency graph: steps whose inputs are already available
+    run concurrently, and their results are merged into the context in step
+    order. Use execution_mode="sequential" to run one step at a time.
     """
     
-    def __init__(self, db_session=None):
-        """Initialize the prompt chain orchestrator."""
+    # Earlier step results each step reads from context["step_results"]
+    STEP_DEPENDENCIES = {
+        "step_01": [],
+        "step_02": [],
+        "step_03": [],
+        "step_04": [],
+        "step_05": ["step_04"],
+        "step_06": ["step_04", "step_05"],
+        "step_07": ["step_01", "step_02", "step_05", "step_06"],
+        "step_08": ["step_01", "step_02", "step_04", "step_05", "step_06", "step_07"],
+        "step_09": ["step_01", "step_02", "step_06", "step_07", "step_08"],
+        "step_10": ["step_06", "step_07", "step_08", "step_09"],
+        "step_11": ["step_01", "step_02", "step_03", "step_04", "step_05", "step_06",
+                    "step_07", "step_08", "step_09", "step_10"],
+        "step_12": ["step_01", "step_02", "step_03", "step_04", "step_05", "step_06",
+                    "step_07", "step_08", "step_09", "step_10", "step_11"],
+    }
+    
+    def __init__(self, db_session=None, execution_mode: str = "dag"):
+        """
+        Initialize the prompt chain orchestrator.
+        
+        Args:
+            db_session: Optional database session injected into the steps
+            execution_mode: "dag" (concurrent where dependencies allow) or "sequential"
+        """
+        if execution_mode not in ("dag", "sequential"):
+            raise ValueError(f"Unknown execution mode: {execution_mode}")
+        self.execution_mode = execution_mode
+        
         self.step_manager = StepManager()
         self.context_manager = ContextManager()
         self.progress_tracker = ProgressTracker()
@@ -91,6 +123,8 @@ class PromptChainOrchestrator:
         # 12-step configuration
         self.steps = self._initialize_steps()
         self.phases = self._initialize_phases()
+        for step_key, step in self.steps.items():
+            self.step_manager.register_step(step_key, step, self.STEP_DEPENDENCIES.get(step_key, []))
         
         logger.info("🚀 Prompt Chain Orchestrator initialized - 12-step framework ready")
     
@@ -322,61 +356,43 @@ class PromptChainOrchestrator:
                 "competitor_data": {}
             }
     
+    def _get_execution_waves(self) -> List[List[str]]:
+        """Get the groups of steps to run together, in order."""
+        if self.execution_mode == "sequential":
+            return [[step_key] for step_key in sorted(self.steps.keys())]
+        return self.step_manager.get_execution_levels()
+    
     async def _execute_12_step_process(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the complete 12-step process."""
         try:
-            logger.info("🔄 Starting 12-step execution process")
+            logger.info(f"🔄 Starting 12-step execution process (mode: {self.execution_mode})")
             logger.info(f"📊 Context keys: {list(context.keys())}")
             
-            # Execute steps sequentially by number
-            for step_num in range(1, 13):
-                step_key = f"step_{step_num:02d}"
-                step = self.steps[step_key]
-                
-                logger.info(f"🎯 Executing {step.name} (Step {step_num}/12)")
-                logger.info(f"📋 Step key: {step_key}")
-                logger.info(f"🔧 Step type: {type(step)}")
-                
-                context["current_step"] = step_num
-                context["phase"] = self._get_phase_for_step(step_num)
-                
-                logger.info(f"🚀 Calling step.run() for {step_key}")
-                try:
-                    step_result = await step.run(context)
-                    logger.info(f"✅ Step {step_num} completed with result keys: {list(step_result.keys()) if step_result else 'None'}")
-                except Exception as step_error:
-                    logger.error(f"❌ Step {step_num} ({step.name}) execution failed - FAILING FAST")
-                    logger.error(f"🚨 FAIL FAST: Step execution error: {str(step_error)}")
-                    raise Exception(f"Step {step_num} ({step.name}) execution failed: {str(step_error)}")
-                
-                context["step_results"][step_key] = step_result
-                context["quality_scores"][step_key] = step_result.get("quality_score", 0.0)
-                
-                # Update progress with correct signature
-                logger.info(f"📊 Updating progress for {step_key}")
-                self.progress_tracker.update_progress(step_key, step_result)
+            waves = self._get_execution_waves()
+            logger.info(f"🧭 Execution plan: {waves}")
+            
+            for wave in waves:
+                # Steps in a wave only depend on earlier waves, so they all see
+                # the same context and can run concurrently
+                wave = sorted(wave)
+                last_step_num = int(wave[-1].split("_")[1])
+                context["current_step"] = last_step_num
+                context["phase"] = self._get_phase_for_step(last_step_num)
                 
-                # Update context with correct signature
-                logger.info(f"🔄 Updating context for {step_key}")
-                await self.context_manager.update_context(step_key, step_result)
+                if len(wave) > 1:
+                    logger.info(f"⚡ Running steps concurrently: {wave}")
                 
-                # Validate step result
-                logger.info(f"🔍 Validating step result for {step_key}")
-                validation_passed = await self._validate_step_result(step_key, step_result, context)
+                outcomes = await asyncio.gather(
+                    *(self._run_step(step_key, context) for step_key in wave),
+                    return_exceptions=True
+                )
                 
-                if validation_passed:
-                    logger.info(f"✅ {step.name} completed (Quality: {step_result.get('quality_score', 0.0):.2f})")
-                else:
-                    logger.error(f"❌ {step.name} validation failed - FAILING FAST")
-                    # Update step result to indicate validation failure
-                    step_result["validation_passed"] = False
-                    step_result["status"] = "failed"
-                    context["step_results"][step_key] = step_result
-                    
-                    # FAIL FAST: Stop execution and return error
-                    error_message = f"Step {step_num} ({step.name}) validation failed. Stopping calendar generation."
-                    logger.error(f"🚨 FAIL FAST: {error_message}")
-                    raise Exception(error_message)
+                # Merge results in step order so the context is deterministic
+                # regardless of which concurrent step finished first
+                for step_key, outcome in zip(wave, outcomes):
+                    if isinstance(outcome, BaseException):
+                        raise outcome
+                    await self._merge_step_result(step_key, outcome, context)
             
             # Generate final calendar
             logger.info("🎯 Generating final calendar from all steps")
@@ -391,6 +407,60 @@ class PromptChainOrchestrator:
             logger.error(f"📋 Traceback: {traceback.format_exc()}")
             raise
     
+    async def _run_step(self, step_key: str, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single step and report its progress as soon as it finishes."""
+        step = self.steps[step_key]
+        step_num = int(step_key.split("_")[1])
+        
+        logger.info(f"🎯 Executing {step.name} (Step {step_num}/12)")
+        logger.info(f"📋 Step key: {step_key}")
+        logger.info(f"🔧 Step type: {type(step)}")
+        
+        logger.info(f"🚀 Calling step.run() for {step_key}")
+        try:
+            step_result = await self.step_manager.execute_step(step_key, context)
+            logger.info(f"✅ Step {step_num} completed with result keys: {list(step_result.keys()) if step_result else 'None'}")
+        except Exception as step_error:
+            logger.error(f"❌ Step {step_num} ({step.name}) execution failed - FAILING FAST")
+            logger.error(f"🚨 FAIL FAST: Step execution error: {str(step_error)}")
+            raise Exception(f"Step {step_num} ({step.name}) execution failed: {str(step_error)}")
+        
+        # Update progress with correct signature
+        logger.info(f"📊 Updating progress for {step_key}")
+        self.progress_tracker.update_progress(step_key, step_result)
+        
+        return step_result
+    
+    async def _merge_step_result(self, step_key: str, step_result: Dict[str, Any], context: Dict[str, Any]):
+        """Merge a finished step's result into the context and validate it."""
+        step = self.steps[step_key]
+        step_num = int(step_key.split("_")[1])
+        
+        context["step_results"][step_key] = step_result
+        context["quality_scores"][step_key] = step_result.get("quality_score", 0.0)
+        
+        # Update context with correct signature
+        logger.info(f"🔄 Updating context for {step_key}")
+        await self.context_manager.update_context(step_key, step_result)
+        
+        # Validate step result
+        logger.info(f"🔍 Validating step result for {step_key}")
+        validation_passed = await self._validate_step_result(step_key, step_result, context)
+        
+        if validation_passed:
+            logger.info(f"✅ {step.name} completed (Quality: {step_result.get('quality_score', 0.0):.2f})")
+        else:
+            logger.error(f"❌ {step.name} validation failed - FAILING FAST")
+            # Update step result to indicate validation failure
+            step_result["validation_passed"] = False
+            step_result["status"] = "failed"
+            context["step_results"][step_key] = step_result
+            
+            # FAIL FAST: Stop execution and return error
+            error_message = f"Step {step_num} ({step.name}) validation failed. Stopping calendar generation."
+            logger.error(f"🚨 FAIL FAST: {error_message}")
+            raise Exception(error_message)
+    
 
     
     async def _validate_step_result(
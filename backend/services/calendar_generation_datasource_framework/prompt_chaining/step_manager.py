@@ -44,6 +44,7 @@ class StepManager:
         """
         self.steps[step_name] = step
         self.step_dependencies[step_name] = dependencies or []
+        self.execution_order = []  # Recalculated on next access
         self.step_states[step_name] = {
             "status": "registered",
             "registered_at": datetime.now().isoformat(),
@@ -113,6 +114,28 @@ class StepManager:
         
         return self.execution_order.copy()
     
+    def get_execution_levels(self) -> List[List[str]]:
+        """
+        Group steps into dependency levels.
+        
+        Every step in a level depends only on steps in earlier levels, so the
+        steps of one level can run concurrently. Steps within a level keep
+        their topological (registration) order.
+        
+        Returns:
+            List of levels, each a list of step names
+        """
+        levels: Dict[str, int] = {}
+        for step_name in self.get_execution_order():
+            deps = [dep for dep in self.step_dependencies.get(step_name, []) if dep in self.steps]
+            levels[step_name] = max((levels[dep] + 1 for dep in deps), default=0)
+        
+        grouped: List[List[str]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for step_name in self.get_execution_order():
+            grouped[levels[step_name]].append(step_name)
+        
+        return grouped
+    
     def _calculate_execution_order(self) -> List[str]:
         """
         Calculate the execution order based on dependencies.
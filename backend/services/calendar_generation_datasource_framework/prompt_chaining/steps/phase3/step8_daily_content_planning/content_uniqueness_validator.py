@@ -24,6 +24,8 @@ try:
 except ImportError:
     raise ImportError("Required AI services not available. Cannot proceed without real AI services.")
 
+from services.calendar_generation_datasource_framework.quality_gates.similarity_index import ContentSimilarityIndex
+
 
 class ContentUniquenessValidator:
     """
@@ -82,9 +84,12 @@ class ContentUniquenessValidator:
             # Generate content fingerprints
             content_fingerprints = self._generate_content_fingerprints(all_content_pieces)
             
+            # Index titles and content once; pairwise similarity only runs on LSH candidates
+            similarity_indexes = self.build_similarity_indexes(all_content_pieces)
+            
             # Validate uniqueness for each piece
             validated_pieces = await self._validate_content_pieces(
-                all_content_pieces, content_fingerprints, weekly_themes, keywords
+                all_content_pieces, content_fingerprints, similarity_indexes, weekly_themes, keywords
             )
             
             # Update daily schedules with validated content
@@ -140,8 +145,7 @@ class ContentUniquenessValidator:
                 # Generate hash fingerprint
                 fingerprint = hashlib.md5(normalized_text.encode()).hexdigest()
                 
-                piece_id = f"{piece.get('schedule_id', 'unknown')}_{piece.get('title', 'unknown')}"
-                fingerprints[piece_id] = fingerprint
+                fingerprints[self._get_piece_id(piece)] = fingerprint
             
             return fingerprints
             
@@ -149,6 +153,42 @@ class ContentUniquenessValidator:
             logger.error(f"Error generating content fingerprints: {str(e)}")
             raise
     
+    def build_similarity_indexes(
+        self,
+        content_pieces: List[Dict],
+        similarity_indexes: Optional[Dict[str, ContentSimilarityIndex]] = None
+    ) -> Dict[str, ContentSimilarityIndex]:
+        """
+        Add content pieces to the title and content similarity indexes.
+        
+        Pass existing indexes to insert pieces incrementally as they are produced.
+        
+        Args:
+            content_pieces: Content pieces to index
+            similarity_indexes: Indexes from a previous call, or None to start new ones
+            
+        Returns:
+            Dict with 'title' and 'content' ContentSimilarityIndex instances
+        """
+        if similarity_indexes is None:
+            similarity_indexes = {
+                "title": ContentSimilarityIndex(),
+                "content": ContentSimilarityIndex()
+            }
+        
+        for piece in content_pieces:
+            piece_key = id(piece)
+            title = piece.get("title", "")
+            if title:
+                similarity_indexes["title"].add(piece_key, title)
+            similarity_indexes["content"].add(piece_key, self._get_piece_content_text(piece))
+        
+        return similarity_indexes
+    
+    def _get_piece_content_text(self, piece: Dict) -> str:
+        """Text used for content similarity (description and key message)."""
+        return f"{piece.get('description', '')} {piece.get('key_message', '')}"
+    
     def _normalize_text_for_fingerprinting(self, text: str) -> str:
         """Normalize text for fingerprinting by removing common words and formatting."""
         try:
@@ -180,6 +220,7 @@ class ContentUniquenessValidator:
         self,
         content_pieces: List[Dict],
         content_fingerprints: Dict[str, str],
+        similarity_indexes: Dict[str, ContentSimilarityIndex],
         weekly_themes: List[Dict],
         keywords: List[str]
     ) -> List[Dict]:
@@ -187,9 +228,16 @@ class ContentUniquenessValidator:
         try:
             validated_pieces = []
             
+            # Group pieces by fingerprint so duplicate lookups are O(1) per piece
+            fingerprint_groups = {}
+            for piece in content_pieces:
+                fingerprint = content_fingerprints.get(self._get_piece_id(piece), "")
+                if fingerprint:
+                    fingerprint_groups.setdefault(fingerprint, []).append(piece)
+            
             for piece in content_pieces:
                 validated_piece = await self._validate_single_piece(
-                    piece, content_pieces, content_fingerprints, weekly_themes, keywords
+                    piece, fingerprint_groups, content_fingerprints, similarity_indexes, weekly_themes, keywords
                 )
                 validated_pieces.append(validated_piece)
             
@@ -202,8 +250,9 @@ class ContentUniquenessValidator:
     async def _validate_single_piece(
         self,
         piece: Dict,
-        all_pieces: List[Dict],
+        fingerprint_groups: Dict[str, List[Dict]],
         content_fingerprints: Dict[str, str],
+        similarity_indexes: Dict[str, ContentSimilarityIndex],
         weekly_themes: List[Dict],
         keywords: List[str]
     ) -> Dict:
@@ -212,8 +261,8 @@ class ContentUniquenessValidator:
             validated_piece = piece.copy()
             
             # Calculate various uniqueness metrics
-            title_uniqueness = self._calculate_title_uniqueness(piece, all_pieces)
-            content_uniqueness = self._calculate_content_uniqueness(piece, all_pieces)
+            title_uniqueness = self._calculate_title_uniqueness(piece, similarity_indexes["title"])
+            content_uniqueness = self._calculate_content_uniqueness(piece, similarity_indexes["content"])
             keyword_uniqueness = self._calculate_keyword_uniqueness(piece, keywords)
             theme_alignment = self._calculate_theme_alignment(piece, weekly_themes)
             
@@ -223,7 +272,7 @@ class ContentUniquenessValidator:
             )
             
             # Check for duplicates
-            duplicate_check = self._check_for_duplicates(piece, all_pieces, content_fingerprints)
+            duplicate_check = self._check_for_duplicates(piece, fingerprint_groups, content_fingerprints)
             
             # Add validation results
             validated_piece["uniqueness_validation"] = {
@@ -245,32 +294,18 @@ class ContentUniquenessValidator:
             logger.error(f"Error validating single piece: {str(e)}")
             raise
     
-    def _calculate_title_uniqueness(self, piece: Dict, all_pieces: List[Dict]) -> float:
+    def _calculate_title_uniqueness(self, piece: Dict, title_index: ContentSimilarityIndex) -> float:
         """Calculate title uniqueness score."""
         try:
-            piece_title = piece.get("title", "").lower()
-            if not piece_title:
+            piece_key = id(piece)
+            if not piece.get("title", "") or piece_key not in title_index:
                 return 0.0
             
-            # Compare with other pieces
-            similarities = []
-            for other_piece in all_pieces:
-                if other_piece == piece:
-                    continue
-                
-                other_title = other_piece.get("title", "").lower()
-                if not other_title:
-                    continue
-                
-                # Calculate similarity using simple word overlap
-                similarity = self._calculate_text_similarity(piece_title, other_title)
-                similarities.append(similarity)
-            
-            if not similarities:
+            if len(title_index) < 2:
                 return 1.0  # No other pieces to compare with
             
-            # Uniqueness is inverse of maximum similarity
-            max_similarity = max(similarities)
+            # Uniqueness is inverse of maximum similarity (word overlap) among LSH candidates
+            max_similarity = title_index.max_similarity(piece_key)
             uniqueness = 1.0 - max_similarity
             
             return max(0.0, uniqueness)
@@ -279,32 +314,18 @@ class ContentUniquenessValidator:
             logger.error(f"Error calculating title uniqueness: {str(e)}")
             return 0.0
     
-    def _calculate_content_uniqueness(self, piece: Dict, all_pieces: List[Dict]) -> float:
+    def _calculate_content_uniqueness(self, piece: Dict, content_index: ContentSimilarityIndex) -> float:
         """Calculate content uniqueness score."""
         try:
-            piece_content = f"{piece.get('description', '')} {piece.get('key_message', '')}".lower()
-            if not piece_content:
+            piece_key = id(piece)
+            if piece_key not in content_index:
                 return 0.0
             
-            # Compare with other pieces
-            similarities = []
-            for other_piece in all_pieces:
-                if other_piece == piece:
-                    continue
-                
-                other_content = f"{other_piece.get('description', '')} {other_piece.get('key_message', '')}".lower()
-                if not other_content:
-                    continue
-                
-                # Calculate similarity
-                similarity = self._calculate_text_similarity(piece_content, other_content)
-                similarities.append(similarity)
-            
-            if not similarities:
+            if len(content_index) < 2:
                 return 1.0
             
-            # Uniqueness is inverse of maximum similarity
-            max_similarity = max(similarities)
+            # Uniqueness is inverse of maximum similarity among LSH candidates
+            max_similarity = content_index.max_similarity(piece_key)
             uniqueness = 1.0 - max_similarity
             
             return max(0.0, uniqueness)
@@ -397,30 +418,6 @@ class ContentUniquenessValidator:
             logger.error(f"Error calculating theme alignment: {str(e)}")
             return 0.0
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings."""
-        try:
-            if not text1 or not text2:
-                return 0.0
-            
-            # Simple word-based similarity
-            words1 = set(text1.split())
-            words2 = set(text2.split())
-            
-            if not words1 or not words2:
-                return 0.0
-            
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            
-            similarity = len(intersection) / len(union) if union else 0.0
-            
-            return similarity
-            
-        except Exception as e:
-            logger.error(f"Error calculating text similarity: {str(e)}")
-            return 0.0
-    
     def _calculate_overall_uniqueness_score(
         self,
         title_uniqueness: float,
@@ -451,32 +448,31 @@ class ContentUniquenessValidator:
             logger.error(f"Error calculating overall uniqueness score: {str(e)}")
             return 0.0
     
+    def _get_piece_id(self, piece: Dict) -> str:
+        """Identifier used for content fingerprints."""
+        return f"{piece.get('schedule_id', 'unknown')}_{piece.get('title', 'unknown')}"
+    
     def _check_for_duplicates(
         self,
         piece: Dict,
-        all_pieces: List[Dict],
+        fingerprint_groups: Dict[str, List[Dict]],
         content_fingerprints: Dict[str, str]
     ) -> Dict[str, Any]:
         """Check for duplicate content."""
         try:
-            piece_id = f"{piece.get('schedule_id', 'unknown')}_{piece.get('title', 'unknown')}"
-            piece_fingerprint = content_fingerprints.get(piece_id, "")
+            piece_fingerprint = content_fingerprints.get(self._get_piece_id(piece), "")
             
             duplicates = []
-            for other_piece in all_pieces:
-                if other_piece == piece:
+            for other_piece in fingerprint_groups.get(piece_fingerprint, []):
+                if other_piece is piece:
                     continue
                 
-                other_id = f"{other_piece.get('schedule_id', 'unknown')}_{other_piece.get('title', 'unknown')}"
-                other_fingerprint = content_fingerprints.get(other_id, "")
-                
-                if piece_fingerprint == other_fingerprint and piece_fingerprint:
-                    duplicates.append({
-                        "piece_id": other_id,
-                        "title": other_piece.get("title", ""),
-                        "day_number": other_piece.get("day_number", 0),
-                        "similarity_type": "exact_match"
-                    })
+                duplicates.append({
+                    "piece_id": self._get_piece_id(other_piece),
+                    "title": other_piece.get("title", ""),
+                    "day_number": other_piece.get("day_number", 0),
+                    "similarity_type": "exact_match"
+                })
             
             return {
                 "has_duplicates": len(duplicates) > 0,
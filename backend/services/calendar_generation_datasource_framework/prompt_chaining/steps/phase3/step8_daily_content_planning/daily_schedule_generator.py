@@ -42,15 +42,37 @@ class DailyScheduleGenerator:
     - Platform-specific optimization
     - Strategic alignment with business goals
     - Content variety and engagement
+    
+    Days are generated concurrently (bounded by ``max_concurrent_days``) and
+    reassembled in calendar order; set ``max_concurrent_days=1`` for the
+    sequential mode.
     """
     
-    def __init__(self):
-        """Initialize the daily schedule generator with real AI services."""
+    DEFAULT_MAX_CONCURRENT_DAYS = 5
+    DEFAULT_DAY_TIMEOUT_SECONDS = 120
+    
+    def __init__(
+        self,
+        max_concurrent_days: int = DEFAULT_MAX_CONCURRENT_DAYS,
+        day_timeout_seconds: Optional[float] = DEFAULT_DAY_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize the daily schedule generator with real AI services.
+        
+        Args:
+            max_concurrent_days: Maximum number of days generated at the same time
+            day_timeout_seconds: Timeout for generating a single day (None disables it)
+        """
         self.ai_engine = AIEngineService()
         self.keyword_researcher = KeywordResearcher()
         self.competitor_analyzer = CompetitorAnalyzer()
+        self.max_concurrent_days = max(1, max_concurrent_days)
+        self.day_timeout_seconds = day_timeout_seconds
         
-        logger.info("🎯 Daily Schedule Generator initialized with real AI services")
+        logger.info(
+            f"🎯 Daily Schedule Generator initialized with real AI services "
+            f"(max_concurrent_days={self.max_concurrent_days}, day_timeout={self.day_timeout_seconds}s)"
+        )
     
     async def generate_daily_schedules(
         self,
@@ -84,25 +106,31 @@ class DailyScheduleGenerator:
             # Calculate posting days based on preferences
             posting_days = self._calculate_posting_days(posting_preferences, calendar_duration)
             
-            # Generate daily content for each posting day
-            for day_number, posting_day in enumerate(posting_days, 1):
-                # Get weekly theme for this day
-                week_number = posting_day.get("week_number", 1)
-                weekly_theme = self._get_weekly_theme(weekly_themes, week_number)
-                
-                # Generate daily content
-                daily_content = await self._generate_daily_content(
-                    day_number=day_number,
-                    posting_day=posting_day,
-                    weekly_theme=weekly_theme,
-                    platform_strategies=platform_strategies,
-                    business_goals=business_goals,
-                    target_audience=target_audience,
-                    posting_preferences=posting_preferences
+            # Resolve weekly themes up front so a missing theme fails before any AI call
+            day_jobs = [
+                (day_number, posting_day, self._get_weekly_theme(weekly_themes, posting_day.get("week_number", 1)))
+                for day_number, posting_day in enumerate(posting_days, 1)
+            ]
+            
+            if self.max_concurrent_days > 1 and len(day_jobs) > 1:
+                daily_schedules = await self._generate_days_concurrently(
+                    day_jobs, platform_strategies, business_goals, target_audience, posting_preferences
                 )
-                
-                daily_schedules.append(daily_content)
-                logger.info(f"✅ Generated daily content for day {day_number}")
+            else:
+                # Generate daily content for each posting day
+                for day_number, posting_day, weekly_theme in day_jobs:
+                    daily_content = await self._generate_daily_content_with_timeout(
+                        day_number=day_number,
+                        posting_day=posting_day,
+                        weekly_theme=weekly_theme,
+                        platform_strategies=platform_strategies,
+                        business_goals=business_goals,
+                        target_audience=target_audience,
+                        posting_preferences=posting_preferences
+                    )
+                    
+                    daily_schedules.append(daily_content)
+                    logger.info(f"✅ Generated daily content for day {day_number}")
             
             logger.info(f"✅ Generated {len(daily_schedules)} daily schedules")
             return daily_schedules
@@ -111,6 +139,74 @@ class DailyScheduleGenerator:
             logger.error(f"❌ Error in daily schedule generation: {str(e)}")
             raise Exception(f"Daily schedule generation failed: {str(e)}")
     
+    async def _generate_days_concurrently(
+        self,
+        day_jobs: List[tuple],
+        platform_strategies: Dict,
+        business_goals: List[str],
+        target_audience: Dict,
+        posting_preferences: Dict
+    ) -> List[Dict]:
+        """
+        Generate all days concurrently under a semaphore.
+        
+        Results are returned in calendar (day number) order. As in the
+        sequential mode, the first failing day fails the whole generation;
+        the remaining in-flight days are cancelled.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_days)
+        start_time = time.time()
+        logger.info(
+            f"⚡ Generating {len(day_jobs)} days concurrently "
+            f"(max {self.max_concurrent_days} at a time)"
+        )
+        
+        async def generate_day(day_number: int, posting_day: Dict, weekly_theme: Dict) -> Dict:
+            async with semaphore:
+                daily_content = await self._generate_daily_content_with_timeout(
+                    day_number=day_number,
+                    posting_day=posting_day,
+                    weekly_theme=weekly_theme,
+                    platform_strategies=platform_strategies,
+                    business_goals=business_goals,
+                    target_audience=target_audience,
+                    posting_preferences=posting_preferences
+                )
+            logger.info(f"✅ Generated daily content for day {day_number}")
+            return daily_content
+        
+        tasks = [
+            asyncio.create_task(generate_day(day_number, posting_day, weekly_theme))
+            for day_number, posting_day, weekly_theme in day_jobs
+        ]
+        try:
+            # gather preserves task order, so results come back in day order
+            daily_schedules = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        logger.info(f"⚡ Concurrent day generation finished in {time.time() - start_time:.2f}s")
+        return list(daily_schedules)
+    
+    async def _generate_daily_content_with_timeout(self, day_number: int, **kwargs) -> Dict:
+        """Generate content for a day, enforcing the per-day timeout."""
+        if not self.day_timeout_seconds:
+            return await self._generate_daily_content(day_number=day_number, **kwargs)
+        try:
+            return await asyncio.wait_for(
+                self._generate_daily_content(day_number=day_number, **kwargs),
+                timeout=self.day_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Error generating daily content for day {day_number}: timed out after {self.day_timeout_seconds}s")
+            raise Exception(
+                f"Failed to generate daily content for day {day_number}: timed out after {self.day_timeout_seconds}s"
+            )
+    
     def _calculate_posting_days(
         self, 
         posting_preferences: Dict, 
@@ -9,6 +9,8 @@ import logging
 from typing import Dict, Any, List, Set
 from datetime import datetime
 
+from .similarity_index import ContentSimilarityIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +23,7 @@ class ContentUniquenessGate:
         self.name = "content_uniqueness"
         self.description = "Validates content uniqueness and prevents duplicate content"
         self.pass_threshold = 0.9
+        self.near_duplicate_threshold = 0.8
         self.validation_criteria = [
             "No duplicate content topics",
             "Unique content titles",
@@ -69,6 +72,11 @@ class ContentUniquenessGate:
             if duplicate_titles:
                 validation_result["issues"].extend(duplicate_titles)
             
+            # Check for near-duplicate titles (reworded variants of the same title)
+            near_duplicate_titles = self._check_near_duplicate_titles(content_items)
+            if near_duplicate_titles:
+                validation_result["issues"].extend(near_duplicate_titles)
+            
             # Check content diversity
             diversity_score = self._calculate_diversity_score(content_items)
             
@@ -186,6 +194,33 @@ class ContentUniquenessGate:
         
         return issues
     
+    def _check_near_duplicate_titles(self, content_items: List[Dict[str, Any]]) -> List[str]:
+        """Check for near-duplicate titles using the MinHash/LSH similarity index."""
+        issues = []
+        titles = []
+        seen_titles = set()
+        
+        # Exact duplicates are reported by _check_duplicate_titles; index each title once
+        for item in content_items:
+            if isinstance(item, dict):
+                title = item.get("title", "").strip()
+                if title and title.lower() not in seen_titles:
+                    seen_titles.add(title.lower())
+                    titles.append(title)
+        
+        index = ContentSimilarityIndex()
+        for position, title in enumerate(titles):
+            index.add(position, title)
+        
+        pairs = index.near_duplicate_pairs(self.near_duplicate_threshold)
+        for first, second, similarity in sorted(pairs, key=lambda pair: sorted(pair[:2])):
+            issues.append(
+                f"Near-duplicate titles found ({similarity:.0%} similar): "
+                f"'{titles[first]}' / '{titles[second]}'"
+            )
+        
+        return issues
+    
     def _calculate_diversity_score(self, content_items: List[Dict[str, Any]]) -> float:
         """Calculate content diversity score."""
         if not content_items:
@@ -0,0 +1,167 @@
+"""
+Content Similarity Index
+
+MinHash/LSH index for near-duplicate detection across calendar content.
+Shared by the content uniqueness quality gate and the Step 8 uniqueness validator.
+"""
+
+import hashlib
+import random
+import re
+from collections import defaultdict
+from typing import Dict, FrozenSet, Hashable, List, Set, Tuple
+
+# Mersenne prime used for the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class ContentSimilarityIndex:
+    """
+    Incremental near-duplicate index over short texts (titles, descriptions).
+
+    Each text is tokenized once into a set of word shingles and summarized by a
+    MinHash signature. Signatures are split into LSH bands; texts sharing any
+    band bucket become candidate pairs, and only candidates are compared with
+    exact Jaccard similarity on the cached shingle sets.
+
+    With the defaults (64 permutations, 32 bands of 2 rows) pairs with Jaccard
+    similarity around 0.3 are found with ~95% probability; pairs that never
+    share a bucket are treated as dissimilar (similarity 0.0).
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 32, shingle_size: int = 1, seed: int = 1):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+        self._shingles: Dict[Hashable, FrozenSet[str]] = {}
+        self._band_keys: Dict[Hashable, List[Tuple[int, ...]]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [defaultdict(set) for _ in range(bands)]
+        self._token_hashes: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shingles
+
+    def shingle(self, text: str) -> FrozenSet[str]:
+        """Lowercased word shingles of ``text`` (punctuation ignored)."""
+        words = _WORD_PATTERN.findall((text or "").lower())
+        if self.shingle_size <= 1:
+            return frozenset(words)
+        if len(words) < self.shingle_size:
+            return frozenset([" ".join(words)]) if words else frozenset()
+        return frozenset(
+            " ".join(words[i:i + self.shingle_size])
+            for i in range(len(words) - self.shingle_size + 1)
+        )
+
+    def add(self, key: Hashable, text: str) -> FrozenSet[str]:
+        """Insert (or replace) ``text`` under ``key``; returns its shingle set."""
+        if key in self._shingles:
+            self.remove(key)
+
+        shingles = self.shingle(text)
+        self._shingles[key] = shingles
+        if not shingles:
+            self._band_keys[key] = []
+            return shingles
+
+        signature = self._signature(shingles)
+        band_keys = [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+        for band, band_key in enumerate(band_keys):
+            self._buckets[band][band_key].add(key)
+        self._band_keys[key] = band_keys
+        return shingles
+
+    def remove(self, key: Hashable):
+        """Remove ``key`` from the index (no-op if absent)."""
+        band_keys = self._band_keys.pop(key, None)
+        self._shingles.pop(key, None)
+        for band, band_key in enumerate(band_keys or []):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def candidates(self, key: Hashable) -> Set[Hashable]:
+        """Keys sharing at least one LSH bucket with ``key`` (excluding itself)."""
+        found: Set[Hashable] = set()
+        for band, band_key in enumerate(self._band_keys.get(key, [])):
+            found.update(self._buckets[band].get(band_key, ()))
+        found.discard(key)
+        return found
+
+    def jaccard(self, key: Hashable, other: Hashable) -> float:
+        """Exact Jaccard similarity between two indexed texts."""
+        first = self._shingles.get(key)
+        second = self._shingles.get(other)
+        if not first or not second:
+            return 0.0
+        return len(first & second) / len(first | second)
+
+    def similar(self, key: Hashable, threshold: float = 0.0) -> List[Tuple[Hashable, float]]:
+        """Candidates of ``key`` with exact similarity >= ``threshold``, most similar first."""
+        matches = []
+        for other in self.candidates(key):
+            similarity = self.jaccard(key, other)
+            if similarity > 0.0 and similarity >= threshold:
+                matches.append((other, similarity))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def max_similarity(self, key: Hashable) -> float:
+        """Highest similarity between ``key`` and any other indexed text."""
+        return max((self.jaccard(key, other) for other in self.candidates(key)), default=0.0)
+
+    def near_duplicate_pairs(self, threshold: float) -> List[Tuple[Hashable, Hashable, float]]:
+        """All candidate pairs with exact similarity >= ``threshold`` (each pair once)."""
+        seen: Set[FrozenSet[Hashable]] = set()
+        pairs = []
+        for bucket_table in self._buckets:
+            for bucket in bucket_table.values():
+                if len(bucket) < 2:
+                    continue
+                members = list(bucket)
+                for i, first in enumerate(members):
+                    for second in members[i + 1:]:
+                        pair = frozenset((first, second))
+                        if pair in seen:
+                            continue
+                        seen.add(pair)
+                        similarity = self.jaccard(first, second)
+                        if similarity >= threshold:
+                            pairs.append((first, second, similarity))
+        return pairs
+
+    def _signature(self, shingles: FrozenSet[str]) -> List[int]:
+        """MinHash signature: element-wise minimum over the per-token hash vectors."""
+        vectors = [self._token_vector(token) for token in shingles]
+        return [min(values) for values in zip(*vectors)]
+
+    def _token_vector(self, token: str) -> List[int]:
+        vector = self._token_hashes.get(token)
+        if vector is None:
+            base = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+            vector = [((a * base + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in self._perms]
+            self._token_hashes[token] = vector
+        return vector
+
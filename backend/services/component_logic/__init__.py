@@ -8,6 +8,7 @@ from .ai_research_logic import AIResearchLogic
 from .personalization_logic import PersonalizationLogic
 from .research_utilities import ResearchUtilities
 from .style_detection_logic import StyleDetectionLogic
+from .style_detection_pipeline import StyleDetectionPipeline, get_style_detection_pipeline
 from .web_crawler_logic import WebCrawlerLogic
 
 __all__ = [
@@ -15,5 +16,7 @@ __all__ = [
     "PersonalizationLogic", 
     "ResearchUtilities",
     "StyleDetectionLogic",
+    "StyleDetectionPipeline",
+    "get_style_detection_pipeline",
     "WebCrawlerLogic"
 ] 
\ No newline at end of file
@@ -0,0 +1,152 @@
+"""Style Detection Pipeline for ALwrity Backend.
+
+Runs the StyleDetectionLogic LLM stages off the event loop, concurrently
+where they are independent, and memoizes results per site.
+
+Stages:
+    1. analyze_content_style + analyze_style_patterns (both only need the crawl content)
+    2. generate_style_guidelines (needs the style analysis)
+
+Results are keyed on the normalized URL plus a fingerprint of the crawled
+content, so re-running style detection against an unchanged site skips the
+LLM calls entirely.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse, urlunparse
+from loguru import logger
+
+from .style_detection_logic import StyleDetectionLogic
+
+STYLE_DETECTION_MEMO_SIZE = int(os.getenv('STYLE_DETECTION_MEMO_SIZE', '256'))
+
+
+def normalize_site_url(url: str) -> str:
+    """Normalize a site URL for memoization (case, default scheme, trailing slash, fragment)."""
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = f"https://{url}"
+    parsed = urlparse(url)
+    path = parsed.path.rstrip('/')
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), path, '', parsed.query, ''))
+
+
+def content_fingerprint(content: Dict[str, Any]) -> str:
+    """Stable hash of crawled content."""
+    payload = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class StyleDetectionPipeline:
+    """Concurrent, memoized style detection over crawled content."""
+
+    def __init__(self, style_logic: Optional[StyleDetectionLogic] = None, memo_size: int = STYLE_DETECTION_MEMO_SIZE):
+        self.style_logic = style_logic or StyleDetectionLogic()
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def run(
+        self,
+        content: Dict[str, Any],
+        source: str,
+        include_patterns: bool = True,
+        include_guidelines: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Run style analysis, pattern analysis and guideline generation.
+
+        Args:
+            content: Crawled (or text-sample) content
+            source: Site URL (normalized for the memo key) or a label such as "text_sample"
+            include_patterns: Whether to analyze style patterns
+            include_guidelines: Whether to generate style guidelines
+
+        Returns:
+            Dict with 'style_analysis' (raw StyleDetectionLogic result), 'style_patterns',
+            'style_guidelines' and 'cached'
+        """
+        source_key = normalize_site_url(source) if source and source != "text_sample" else "text_sample"
+        memo_key = f"{source_key}|{content_fingerprint(content)}|{int(include_patterns)}{int(include_guidelines)}"
+
+        cached = self._get(memo_key)
+        if cached is not None:
+            logger.info(f"[StyleDetectionPipeline] Reusing style detection for unchanged content: {source_key}")
+            return {**cached, 'cached': True}
+
+        # Stage 1: style analysis and pattern analysis are independent
+        style_task = asyncio.to_thread(self.style_logic.analyze_content_style, content)
+        if include_patterns:
+            style_analysis, patterns_result = await asyncio.gather(
+                style_task,
+                asyncio.to_thread(self.style_logic.analyze_style_patterns, content),
+                return_exceptions=True
+            )
+        else:
+            (style_analysis,) = await asyncio.gather(style_task, return_exceptions=True)
+            patterns_result = None
+
+        if isinstance(style_analysis, Exception):
+            style_analysis = {'success': False, 'error': str(style_analysis)}
+        if isinstance(patterns_result, Exception):
+            logger.warning(f"[StyleDetectionPipeline] Pattern analysis failed: {patterns_result}")
+            patterns_result = None
+
+        style_patterns = None
+        if patterns_result and patterns_result.get('success'):
+            style_patterns = patterns_result.get('patterns')
+
+        result = {
+            'style_analysis': style_analysis,
+            'style_patterns': style_patterns,
+            'style_guidelines': None
+        }
+        if not style_analysis or not style_analysis.get('success'):
+            return {**result, 'cached': False}
+
+        # Stage 2: guidelines build on the style analysis
+        if include_guidelines:
+            try:
+                guidelines_result = await asyncio.to_thread(
+                    self.style_logic.generate_style_guidelines, style_analysis.get('analysis', {})
+                )
+                if guidelines_result and guidelines_result.get('success'):
+                    result['style_guidelines'] = guidelines_result.get('guidelines')
+            except Exception as e:
+                logger.warning(f"[StyleDetectionPipeline] Guideline generation failed: {e}")
+
+        # Results flagged with a warning are recomputed next time
+        if 'warning' not in style_analysis:
+            self._put(memo_key, result)
+        return {**result, 'cached': False}
+
+    def clear(self):
+        with self._lock:
+            self._memo.clear()
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry is not None:
+                self._memo.move_to_end(key)
+            return entry
+
+    def _put(self, key: str, value: Dict[str, Any]):
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+
+
+def get_style_detection_pipeline() -> StyleDetectionPipeline:
+    """Get the process-wide style detection pipeline."""
+    if not hasattr(get_style_detection_pipeline, '_instance'):
+        get_style_detection_pipeline._instance = StyleDetectionPipeline()
+    return get_style_detection_pipeline._instance
@@ -8,12 +8,13 @@ from typing import Dict, Any, List, Optional
 from loguru import logger
 from datetime import datetime
 import asyncio
-import aiohttp
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 import requests
 import re
 
+from services.http_client_registry import get_http_client_registry
+
 class WebCrawlerLogic:
     """Business logic for web crawling and content extraction."""
     
@@ -118,18 +119,19 @@ class WebCrawlerLogic:
             
             # Fetch the page content
             try:
-                async with aiohttp.ClientSession(headers=self.headers, timeout=aiohttp.ClientTimeout(total=self.timeout)) as session:
-                    async with session.get(fixed_url) as response:
-                        if response.status == 200:
-                            html_content = await response.text()
-                            logger.debug("[WebCrawlerLogic.crawl_website] Successfully fetched HTML content")
-                        else:
-                            error_msg = f"Failed to fetch content: Status code {response.status}"
-                            logger.error(f"[WebCrawlerLogic.crawl_website] {error_msg}")
-                            return {
-                                'success': False,
-                                'error': error_msg
-                            }
+                response = await get_http_client_registry().request(
+                    'GET', fixed_url, headers=self.headers, timeout=self.timeout
+                )
+                if response.status == 200:
+                    html_content = response.text()
+                    logger.debug("[WebCrawlerLogic.crawl_website] Successfully fetched HTML content")
+                else:
+                    error_msg = f"Failed to fetch content: Status code {response.status}"
+                    logger.error(f"[WebCrawlerLogic.crawl_website] {error_msg}")
+                    return {
+                        'success': False,
+                        'error': error_msg
+                    }
             except Exception as e:
                 error_msg = f"Failed to fetch content from {fixed_url}: {str(e)}"
                 logger.error(f"[WebCrawlerLogic.crawl_website] {error_msg}")
@@ -29,12 +29,13 @@ class AIEngineService:
         self.ai_service_manager = AIServiceManager()
         logger.info("AIEngineService initialized")
     
-    async def analyze_content_gaps(self, analysis_summary: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_content_gaps(self, analysis_summary: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Analyze content gaps using AI insights.
         
         Args:
             analysis_summary: Summary of content analysis
+            force_refresh: Bypass the AI response cache
             
         Returns:
             AI-powered content gap insights
@@ -43,7 +44,7 @@ class AIEngineService:
             logger.info("🤖 Generating AI-powered content gap insights using centralized AI service")
             
             # Use the centralized AI service manager for strategic analysis
-            result = await self.ai_service_manager.generate_content_gap_analysis(analysis_summary)
+            result = await self.ai_service_manager.generate_content_gap_analysis(analysis_summary, force_refresh=force_refresh)
             
             logger.info("✅ Advanced AI content gap analysis completed")
             return result
@@ -86,12 +87,13 @@ class AIEngineService:
                 }
             }
     
-    async def analyze_market_position(self, market_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def analyze_market_position(self, market_data: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Analyze market position using AI insights.
         
         Args:
             market_data: Market analysis data
+            force_refresh: Bypass the AI response cache
             
         Returns:
             AI-powered market position analysis
@@ -100,7 +102,7 @@ class AIEngineService:
             logger.info("🤖 Generating AI-powered market position analysis using centralized AI service")
             
             # Use the centralized AI service manager for market position analysis
-            result = await self.ai_service_manager.generate_market_position_analysis(market_data)
+            result = await self.ai_service_manager.generate_market_position_analysis(market_data, force_refresh=force_refresh)
             
             logger.info("✅ Advanced AI market position analysis completed")
             return result
@@ -184,8 +186,10 @@ class AIEngineService:
             Format as structured JSON with detailed recommendations.
             """
             
-            # Use structured JSON response for better parsing
-            response = gemini_structured_json_response(
+            # Use structured JSON response for better parsing; run the blocking
+            # provider call off the event loop so concurrent callers overlap
+            response = await asyncio.to_thread(
+                gemini_structured_json_response,
                 prompt=prompt,
                 schema={
                     "type": "object",
@@ -0,0 +1,271 @@
+"""
+Competitor Crawler
+Runs advertools/Scrapy crawls in bounded child processes and aggregates records as they stream in.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import sys
+from collections import Counter
+from typing import Dict, Any, List, Optional, Set
+from urllib.parse import urlparse
+from loguru import logger
+
+from advertools.spider import spider_path
+
+# Crawl subsystem configuration
+COMPETITOR_CRAWL_MAX_PROCESSES = int(os.getenv('COMPETITOR_CRAWL_MAX_PROCESSES', '4'))
+COMPETITOR_CRAWL_MAX_COMPETITORS = int(os.getenv('COMPETITOR_CRAWL_MAX_COMPETITORS', '15'))
+COMPETITOR_CRAWL_DEPTH_LIMIT = int(os.getenv('COMPETITOR_CRAWL_DEPTH_LIMIT', '2'))
+COMPETITOR_CRAWL_PAGE_LIMIT = int(os.getenv('COMPETITOR_CRAWL_PAGE_LIMIT', '50'))
+COMPETITOR_CRAWL_PER_DOMAIN_CONCURRENCY = int(os.getenv('COMPETITOR_CRAWL_PER_DOMAIN_CONCURRENCY', '2'))
+COMPETITOR_CRAWL_TIMEOUT_SECONDS = int(os.getenv('COMPETITOR_CRAWL_TIMEOUT_SECONDS', '120'))
+# Extra time the reader allows after CLOSESPIDER_TIMEOUT for Scrapy's graceful close to flush the feed
+COMPETITOR_CRAWL_SHUTDOWN_GRACE_SECONDS = int(os.getenv('COMPETITOR_CRAWL_SHUTDOWN_GRACE_SECONDS', '15'))
+
+# Only the fields the aggregates use are streamed back from the crawler
+CRAWL_KEEP_COLUMNS = ['^status$', '^size$', '^title$', '^meta_desc$', '^depth$']
+
+# Crawl records can carry full page text; allow long JSON lines on stdout
+STREAM_LINE_LIMIT = 16 * 1024 * 1024
+
+PAGE_TYPE_INDICATORS = [
+    ('blog_posts', ['/blog/', '/post/', '/article/', '/news/']),
+    ('product_pages', ['/product/', '/item/', '/shop/']),
+    ('category_pages', ['/category/', '/collection/', '/browse/']),
+    ('landing_pages', ['/landing/', '/promo/', '/campaign/']),
+]
+
+
+def categorize_page_url(url: str) -> str:
+    """Page type for a crawled URL based on its path."""
+    url_lower = url.lower()
+    for page_type, indicators in PAGE_TYPE_INDICATORS:
+        if any(indicator in url_lower for indicator in indicators):
+            return page_type
+    return 'other'
+
+
+class CompetitorCrawlAggregates:
+    """Running aggregates for one competitor crawl, updated per record."""
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.total_pages = 0
+        self.status_codes: Counter = Counter()
+        self.page_types = {page_type: 0 for page_type, _ in PAGE_TYPE_INDICATORS}
+        self.page_types['other'] = 0
+        self.sizes: List[float] = []  # bounded by the page budget; needed for the median
+        self.title_length_total = 0
+        self.title_count = 0
+        self.meta_desc_length_total = 0
+        self.meta_desc_count = 0
+        self.truncated = False
+        self.errors: List[str] = []
+
+    def add(self, record: Dict[str, Any]):
+        self.total_pages += 1
+
+        status = record.get('status')
+        if status is not None:
+            self.status_codes[status] += 1
+
+        url = record.get('url')
+        if url:
+            self.page_types[categorize_page_url(url)] += 1
+
+        size = record.get('size')
+        if isinstance(size, (int, float)):
+            self.sizes.append(size)
+
+        title = record.get('title')
+        if isinstance(title, str):
+            self.title_length_total += len(title)
+            self.title_count += 1
+
+        meta_desc = record.get('meta_desc')
+        if isinstance(meta_desc, str):
+            self.meta_desc_length_total += len(meta_desc)
+            self.meta_desc_count += 1
+
+    def to_crawl_result(self) -> Dict[str, Any]:
+        return {
+            'total_pages': self.total_pages,
+            'status_codes': dict(self.status_codes),
+            'page_types': dict(self.page_types),
+            'content_length_stats': {
+                'mean': statistics.fmean(self.sizes) if self.sizes else 0,
+                'median': statistics.median(self.sizes) if self.sizes else 0
+            }
+        }
+
+    def to_content_structure(self) -> Dict[str, Any]:
+        return {
+            'avg_title_length': self.title_length_total / self.title_count if self.title_count else 0,
+            'avg_meta_desc_length': self.meta_desc_length_total / self.meta_desc_count if self.meta_desc_count else 0,
+            'h1_usage': 0,
+            'internal_links_avg': 0,
+            'external_links_avg': 0
+        }
+
+
+class CompetitorCrawler:
+    """
+    Non-blocking competitor crawl engine.
+
+    Each crawl is a ``scrapy runspider`` child process running the advertools
+    spider (a Twisted reactor cannot be restarted inside a pooled worker), with
+    at most ``max_processes`` running at once and one crawl per domain. Crawl
+    records are read from the child's stdout as JSON lines and folded into
+    CompetitorCrawlAggregates, so nothing is written to disk or loaded into a
+    DataFrame. Depth, page and time budgets are enforced both through Scrapy
+    settings and on the reading side. The reader waits ``shutdown_grace_seconds``
+    past Scrapy's own timeout so a slow site still returns the pages the spider
+    flushes on close; cancelling the awaiting task (or calling ``cancel()``)
+    terminates the child processes.
+    """
+
+    def __init__(
+        self,
+        max_processes: int = COMPETITOR_CRAWL_MAX_PROCESSES,
+        depth_limit: int = COMPETITOR_CRAWL_DEPTH_LIMIT,
+        page_limit: int = COMPETITOR_CRAWL_PAGE_LIMIT,
+        per_domain_concurrency: int = COMPETITOR_CRAWL_PER_DOMAIN_CONCURRENCY,
+        timeout_seconds: int = COMPETITOR_CRAWL_TIMEOUT_SECONDS,
+        download_delay: float = 1.0,
+        shutdown_grace_seconds: int = COMPETITOR_CRAWL_SHUTDOWN_GRACE_SECONDS
+    ):
+        self.max_processes = max(1, max_processes)
+        self.depth_limit = depth_limit
+        self.page_limit = max(1, page_limit)
+        self.per_domain_concurrency = max(1, per_domain_concurrency)
+        self.timeout_seconds = timeout_seconds
+        self.download_delay = download_delay
+        self.shutdown_grace_seconds = max(0, shutdown_grace_seconds)
+        self._process_slots: Optional[asyncio.Semaphore] = None
+        self._running: Set[asyncio.subprocess.Process] = set()
+
+    async def crawl_many(
+        self,
+        urls: List[str],
+        max_competitors: int = COMPETITOR_CRAWL_MAX_COMPETITORS
+    ) -> Dict[str, CompetitorCrawlAggregates]:
+        """
+        Crawl competitor sites concurrently (one crawl per domain).
+
+        Returns:
+            Mapping of domain to its aggregates; failed crawls carry ``errors``
+        """
+        targets: Dict[str, str] = {}
+        for url in urls:
+            domain = urlparse(url).netloc
+            if domain and domain not in targets:
+                targets[domain] = url
+            if len(targets) >= max_competitors:
+                break
+
+        results = await asyncio.gather(*(self.crawl(url) for url in targets.values()))
+        return dict(zip(targets.keys(), results))
+
+    async def crawl(self, url: str) -> CompetitorCrawlAggregates:
+        """Crawl one site within the depth/page/time budgets."""
+        domain = urlparse(url).netloc
+        aggregates = CompetitorCrawlAggregates(domain)
+
+        if self._process_slots is None:
+            self._process_slots = asyncio.Semaphore(self.max_processes)
+
+        async with self._process_slots:
+            process = await asyncio.create_subprocess_exec(
+                *self._build_command(url, domain),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=STREAM_LINE_LIMIT
+            )
+            self._running.add(process)
+            # Scrapy closes the spider at CLOSESPIDER_TIMEOUT; the reader only gives up
+            # once the grace period for that graceful close has also passed
+            reader_timeout = self.timeout_seconds + self.shutdown_grace_seconds
+            try:
+                await asyncio.wait_for(self._consume(process, aggregates), timeout=reader_timeout)
+            except asyncio.TimeoutError:
+                aggregates.truncated = True
+                logger.warning(f"Crawl of {domain} did not finish within {reader_timeout}s; keeping partial results")
+            except Exception as e:
+                aggregates.errors.append(str(e))
+                logger.warning(f"Crawl of {domain} failed: {e}")
+            finally:
+                self._running.discard(process)
+                await self._terminate(process)
+
+        return aggregates
+
+    async def cancel(self):
+        """Terminate every running crawl."""
+        await asyncio.gather(*(self._terminate(process) for process in list(self._running)))
+
+    async def _consume(self, process: asyncio.subprocess.Process, aggregates: CompetitorCrawlAggregates):
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                break
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            aggregates.add(record)
+            if aggregates.total_pages >= self.page_limit:
+                aggregates.truncated = True
+                return
+
+        returncode = await process.wait()
+        if returncode != 0 and not aggregates.total_pages:
+            raise RuntimeError(f"crawler exited with status {returncode}")
+
+    async def _terminate(self, process: asyncio.subprocess.Process):
+        if process.returncode is not None:
+            return
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except ProcessLookupError:
+            return
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    def _build_command(self, url: str, domain: str) -> List[str]:
+        """``scrapy runspider`` command equivalent to ``adv.crawl``, writing the feed to stdout."""
+        settings = {
+            'DEPTH_LIMIT': self.depth_limit,
+            'CLOSESPIDER_PAGECOUNT': self.page_limit,
+            'CLOSESPIDER_TIMEOUT': self.timeout_seconds,
+            'CONCURRENT_REQUESTS_PER_DOMAIN': self.per_domain_concurrency,
+            'DOWNLOAD_DELAY': self.download_delay,
+            'LOG_LEVEL': 'ERROR',
+        }
+        spider_args = {
+            'url_list': url,
+            'allowed_domains': urlparse(url).hostname or domain,  # Scrapy ignores entries with a port
+            'follow_links': True,
+            'exclude_url_params': None,
+            'include_url_params': None,
+            'exclude_url_regex': None,
+            'include_url_regex': None,
+            'css_selectors': None,
+            'xpath_selectors': None,
+            'meta': None,
+            'keep_columns': CRAWL_KEEP_COLUMNS,
+            'discard_columns': None,
+        }
+
+        # -u: records reach the reader as they are exported instead of in 8 KB blocks
+        command = [sys.executable, '-u', '-m', 'scrapy', 'runspider', spider_path]
+        for key, value in spider_args.items():
+            command.extend(['-a', f"{key}={value}"])
+        command.extend(['-o', 'stdout::jsonlines'])
+        for key, value in settings.items():
+            command.extend(['-s', f"{key}={value}"])
+        return command
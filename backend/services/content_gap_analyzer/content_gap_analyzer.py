@@ -11,8 +11,6 @@ import asyncio
 import json
 import pandas as pd
 import advertools as adv
-import tempfile
-import os
 from urllib.parse import urlparse
 from collections import Counter, defaultdict
 
@@ -20,6 +18,7 @@ from collections import Counter, defaultdict
 from services.database import get_db_session
 from .ai_engine_service import AIEngineService
 from .competitor_analyzer import CompetitorAnalyzer
+from .competitor_crawler import CompetitorCrawler
 from .keyword_researcher import KeywordResearcher
 
 class ContentGapAnalyzer:
@@ -30,14 +29,13 @@ class ContentGapAnalyzer:
         self.ai_engine = AIEngineService()
         self.competitor_analyzer = CompetitorAnalyzer()
         self.keyword_researcher = KeywordResearcher()
-        
-        # Temporary directories for crawl data
-        self.temp_dir = tempfile.mkdtemp()
+        self.competitor_crawler = CompetitorCrawler()
         
         logger.info("ContentGapAnalyzer initialized")
     
     async def analyze_comprehensive_gap(self, target_url: str, competitor_urls: List[str], 
-                                      target_keywords: List[str], industry: str = "general") -> Dict[str, Any]:
+                                      target_keywords: List[str], industry: str = "general",
+                                      force_refresh: bool = False) -> Dict[str, Any]:
         """
         Perform comprehensive content gap analysis.
         
@@ -46,6 +44,7 @@ class ContentGapAnalyzer:
             competitor_urls: List of competitor URLs (max 5 for performance)
             target_keywords: List of primary keywords to analyze
             industry: Industry category for context
+            force_refresh: Bypass the AI response cache for a deliberately fresh run
             
         Returns:
             Comprehensive analysis results
@@ -95,7 +94,7 @@ class ContentGapAnalyzer:
             
             # Phase 5: AI-Powered Insights
             logger.info("🤖 Generating AI-powered insights")
-            ai_insights = await self._generate_ai_insights(results)
+            ai_insights = await self._generate_ai_insights(results, force_refresh=force_refresh)
             results['ai_insights'] = ai_insights
             logger.info("✅ Generated comprehensive AI insights")
             
@@ -293,7 +292,7 @@ class ContentGapAnalyzer:
     
     async def _analyze_competitor_content_deep(self, competitor_urls: List[str]) -> Dict[str, Any]:
         """
-        Deep competitor content analysis using adv.crawl.
+        Deep competitor content analysis using the advertools crawler.
         
         Args:
             competitor_urls: List of competitor URLs to analyze
@@ -311,70 +310,33 @@ class ContentGapAnalyzer:
                 'technical_insights': {}
             }
             
-            for i, url in enumerate(competitor_urls[:3]):  # Limit to 3 for performance
-                try:
-                    domain = urlparse(url).netloc
-                    logger.info(f"🔍 Analyzing competitor {i+1}: {domain}")
-                    
-                    # Create temporary file for crawl results
-                    crawl_file = os.path.join(self.temp_dir, f"crawl_{domain.replace('.', '_')}.jl")
-                    
-                    # Use adv.crawl for comprehensive analysis
-                    # Note: This is a simplified crawl - in production, customize settings
-                    try:
-                        adv.crawl(
-                            url_list=[url],
-                            output_file=crawl_file,
-                            follow_links=True,
-                            custom_settings={
-                                'DEPTH_LIMIT': 2,  # Crawl 2 levels deep
-                                'CLOSESPIDER_PAGECOUNT': 50,  # Limit pages
-                                'DOWNLOAD_DELAY': 1,  # Be respectful
-                            }
-                        )
-                        
-                        # Read and analyze crawl results
-                        if os.path.exists(crawl_file):
-                            crawl_df = pd.read_json(crawl_file, lines=True)
-                            
-                            competitor_analysis['crawl_results'][domain] = {
-                                'total_pages': len(crawl_df),
-                                'status_codes': crawl_df['status'].value_counts().to_dict() if 'status' in crawl_df.columns else {},
-                                'page_types': self._categorize_pages(crawl_df),
-                                'content_length_stats': {
-                                    'mean': crawl_df['size'].mean() if 'size' in crawl_df.columns else 0,
-                                    'median': crawl_df['size'].median() if 'size' in crawl_df.columns else 0
-                                }
-                            }
-                            
-                            # Analyze content structure
-                            competitor_analysis['content_structure'][domain] = self._analyze_content_structure(crawl_df)
-                            
-                            logger.info(f"✅ Crawled {len(crawl_df)} pages from {domain}")
-                        else:
-                            logger.warning(f"⚠️ No crawl data available for {domain}")
-                            
-                    except Exception as crawl_error:
-                        logger.warning(f"Could not crawl {url}: {str(crawl_error)}")
-                        # Fallback to simulated data
-                        competitor_analysis['crawl_results'][domain] = {
-                            'total_pages': 150,
-                            'status_codes': {'200': 150},
-                            'page_types': {
-                                'blog_posts': 80,
-                                'product_pages': 30,
-                                'landing_pages': 20,
-                                'guides': 20
-                            },
-                            'content_length_stats': {
-                                'mean': 2500,
-                                'median': 2200
-                            }
+            # Crawls run in bounded child processes; records are aggregated as they stream in
+            crawls = await self.competitor_crawler.crawl_many(competitor_urls)
+            
+            for domain, aggregates in crawls.items():
+                if aggregates.errors:
+                    logger.warning(f"Could not crawl {domain}: {aggregates.errors[0]}")
+                    # Fallback to simulated data
+                    competitor_analysis['crawl_results'][domain] = {
+                        'total_pages': 150,
+                        'status_codes': {'200': 150},
+                        'page_types': {
+                            'blog_posts': 80,
+                            'product_pages': 30,
+                            'landing_pages': 20,
+                            'guides': 20
+                        },
+                        'content_length_stats': {
+                            'mean': 2500,
+                            'median': 2200
                         }
-                        
-                except Exception as e:
-                    logger.warning(f"Could not analyze {url}: {str(e)}")
-                    continue
+                    }
+                elif aggregates.total_pages:
+                    competitor_analysis['crawl_results'][domain] = aggregates.to_crawl_result()
+                    competitor_analysis['content_structure'][domain] = aggregates.to_content_structure()
+                    logger.info(f"✅ Crawled {aggregates.total_pages} pages from {domain}")
+                else:
+                    logger.warning(f"⚠️ No crawl data available for {domain}")
             
             # Analyze content themes across competitors
             all_topics = []
@@ -496,12 +458,13 @@ class ContentGapAnalyzer:
             logger.error(f"Error in content theme analysis: {str(e)}")
             return {}
     
-    async def _generate_ai_insights(self, analysis_results: Dict[str, Any]) -> Dict[str, Any]:
+    async def _generate_ai_insights(self, analysis_results: Dict[str, Any], force_refresh: bool = False) -> Dict[str, Any]:
         """
         Generate AI-powered insights using advanced AI analysis.
         
         Args:
             analysis_results: Complete analysis results
+            force_refresh: Bypass the AI response cache
             
         Returns:
             AI-generated insights
@@ -520,7 +483,7 @@ class ContentGapAnalyzer:
             }
             
             # Generate comprehensive AI insights using AI engine
-            ai_insights = await self.ai_engine.analyze_content_gaps(analysis_summary)
+            ai_insights = await self.ai_engine.analyze_content_gaps(analysis_summary, force_refresh=force_refresh)
             
             if ai_insights:
                 logger.info("✅ Generated comprehensive AI insights")
@@ -718,53 +681,6 @@ class ContentGapAnalyzer:
             logger.error(f"Error generating strategic recommendations: {str(e)}")
             return []
     
-    def _categorize_pages(self, crawl_df: pd.DataFrame) -> Dict[str, int]:
-        """Categorize crawled pages by type."""
-        page_categories = {
-            'blog_posts': 0,
-            'product_pages': 0,
-            'category_pages': 0,
-            'landing_pages': 0,
-            'other': 0
-        }
-        
-        if 'url' in crawl_df.columns:
-            for url in crawl_df['url']:
-                url_lower = url.lower()
-                if any(indicator in url_lower for indicator in ['/blog/', '/post/', '/article/', '/news/']):
-                    page_categories['blog_posts'] += 1
-                elif any(indicator in url_lower for indicator in ['/product/', '/item/', '/shop/']):
-                    page_categories['product_pages'] += 1
-                elif any(indicator in url_lower for indicator in ['/category/', '/collection/', '/browse/']):
-                    page_categories['category_pages'] += 1
-                elif any(indicator in url_lower for indicator in ['/landing/', '/promo/', '/campaign/']):
-                    page_categories['landing_pages'] += 1
-                else:
-                    page_categories['other'] += 1
-        
-        return page_categories
-    
-    def _analyze_content_structure(self, crawl_df: pd.DataFrame) -> Dict[str, Any]:
-        """Analyze content structure from crawl data."""
-        structure_analysis = {
-            'avg_title_length': 0,
-            'avg_meta_desc_length': 0,
-            'h1_usage': 0,
-            'internal_links_avg': 0,
-            'external_links_avg': 0
-        }
-        
-        # Analyze available columns
-        if 'title' in crawl_df.columns:
-            structure_analysis['avg_title_length'] = crawl_df['title'].str.len().mean()
-        
-        if 'meta_desc' in crawl_df.columns:
-            structure_analysis['avg_meta_desc_length'] = crawl_df['meta_desc'].str.len().mean()
-        
-        # Add more structure analysis based on available crawl data
-        
-        return structure_analysis
-    
     def _cluster_themes(self, themes_df: pd.DataFrame) -> Dict[str, List[str]]:
         """Cluster themes into topic groups."""
         clusters = {
@@ -4,7 +4,8 @@ Handles all database operations for content planning system.
 """
 
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 from loguru import logger
 from datetime import datetime
@@ -44,10 +45,25 @@ class ContentPlanningDBService:
             self.logger.error(f"Error getting content strategy: {str(e)}")
             return None
     
-    async def get_user_content_strategies(self, user_id: int) -> List[ContentStrategy]:
-        """Get all content strategies for a user."""
+    async def get_user_content_strategies(
+        self,
+        user_id: int,
+        include_events: bool = False,
+        include_analytics: bool = False
+    ) -> List[ContentStrategy]:
+        """
+        Get all content strategies for a user.
+        
+        include_events / include_analytics eager-load the relationships with one
+        extra query each instead of one lazy query per strategy.
+        """
         try:
-            return self.db.query(ContentStrategy).filter(ContentStrategy.user_id == user_id).all()
+            query = self.db.query(ContentStrategy).filter(ContentStrategy.user_id == user_id)
+            if include_events:
+                query = query.options(selectinload(ContentStrategy.calendar_events))
+            if include_analytics:
+                query = query.options(selectinload(ContentStrategy.analytics))
+            return query.all()
         except SQLAlchemyError as e:
             self.logger.error(f"Error getting user content strategies: {str(e)}")
             return []
@@ -115,6 +131,15 @@ class ContentPlanningDBService:
             self.logger.error(f"Error getting strategy calendar events: {str(e)}")
             return []
     
+    async def get_strategy_calendar_events_version(self, strategy_id: int) -> Dict[str, Any]:
+        """Count, highest id and latest update of a strategy's events (changes on any create/update/delete)."""
+        count, max_id, last_updated = self.db.query(
+            func.count(CalendarEvent.id),
+            func.max(CalendarEvent.id),
+            func.max(CalendarEvent.updated_at)
+        ).filter(CalendarEvent.strategy_id == strategy_id).one()
+        return {"count": count, "max_id": max_id, "last_updated": last_updated}
+    
     async def update_calendar_event(self, event_id: int, update_data: Dict[str, Any]) -> Optional[CalendarEvent]:
         """Update calendar event."""
         try:
@@ -314,27 +339,207 @@ class ContentPlanningDBService:
     
     # Advanced Query Operations
     async def get_strategies_with_analytics(self, user_id: int) -> List[Dict[str, Any]]:
-        """Get content strategies with their analytics summary."""
+        """Get content strategies with their analytics summary (single aggregate query)."""
         try:
-            strategies = await self.get_user_content_strategies(user_id)
-            result = []
+            summary = (
+                self.db.query(
+                    ContentAnalytics.strategy_id.label('strategy_id'),
+                    func.count(ContentAnalytics.id).label('analytics_count'),
+                    func.avg(func.coalesce(ContentAnalytics.performance_score, 0)).label('average_performance'),
+                    func.max(ContentAnalytics.recorded_at).label('last_analytics')
+                )
+                .join(ContentStrategy, ContentStrategy.id == ContentAnalytics.strategy_id)
+                .filter(ContentStrategy.user_id == user_id)
+                .group_by(ContentAnalytics.strategy_id)
+                .subquery()
+            )
+            rows = (
+                self.db.query(
+                    ContentStrategy,
+                    summary.c.analytics_count,
+                    summary.c.average_performance,
+                    summary.c.last_analytics
+                )
+                .outerjoin(summary, summary.c.strategy_id == ContentStrategy.id)
+                .filter(ContentStrategy.user_id == user_id)
+                .all()
+            )
             
-            for strategy in strategies:
-                analytics = await self.get_strategy_analytics(strategy.id)
-                avg_performance = sum(a.performance_score or 0 for a in analytics) / len(analytics) if analytics else 0
-                
-                result.append({
+            return [
+                {
                     'strategy': strategy.to_dict(),
-                    'analytics_count': len(analytics),
-                    'average_performance': avg_performance,
-                    'last_analytics': max(a.recorded_at for a in analytics).isoformat() if analytics else None
-                })
-            
-            return result
+                    'analytics_count': analytics_count or 0,
+                    'average_performance': float(average_performance or 0),
+                    'last_analytics': last_analytics.isoformat() if last_analytics else None
+                }
+                for strategy, analytics_count, average_performance, last_analytics in rows
+            ]
         except SQLAlchemyError as e:
             self.logger.error(f"Error getting strategies with analytics: {str(e)}")
             return []
     
+    # Aggregate Analytics Operations
+    def _analytics_range_filters(
+        self,
+        strategy_id: int,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> List[Any]:
+        """Filters served by the (strategy_id, recorded_at) index."""
+        filters = [ContentAnalytics.strategy_id == strategy_id]
+        if start_date:
+            filters.append(ContentAnalytics.recorded_at >= start_date)
+        if end_date:
+            filters.append(ContentAnalytics.recorded_at <= end_date)
+        return filters
+    
+    async def get_strategy_analytics_summary(
+        self,
+        strategy_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Count, average/max performance and last record time for a strategy."""
+        try:
+            count, average, maximum, last_recorded = self.db.query(
+                func.count(ContentAnalytics.id),
+                func.avg(func.coalesce(ContentAnalytics.performance_score, 0)),
+                func.max(ContentAnalytics.performance_score),
+                func.max(ContentAnalytics.recorded_at)
+            ).filter(*self._analytics_range_filters(strategy_id, start_date, end_date)).one()
+            
+            return {
+                'strategy_id': strategy_id,
+                'analytics_count': count or 0,
+                'average_performance': float(average or 0),
+                'max_performance': float(maximum) if maximum is not None else None,
+                'last_analytics': last_recorded.isoformat() if last_recorded else None
+            }
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error getting strategy analytics summary: {str(e)}")
+            return {
+                'strategy_id': strategy_id,
+                'analytics_count': 0,
+                'average_performance': 0.0,
+                'max_performance': None,
+                'last_analytics': None
+            }
+    
+    async def get_analytics_breakdown(
+        self,
+        strategy_id: int,
+        group_by: str = 'platform',
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-platform or per-content-type analytics aggregates for a strategy.
+        
+        Args:
+            strategy_id: Content strategy ID
+            group_by: 'platform' or 'content_type' (taken from the linked calendar event)
+            start_date: Optional lower bound on recorded_at
+            end_date: Optional upper bound on recorded_at
+            
+        Returns:
+            Mapping of group key to count, average performance and average engagement rate
+        """
+        try:
+            if group_by == 'platform':
+                key = ContentAnalytics.platform
+            elif group_by == 'content_type':
+                key = func.coalesce(CalendarEvent.content_type, 'unknown')
+            else:
+                raise ValueError(f"Unsupported analytics grouping: {group_by}")
+            
+            engagement = func.coalesce(ContentAnalytics.metrics['engagement_rate'].as_float(), 0.0)
+            query = self.db.query(
+                key.label('group_key'),
+                func.count(ContentAnalytics.id),
+                func.avg(func.coalesce(ContentAnalytics.performance_score, 0)),
+                func.avg(engagement)
+            )
+            if group_by == 'content_type':
+                query = query.outerjoin(CalendarEvent, CalendarEvent.id == ContentAnalytics.event_id)
+            rows = (
+                query.filter(*self._analytics_range_filters(strategy_id, start_date, end_date))
+                .group_by(key)
+                .all()
+            )
+            
+            return {
+                group_key: {
+                    'count': count,
+                    'average_performance': float(average_performance or 0),
+                    'average_engagement': float(average_engagement or 0)
+                }
+                for group_key, count, average_performance, average_engagement in rows
+            }
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error getting analytics breakdown: {str(e)}")
+            return {}
+    
+    async def get_analytics_rollup(
+        self,
+        strategy_id: int,
+        bucket: str = 'day',
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Time-bucketed analytics rollup for a strategy.
+        
+        Args:
+            strategy_id: Content strategy ID
+            bucket: 'hour', 'day', 'week' or 'month'
+            start_date: Optional lower bound on recorded_at
+            end_date: Optional upper bound on recorded_at
+            
+        Returns:
+            One entry per bucket (oldest first) with count and average/max performance
+        """
+        try:
+            period = self._time_bucket(ContentAnalytics.recorded_at, bucket).label('period')
+            rows = (
+                self.db.query(
+                    period,
+                    func.count(ContentAnalytics.id),
+                    func.avg(func.coalesce(ContentAnalytics.performance_score, 0)),
+                    func.max(ContentAnalytics.performance_score)
+                )
+                .filter(*self._analytics_range_filters(strategy_id, start_date, end_date))
+                .group_by(period)
+                .order_by(period)
+                .all()
+            )
+            
+            return [
+                {
+                    'period': value.isoformat() if isinstance(value, datetime) else value,
+                    'analytics_count': count,
+                    'average_performance': float(average or 0),
+                    'max_performance': float(maximum) if maximum is not None else None
+                }
+                for value, count, average, maximum in rows
+            ]
+        except SQLAlchemyError as e:
+            self.logger.error(f"Error getting analytics rollup: {str(e)}")
+            return []
+    
+    def _time_bucket(self, column, bucket: str):
+        """Dialect-specific expression truncating a timestamp to a bucket."""
+        if bucket not in ('hour', 'day', 'week', 'month'):
+            raise ValueError(f"Unsupported rollup bucket: {bucket}")
+        
+        dialect = self.db.get_bind().dialect.name
+        if dialect == 'postgresql':
+            return func.date_trunc(bucket, column)
+        if dialect == 'mysql':
+            formats = {'hour': '%Y-%m-%d %H:00', 'day': '%Y-%m-%d', 'week': '%x-W%v', 'month': '%Y-%m'}
+            return func.date_format(column, formats[bucket])
+        formats = {'hour': '%Y-%m-%d %H:00', 'day': '%Y-%m-%d', 'week': '%Y-W%W', 'month': '%Y-%m'}
+        return func.strftime(formats[bucket], column)
+    
     async def get_events_by_status(self, strategy_id: int, status: str) -> List[CalendarEvent]:
         """Get calendar events by status for a strategy."""
         try:
@@ -59,11 +59,24 @@ def init_database():
         EnhancedStrategyBase.metadata.create_all(bind=engine)
         MonitoringBase.metadata.create_all(bind=engine)
         PersonaBase.metadata.create_all(bind=engine)
+        _ensure_indexes(ContentPlanningBase)
+        _ensure_indexes(EnhancedStrategyBase)
         logger.info("Database initialized successfully with all models including personas")
     except SQLAlchemyError as e:
         logger.error(f"Error initializing database: {str(e)}")
         raise
 
+def _ensure_indexes(base):
+    """
+    Create indexes declared on models whose tables already existed.
+    
+    create_all() skips existing tables, so indexes added to a model later
+    would otherwise never reach databases created before they were declared.
+    """
+    for table in base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
 def close_database():
     """
     Close database connections.
@@ -0,0 +1,516 @@
+"""
+HTTP Client Registry
+Process-wide pooled HTTP clients shared by crawlers and SEO tools.
+
+Outbound fetches go through one registry instead of a new client per call:
+
+- an aiohttp session per event loop over a TCPConnector with a global pool
+  limit, a per-host limit, a DNS cache and keep-alive connection reuse
+- per-host concurrency slots and request spacing (politeness)
+- a uniform timeout, retry/backoff and response size policy, applied to
+  both fully read (``request``) and streamed (``stream``) responses
+- one ``requests.Session`` per thread over a shared ``HTTPAdapter`` for the
+  synchronous SEO analyzers (sessions are not thread-safe and carry cookies;
+  the adapter's connection pools are)
+
+Pool metrics (connections created vs reused, DNS cache hits, per-host
+request counts and latency) are available from ``get_metrics()``.
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, AsyncIterator
+from urllib.parse import urlparse
+from loguru import logger
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Pool configuration
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv('HTTP_POOL_MAX_CONNECTIONS', '100'))
+HTTP_POOL_MAX_PER_HOST = int(os.getenv('HTTP_POOL_MAX_PER_HOST', '8'))
+HTTP_DNS_CACHE_TTL = int(os.getenv('HTTP_DNS_CACHE_TTL', '300'))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv('HTTP_KEEPALIVE_TIMEOUT', '30'))
+
+# Request policy
+HTTP_DEFAULT_TIMEOUT = float(os.getenv('HTTP_DEFAULT_TIMEOUT', '30'))
+HTTP_MAX_RETRIES = int(os.getenv('HTTP_MAX_RETRIES', '2'))
+HTTP_RETRY_BACKOFF_SECONDS = float(os.getenv('HTTP_RETRY_BACKOFF_SECONDS', '0.5'))
+HTTP_MAX_RESPONSE_BYTES = int(os.getenv('HTTP_MAX_RESPONSE_BYTES', str(10 * 1024 * 1024)))
+HTTP_PER_HOST_MIN_INTERVAL = float(os.getenv('HTTP_PER_HOST_MIN_INTERVAL', '0'))  # seconds between request starts
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+)
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseTooLargeError(Exception):
+    """Raised when a response body exceeds the registry's size cap."""
+
+
+class HTTPResponse:
+    """Fully read response returned by ``HTTPClientRegistry.request``."""
+
+    def __init__(self, url: str, status: int, headers: Dict[str, str], body: bytes, charset: Optional[str], elapsed: float):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.charset = charset
+        self.elapsed = elapsed
+
+    def text(self, encoding: Optional[str] = None) -> str:
+        return self.body.decode(encoding or self.charset or 'utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.text())
+
+
+class _HostStats:
+    __slots__ = ('requests', 'errors', 'retries', 'bytes', 'latency_total')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'bytes': self.bytes,
+            'avg_latency_ms': round(self.latency_total / self.requests * 1000, 2) if self.requests else 0.0,
+        }
+
+
+class _HostLimiter:
+    """Per-host concurrency slots plus minimum spacing between request starts."""
+
+    def __init__(self, max_concurrent: int, min_interval: float):
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.min_interval = min_interval
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def acquire(self):
+        await self.slots.acquire()
+        if self.min_interval <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def release(self):
+        self.slots.release()
+
+
+class _LoopClients:
+    """aiohttp state bound to one event loop."""
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self.host_limiters: Dict[str, _HostLimiter] = {}
+
+
+class HTTPClientRegistry:
+    """
+    Shared HTTP clients with per-host limits.
+
+    aiohttp sessions and asyncio primitives are bound to the loop they were
+    created on, so async state is kept per event loop. ``requests`` sessions
+    are kept per thread and share one pooled adapter; policy and metrics are
+    process-wide.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = HTTP_POOL_MAX_CONNECTIONS,
+        max_per_host: int = HTTP_POOL_MAX_PER_HOST,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        timeout: float = HTTP_DEFAULT_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        retry_backoff: float = HTTP_RETRY_BACKOFF_SECONDS,
+        max_response_bytes: int = HTTP_MAX_RESPONSE_BYTES,
+        per_host_min_interval: float = HTTP_PER_HOST_MIN_INTERVAL
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max(1, max_per_host)
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_response_bytes = max_response_bytes
+        self.per_host_min_interval = per_host_min_interval
+
+        # A session references its loop, so entries are evicted explicitly once the loop is closed
+        self._loops: Dict[asyncio.AbstractEventLoop, _LoopClients] = {}
+        self._sync_adapter: Optional[HTTPAdapter] = None
+        self._thread_sessions = threading.local()
+        self._lock = threading.Lock()
+        self._host_stats: Dict[str, _HostStats] = {}
+        self._pool_stats = {
+            'connections_created': 0,
+            'connections_reused': 0,
+            'dns_cache_hits': 0,
+            'dns_cache_misses': 0,
+        }
+
+    # ------------------------------------------------------------------ async
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Pooled aiohttp session for the running event loop."""
+        return self._loop_clients().session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs
+    ) -> HTTPResponse:
+        """
+        Perform a request and read the body under the size cap.
+
+        Idempotent requests are retried with exponential backoff on connection
+        errors, timeouts, 429 and 5xx; the last response is returned as-is
+        once retries are exhausted.
+        """
+        method = method.upper()
+        retries = self.max_retries if retries is None else retries
+        if method not in IDEMPOTENT_METHODS:
+            retries = 0
+        max_bytes = self._max_bytes(max_bytes)
+        host = self._host(url)
+
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            try:
+                async with self._open(method, url, headers=headers, params=params, timeout=timeout, **kwargs) as response:
+                    if response.status in RETRY_STATUSES and attempt < retries:
+                        delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                    else:
+                        body = await self._read_body(response, max_bytes)
+                        self._record(host, bytes_read=len(body))
+                        return HTTPResponse(
+                            url=str(response.url),
+                            status=response.status,
+                            headers=dict(response.headers),
+                            body=body,
+                            charset=response.charset,
+                            elapsed=time.monotonic() - started
+                        )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.debug(f"Retrying {method} {url} after {type(e).__name__}: {e}")
+
+            attempt += 1
+            self._record(host, retried=True)
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        retries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Open a response for incremental reading, holding a per-host slot until it is closed.
+
+        Opening the response follows the same retry policy as ``request``; once
+        the response is handed to the caller nothing is retried. A declared
+        Content-Length over the size cap raises ResponseTooLargeError here, and
+        reading the body through ``iter_body`` enforces the cap on the bytes
+        actually received.
+        """
+        method = method.upper()
+        retries = self.max_retries if retries is None else retries
+        if method not in IDEMPOTENT_METHODS:
+            retries = 0
+        host = self._host(url)
+
+        attempt = 0
+        opened = False
+        while True:
+            try:
+                async with self._open(method, url, headers=headers, timeout=timeout, **kwargs) as response:
+                    if response.status in RETRY_STATUSES and attempt < retries:
+                        delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                    else:
+                        self._check_declared_size(response, self._max_bytes(max_bytes))
+                        opened = True
+                        yield response
+                        return
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Errors raised while the caller reads the body are not retried
+                if opened or attempt >= retries:
+                    raise
+                delay = self._retry_delay(attempt)
+                logger.debug(f"Retrying {method} {url} after {type(e).__name__}: {e}")
+
+            attempt += 1
+            self._record(host, retried=True)
+            await asyncio.sleep(delay)
+
+    async def iter_body(self, response: aiohttp.ClientResponse, max_bytes: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Yield body chunks, raising ResponseTooLargeError once the size cap is exceeded."""
+        max_bytes = self._max_bytes(max_bytes)
+        host = self._host(str(response.url))
+        total = 0
+        try:
+            async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+                total += len(chunk)
+                if max_bytes and total > max_bytes:
+                    raise ResponseTooLargeError(f"Response from {response.url} exceeded {max_bytes} bytes")
+                yield chunk
+        finally:
+            self._record(host, bytes_read=total)
+
+    @asynccontextmanager
+    async def _open(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Single attempt: open a response while holding a per-host slot."""
+        clients = self._loop_clients()
+        host = self._host(url)
+        limiter = clients.host_limiters.get(host)
+        if limiter is None:
+            limiter = _HostLimiter(self.max_per_host, self.per_host_min_interval)
+            clients.host_limiters[host] = limiter
+
+        request_headers = {'User-Agent': DEFAULT_USER_AGENT}
+        if headers:
+            request_headers.update(headers)
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+
+        await limiter.acquire()
+        started = time.monotonic()
+        try:
+            async with clients.session.request(method, url, headers=request_headers, timeout=client_timeout, **kwargs) as response:
+                self._record(host, latency=time.monotonic() - started)
+                yield response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._record(host, failed=True)
+            raise
+        finally:
+            limiter.release()
+
+    async def close(self):
+        """Close the aiohttp sessions of every event loop and the shared requests adapter."""
+        current = asyncio.get_running_loop()
+        with self._lock:
+            loops, self._loops = self._loops, {}
+        for loop, clients in loops.items():
+            if clients.session.closed:
+                continue
+            if loop is current:
+                await clients.session.close()
+            elif loop.is_running():
+                # A session can only be closed on the loop that owns it
+                future = asyncio.run_coroutine_threadsafe(clients.session.close(), loop)
+                try:
+                    await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+                except Exception as e:
+                    logger.debug(f"Could not close HTTP session of another event loop: {e}")
+            # Sessions of loops that are closed or no longer running are just dropped
+
+        with self._lock:
+            sync_adapter, self._sync_adapter = self._sync_adapter, None
+            # Sessions built on the closed adapter are dropped in every thread
+            self._thread_sessions = threading.local()
+        if sync_adapter is not None:
+            sync_adapter.close()
+
+    # ------------------------------------------------------------------- sync
+
+    def get_sync_session(self) -> requests.Session:
+        """
+        ``requests.Session`` for the calling thread.
+
+        Each thread gets its own session (headers, cookies) mounted on the shared
+        adapter, so connection pools and the retry policy are process-wide.
+        """
+        thread_sessions = self._thread_sessions
+        session = getattr(thread_sessions, 'session', None)
+        if session is None:
+            session = thread_sessions.session = self._build_sync_session()
+        return session
+
+    def _get_sync_adapter(self) -> HTTPAdapter:
+        if self._sync_adapter is None:
+            with self._lock:
+                if self._sync_adapter is None:
+                    self._sync_adapter = self._build_sync_adapter()
+        return self._sync_adapter
+
+    def _build_sync_session(self) -> requests.Session:
+        adapter = self._get_sync_adapter()
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({'User-Agent': DEFAULT_USER_AGENT})
+        return session
+
+    def _build_sync_adapter(self) -> HTTPAdapter:
+        retry = Retry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.retry_backoff,
+            status_forcelist=sorted(RETRY_STATUSES),
+            allowed_methods=IDEMPOTENT_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        return HTTPAdapter(
+            pool_connections=self.max_connections,
+            pool_maxsize=self.max_per_host,
+            max_retries=retry
+        )
+
+    # ---------------------------------------------------------------- metrics
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pool and per-host request metrics."""
+        with self._lock:
+            pool = dict(self._pool_stats)
+            hosts = {host: stats.to_dict() for host, stats in self._host_stats.items()}
+            loop_clients = list(self._loops.values())
+        acquired = pool['connections_created'] + pool['connections_reused']
+        pool['connection_reuse_rate'] = round(pool['connections_reused'] / acquired, 4) if acquired else 0.0
+        pool['open_sessions'] = sum(1 for clients in loop_clients if not clients.session.closed)
+        return {'pool': pool, 'hosts': hosts}
+
+    # -------------------------------------------------------------- internals
+
+    def _loop_clients(self) -> _LoopClients:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._loops.get(loop)
+            if clients is not None and not clients.session.closed:
+                return clients
+            # Drop sessions left behind by loops that have since closed (asyncio.run in threads/tests)
+            for closed_loop in [known for known in self._loops if known.is_closed()]:
+                del self._loops[closed_loop]
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            session = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+            clients = _LoopClients(session)
+            self._loops[loop] = clients
+        return clients
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        def counter(name: str):
+            async def on_event(session, context, params):
+                with self._lock:
+                    self._pool_stats[name] += 1
+            return on_event
+
+        trace_config.on_connection_create_end.append(counter('connections_created'))
+        trace_config.on_connection_reuseconn.append(counter('connections_reused'))
+        trace_config.on_dns_cache_hit.append(counter('dns_cache_hits'))
+        trace_config.on_dns_cache_miss.append(counter('dns_cache_misses'))
+        return trace_config
+
+    async def _read_body(self, response: aiohttp.ClientResponse, max_bytes: int) -> bytes:
+        self._check_declared_size(response, max_bytes)
+
+        chunks = []
+        total = 0
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            total += len(chunk)
+            if max_bytes and total > max_bytes:
+                raise ResponseTooLargeError(f"Response from {response.url} exceeded {max_bytes} bytes")
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def _check_declared_size(self, response: aiohttp.ClientResponse, max_bytes: int):
+        content_length = response.content_length
+        if max_bytes and content_length is not None and content_length > max_bytes:
+            raise ResponseTooLargeError(f"Response from {response.url} is {content_length} bytes (limit {max_bytes})")
+
+    def _max_bytes(self, max_bytes: Optional[int]) -> int:
+        return self.max_response_bytes if max_bytes is None else max_bytes
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), 30.0)
+            except ValueError:
+                pass
+        return self.retry_backoff * (2 ** attempt) + random.uniform(0, self.retry_backoff)
+
+    def _host(self, url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def _record(self, host: str, latency: Optional[float] = None, bytes_read: int = 0, failed: bool = False, retried: bool = False):
+        with self._lock:
+            stats = self._host_stats.get(host)
+            if stats is None:
+                stats = self._host_stats[host] = _HostStats()
+            if latency is not None:
+                stats.requests += 1
+                stats.latency_total += latency
+            stats.bytes += bytes_read
+            if failed:
+                stats.errors += 1
+            if retried:
+                stats.retries += 1
+
+
+def get_http_client_registry() -> HTTPClientRegistry:
+    """Get the process-wide HTTP client registry."""
+    if not hasattr(get_http_client_registry, '_instance'):
+        get_http_client_registry._instance = HTTPClientRegistry()
+    return get_http_client_registry._instance
+
+
+def get_shared_requests_session() -> requests.Session:
+    """Pooled ``requests.Session`` for the calling thread, for synchronous fetchers."""
+    return get_http_client_registry().get_sync_session()
@@ -0,0 +1,174 @@
+"""
+Lazy Router Mounting
+Register API routers by import path and import them on their first request.
+
+Importing every router when ``app`` loads pulls in pandas, advertools, the
+LLM provider SDKs and the 12-step calendar framework before the first
+request. ``mount_router`` instead registers a single placeholder route per
+router that matches the router's path prefixes. The first request under one
+of them imports the module (in a worker thread), splices the router's real
+routes into the placeholder's position in the route table and re-dispatches
+the request, so routing precedence is the same as with eager mounting.
+
+- ``ALWRITY_LAZY_ROUTERS=false`` mounts everything eagerly (previous behaviour)
+- ``ALWRITY_WARM_UP_ROUTERS=true`` makes ``warm_up`` load all routers in the
+  background after startup
+- generating the OpenAPI schema loads all routers, so /api/docs stays complete
+"""
+
+import os
+import time
+import asyncio
+import importlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+from loguru import logger
+from starlette.routing import BaseRoute, Match, NoMatchFound
+from starlette.types import Receive, Scope, Send
+
+LAZY_ROUTERS_ENABLED = os.getenv('ALWRITY_LAZY_ROUTERS', 'true').lower() == 'true'
+WARM_UP_ROUTERS = os.getenv('ALWRITY_WARM_UP_ROUTERS', 'false').lower() == 'true'
+
+
+def _split_target(target: str) -> Tuple[str, str]:
+    module_name, _, attr = target.partition(':')
+    return module_name, attr or 'router'
+
+
+class LazyRouter(BaseRoute):
+    """Placeholder route that mounts the router at ``target`` ("module:attribute") on first match."""
+
+    def __init__(self, app: FastAPI, target: str, prefixes: Sequence[str]):
+        self.app = app
+        self.target = target
+        self.prefixes = tuple(prefix.rstrip('/') for prefix in prefixes)
+        self.loaded = False
+        self.load_seconds: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def name(self) -> str:
+        return self.target
+
+    def matches(self, scope: Scope) -> Tuple[Match, Scope]:
+        if self.loaded or scope['type'] not in ('http', 'websocket'):
+            return Match.NONE, {}
+        path = scope['path']
+        root_path = scope.get('root_path', '')
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        if any(path == prefix or path.startswith(prefix + '/') for prefix in self.prefixes):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name: str, /, **path_params):
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send):
+        await self.load_async()
+        # The real routes now sit where this placeholder was; route the request again
+        await self.app.router(scope, receive, send)
+
+    async def load_async(self):
+        """Import the router module off the event loop, then mount it."""
+        if self.loaded:
+            return
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self.loaded:
+                return
+            started = time.perf_counter()
+            module_name, _ = _split_target(self.target)
+            try:
+                await asyncio.to_thread(importlib.import_module, module_name)
+            except Exception as e:
+                logger.error(f"Failed to import router {self.target}: {e}")
+                raise
+            self.load(started)
+
+    def load(self, started: Optional[float] = None):
+        """Import (if needed) and mount the router in place of this placeholder."""
+        if self.loaded:
+            return
+        started = started if started is not None else time.perf_counter()
+        module_name, attr = _split_target(self.target)
+        router = getattr(importlib.import_module(module_name), attr)
+
+        routes = self.app.router.routes
+        appended_from = len(routes)
+        self.app.include_router(router)
+        new_routes = routes[appended_from:]
+        del routes[appended_from:]
+        position = next((i for i, route in enumerate(routes) if route is self), len(routes))
+        routes[position:position + 1] = new_routes
+
+        self.app.openapi_schema = None
+        self.loaded = True
+        self.load_seconds = time.perf_counter() - started
+        logger.info(f"Mounted router {self.target} ({len(new_routes)} routes) in {self.load_seconds:.2f}s")
+
+
+def mount_router(app: FastAPI, target: str, prefixes: Sequence[str]) -> Optional[LazyRouter]:
+    """
+    Mount the router at ``target`` ("module:attribute") serving ``prefixes``.
+
+    Returns the placeholder, or None when lazy mounting is disabled and the
+    router was included immediately.
+    """
+    if not LAZY_ROUTERS_ENABLED:
+        module_name, attr = _split_target(target)
+        app.include_router(getattr(importlib.import_module(module_name), attr))
+        return None
+
+    lazy_router = LazyRouter(app, target, prefixes)
+    app.router.routes.append(lazy_router)
+    get_lazy_routers(app).append(lazy_router)
+    _install_openapi_loader(app)
+    return lazy_router
+
+
+def get_lazy_routers(app: FastAPI) -> List[LazyRouter]:
+    """Lazy router placeholders registered on ``app`` (loaded or not)."""
+    routers = getattr(app.state, 'lazy_routers', None)
+    if routers is None:
+        routers = app.state.lazy_routers = []
+    return routers
+
+
+async def warm_up(app: FastAPI) -> Dict[str, float]:
+    """Load every pending router, one at a time; returns load seconds per router."""
+    timings = {}
+    for lazy_router in get_lazy_routers(app):
+        if lazy_router.loaded:
+            continue
+        try:
+            await lazy_router.load_async()
+            timings[lazy_router.target] = lazy_router.load_seconds
+        except Exception:
+            # Logged in load_async; the router is retried on its first request
+            continue
+        await asyncio.sleep(0)
+    if timings:
+        logger.info(f"Router warm-up loaded {len(timings)} routers in {sum(timings.values()):.2f}s")
+    return timings
+
+
+def _install_openapi_loader(app: FastAPI):
+    if getattr(app.state, 'lazy_openapi_installed', False):
+        return
+    app.state.lazy_openapi_installed = True
+    build_openapi = app.openapi
+
+    def openapi():
+        # The schema lists every route, so mount whatever has not been requested yet
+        for lazy_router in get_lazy_routers(app):
+            if not lazy_router.loaded:
+                try:
+                    lazy_router.load()
+                except Exception as e:
+                    logger.error(f"Router {lazy_router.target} left out of the OpenAPI schema: {e}")
+        return build_openapi()
+
+    app.openapi = openapi
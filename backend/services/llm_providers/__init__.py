@@ -5,6 +5,7 @@ migrated from the legacy lib/gpt_providers functionality.
 """
 
 from services.llm_providers.main_text_generation import llm_text_gen
+from services.llm_providers.llm_gateway import LLMGateway, get_llm_gateway
 from services.llm_providers.openai_provider import openai_chatgpt, test_openai_api_key
 from services.llm_providers.gemini_provider import gemini_text_response, gemini_structured_json_response
 from services.llm_providers.anthropic_provider import anthropic_text_response
@@ -12,6 +13,8 @@ from services.llm_providers.deepseek_provider import deepseek_text_response
 
 __all__ = [
     "llm_text_gen",
+    "LLMGateway",
+    "get_llm_gateway",
     "openai_chatgpt",
     "test_openai_api_key",
     "gemini_text_response", 
@@ -7,8 +7,11 @@ Based on Google AI's official grounding documentation.
 """
 
 import os
+import copy
 import json
 import re
+import asyncio
+import hashlib
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from loguru import logger
@@ -41,8 +44,11 @@ class GeminiGroundedProvider:
         if not self.api_key:
             raise ValueError("GEMINI_API_KEY environment variable is required")
         
-        # Initialize the Gemini client
+        # Initialize the Gemini client (requests go through its async interface, client.aio)
         self.client = genai.Client(api_key=self.api_key)
+        
+        # Identical requests currently in flight, keyed by request fingerprint
+        self._inflight: Dict[str, asyncio.Task] = {}
         logger.info("✅ Gemini Grounded Provider initialized with native Google Search grounding")
     
     async def generate_grounded_content(
@@ -55,6 +61,9 @@ class GeminiGroundedProvider:
         """
         Generate grounded content using native Google Search grounding.
         
+        Identical requests (same prompt, content type, temperature and token
+        limit) made while one is already in flight share its upstream call.
+        
         Args:
             prompt: The content generation prompt
             content_type: Type of content to generate
@@ -64,6 +73,39 @@ class GeminiGroundedProvider:
         Returns:
             Dictionary containing generated content and grounding metadata
         """
+        request_key = self._request_key(prompt, content_type, temperature, max_tokens)
+        task = self._inflight.get(request_key)
+        if task is not None and not task.done():
+            logger.info(f"Joining in-flight grounded generation for {content_type}")
+        else:
+            task = asyncio.ensure_future(
+                self._generate_grounded_content(prompt, content_type, temperature, max_tokens)
+            )
+            self._inflight[request_key] = task
+            task.add_done_callback(lambda t, key=request_key: self._forget_inflight(key, t))
+        
+        # Shielded so one caller disconnecting does not cancel the shared call
+        result = await asyncio.shield(task)
+        # Each caller gets its own copy; results are post-processed downstream
+        return copy.deepcopy(result)
+    
+    def _forget_inflight(self, request_key: str, task: asyncio.Task):
+        if self._inflight.get(request_key) is task:
+            del self._inflight[request_key]
+    
+    @staticmethod
+    def _request_key(prompt: str, content_type: str, temperature: float, max_tokens: int) -> str:
+        payload = json.dumps([prompt, content_type, temperature, max_tokens])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    async def _generate_grounded_content(
+        self,
+        prompt: str,
+        content_type: str,
+        temperature: float,
+        max_tokens: int
+    ) -> Dict[str, Any]:
+        """Single upstream grounded generation call (non-blocking)."""
         try:
             logger.info(f"Generating grounded content for {content_type} using native Google Search")
             
@@ -82,8 +124,8 @@ class GeminiGroundedProvider:
                 temperature=temperature
             )
             
-            # Make the request with native grounding
-            response = self.client.models.generate_content(
+            # Make the request with native grounding (async client, does not block the event loop)
+            response = await self.client.aio.models.generate_content(
                 model="gemini-2.5-flash",
                 contents=grounded_prompt,
                 config=config,
@@ -115,6 +115,26 @@ def get_gemini_api_key() -> str:
     
     return api_key
 
+# Long-lived clients keyed by API key. A genai.Client owns its own HTTP
+# connection pool, so building one per request throws away keep-alive
+# connections and repeats TLS handshakes on every call.
+_gemini_clients: Dict[str, "genai.Client"] = {}
+
+def get_gemini_client(api_key: Optional[str] = None) -> "genai.Client":
+    """Get a shared Gemini client for the given (or configured) API key."""
+    if api_key is None:
+        api_key = get_gemini_api_key()
+    client = _gemini_clients.get(api_key)
+    if client is None:
+        client = genai.Client(api_key=api_key)
+        _gemini_clients[api_key] = client
+        logger.info("✅ Gemini client initialized successfully")
+    return client
+
+def reset_gemini_clients():
+    """Drop cached Gemini clients (e.g. after API keys were changed)."""
+    _gemini_clients.clear()
+
 @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
 def gemini_text_response(prompt, temperature, top_p, n, max_tokens, system_prompt):
     """
@@ -152,9 +172,7 @@ def gemini_text_response(prompt, temperature, top_p, n, max_tokens, system_promp
     """
     #FIXME: Include : https://github.com/google-gemini/cookbook/blob/main/quickstarts/rest/System_instructions_REST.ipynb
     try:
-        api_key = get_gemini_api_key()
-        client = genai.Client(api_key=api_key)
-        logger.info("✅ Gemini client initialized successfully")
+        client = get_gemini_client()
     except Exception as err:
         logger.error(f"Failed to configure Gemini: {err}")
         raise
@@ -346,10 +364,8 @@ def gemini_structured_json_response(prompt, schema, temperature=0.7, top_p=0.9,
         result = gemini_structured_json_response(prompt, schema, temperature=0.2, max_tokens=8192)
     """
     try:
-        # Get API key with proper error handling
-        api_key = get_gemini_api_key()
-        client = genai.Client(api_key=api_key)
-        logger.info("✅ Gemini client initialized for structured JSON response")
+        # Shared client; raises ValueError when the API key is missing/invalid
+        client = get_gemini_client()
 
         # Prepare schema for SDK (dict -> types.Schema). If schema is already a types.Schema or Pydantic type, use as-is
         try:
@@ -389,43 +405,7 @@ def gemini_structured_json_response(prompt, schema, temperature=0.7, top_p=0.9,
             config=generation_config,
         )
 
-        # Add debugging for response
-        logger.info("Gemini response | type=%s | has_text=%s | has_parsed=%s",
-                     type(response), hasattr(response, 'text'), hasattr(response, 'parsed'))
-        
-        if hasattr(response, 'text'):
-            logger.info(f"Gemini response.text: {repr(response.text)}")
-        if hasattr(response, 'parsed'):
-            logger.info(f"Gemini response.parsed: {repr(response.parsed)}")
-
-        # According to the documentation, we should use response.parsed for structured output
-        if hasattr(response, 'parsed') and response.parsed is not None:
-            logger.info("Using response.parsed for structured output")
-            return response.parsed
-        
-        # Fallback to text if parsed is not available
-        if hasattr(response, 'text') and response.text:
-            logger.info("Falling back to response.text parsing")
-            text = response.text.strip()
-            
-            # Strip markdown code fences if present
-            if text.startswith('```'):
-                if text.lower().startswith('```json'):
-                    text = text[7:]
-                else:
-                    text = text[3:]
-                if text.endswith('```'):
-                    text = text[:-3]
-                text = text.strip()
-            
-            try:
-                return json.loads(text)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse response.text as JSON: {e}")
-                return {"error": f"Failed to parse JSON response: {e}", "raw_response": text[:500]}
-        
-        logger.error("No valid response content found")
-        return {"error": "No valid response content found", "raw_response": ""}
+        return parse_structured_response(response)
 
     except ValueError as e:
         # API key related errors
@@ -436,6 +416,52 @@ def gemini_structured_json_response(prompt, schema, temperature=0.7, top_p=0.9,
         return {"error": str(e)}
 
 
+def parse_structured_response(response) -> Dict[str, Any]:
+    """
+    Extract the JSON payload from a Gemini structured-output response.
+
+    Shared by the sync provider and the async LLM gateway so both paths
+    return the same shape for the same response.
+    """
+    # Add debugging for response
+    logger.info("Gemini response | type=%s | has_text=%s | has_parsed=%s",
+                 type(response), hasattr(response, 'text'), hasattr(response, 'parsed'))
+    
+    if hasattr(response, 'text'):
+        logger.info(f"Gemini response.text: {repr(response.text)}")
+    if hasattr(response, 'parsed'):
+        logger.info(f"Gemini response.parsed: {repr(response.parsed)}")
+
+    # According to the documentation, we should use response.parsed for structured output
+    if hasattr(response, 'parsed') and response.parsed is not None:
+        logger.info("Using response.parsed for structured output")
+        return response.parsed
+    
+    # Fallback to text if parsed is not available
+    if hasattr(response, 'text') and response.text:
+        logger.info("Falling back to response.text parsing")
+        text = response.text.strip()
+        
+        # Strip markdown code fences if present
+        if text.startswith('```'):
+            if text.lower().startswith('```json'):
+                text = text[7:]
+            else:
+                text = text[3:]
+            if text.endswith('```'):
+                text = text[:-3]
+            text = text.strip()
+        
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse response.text as JSON: {e}")
+            return {"error": f"Failed to parse JSON response: {e}", "raw_response": text[:500]}
+    
+    logger.error("No valid response content found")
+    return {"error": "No valid response content found", "raw_response": ""}
+
+
 def _repair_json_string(text: str) -> Optional[str]:
     """
     Attempt to repair common JSON issues in AI responses.
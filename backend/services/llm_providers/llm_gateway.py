@@ -0,0 +1,306 @@
+"""Async LLM Gateway for ALwrity Backend.
+
+Non-blocking counterpart of ``llm_text_gen`` for use inside ``async def``
+handlers. Provider clients are created once and reused across requests, and
+API keys are resolved once (at startup) instead of re-reading ``.env`` on
+every call. Call ``reload_keys()`` after keys change, e.g. when onboarding
+saves a new provider key.
+
+Usage:
+    from services.llm_providers.llm_gateway import get_llm_gateway
+
+    text = await get_llm_gateway().generate(prompt, system_prompt=system_prompt)
+    data = await get_llm_gateway().generate(prompt, json_struct=schema)
+"""
+
+import asyncio
+from typing import Optional, Dict, Any, List, Union
+from loguru import logger
+from tenacity import (
+    retry,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ..api_key_manager import get_api_key_manager
+from .main_text_generation import build_default_system_prompt
+from .gemini_provider import (
+    get_gemini_client,
+    reset_gemini_clients,
+    parse_structured_response,
+    _dict_to_types_schema,
+)
+
+from google.genai import types
+
+try:
+    import openai
+except ImportError:
+    openai = None
+    logger.warning("OpenAI library not available. Install with: pip install openai")
+
+try:
+    import anthropic
+except ImportError:
+    anthropic = None
+    logger.warning("Anthropic library not available. Install with: pip install anthropic")
+
+
+class LLMGateway:
+    """Async, pooled dispatcher over the configured LLM providers."""
+
+    # Provider -> key name in APIKeyManager
+    PROVIDER_KEYS = {
+        "openai": "openai",
+        "google": "gemini",
+        "anthropic": "anthropic",
+        "deepseek": "deepseek",
+    }
+
+    # Same models llm_text_gen and the sync providers use
+    DEFAULT_MODELS = {
+        "google": "gemini-2.0-flash-lite",
+        "openai": "gpt-4o",
+        "anthropic": "claude-3-5-sonnet-20241022",
+        "deepseek": "deepseek-chat",
+    }
+    GEMINI_STRUCTURED_MODEL = "gemini-2.5-flash"
+
+    # Preferred provider first, then the same fallback order as llm_text_gen
+    PROVIDER_ORDER = ["google", "openai", "anthropic", "deepseek"]
+
+    def __init__(self):
+        self._keys: Dict[str, Optional[str]] = {}
+        self._clients: Dict[str, Any] = {}
+        self._keys_loaded = False
+
+    # ------------------------------------------------------------------
+    # Key resolution and client pooling
+    # ------------------------------------------------------------------
+
+    def reload_keys(self):
+        """Re-read provider API keys and drop clients built with stale keys."""
+        api_key_manager = get_api_key_manager()
+        api_key_manager.load_api_keys()
+        self._keys = {
+            provider: api_key_manager.get_api_key(key_name)
+            for provider, key_name in self.PROVIDER_KEYS.items()
+        }
+        self._keys_loaded = True
+
+        stale_clients = list(self._clients.values())
+        self._clients = {}
+        reset_gemini_clients()
+        for client in stale_clients:
+            self._schedule_close(client)
+
+        logger.info(f"[LLMGateway] API keys loaded, available providers: {self.available_providers()}")
+
+    def available_providers(self) -> List[str]:
+        """Providers with a configured API key, in preference order."""
+        if not self._keys_loaded:
+            self.reload_keys()
+        return [p for p in self.PROVIDER_ORDER if self._keys.get(p)]
+
+    def _get_client(self, provider: str):
+        """Return the long-lived async client for a provider, creating it once."""
+        client = self._clients.get(provider)
+        if client is not None:
+            return client
+
+        api_key = self._keys.get(provider)
+        if not api_key:
+            raise ValueError(f"{provider} API key not found. Please configure it in the onboarding process.")
+
+        if provider == "google":
+            client = get_gemini_client(api_key).aio
+        elif provider == "openai":
+            if not openai:
+                raise RuntimeError("OpenAI library not available. Please install openai package.")
+            client = openai.AsyncOpenAI(api_key=api_key)
+        elif provider == "anthropic":
+            if not anthropic:
+                raise RuntimeError("Anthropic library not available. Please install anthropic package.")
+            client = anthropic.AsyncAnthropic(api_key=api_key)
+        elif provider == "deepseek":
+            if not openai:
+                raise RuntimeError("OpenAI library not available. Please install openai package.")
+            client = openai.AsyncOpenAI(api_key=api_key, base_url="https://api.deepseek.com/v1")
+        else:
+            raise RuntimeError(f"Unknown LLM provider: {provider}")
+
+        self._clients[provider] = client
+        logger.info(f"[LLMGateway] Initialized {provider} client")
+        return client
+
+    @staticmethod
+    def _schedule_close(client):
+        """Close a client that exposes an async ``close``/``aclose`` method."""
+        close = getattr(client, "aclose", None) or getattr(client, "close", None)
+        if close is None:
+            return
+        try:
+            result = close()
+            if asyncio.iscoroutine(result):
+                try:
+                    asyncio.get_running_loop().create_task(result)
+                except RuntimeError:
+                    result.close()
+        except Exception as e:
+            logger.debug(f"[LLMGateway] Error closing client: {e}")
+
+    async def aclose(self):
+        """Close all pooled clients (called on application shutdown)."""
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            close = getattr(client, "aclose", None) or getattr(client, "close", None)
+            if close is None:
+                continue
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.debug(f"[LLMGateway] Error closing client: {e}")
+
+    # ------------------------------------------------------------------
+    # Generation
+    # ------------------------------------------------------------------
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        json_struct: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        top_p: float = 0.9,
+    ) -> Union[str, Dict[str, Any]]:
+        """
+        Generate text (or structured JSON when ``json_struct`` is given).
+
+        Mirrors ``llm_text_gen``: prefers Gemini, then falls back to the other
+        configured providers in order if the preferred one fails.
+
+        Args:
+            prompt: The prompt to generate text from.
+            system_prompt: Custom system prompt to use instead of the default one.
+            json_struct: JSON schema for structured responses (Gemini only).
+            temperature: Sampling temperature.
+            max_tokens: Maximum tokens in the response.
+            top_p: Nucleus sampling parameter.
+
+        Returns:
+            Generated text, or the parsed JSON dict for structured requests.
+        """
+        logger.info("[LLMGateway.generate] Starting text generation")
+        logger.debug(f"[LLMGateway.generate] Prompt length: {len(prompt)} characters")
+
+        providers = self.available_providers()
+        if not providers:
+            logger.error("[LLMGateway.generate] No API keys found. Structured mock responses are disabled.")
+            raise RuntimeError("No LLM API keys configured. Configure provider API keys to enable AI responses.")
+
+        system_instructions = system_prompt if system_prompt is not None else build_default_system_prompt()
+
+        for provider in providers:
+            try:
+                logger.debug(f"[LLMGateway.generate] Using provider: {provider}")
+                if provider == "google":
+                    if json_struct:
+                        return await self._gemini_structured(prompt, json_struct, temperature, top_p, max_tokens, system_instructions)
+                    return await self._gemini_text(prompt, temperature, top_p, max_tokens, system_instructions)
+                if provider in ("openai", "deepseek"):
+                    return await self._openai_compatible(provider, prompt, temperature, top_p, max_tokens, system_instructions)
+                if provider == "anthropic":
+                    return await self._anthropic(prompt, temperature, max_tokens, system_instructions)
+            except Exception as provider_error:
+                logger.error(f"[LLMGateway.generate] Provider {provider} failed: {str(provider_error)}")
+                continue
+
+        logger.error("[LLMGateway.generate] All providers failed. Structured mock responses are disabled.")
+        raise RuntimeError("All LLM providers failed to generate a response.")
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    async def _gemini_text(self, prompt, temperature, top_p, max_tokens, system_prompt) -> str:
+        client = self._get_client("google")
+        response = await client.models.generate_content(
+            model=self.DEFAULT_MODELS["google"],
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                system_instruction=system_prompt,
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=1,
+            ),
+        )
+        return response.text
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    async def _gemini_structured(self, prompt, schema, temperature, top_p, max_tokens, system_prompt) -> Dict[str, Any]:
+        client = self._get_client("google")
+        try:
+            types_schema = _dict_to_types_schema(schema) if isinstance(schema, dict) else schema
+        except Exception as conv_err:
+            logger.info(f"Schema conversion warning, defaulting to OBJECT: {conv_err}")
+            types_schema = types.Schema(type=types.Type.OBJECT)
+
+        response = await client.models.generate_content(
+            model=self.GEMINI_STRUCTURED_MODEL,
+            contents=prompt,
+            config=types.GenerateContentConfig(
+                response_mime_type='application/json',
+                response_schema=types_schema,
+                max_output_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=1,
+                system_instruction=system_prompt,
+            ),
+        )
+        return parse_structured_response(response)
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    async def _openai_compatible(self, provider, prompt, temperature, top_p, max_tokens, system_prompt) -> str:
+        client = self._get_client(provider)
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+
+        response = await client.chat.completions.create(
+            model=self.DEFAULT_MODELS[provider],
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+        )
+        content = response.choices[0].message.content
+        logger.info(f"[LLMGateway] {provider} generated response with {len(content or '')} characters")
+        return content
+
+    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(6))
+    async def _anthropic(self, prompt, temperature, max_tokens, system_prompt) -> str:
+        client = self._get_client("anthropic")
+        kwargs = {}
+        if system_prompt:
+            kwargs["system"] = system_prompt
+        response = await client.messages.create(
+            model=self.DEFAULT_MODELS["anthropic"],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            messages=[{"role": "user", "content": prompt}],
+            **kwargs,
+        )
+        text = response.content[0].text
+        logger.info(f"[LLMGateway] anthropic generated response with {len(text)} characters")
+        return text
+
+
+def get_llm_gateway() -> LLMGateway:
+    """Get the global LLM gateway instance."""
+    if not hasattr(get_llm_gateway, '_instance'):
+        get_llm_gateway._instance = LLMGateway()
+    return get_llm_gateway._instance
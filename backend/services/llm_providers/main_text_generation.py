@@ -8,13 +8,42 @@ import os
 import json
 from typing import Optional, Dict, Any
 from loguru import logger
-from ..api_key_manager import APIKeyManager
+from ..api_key_manager import get_api_key_manager
 
 from .openai_provider import openai_chatgpt
 from .gemini_provider import gemini_text_response, gemini_structured_json_response
 from .anthropic_provider import anthropic_text_response
 from .deepseek_provider import deepseek_text_response
 
+# Default blog characteristics used when callers don't pass a system prompt
+DEFAULT_BLOG_TONE = "Professional"
+DEFAULT_BLOG_DEMOGRAPHIC = "Professional"
+DEFAULT_BLOG_TYPE = "Informational"
+DEFAULT_BLOG_LANGUAGE = "English"
+DEFAULT_BLOG_OUTPUT_FORMAT = "markdown"
+DEFAULT_BLOG_LENGTH = 2000
+
+def build_default_system_prompt() -> str:
+    """Build the default content-writer system prompt."""
+    return f"""You are a highly skilled content writer with a knack for creating engaging and informative content. 
+                Your expertise spans various writing styles and formats.
+
+                Writing Style Guidelines:
+                - Tone: {DEFAULT_BLOG_TONE}
+                - Target Audience: {DEFAULT_BLOG_DEMOGRAPHIC}
+                - Content Type: {DEFAULT_BLOG_TYPE}
+                - Language: {DEFAULT_BLOG_LANGUAGE}
+                - Output Format: {DEFAULT_BLOG_OUTPUT_FORMAT}
+                - Target Length: {DEFAULT_BLOG_LENGTH} words
+
+                Please provide responses that are:
+                - Well-structured and easy to read
+                - Engaging and informative
+                - Tailored to the specified tone and audience
+                - Professional yet accessible
+                - Optimized for the target content type
+            """
+
 def llm_text_gen(prompt: str, system_prompt: Optional[str] = None, json_struct: Optional[Dict[str, Any]] = None) -> str:
     """
     Generate text using Language Model (LLM) based on the provided prompt.
@@ -31,8 +60,9 @@ def llm_text_gen(prompt: str, system_prompt: Optional[str] = None, json_struct:
         logger.info("[llm_text_gen] Starting text generation")
         logger.debug(f"[llm_text_gen] Prompt length: {len(prompt)} characters")
         
-        # Initialize API key manager
-        api_key_manager = APIKeyManager()
+        # Shared API key manager; keys are resolved once and refreshed via
+        # LLMGateway.reload_keys() instead of re-reading .env on every call
+        api_key_manager = get_api_key_manager()
         
         # Set default values for LLM parameters
         gpt_provider = "google"  # Default to Google Gemini
@@ -45,14 +75,6 @@ def llm_text_gen(prompt: str, system_prompt: Optional[str] = None, json_struct:
         frequency_penalty = 0.0
         presence_penalty = 0.0
         
-        # Default blog characteristics
-        blog_tone = "Professional"
-        blog_demographic = "Professional"
-        blog_type = "Informational"
-        blog_language = "English"
-        blog_output_format = "markdown"
-        blog_length = 2000
-        
         # Try to get provider from environment or config
         try:
             # Check which providers have API keys available
@@ -90,27 +112,7 @@ def llm_text_gen(prompt: str, system_prompt: Optional[str] = None, json_struct:
             model = "gemini-2.0-flash-001"
 
         # Construct the system prompt if not provided
-        if system_prompt is None:
-            system_instructions = f"""You are a highly skilled content writer with a knack for creating engaging and informative content. 
-                Your expertise spans various writing styles and formats.
-
-                Writing Style Guidelines:
-                - Tone: {blog_tone}
-                - Target Audience: {blog_demographic}
-                - Content Type: {blog_type}
-                - Language: {blog_language}
-                - Output Format: {blog_output_format}
-                - Target Length: {blog_length} words
-
-                Please provide responses that are:
-                - Well-structured and easy to read
-                - Engaging and informative
-                - Tailored to the specified tone and audience
-                - Professional yet accessible
-                - Optimized for the target content type
-            """
-        else:
-            system_instructions = system_prompt
+        system_instructions = system_prompt if system_prompt is not None else build_default_system_prompt()
 
         # Generate response based on provider
         try:
@@ -219,7 +221,7 @@ def check_gpt_provider(gpt_provider: str) -> bool:
 def get_api_key(gpt_provider: str) -> Optional[str]:
     """Get API key for the specified provider."""
     try:
-        api_key_manager = APIKeyManager()
+        api_key_manager = get_api_key_manager()
         provider_mapping = {
             "openai": "openai",
             "google": "gemini",
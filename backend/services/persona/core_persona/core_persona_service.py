@@ -4,7 +4,10 @@ Core Persona Service
 Handles the core persona generation logic using Gemini AI.
 """
 
-from typing import Dict, Any, List
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, Any, List, Optional, Callable
 from loguru import logger
 from datetime import datetime
 
@@ -13,12 +16,30 @@ from .data_collector import OnboardingDataCollector
 from .prompt_builder import PersonaPromptBuilder
 from services.persona.linkedin.linkedin_persona_service import LinkedInPersonaService
 
+# Platform adaptation concurrency (1 = sequential)
+PERSONA_ADAPTATION_MAX_PARALLEL = int(os.getenv('PERSONA_ADAPTATION_MAX_PARALLEL', '4'))
+PERSONA_PLATFORM_TIMEOUT_SECONDS = float(os.getenv('PERSONA_PLATFORM_TIMEOUT_SECONDS', '180'))
+
+SUPPORTED_PLATFORMS = ["twitter", "linkedin", "instagram", "facebook", "blog", "medium", "substack"]
+
 
 class CorePersonaService:
     """Core service for generating writing personas using Gemini AI."""
     
-    def __init__(self):
-        """Initialize the core persona service."""
+    def __init__(
+        self,
+        max_parallel_platforms: int = PERSONA_ADAPTATION_MAX_PARALLEL,
+        platform_timeout_seconds: float = PERSONA_PLATFORM_TIMEOUT_SECONDS
+    ):
+        """
+        Initialize the core persona service.
+        
+        Args:
+            max_parallel_platforms: Platform adaptations generated at once (1 = sequential)
+            platform_timeout_seconds: Time a single platform adaptation may run before it is abandoned
+        """
+        self.max_parallel_platforms = max(1, max_parallel_platforms)
+        self.platform_timeout_seconds = platform_timeout_seconds
         self.data_collector = OnboardingDataCollector()
         self.prompt_builder = PersonaPromptBuilder()
         self.linkedin_service = LinkedInPersonaService()
@@ -54,22 +75,74 @@ class CorePersonaService:
             logger.error(f"Error generating core persona: {str(e)}")
             return {"error": f"Failed to generate core persona: {str(e)}"}
     
-    def generate_platform_adaptations(self, core_persona: Dict[str, Any], onboarding_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate platform-specific persona adaptations."""
+    def generate_platform_adaptations(
+        self,
+        core_persona: Dict[str, Any],
+        onboarding_data: Dict[str, Any],
+        on_platform_ready: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate platform-specific persona adaptations.
         
-        platforms = ["twitter", "linkedin", "instagram", "facebook", "blog", "medium", "substack"]
+        Platforms are generated concurrently (up to ``max_parallel_platforms``
+        at once). ``on_platform_ready`` is called from the calling thread as
+        soon as each platform persona succeeds, so it can be persisted before
+        the remaining platforms finish.
+        """
+        
+        platforms = SUPPORTED_PLATFORMS
         platform_personas = {}
         
-        for platform in platforms:
-            try:
-                platform_persona = self._generate_single_platform_persona(core_persona, platform, onboarding_data)
-                if "error" not in platform_persona:
-                    platform_personas[platform] = platform_persona
-                else:
-                    logger.warning(f"Failed to generate {platform} persona: {platform_persona['error']}")
-            except Exception as e:
-                logger.error(f"Error generating {platform} persona: {str(e)}")
+        def handle_result(platform: str, platform_persona: Dict[str, Any]):
+            if "error" in platform_persona:
+                logger.warning(f"Failed to generate {platform} persona: {platform_persona['error']}")
+                return
+            platform_personas[platform] = platform_persona
+            if on_platform_ready:
+                try:
+                    on_platform_ready(platform, platform_persona)
+                except Exception as e:
+                    logger.error(f"Error handling completed {platform} persona: {str(e)}")
+        
+        if self.max_parallel_platforms == 1:
+            for platform in platforms:
+                try:
+                    handle_result(platform, self._generate_single_platform_persona(core_persona, platform, onboarding_data))
+                except Exception as e:
+                    logger.error(f"Error generating {platform} persona: {str(e)}")
+            return platform_personas
+        
+        started_at: Dict[str, float] = {}
+        
+        def run(platform: str) -> Dict[str, Any]:
+            started_at[platform] = time.monotonic()
+            return self._generate_single_platform_persona(core_persona, platform, onboarding_data)
+        
+        executor = ThreadPoolExecutor(max_workers=self.max_parallel_platforms, thread_name_prefix="persona-platform")
+        try:
+            pending = {executor.submit(run, platform): platform for platform in platforms}
+            while pending:
+                done, _ = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    platform = pending.pop(future)
+                    try:
+                        handle_result(platform, future.result())
+                    except Exception as e:
+                        logger.error(f"Error generating {platform} persona: {str(e)}")
+                
+                # Abandon platforms that have been running longer than the per-platform timeout
+                now = time.monotonic()
+                for future, platform in list(pending.items()):
+                    started = started_at.get(platform)
+                    if started is not None and now - started > self.platform_timeout_seconds:
+                        logger.error(f"Timed out generating {platform} persona after {self.platform_timeout_seconds}s")
+                        future.cancel()
+                        del pending[future]
+        finally:
+            # Do not block on abandoned (timed out) calls
+            executor.shutdown(wait=False, cancel_futures=True)
         
+        logger.info(f"✅ Generated {len(platform_personas)}/{len(platforms)} platform personas")
         return platform_personas
     
     def _generate_single_platform_persona(self, core_persona: Dict[str, Any], platform: str, onboarding_data: Dict[str, Any]) -> Dict[str, Any]:
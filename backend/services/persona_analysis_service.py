@@ -54,14 +54,24 @@ class PersonaAnalysisService:
             if "error" in core_persona:
                 return core_persona
             
-            # Generate platform-specific adaptations
-            platform_personas = self.core_persona_service.generate_platform_adaptations(core_persona, onboarding_data)
+            # Save the core persona first so platform personas can be stored as they finish
+            persona_id = self._save_core_persona_to_db(user_id, core_persona, onboarding_data)
             
-            # Save to database
-            saved_persona = self._save_persona_to_db(user_id, core_persona, platform_personas, onboarding_data)
+            # Generate platform-specific adaptations; each one is persisted (and visible via
+            # get_persona_for_platform) as soon as it is ready
+            platform_personas = self.core_persona_service.generate_platform_adaptations(
+                core_persona,
+                onboarding_data,
+                on_platform_ready=lambda platform, platform_data: self._save_platform_persona_to_db(
+                    persona_id, core_persona, platform, platform_data
+                )
+            )
+            
+            # Save analysis result with the final platform list
+            self._save_analysis_result_to_db(user_id, persona_id, core_persona, platform_personas, onboarding_data)
             
             return {
-                "persona_id": saved_persona.id,
+                "persona_id": persona_id,
                 "core_persona": core_persona,
                 "platform_personas": platform_personas,
                 "analysis_metadata": {
@@ -303,8 +313,9 @@ Generate a platform-optimized persona adaptation that maintains brand consistenc
         
         return constraints.get(platform, {})
     
-    def _save_persona_to_db(self, user_id: int, core_persona: Dict[str, Any], platform_personas: Dict[str, Any], onboarding_data: Dict[str, Any]) -> WritingPersona:
-        """Save generated persona to database."""
+    def _save_core_persona_to_db(self, user_id: int, core_persona: Dict[str, Any], onboarding_data: Dict[str, Any]) -> int:
+        """Save the core writing persona record; returns its ID."""
+        session = None
         try:
             session = get_db_session()
             
@@ -316,7 +327,7 @@ Generate a platform-optimized persona adaptation that maintains brand consistenc
                 core_belief=core_persona.get("identity", {}).get("core_belief"),
                 brand_voice_description=core_persona.get("identity", {}).get("brand_voice_description"),
                 linguistic_fingerprint=core_persona.get("linguistic_fingerprint", {}),
-                platform_adaptations={"platforms": list(platform_personas.keys())},
+                platform_adaptations={"platforms": []},
                 onboarding_session_id=onboarding_data.get("session_info", {}).get("session_id"),
                 source_website_analysis=onboarding_data.get("website_analysis") or {},
                 source_research_preferences=onboarding_data.get("research_preferences") or {},
@@ -326,47 +337,86 @@ Generate a platform-optimized persona adaptation that maintains brand consistenc
             
             session.add(writing_persona)
             session.commit()
-            session.refresh(writing_persona)
-            
-            # Create platform-specific persona records
-            for platform, platform_data in platform_personas.items():
-                # Prepare platform-specific data
-                platform_specific_data = {}
-                if platform.lower() == "linkedin":
-                    platform_specific_data = {
-                        "professional_networking": platform_data.get("professional_networking", {}),
-                        "linkedin_features": platform_data.get("linkedin_features", {}),
-                        "algorithm_optimization": platform_data.get("algorithm_optimization", {}),
-                        "professional_context_optimization": platform_data.get("professional_context_optimization", {})
-                    }
-                elif platform.lower() == "facebook":
-                    platform_specific_data = {
-                        "facebook_algorithm_optimization": platform_data.get("facebook_algorithm_optimization", {}),
-                        "facebook_engagement_strategies": platform_data.get("facebook_engagement_strategies", {}),
-                        "facebook_content_formats": platform_data.get("facebook_content_formats", {}),
-                        "facebook_audience_targeting": platform_data.get("facebook_audience_targeting", {}),
-                        "facebook_community_building": platform_data.get("facebook_community_building", {})
-                    }
-                
-                platform_persona = PlatformPersona(
-                    writing_persona_id=writing_persona.id,
-                    platform_type=platform,
-                    sentence_metrics=platform_data.get("sentence_metrics", {}),
-                    lexical_features=platform_data.get("lexical_adaptations", {}),
-                    rhetorical_devices=core_persona.get("linguistic_fingerprint", {}).get("rhetorical_devices", {}),
-                    tonal_range=core_persona.get("tonal_range", {}),
-                    stylistic_constraints=core_persona.get("stylistic_constraints", {}),
-                    content_format_rules=platform_data.get("content_format_rules", {}),
-                    engagement_patterns=platform_data.get("engagement_patterns", {}),
-                    platform_best_practices={"practices": platform_data.get("platform_best_practices", [])},
-                    algorithm_considerations=platform_specific_data if platform_specific_data else platform_data.get("algorithm_considerations", {})
-                )
-                session.add(platform_persona)
+            persona_id = writing_persona.id
+            session.close()
+            
+            logger.info(f"✅ Persona saved to database with ID: {persona_id}")
+            return persona_id
+            
+        except Exception as e:
+            logger.error(f"Error saving persona to database: {str(e)}")
+            if session:
+                session.rollback()
+                session.close()
+            raise
+    
+    def _save_platform_persona_to_db(self, writing_persona_id: int, core_persona: Dict[str, Any], platform: str, platform_data: Dict[str, Any]):
+        """Save one platform persona and add it to the core persona's platform list."""
+        session = None
+        try:
+            session = get_db_session()
+            
+            # Prepare platform-specific data
+            platform_specific_data = {}
+            if platform.lower() == "linkedin":
+                platform_specific_data = {
+                    "professional_networking": platform_data.get("professional_networking", {}),
+                    "linkedin_features": platform_data.get("linkedin_features", {}),
+                    "algorithm_optimization": platform_data.get("algorithm_optimization", {}),
+                    "professional_context_optimization": platform_data.get("professional_context_optimization", {})
+                }
+            elif platform.lower() == "facebook":
+                platform_specific_data = {
+                    "facebook_algorithm_optimization": platform_data.get("facebook_algorithm_optimization", {}),
+                    "facebook_engagement_strategies": platform_data.get("facebook_engagement_strategies", {}),
+                    "facebook_content_formats": platform_data.get("facebook_content_formats", {}),
+                    "facebook_audience_targeting": platform_data.get("facebook_audience_targeting", {}),
+                    "facebook_community_building": platform_data.get("facebook_community_building", {})
+                }
+            
+            platform_persona = PlatformPersona(
+                writing_persona_id=writing_persona_id,
+                platform_type=platform,
+                sentence_metrics=platform_data.get("sentence_metrics", {}),
+                lexical_features=platform_data.get("lexical_adaptations", {}),
+                rhetorical_devices=core_persona.get("linguistic_fingerprint", {}).get("rhetorical_devices", {}),
+                tonal_range=core_persona.get("tonal_range", {}),
+                stylistic_constraints=core_persona.get("stylistic_constraints", {}),
+                content_format_rules=platform_data.get("content_format_rules", {}),
+                engagement_patterns=platform_data.get("engagement_patterns", {}),
+                platform_best_practices={"practices": platform_data.get("platform_best_practices", [])},
+                algorithm_considerations=platform_specific_data if platform_specific_data else platform_data.get("algorithm_considerations", {})
+            )
+            session.add(platform_persona)
+            
+            writing_persona = session.query(WritingPersona).filter(WritingPersona.id == writing_persona_id).first()
+            if writing_persona:
+                platforms = list((writing_persona.platform_adaptations or {}).get("platforms", []))
+                if platform not in platforms:
+                    platforms.append(platform)
+                writing_persona.platform_adaptations = {"platforms": platforms}
+            
+            session.commit()
+            session.close()
+            
+            logger.info(f"✅ {platform} persona saved for persona ID: {writing_persona_id}")
+            
+        except Exception as e:
+            logger.error(f"Error saving {platform} persona to database: {str(e)}")
+            if session:
+                session.rollback()
+                session.close()
+            raise
+    
+    def _save_analysis_result_to_db(self, user_id: int, writing_persona_id: int, core_persona: Dict[str, Any], platform_personas: Dict[str, Any], onboarding_data: Dict[str, Any]):
+        """Save the persona analysis result record."""
+        session = None
+        try:
+            session = get_db_session()
             
-            # Save analysis result
             analysis_result = PersonaAnalysisResult(
                 user_id=user_id,
-                writing_persona_id=writing_persona.id,
+                writing_persona_id=writing_persona_id,
                 analysis_prompt=self._build_persona_analysis_prompt(onboarding_data)[:5000],  # Truncate for storage
                 input_data=onboarding_data,
                 linguistic_analysis=core_persona.get("linguistic_fingerprint", {}),
@@ -381,14 +431,10 @@ Generate a platform-optimized persona adaptation that maintains brand consistenc
             session.add(analysis_result)
             
             session.commit()
-            persona_id = writing_persona.id
             session.close()
             
-            logger.info(f"✅ Persona saved to database with ID: {persona_id}")
-            return writing_persona
-            
         except Exception as e:
-            logger.error(f"Error saving persona to database: {str(e)}")
+            logger.error(f"Error saving persona analysis result to database: {str(e)}")
             if session:
                 session.rollback()
                 session.close()
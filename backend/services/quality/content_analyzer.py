@@ -22,9 +22,82 @@ Last Updated: January 2025
 """
 
 import re
+from bisect import bisect_left
 from typing import Dict, List, Optional, Any, Tuple
 from loguru import logger
 
+# Factual claim indicators (earlier alternatives win when several match at one position)
+FACTUAL_INDICATOR_PATTERNS = [
+    r'\d+%', r'\d+ percent',  # Percentages
+    r'\$\d+', r'\d+ dollars',  # Dollar amounts
+    r'\d+ million', r'\d+ billion',  # Billions
+    r'research shows', r'studies indicate', r'data reveals',
+    r'experts say', r'according to', r'statistics show',
+    r'\d+ organizations', r'\d+ companies', r'\d+ enterprises',
+    r'\d{4}',  # Years
+    r'AI', r'artificial intelligence', r'machine learning',  # Technology terms
+    r'content creation', r'digital marketing', r'technology industry',  # Industry terms
+    r'efficiency', r'innovation', r'development', r'growth',  # Business terms
+    r'businesses', r'companies', r'organizations',  # Entity terms
+    r'tools', r'platforms', r'systems', r'solutions'  # Product terms
+]
+
+# Citation formats - updated to match our actual citation format
+CITATION_PATTERNS = [
+    r'<sup class="liw-cite"[^>]*>\[\d+\]</sup>',  # HTML format - PRIORITY 1
+    r'\[\d+\]',  # Our primary format: [1], [2], etc.
+    r'\[Source \d+\]', r'\(Source \d+\)',
+    r'\(\d+\)', r'Source \d+', r'Ref\. \d+', r'Reference \d+'
+]
+
+# Citations within this many characters of a claim count as supporting it
+CLAIM_SUPPORT_WINDOW = 150
+
+# Citations and claims precompiled into one alternation so the content is scanned once
+CONTENT_TOKEN_PATTERN = re.compile(
+    '(?P<citation>' + '|'.join(CITATION_PATTERNS) + ')|(?P<claim>' + '|'.join(FACTUAL_INDICATOR_PATTERNS) + ')',
+    re.IGNORECASE
+)
+
+
+class ContentClaimIndex:
+    """
+    Citation positions and factual claim spans collected in a single pass.
+    
+    Citations are kept as sorted start/end offsets so checking whether a claim
+    has a citation nearby is a bisect lookup rather than a rescan of the text.
+    """
+    
+    def __init__(self, content: str):
+        self.content_length = len(content)
+        self.citation_starts: List[int] = []
+        self.citation_ends: List[int] = []
+        self.claims: List[Tuple[int, int]] = []
+        
+        for match in CONTENT_TOKEN_PATTERN.finditer(content):
+            if match.lastgroup == 'citation':
+                self.citation_starts.append(match.start())
+                self.citation_ends.append(match.end())
+            else:
+                self.claims.append((match.start(), match.end()))
+    
+    @property
+    def citation_count(self) -> int:
+        return len(self.citation_starts)
+    
+    def is_supported(self, start: int, end: int, window: int = CLAIM_SUPPORT_WINDOW) -> bool:
+        """True if a whole citation lies within ``window`` characters of the span."""
+        window_start = max(0, start - window)
+        window_end = min(self.content_length, end + window)
+        
+        # Citations do not overlap, so the first one starting in the window ends earliest
+        position = bisect_left(self.citation_starts, window_start)
+        return position < len(self.citation_starts) and self.citation_ends[position] <= window_end
+    
+    def supported_claim_count(self) -> int:
+        return sum(1 for start, end in self.claims if self.is_supported(start, end))
+
+
 class ContentQualityAnalyzer:
     """
     Service for analyzing and scoring content quality.
@@ -83,7 +156,10 @@ class ContentQualityAnalyzer:
             logger.info(f"🔍 [Quality Analysis] Content length: {len(content)} characters")
             logger.info(f"🔍 [Quality Analysis] Sources count: {len(sources)}")
             
-            factual_accuracy = self._assess_factual_accuracy(content, sources)
+            # Scan citations and claims once for both citation-based metrics
+            claim_index = ContentClaimIndex(content)
+            
+            factual_accuracy = self._assess_factual_accuracy(content, sources, claim_index)
             logger.info(f"🔍 [Quality Analysis] Factual accuracy score: {factual_accuracy}")
             
             source_verification = self._assess_source_verification(content, sources)
@@ -95,7 +171,7 @@ class ContentQualityAnalyzer:
             industry_relevance = self._assess_industry_relevance(content, industry)
             logger.info(f"🔍 [Quality Analysis] Industry relevance score: {industry_relevance}")
             
-            citation_coverage = self._assess_citation_coverage(content, sources)
+            citation_coverage = self._assess_citation_coverage(content, sources, claim_index)
             logger.info(f"🔍 [Quality Analysis] Citation coverage score: {citation_coverage}")
             
             # Calculate overall quality score
@@ -145,13 +221,19 @@ class ContentQualityAnalyzer:
                 "recommendations": ["Content quality analysis failed. Please try again."]
             }
     
-    def _assess_factual_accuracy(self, content: str, sources: List[Dict[str, Any]]) -> float:
+    def _assess_factual_accuracy(
+        self,
+        content: str,
+        sources: List[Dict[str, Any]],
+        claim_index: Optional[ContentClaimIndex] = None
+    ) -> float:
         """
         Assess factual accuracy based on source verification.
         
         Args:
             content: The content to analyze
             sources: Research sources used
+            claim_index: Pre-built claim/citation index for the content
             
         Returns:
             Factual accuracy score between 0.0 and 1.0
@@ -163,35 +245,10 @@ class ContentQualityAnalyzer:
             logger.warning("🔍 [Factual Accuracy] No sources provided, returning 0.0")
             return 0.0
         
-        # Look for factual indicators in the content
-        factual_indicators = [
-            r'\d+%', r'\d+ percent',  # Percentages
-            r'\$\d+', r'\d+ dollars',  # Dollar amounts
-            r'\d+ million', r'\d+ billion',  # Billions
-            r'research shows', r'studies indicate', r'data reveals',
-            r'experts say', r'according to', r'statistics show',
-            r'\d{4}',  # Years
-            r'\d+ organizations', r'\d+ companies', r'\d+ enterprises',
-            r'AI', r'artificial intelligence', r'machine learning',  # Technology terms
-            r'content creation', r'digital marketing', r'technology industry',  # Industry terms
-            r'efficiency', r'innovation', r'development', r'growth',  # Business terms
-            r'businesses', r'companies', r'organizations',  # Entity terms
-            r'tools', r'platforms', r'systems', r'solutions'  # Product terms
-        ]
-        
-        factual_claims = 0
-        supported_claims = 0
-        
-        for pattern in factual_indicators:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                logger.info(f"🔍 [Factual Accuracy] Pattern {pattern} found {len(matches)} matches: {matches}")
-            factual_claims += len(matches)
-            
-            # Check if claims are near citations
-            for match in matches:
-                if self._is_claim_supported(match, content, sources):
-                    supported_claims += 1
+        # Claims are supported when a citation sits next to that occurrence
+        claim_index = claim_index or ContentClaimIndex(content)
+        factual_claims = len(claim_index.claims)
+        supported_claims = claim_index.supported_claim_count()
         
         logger.info(f"🔍 [Factual Accuracy] Total factual claims: {factual_claims}")
         logger.info(f"🔍 [Factual Accuracy] Supported claims: {supported_claims}")
@@ -352,13 +409,19 @@ class ContentQualityAnalyzer:
         
         return round(relevance_score, 3)
     
-    def _assess_citation_coverage(self, content: str, sources: List[Dict[str, Any]]) -> float:
+    def _assess_citation_coverage(
+        self,
+        content: str,
+        sources: List[Dict[str, Any]],
+        claim_index: Optional[ContentClaimIndex] = None
+    ) -> float:
         """
         Assess citation coverage in the content.
         
         Args:
             content: The content to analyze
             sources: Research sources used
+            claim_index: Pre-built claim/citation index for the content
             
         Returns:
             Citation coverage score between 0.0 and 1.0
@@ -374,20 +437,8 @@ class ContentQualityAnalyzer:
             logger.warning("🔍 [Citation Coverage] No sources provided, returning 0.0")
             return 0.0
         
-        # Look for citation patterns - updated to match our actual citation format
-        citation_patterns = [
-            r'<sup class="liw-cite"[^>]*>\[(\d+)\]</sup>',  # HTML format - PRIORITY 1
-            r'\[(\d+)\]',  # Our primary format: [1], [2], etc.
-            r'\[Source (\d+)\]', r'\(Source (\d+)\)',
-            r'\((\d+)\)', r'Source (\d+)', r'Ref\. (\d+)', r'Reference (\d+)'
-        ]
-        
-        total_citations = 0
-        for pattern in citation_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                logger.info(f"🔍 [Citation Coverage] Pattern {pattern} found {len(matches)} matches: {matches}")
-            total_citations += len(matches)
+        claim_index = claim_index or ContentClaimIndex(content)
+        total_citations = claim_index.citation_count
         
         logger.info(f"🔍 [Citation Coverage] Total citations found: {total_citations}")
         
@@ -409,43 +460,6 @@ class ContentQualityAnalyzer:
         logger.info(f"🔍 [Citation Coverage] Final coverage score: {final_score}")
         return final_score
     
-    def _is_claim_supported(self, claim: str, content: str, sources: List[Dict[str, Any]]) -> bool:
-        """
-        Check if a factual claim is supported by nearby citations.
-        
-        Args:
-            claim: The factual claim to check
-            content: The content containing the claim
-            sources: Research sources used
-            
-        Returns:
-            True if the claim appears to be supported
-        """
-        # Find the position of the claim
-        claim_pos = content.lower().find(claim.lower())
-        if claim_pos == -1:
-            return False
-        
-        # Look for citations within 300 characters of the claim (increased range)
-        start_pos = max(0, claim_pos - 150)
-        end_pos = min(len(content), claim_pos + len(claim) + 150)
-        
-        nearby_text = content[start_pos:end_pos]
-        
-        # Check for citation patterns - updated to match our actual format
-        citation_patterns = [
-            r'<sup class="liw-cite"[^>]*>\[(\d+)\]</sup>',  # HTML format - PRIORITY 1
-            r'\[(\d+)\]',  # Our primary format: [1], [2], etc.
-            r'\[Source (\d+)\]', r'\[(\d+)\]', r'\(Source (\d+)\)',
-            r'\((\d+)\)', r'Source (\d+)', r'Ref\. (\d+)', r'Reference (\d+)'
-        ]
-        
-        for pattern in citation_patterns:
-            if re.search(pattern, nearby_text, re.IGNORECASE):
-                return True
-        
-        return False
-    
     def _calculate_overall_score(self, metrics: Dict[str, float]) -> float:
         """
         Calculate overall quality score from individual metrics.
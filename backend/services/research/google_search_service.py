@@ -13,7 +13,7 @@ Key Features:
 
 Dependencies:
 - google-api-python-client
-- aiohttp (for async HTTP requests)
+- services.http_client_registry (pooled async HTTP requests)
 - os (for environment variables)
 - logging (for debugging)
 
@@ -25,11 +25,12 @@ Last Updated: January 2025
 import os
 import json
 import asyncio
-import aiohttp
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from loguru import logger
 
+from services.http_client_registry import get_http_client_registry
+
 class GoogleSearchService:
     """
     Service for conducting real industry research using Google Custom Search API.
@@ -163,15 +164,14 @@ class GoogleSearchService:
             "safe": "active"  # Safe search for professional content
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.base_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("items", [])
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Google Search API error: {response.status} - {error_text}")
-                    raise Exception(f"Search API returned status {response.status}")
+        response = await get_http_client_registry().request('GET', self.base_url, params=params)
+        if response.status == 200:
+            data = response.json()
+            return data.get("items", [])
+        else:
+            error_text = response.text()
+            logger.error(f"Google Search API error: {response.status} - {error_text}")
+            raise Exception(f"Search API returned status {response.status}")
     
     async def _process_search_results(
         self, 
@@ -12,11 +12,14 @@ This package provides:
 - User experience analysis
 - Security headers analysis
 - Keyword analysis
+- Single-parse HTML document model shared by all analyzers
 - AI-powered insights generation
+- Concurrent batch analysis with per-host limits
 - Database service for storing and retrieving analysis results
 """
 
 from .core import ComprehensiveSEOAnalyzer, SEOAnalysisResult
+from .batch import BatchSEOAnalyzer
 from .analyzers import (
     URLStructureAnalyzer,
     MetaDataAnalyzer,
@@ -28,7 +31,8 @@ from .analyzers import (
     SecurityHeadersAnalyzer,
     KeywordAnalyzer
 )
-from .utils import HTMLFetcher, AIInsightGenerator
+from .document import HTMLDocument
+from .utils import HTMLFetcher, FetchedPage, AIInsightGenerator
 from .service import SEOAnalysisService
 
 __version__ = "1.0.0"
@@ -37,6 +41,7 @@ __author__ = "AI-Writer Team"
 __all__ = [
     'ComprehensiveSEOAnalyzer',
     'SEOAnalysisResult',
+    'BatchSEOAnalyzer',
     'URLStructureAnalyzer',
     'MetaDataAnalyzer',
     'ContentAnalyzer',
@@ -46,7 +51,9 @@ __all__ = [
     'UserExperienceAnalyzer',
     'SecurityHeadersAnalyzer',
     'KeywordAnalyzer',
+    'HTMLDocument',
     'HTMLFetcher',
+    'FetchedPage',
     'AIInsightGenerator',
     'SEOAnalysisService'
 ] 
\ No newline at end of file
@@ -5,21 +5,24 @@ Contains all individual SEO analysis components.
 
 import re
 import time
-import requests
 from urllib.parse import urlparse, urljoin
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Optional, Union
 from loguru import logger
 
+from services.http_client_registry import get_shared_requests_session
+
+from .document import HTMLDocument
+from .utils import FetchedPage
+
 
 class BaseAnalyzer:
     """Base class for all SEO analyzers"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    @property
+    def session(self):
+        # Looked up per use: analyzers run on BatchSEOAnalyzer worker threads,
+        # and each thread has its own session over the shared connection pool
+        return get_shared_requests_session()
 
 
 class URLStructureAnalyzer(BaseAnalyzer):
@@ -98,16 +101,16 @@ class URLStructureAnalyzer(BaseAnalyzer):
 class MetaDataAnalyzer(BaseAnalyzer):
     """Analyzes meta data and technical SEO elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str], url: str) -> Dict[str, Any]:
         """Enhanced meta data analysis with specific element locations"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
         # Title analysis
-        title_tag = soup.find('title')
-        if not title_tag:
+        title_text = document.title
+        if title_text is None:
             issues.append({
                 'type': 'critical',
                 'message': 'Missing title tag',
@@ -117,7 +120,6 @@ class MetaDataAnalyzer(BaseAnalyzer):
                 'action': 'add_title_tag'
             })
         else:
-            title_text = title_tag.get_text().strip()
             if len(title_text) < 30:
                 warnings.append({
                     'type': 'warning',
@@ -140,7 +142,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
                 })
         
         # Meta description analysis
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = document.meta('description')
         if not meta_desc:
             issues.append({
                 'type': 'critical',
@@ -174,7 +176,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
                 })
         
         # Viewport meta tag
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = document.meta('viewport')
         if not viewport:
             issues.append({
                 'type': 'critical',
@@ -186,7 +188,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
             })
         
         # Charset declaration
-        charset = soup.find('meta', attrs={'charset': True}) or soup.find('meta', attrs={'http-equiv': 'Content-Type'})
+        charset = document.meta_charset or document.meta_by_http_equiv.get('content-type')
         if not charset:
             warnings.append({
                 'type': 'warning',
@@ -204,7 +206,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
             'issues': issues,
             'warnings': warnings,
             'recommendations': recommendations,
-            'title_length': len(title_tag.get_text().strip()) if title_tag else 0,
+            'title_length': len(title_text) if title_text else 0,
             'description_length': len(meta_desc.get('content', '')) if meta_desc else 0,
             'has_viewport': bool(viewport),
             'has_charset': bool(charset)
@@ -214,16 +216,15 @@ class MetaDataAnalyzer(BaseAnalyzer):
 class ContentAnalyzer(BaseAnalyzer):
     """Analyzes content quality and structure"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str], url: str) -> Dict[str, Any]:
         """Enhanced content analysis with specific text locations"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
-        # Get all text content
-        text_content = soup.get_text()
-        words = text_content.split()
+        # Get all visible text content
+        words = document.visible_text.split()
         word_count = len(words)
         
         # Check word count
@@ -239,7 +240,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for H1 tags
-        h1_tags = soup.find_all('h1')
+        h1_tags = document.find_all('h1')
         if len(h1_tags) == 0:
             issues.append({
                 'type': 'critical',
@@ -261,7 +262,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for images without alt text
-        images = soup.find_all('img')
+        images = document.find_all('img')
         images_without_alt = [img for img in images if not img.get('alt')]
         if images_without_alt:
             warnings.append({
@@ -275,7 +276,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for internal links
-        internal_links = soup.find_all('a', href=re.compile(r'^[^http]'))
+        internal_links = document.internal_links
         if len(internal_links) < 3:
             warnings.append({
                 'type': 'warning',
@@ -326,9 +327,9 @@ class ContentAnalyzer(BaseAnalyzer):
 class TechnicalSEOAnalyzer(BaseAnalyzer):
     """Analyzes technical SEO elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str], url: str) -> Dict[str, Any]:
         """Enhanced technical SEO analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content, url)
         issues = []
         warnings = []
         recommendations = []
@@ -380,7 +381,7 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
             })
         
         # Check for structured data
-        structured_data = soup.find_all('script', type='application/ld+json')
+        structured_data = document.scripts_of_type('application/ld+json')
         if not structured_data:
             warnings.append({
                 'type': 'warning',
@@ -392,7 +393,7 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
             })
         
         # Check for canonical URL
-        canonical = soup.find('link', rel='canonical')
+        canonical = document.link_rel('canonical')
         if not canonical:
             issues.append({
                 'type': 'critical',
@@ -420,12 +421,18 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
 class PerformanceAnalyzer(BaseAnalyzer):
     """Analyzes page performance"""
     
-    def analyze(self, url: str) -> Dict[str, Any]:
+    def analyze(self, url: str, page: Optional[FetchedPage] = None) -> Dict[str, Any]:
         """Enhanced performance analysis with specific fixes"""
         try:
-            start_time = time.time()
-            response = self.session.get(url, timeout=20)
-            load_time = time.time() - start_time
+            if page is not None:
+                # Reuse the shared fetch instead of downloading the page again
+                load_time = page.load_time
+                response_headers = page.headers
+            else:
+                start_time = time.time()
+                response = self.session.get(url, timeout=20)
+                load_time = time.time() - start_time
+                response_headers = response.headers
             
             issues = []
             warnings = []
@@ -454,7 +461,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 })
             
             # Check for compression
-            content_encoding = response.headers.get('Content-Encoding')
+            content_encoding = response_headers.get('Content-Encoding')
             if not content_encoding:
                 warnings.append({
                     'type': 'warning',
@@ -467,7 +474,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
             
             # Check for caching headers
             cache_headers = ['Cache-Control', 'Expires', 'ETag']
-            has_cache = any(response.headers.get(header) for header in cache_headers)
+            has_cache = any(response_headers.get(header) for header in cache_headers)
             if not has_cache:
                 warnings.append({
                     'type': 'warning',
@@ -485,6 +492,8 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 'load_time': load_time,
                 'is_compressed': bool(content_encoding),
                 'has_cache': has_cache,
+                'redirect_count': len(page.redirect_chain) if page else None,
+                'final_url': page.final_url if page else None,
                 'issues': issues,
                 'warnings': warnings,
                 'recommendations': recommendations
@@ -503,15 +512,15 @@ class PerformanceAnalyzer(BaseAnalyzer):
 class AccessibilityAnalyzer(BaseAnalyzer):
     """Analyzes accessibility features"""
     
-    def analyze(self, html_content: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str]) -> Dict[str, Any]:
         """Enhanced accessibility analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content)
         issues = []
         warnings = []
         recommendations = []
         
         # Check for alt text on images
-        images = soup.find_all('img')
+        images = document.find_all('img')
         images_without_alt = [img for img in images if not img.get('alt')]
         if images_without_alt:
             issues.append({
@@ -525,15 +534,14 @@ class AccessibilityAnalyzer(BaseAnalyzer):
             })
         
         # Check for form labels
-        forms = soup.find_all('form')
+        forms = document.find_all('form')
         for form in forms:
             inputs = form.find_all(['input', 'textarea', 'select'])
             for input_elem in inputs:
                 if input_elem.get('type') not in ['hidden', 'submit', 'button']:
                     input_id = input_elem.get('id')
                     if input_id:
-                        label = soup.find('label', attrs={'for': input_id})
-                        if not label:
+                        if input_id not in document.label_targets:
                             warnings.append({
                                 'type': 'warning',
                                 'message': f'Input without label (ID: {input_id})',
@@ -545,7 +553,7 @@ class AccessibilityAnalyzer(BaseAnalyzer):
                             })
         
         # Check for heading hierarchy
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = document.headings
         if headings:
             h1_count = len([h for h in headings if h.name == 'h1'])
             if h1_count == 0:
@@ -559,8 +567,8 @@ class AccessibilityAnalyzer(BaseAnalyzer):
                 })
         
         # Check for color contrast (basic check)
-        style_tags = soup.find_all('style')
-        inline_styles = soup.find_all(style=True)
+        style_tags = document.find_all('style')
+        inline_styles = document.styled_elements
         if style_tags or inline_styles:
             warnings.append({
                 'type': 'warning',
@@ -588,15 +596,15 @@ class AccessibilityAnalyzer(BaseAnalyzer):
 class UserExperienceAnalyzer(BaseAnalyzer):
     """Analyzes user experience elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str], url: str) -> Dict[str, Any]:
         """Enhanced user experience analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
         # Check for mobile responsiveness indicators
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = document.meta('viewport')
         if not viewport:
             issues.append({
                 'type': 'critical',
@@ -608,7 +616,7 @@ class UserExperienceAnalyzer(BaseAnalyzer):
             })
         
         # Check for navigation menu
-        nav_elements = soup.find_all(['nav', 'ul', 'ol'])
+        nav_elements = document.find_all('nav', 'ul', 'ol')
         if not nav_elements:
             warnings.append({
                 'type': 'warning',
@@ -621,7 +629,7 @@ class UserExperienceAnalyzer(BaseAnalyzer):
         
         # Check for contact information
         contact_patterns = ['contact', 'phone', 'email', '@', 'tel:']
-        page_text = soup.get_text().lower()
+        page_text = document.visible_text_lower
         has_contact = any(pattern in page_text for pattern in contact_patterns)
         if not has_contact:
             warnings.append({
@@ -664,17 +672,20 @@ class UserExperienceAnalyzer(BaseAnalyzer):
 class SecurityHeadersAnalyzer(BaseAnalyzer):
     """Analyzes security headers"""
     
-    def analyze(self, url: str) -> Dict[str, Any]:
+    def analyze(self, url: str, page: Optional[FetchedPage] = None) -> Dict[str, Any]:
         """Enhanced security headers analysis with specific fixes"""
         try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
+            if page is not None:
+                response_headers = page.headers
+            else:
+                response_headers = self.session.get(url, timeout=15, allow_redirects=True).headers
             security_headers = {
-                'X-Frame-Options': response.headers.get('X-Frame-Options'),
-                'X-Content-Type-Options': response.headers.get('X-Content-Type-Options'),
-                'X-XSS-Protection': response.headers.get('X-XSS-Protection'),
-                'Strict-Transport-Security': response.headers.get('Strict-Transport-Security'),
-                'Content-Security-Policy': response.headers.get('Content-Security-Policy'),
-                'Referrer-Policy': response.headers.get('Referrer-Policy')
+                'X-Frame-Options': response_headers.get('X-Frame-Options'),
+                'X-Content-Type-Options': response_headers.get('X-Content-Type-Options'),
+                'X-XSS-Protection': response_headers.get('X-XSS-Protection'),
+                'Strict-Transport-Security': response_headers.get('Strict-Transport-Security'),
+                'Content-Security-Policy': response_headers.get('Content-Security-Policy'),
+                'Referrer-Policy': response_headers.get('Referrer-Policy')
             }
             
             issues = []
@@ -732,19 +743,18 @@ class SecurityHeadersAnalyzer(BaseAnalyzer):
 class KeywordAnalyzer(BaseAnalyzer):
     """Analyzes keyword usage and optimization"""
     
-    def analyze(self, html_content: str, target_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[HTMLDocument, str], target_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
         """Enhanced keyword analysis with specific locations"""
         if not target_keywords:
             return {'score': 0, 'issues': [], 'warnings': [], 'recommendations': []}
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        document = HTMLDocument.ensure(html_content)
         issues = []
         warnings = []
         recommendations = []
         
-        page_text = soup.get_text().lower()
-        title_text = soup.find('title')
-        title_text = title_text.get_text().lower() if title_text else ""
+        page_text = document.visible_text_lower
+        title_text = document.title.lower() if document.title else ""
         
         for keyword in target_keywords:
             keyword_lower = keyword.lower()
@@ -0,0 +1,174 @@
+"""
+Batch SEO Analyzer
+Runs ComprehensiveSEOAnalyzer over many URLs concurrently without blocking the event loop.
+"""
+
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from typing import Deque, Dict, List, Any, Optional, AsyncIterator, Tuple
+from urllib.parse import urlparse
+from loguru import logger
+
+from .core import ComprehensiveSEOAnalyzer
+
+# Batch engine configuration
+SEO_BATCH_MAX_CONCURRENCY = int(os.getenv('SEO_BATCH_MAX_CONCURRENCY', '8'))
+SEO_BATCH_PER_HOST_LIMIT = int(os.getenv('SEO_BATCH_PER_HOST_LIMIT', '2'))
+SEO_BATCH_QUEUE_SIZE = int(os.getenv('SEO_BATCH_QUEUE_SIZE', '32'))
+
+
+def normalize_url(url: str) -> str:
+    """Ensure URL has protocol"""
+    url = url.strip()
+    if not url.startswith(('http://', 'https://')):
+        url = f"https://{url}"
+    return url
+
+
+def url_host(url: str) -> str:
+    """Host a URL is rate limited under (empty for unparseable input)"""
+    try:
+        return urlparse(normalize_url(url)).netloc.lower()
+    except Exception:
+        return ''
+
+
+class BatchSEOAnalyzer:
+    """
+    Async batch engine over a shared ComprehensiveSEOAnalyzer.
+
+    - ``max_concurrency`` bounds the number of analyses running at once
+      (each runs on a dedicated worker thread and shares the analyzer's
+      HTTP connection pool)
+    - ``per_host_limit`` bounds concurrent analyses against the same host;
+      a host at its limit does not hold worker slots other hosts could use
+    - at most ``queue_size`` URLs are read ahead, so a long URL list is
+      never materialized as in-flight work, and results are handed to the
+      consumer as soon as each analysis finishes
+    """
+
+    def __init__(
+        self,
+        analyzer: ComprehensiveSEOAnalyzer,
+        max_concurrency: int = SEO_BATCH_MAX_CONCURRENCY,
+        per_host_limit: int = SEO_BATCH_PER_HOST_LIMIT,
+        queue_size: int = SEO_BATCH_QUEUE_SIZE
+    ):
+        self.analyzer = analyzer
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_limit = max(1, per_host_limit)
+        self.queue_size = max(1, queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="seo-batch")
+
+    async def iter_results(
+        self,
+        urls: List[str],
+        target_keywords: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield one summary per URL, in completion order.
+
+        URLs are read ahead (at most ``queue_size`` waiting) into per-host
+        queues, and an analysis only takes a worker slot once its host is
+        below ``per_host_limit``. A list dominated by one host therefore
+        never parks every slot behind that host's limit.
+        """
+        url_iter = enumerate(urls)
+        exhausted = False
+        waiting_count = 0
+        waiting: Dict[str, Deque[Tuple[int, str]]] = {}
+        running_per_host: Dict[str, int] = {}
+        in_flight: Dict[asyncio.Task, Tuple[str, int]] = {}
+
+        try:
+            while True:
+                # Read ahead into the per-host queues
+                while not exhausted and waiting_count < self.queue_size:
+                    item = next(url_iter, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, url = item
+                    waiting.setdefault(url_host(url), deque()).append((index, url))
+                    waiting_count += 1
+
+                # Start analyses for hosts with spare capacity, rotating between hosts
+                for host in list(waiting):
+                    if len(in_flight) >= self.max_concurrency:
+                        break
+                    queue = waiting[host]
+                    while queue and len(in_flight) < self.max_concurrency and running_per_host.get(host, 0) < self.per_host_limit:
+                        index, url = queue.popleft()
+                        waiting_count -= 1
+                        running_per_host[host] = running_per_host.get(host, 0) + 1
+                        in_flight[asyncio.create_task(self._analyze_one(url, target_keywords))] = (host, index)
+                    del waiting[host]
+                    if queue:
+                        waiting[host] = queue  # back of the rotation
+
+                if not in_flight:
+                    return
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    host, index = in_flight.pop(task)
+                    running_per_host[host] -= 1
+                    summary = task.result()
+                    summary['index'] = index
+                    yield summary
+        finally:
+            # Consumer went away (e.g. client disconnected): stop scheduling new URLs
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def analyze(self, urls: List[str], target_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Analyze all URLs and return the aggregate batch result (input order)."""
+        results = [summary async for summary in self.iter_results(urls, target_keywords)]
+        results.sort(key=lambda r: r.pop('index'))
+        return self.build_batch_result(len(urls), results)
+
+    @staticmethod
+    def build_batch_result(total_urls: int, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "total_urls": total_urls,
+            "successful_analyses": len([r for r in results if r['success']]),
+            "failed_analyses": len([r for r in results if not r['success']]),
+            "results": results
+        }
+
+    async def _analyze_one(self, url: str, target_keywords: Optional[List[str]]) -> Dict[str, Any]:
+        try:
+            url = normalize_url(url)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                self._executor, self.analyzer.analyze_url_progressive, url, target_keywords
+            )
+
+            summary = {
+                "url": result.url,
+                "overall_score": result.overall_score,
+                "health_status": result.health_status,
+                "critical_issues_count": len(result.critical_issues),
+                "warnings_count": len(result.warnings),
+                "success": result.health_status != 'error'
+            }
+            if not summary["success"] and result.critical_issues:
+                summary["error"] = result.critical_issues[0].get('message')
+            return summary
+        except Exception as e:
+            logger.warning(f"Batch SEO analysis failed for {url}: {e}")
+            return {
+                "url": url,
+                "overall_score": 0,
+                "health_status": "error",
+                "critical_issues_count": 0,
+                "warnings_count": 0,
+                "success": False,
+                "error": str(e)
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
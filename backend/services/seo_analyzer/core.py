@@ -64,36 +64,39 @@ class ComprehensiveSEOAnalyzer:
         try:
             logger.info(f"Starting enhanced SEO analysis for URL: {url}")
             
-            # Fetch HTML content
-            html_content = self.html_fetcher.fetch_html(url)
-            if not html_content:
+            # Fetch the page once; every analyzer reads from the same response
+            page = self.html_fetcher.fetch(url)
+            if not page or not page.html:
                 return self._create_error_result(url, "Failed to fetch HTML content")
             
+            # Parsed once per page (and reused as-is when the page was not modified)
+            document = page.document
+            
             # Run all analyzers
             analysis_data = {}
             
             logger.info("Running enhanced analyses...")
             analysis_data.update({
                 'url_structure': self.url_analyzer.analyze(url),
-                'meta_data': self.meta_analyzer.analyze(html_content, url),
-                'content_analysis': self.content_analyzer.analyze(html_content, url),
-                'keyword_analysis': self.keyword_analyzer.analyze(html_content, target_keywords) if target_keywords else {},
-                'technical_seo': self.technical_analyzer.analyze(html_content, url),
-                'accessibility': self.accessibility_analyzer.analyze(html_content),
-                'user_experience': self.ux_analyzer.analyze(html_content, url)
+                'meta_data': self.meta_analyzer.analyze(document, url),
+                'content_analysis': self.content_analyzer.analyze(document, url),
+                'keyword_analysis': self.keyword_analyzer.analyze(document, target_keywords) if target_keywords else {},
+                'technical_seo': self.technical_analyzer.analyze(document, url),
+                'accessibility': self.accessibility_analyzer.analyze(document),
+                'user_experience': self.ux_analyzer.analyze(document, url)
             })
             
             # Run potentially slower analyses with error handling
             logger.info("Running security headers analysis...")
             try:
-                analysis_data['security_headers'] = self.security_analyzer.analyze(url)
+                analysis_data['security_headers'] = self.security_analyzer.analyze(url, page)
             except Exception as e:
                 logger.warning(f"Security headers analysis failed: {e}")
                 analysis_data['security_headers'] = self._create_fallback_result('security_headers', str(e))
             
             logger.info("Running performance analysis...")
             try:
-                analysis_data['performance'] = self.performance_analyzer.analyze(url)
+                analysis_data['performance'] = self.performance_analyzer.analyze(url, page)
             except Exception as e:
                 logger.warning(f"Performance analysis failed: {e}")
                 analysis_data['performance'] = self._create_fallback_result('performance', str(e))
@@ -0,0 +1,153 @@
+"""
+SEO Analyzer HTML Document
+Parses a page once and exposes the lookups every analyzer needs.
+"""
+
+from collections import defaultdict
+from urllib.parse import urlparse, urljoin
+from typing import Dict, List, Optional, Union
+from bs4 import BeautifulSoup, Tag
+from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction
+from loguru import logger
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    logger.warning("lxml not available, SEO analyzers fall back to html.parser. Install with: pip install lxml")
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Elements whose text is never rendered on the page
+NON_VISIBLE_TAGS = {'script', 'style', 'noscript', 'template', 'head', 'title', 'meta', '[document]'}
+
+NON_TEXT_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+
+class HTMLDocument:
+    """
+    Parsed HTML page shared by all analyzers for one URL.
+
+    The markup is parsed a single time (lxml when installed) and the tree is
+    walked once to build indexes for tags, meta tags, links, headings and
+    visible text, so analyzers never re-parse or re-scan the whole page.
+    """
+
+    def __init__(self, html_content: str, url: Optional[str] = None):
+        self.url = url
+        self.soup = BeautifulSoup(html_content or '', HTML_PARSER)
+
+        self.tags_by_name: Dict[str, List[Tag]] = defaultdict(list)
+        self.meta_by_name: Dict[str, Tag] = {}
+        self.meta_by_property: Dict[str, Tag] = {}
+        self.meta_by_http_equiv: Dict[str, Tag] = {}
+        self.meta_charset: Optional[Tag] = None
+        self.headings: List[Tag] = []
+        self.styled_elements: List[Tag] = []
+        self.internal_links: List[Tag] = []
+        self.external_links: List[Tag] = []
+        self.label_targets = set()
+
+        self._build_indexes()
+        self.visible_text = self._extract_visible_text()
+        self.visible_text_lower = self.visible_text.lower()
+
+        title_tag = self.find('title')
+        self.title = title_tag.get_text().strip() if title_tag else None
+
+    @classmethod
+    def ensure(cls, document: Union['HTMLDocument', str], url: Optional[str] = None) -> 'HTMLDocument':
+        """Return ``document`` as an HTMLDocument, parsing raw HTML if needed."""
+        if isinstance(document, cls):
+            return document
+        return cls(document, url)
+
+    def _build_indexes(self):
+        """Walk the tree once and populate every index."""
+        base_host = urlparse(self.url).netloc.lower() if self.url else ''
+
+        for tag in self.soup.find_all(True):
+            name = tag.name
+            self.tags_by_name[name].append(tag)
+
+            if tag.has_attr('style'):
+                self.styled_elements.append(tag)
+
+            if name in HEADING_TAGS:
+                self.headings.append(tag)
+            elif name == 'meta':
+                self._index_meta(tag)
+            elif name == 'a':
+                self._index_link(tag, base_host)
+            elif name == 'label' and tag.get('for'):
+                self.label_targets.add(tag.get('for'))
+
+    def _index_meta(self, tag: Tag):
+        # First occurrence wins, matching soup.find semantics
+        meta_name = tag.get('name')
+        if meta_name:
+            self.meta_by_name.setdefault(meta_name.lower(), tag)
+        meta_property = tag.get('property')
+        if meta_property:
+            self.meta_by_property.setdefault(meta_property.lower(), tag)
+        http_equiv = tag.get('http-equiv')
+        if http_equiv:
+            self.meta_by_http_equiv.setdefault(http_equiv.lower(), tag)
+        if self.meta_charset is None and tag.has_attr('charset'):
+            self.meta_charset = tag
+
+    def _index_link(self, tag: Tag, base_host: str):
+        href = (tag.get('href') or '').strip()
+        if not href or href.startswith('#'):
+            return
+        absolute = urljoin(self.url, href) if self.url else href
+        parsed = urlparse(absolute)
+        if parsed.scheme and parsed.scheme not in ('http', 'https'):
+            return  # mailto:, tel:, javascript: ...
+        if not parsed.netloc or parsed.netloc.lower() == base_host:
+            self.internal_links.append(tag)
+        else:
+            self.external_links.append(tag)
+
+    def _extract_visible_text(self) -> str:
+        parts = []
+        for text in self.soup.find_all(string=True):
+            if isinstance(text, NON_TEXT_STRINGS):
+                continue
+            if text.parent is not None and text.parent.name in NON_VISIBLE_TAGS:
+                continue
+            parts.append(text)
+        return ' '.join(parts)
+
+    def find(self, name: str) -> Optional[Tag]:
+        """First tag with the given name."""
+        tags = self.tags_by_name.get(name)
+        return tags[0] if tags else None
+
+    def find_all(self, *names: str) -> List[Tag]:
+        """All tags with any of the given names (document order per name)."""
+        if len(names) == 1:
+            return list(self.tags_by_name.get(names[0], []))
+        return [tag for name in names for tag in self.tags_by_name.get(name, [])]
+
+    def meta(self, name: str) -> Optional[Tag]:
+        """``<meta name=...>`` lookup (case-insensitive)."""
+        return self.meta_by_name.get(name.lower())
+
+    def meta_property(self, prop: str) -> Optional[Tag]:
+        """``<meta property=...>`` lookup, e.g. Open Graph tags."""
+        return self.meta_by_property.get(prop.lower())
+
+    def link_rel(self, rel: str) -> Optional[Tag]:
+        """First ``<link>`` whose rel contains ``rel``."""
+        for tag in self.tags_by_name.get('link', []):
+            rel_values = tag.get('rel') or []
+            if isinstance(rel_values, str):
+                rel_values = rel_values.split()
+            if rel in (value.lower() for value in rel_values):
+                return tag
+        return None
+
+    def scripts_of_type(self, script_type: str) -> List[Tag]:
+        return [tag for tag in self.tags_by_name.get('script', []) if tag.get('type') == script_type]
@@ -3,30 +3,199 @@ SEO Analyzer Utilities
 Contains utility classes for HTML fetching and AI insight generation.
 """
 
-import requests
+import os
+import time
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional, Dict, List, Any
 from loguru import logger
+from requests.structures import CaseInsensitiveDict
+
+from services.http_client_registry import get_shared_requests_session
+
+from .document import HTMLDocument
+
+# Raw bodies kept for conditional re-fetches (per fetcher)
+SEO_FETCH_CACHE_MAX_BYTES = int(os.getenv('SEO_FETCH_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+
+
+@dataclass
+class FetchedPage:
+    """
+    Single HTTP fetch of a page, shared by every analyzer for one analysis.
+
+    ``load_time`` is the duration of this fetch. When a repeat fetch is
+    answered with 304 Not Modified, the page is rebuilt from the cached raw
+    body, ``load_time`` is the revalidation round trip and ``not_modified``
+    is set.
+    """
+    url: str
+    final_url: str
+    status_code: int
+    headers: CaseInsensitiveDict
+    html: str
+    load_time: float
+    content_length: int
+    content_encoding: Optional[str] = None
+    redirect_chain: List[Dict[str, Any]] = field(default_factory=list)
+    not_modified: bool = False
+    revalidation_time: Optional[float] = None
+    fetched_at: datetime = field(default_factory=datetime.now)
+    _document: Optional[HTMLDocument] = field(default=None, repr=False, compare=False)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    @property
+    def document(self) -> HTMLDocument:
+        """Parsed document, built on first access and kept with the page."""
+        if self._document is None:
+            self._document = HTMLDocument(self.html, self.final_url)
+        return self._document
+
+
+@dataclass
+class _RevalidationEntry:
+    """Validators and raw body of a fetched page; enough to rebuild it after a 304."""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    status_code: int
+    headers: CaseInsensitiveDict
+    body: bytes
+    encoding: Optional[str]
+    content_encoding: Optional[str]
 
 
 class HTMLFetcher:
     """Utility class for fetching HTML content from URLs"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+    def __init__(self, max_cached_pages: int = 32, max_cached_bytes: int = SEO_FETCH_CACHE_MAX_BYTES):
+        # Validators (ETag/Last-Modified) and raw bodies of recently fetched pages, for
+        # conditional requests; parsed documents are not kept past the analysis using them
+        self.max_cached_pages = max_cached_pages
+        self.max_cached_bytes = max_cached_bytes
+        self._page_cache: "OrderedDict[str, _RevalidationEntry]" = OrderedDict()
+        self._cached_bytes = 0
+        self._cache_lock = threading.Lock()
+
+    @property
+    def session(self):
+        # Per-thread session over the process-wide pool (keep-alive, per-host pool, retry policy)
+        return get_shared_requests_session()
+
+    def fetch(self, url: str, timeout: int = 30) -> Optional[FetchedPage]:
+        """
+        Fetch a page once, recording timing, headers, compression and redirects.
+
+        Pages fetched before with an ETag or Last-Modified header are
+        revalidated with a conditional request, so unchanged pages skip the
+        body download and are re-parsed from the cached body.
+        """
+        cached = self._get_cached(url)
+        conditional_headers = {}
+        if cached is not None:
+            if cached.etag:
+                conditional_headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                conditional_headers['If-Modified-Since'] = cached.last_modified
 
-    def fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content with error handling"""
         try:
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.text
+            start_time = time.time()
+            response = self.session.get(url, timeout=timeout, headers=conditional_headers or None)
+            elapsed = time.time() - start_time
+
+            redirect_chain = [
+                {'url': hop.url, 'status_code': hop.status_code, 'location': hop.headers.get('Location')}
+                for hop in response.history
+            ]
+
+            if response.status_code == 304 and cached is not None:
+                logger.info(f"Page not modified since last fetch, reusing cached body: {url}")
+                headers = CaseInsensitiveDict(cached.headers)
+                headers.update(response.headers)
+                page = FetchedPage(
+                    url=url,
+                    final_url=response.url,
+                    status_code=cached.status_code,
+                    headers=headers,
+                    html=cached.body.decode(cached.encoding or 'utf-8', errors='replace'),
+                    load_time=elapsed,
+                    content_length=len(cached.body),
+                    content_encoding=cached.content_encoding,
+                    redirect_chain=redirect_chain,
+                    not_modified=True,
+                    revalidation_time=elapsed,
+                )
+                self._touch_cached(url, headers)
+            else:
+                response.raise_for_status()
+                page = FetchedPage(
+                    url=url,
+                    final_url=response.url,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    html=response.text,
+                    load_time=elapsed,
+                    content_length=len(response.content),
+                    content_encoding=response.headers.get('Content-Encoding'),
+                    redirect_chain=redirect_chain,
+                )
+                self._store_cached(url, _RevalidationEntry(
+                    etag=page.etag,
+                    last_modified=page.last_modified,
+                    status_code=response.status_code,
+                    headers=response.headers,
+                    body=response.content,
+                    encoding=response.encoding or response.apparent_encoding,
+                    content_encoding=page.content_encoding,
+                ))
+
+            return page
         except Exception as e:
             logger.error(f"Error fetching HTML from {url}: {e}")
             return None
 
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch HTML content with error handling"""
+        page = self.fetch(url)
+        return page.html if page else None
+
+    def _get_cached(self, url: str) -> Optional[_RevalidationEntry]:
+        with self._cache_lock:
+            entry = self._page_cache.get(url)
+            if entry is not None:
+                self._page_cache.move_to_end(url)
+            return entry
+
+    def _touch_cached(self, url: str, headers: CaseInsensitiveDict):
+        """Pick up validators a 304 may have refreshed."""
+        with self._cache_lock:
+            entry = self._page_cache.get(url)
+            if entry is not None:
+                entry.headers = headers
+                entry.etag = headers.get('ETag')
+                entry.last_modified = headers.get('Last-Modified')
+
+    def _store_cached(self, url: str, entry: _RevalidationEntry):
+        with self._cache_lock:
+            previous = self._page_cache.pop(url, None)
+            if previous is not None:
+                self._cached_bytes -= len(previous.body)
+            if not (entry.etag or entry.last_modified) or len(entry.body) > self.max_cached_bytes:
+                return
+            self._page_cache[url] = entry
+            self._cached_bytes += len(entry.body)
+            while len(self._page_cache) > self.max_cached_pages or self._cached_bytes > self.max_cached_bytes:
+                _, evicted = self._page_cache.popitem(last=False)
+                self._cached_bytes -= len(evicted.body)
+
 
 class AIInsightGenerator:
     """Utility class for generating AI-powered insights from analysis data"""
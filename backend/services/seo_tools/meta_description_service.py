@@ -9,7 +9,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from loguru import logger
 
-from ..llm_providers.main_text_generation import llm_text_gen
+from ..llm_providers.llm_gateway import get_llm_gateway
 from middleware.logging_middleware import seo_logger
 
 
@@ -63,7 +63,7 @@ class MetaDescriptionService:
             # Generate meta descriptions using AI
             logger.info(f"Generating meta descriptions for keywords: {keywords_str}")
             
-            ai_response = llm_text_gen(
+            ai_response = await get_llm_gateway().generate(
                 prompt=prompt,
                 system_prompt=self._get_system_prompt(language)
             )
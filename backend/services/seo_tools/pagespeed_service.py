@@ -5,14 +5,14 @@ AI-enhanced PageSpeed analysis service that provides comprehensive
 performance insights with actionable recommendations for optimization.
 """
 
-import aiohttp
 import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from loguru import logger
 import os
 
-from ..llm_providers.main_text_generation import llm_text_gen
+from ..llm_providers.llm_gateway import get_llm_gateway
+from ..http_client_registry import get_http_client_registry
 from middleware.logging_middleware import seo_logger
 
 
@@ -159,22 +159,21 @@ class PageSpeedService:
             api_url += f"&key={self.api_key}"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url, timeout=aiohttp.ClientTimeout(total=60)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"PageSpeed API error {response.status}: {error_text}")
-                        
-                        if response.status == 429:
-                            raise Exception("PageSpeed API rate limit exceeded")
-                        elif response.status == 400:
-                            raise Exception(f"Invalid URL or parameters: {error_text}")
-                        else:
-                            raise Exception(f"PageSpeed API error: {response.status}")
-                        
+            response = await get_http_client_registry().request('GET', api_url, timeout=60)
+            if response.status == 200:
+                data = response.json()
+                return data
+            else:
+                error_text = response.text()
+                logger.error(f"PageSpeed API error {response.status}: {error_text}")
+                
+                if response.status == 429:
+                    raise Exception("PageSpeed API rate limit exceeded")
+                elif response.status == 400:
+                    raise Exception(f"Invalid URL or parameters: {error_text}")
+                else:
+                    raise Exception(f"PageSpeed API error: {response.status}")
+                
         except asyncio.TimeoutError:
             raise Exception("PageSpeed API request timed out")
         except Exception as e:
@@ -297,7 +296,7 @@ class PageSpeedService:
             )
             
             # Generate AI insights
-            ai_response = llm_text_gen(
+            ai_response = await get_llm_gateway().generate(
                 prompt=prompt,
                 system_prompt=self._get_system_prompt()
             )
@@ -5,18 +5,111 @@ AI-enhanced sitemap analyzer that provides insights into website structure,
 content distribution, and publishing patterns for SEO optimization.
 """
 
-import aiohttp
+import os
+import zlib
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 from loguru import logger
 import xml.etree.ElementTree as ET
 from urllib.parse import urlparse, urljoin
 import pandas as pd
 
-from ..llm_providers.main_text_generation import llm_text_gen
+from ..llm_providers.llm_gateway import get_llm_gateway
+from ..http_client_registry import get_http_client_registry, ResponseTooLargeError
 from middleware.logging_middleware import seo_logger
 
+# Sitemap ingestion limits
+SITEMAP_MAX_CONCURRENT_FETCHES = int(os.getenv('SITEMAP_MAX_CONCURRENT_FETCHES', '8'))
+SITEMAP_MAX_CHILD_SITEMAPS = int(os.getenv('SITEMAP_MAX_CHILD_SITEMAPS', '500'))
+SITEMAP_MAX_INDEX_DEPTH = 3
+# The sitemap protocol allows up to 50 MB per (uncompressed) file; the cap
+# applies to the downloaded bytes and again to the inflated .xml.gz output
+SITEMAP_MAX_BYTES = int(os.getenv('SITEMAP_MAX_BYTES', str(50 * 1024 * 1024)))
+# Most bytes inflated from a gzip sitemap per decompress() call
+SITEMAP_INFLATE_CHUNK_SIZE = 1024 * 1024
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace from a tag"""
+    return tag.rsplit('}', 1)[-1]
+
+
+class SitemapAggregates:
+    """
+    Running structure/trend/pattern aggregates over sitemap <url> records.
+
+    Records are folded in one at a time as they are parsed, so the full URL
+    list is never held in memory.
+    """
+
+    def __init__(self):
+        self.total_urls = 0
+        self.url_patterns: Dict[str, int] = {}
+        self.file_types: Dict[str, int] = {}
+        self.path_depth_total = 0
+        self.max_path_depth = 0
+        self.monthly_counts: Dict[str, int] = {}
+        self.yearly_counts: Dict[str, int] = {}
+        self.earliest_date: Optional[datetime] = None
+        self.latest_date: Optional[datetime] = None
+        self.total_dated_urls = 0
+        self.priority_distribution: Dict[str, int] = {}
+        self.changefreq_distribution: Dict[str, int] = {}
+
+    def add(self, url_info: Dict[str, Any]):
+        """Fold a single <url> record into the aggregates"""
+        self.total_urls += 1
+
+        # Structure
+        parsed_url = urlparse(url_info.get("loc", "") or "")
+        path_parts = parsed_url.path.strip('/').split('/')
+        self.path_depth_total += len(path_parts)
+        self.max_path_depth = max(self.max_path_depth, len(path_parts))
+        if path_parts[0]:
+            category = path_parts[0]
+            self.url_patterns[category] = self.url_patterns.get(category, 0) + 1
+        if '.' in parsed_url.path:
+            extension = parsed_url.path.split('.')[-1].lower()
+            self.file_types[extension] = self.file_types.get(extension, 0) + 1
+
+        # Content trends
+        lastmod = url_info.get("lastmod")
+        if lastmod:
+            try:
+                date_obj = datetime.strptime(lastmod.strip().split('T')[0], "%Y-%m-%d")
+            except ValueError:
+                date_obj = None
+            if date_obj is not None:
+                self.total_dated_urls += 1
+                month_key = date_obj.strftime("%Y-%m")
+                year_key = date_obj.strftime("%Y")
+                self.monthly_counts[month_key] = self.monthly_counts.get(month_key, 0) + 1
+                self.yearly_counts[year_key] = self.yearly_counts.get(year_key, 0) + 1
+                if self.earliest_date is None or date_obj < self.earliest_date:
+                    self.earliest_date = date_obj
+                if self.latest_date is None or date_obj > self.latest_date:
+                    self.latest_date = date_obj
+
+        # Publishing patterns
+        priority = url_info.get("priority")
+        if priority:
+            try:
+                priority_range = f"{int(float(priority) * 10)}/10"
+                self.priority_distribution[priority_range] = self.priority_distribution.get(priority_range, 0) + 1
+            except ValueError:
+                pass
+        changefreq = url_info.get("changefreq")
+        if changefreq:
+            changefreq = changefreq.strip()
+            self.changefreq_distribution[changefreq] = self.changefreq_distribution.get(changefreq, 0) + 1
+
+    @property
+    def average_path_depth(self) -> float:
+        return self.path_depth_total / self.total_urls if self.total_urls else 0
+
 
 class SitemapService:
     """Service for analyzing website sitemaps with AI insights"""
@@ -57,18 +150,20 @@ class SitemapService:
             if not sitemap_data:
                 raise Exception("Failed to fetch sitemap data")
             
+            aggregates = sitemap_data["aggregates"]
+            
             # Analyze sitemap structure
-            structure_analysis = self._analyze_sitemap_structure(sitemap_data)
+            structure_analysis = self._analyze_sitemap_structure(aggregates)
             
             # Analyze content trends if requested
             content_trends = {}
-            if analyze_content_trends and sitemap_data.get("urls"):
-                content_trends = self._analyze_content_trends(sitemap_data["urls"])
+            if analyze_content_trends and aggregates.total_urls:
+                content_trends = self._analyze_content_trends(aggregates)
             
             # Analyze publishing patterns if requested  
             publishing_patterns = {}
-            if analyze_publishing_patterns and sitemap_data.get("urls"):
-                publishing_patterns = self._analyze_publishing_patterns(sitemap_data["urls"])
+            if analyze_publishing_patterns and aggregates.total_urls:
+                publishing_patterns = self._analyze_publishing_patterns(aggregates)
             
             # Generate AI insights
             ai_insights = await self._generate_ai_insights(
@@ -80,7 +175,9 @@ class SitemapService:
             result = {
                 "sitemap_url": sitemap_url,
                 "analysis_date": datetime.utcnow().isoformat(),
-                "total_urls": len(sitemap_data.get("urls", [])),
+                "total_urls": aggregates.total_urls,
+                "child_sitemaps": len(sitemap_data["sitemaps"]),
+                "failed_sitemaps": sitemap_data["failed_sitemaps"],
                 "structure_analysis": structure_analysis,
                 "content_trends": content_trends,
                 "publishing_patterns": publishing_patterns,
@@ -124,184 +221,185 @@ class SitemapService:
             raise
     
     async def _fetch_sitemap_data(self, sitemap_url: str) -> Dict[str, Any]:
-        """Fetch and parse sitemap data"""
+        """
+        Stream a sitemap (or sitemap index) into running aggregates
+        
+        Child sitemaps of an index are fetched concurrently through the shared
+        HTTP client registry; gzip-compressed sitemaps (.xml.gz) are decompressed
+        on the fly.
+        """
+        aggregates = SitemapAggregates()
+        sitemaps: List[str] = []
+        failed_sitemaps: List[str] = []
+        seen: Set[str] = {sitemap_url}
+        semaphore = asyncio.Semaphore(SITEMAP_MAX_CONCURRENT_FETCHES)
+        
+        async def ingest_children(child_urls: List[str], depth: int):
+            new_urls = []
+            for child_url in child_urls:
+                if child_url in seen:
+                    continue
+                if len(sitemaps) >= SITEMAP_MAX_CHILD_SITEMAPS:
+                    logger.warning(f"Sitemap child limit reached ({SITEMAP_MAX_CHILD_SITEMAPS}), skipping remaining sitemaps")
+                    break
+                seen.add(child_url)
+                sitemaps.append(child_url)
+                new_urls.append(child_url)
+            await asyncio.gather(*(ingest_child(child_url, depth) for child_url in new_urls))
+        
+        async def ingest_child(child_url: str, depth: int):
+            try:
+                async with semaphore:
+                    nested = await self._stream_sitemap(child_url, aggregates)
+            except Exception as e:
+                logger.warning(f"Failed to fetch nested sitemap {child_url}: {e}")
+                failed_sitemaps.append(child_url)
+                return
+            if nested and depth < SITEMAP_MAX_INDEX_DEPTH:
+                await ingest_children(nested, depth + 1)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(sitemap_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to fetch sitemap: HTTP {response.status}")
-                    
-                    content = await response.text()
-                    
-                    # Parse XML
-                    root = ET.fromstring(content)
-                    
-                    # Handle different sitemap formats
-                    urls = []
-                    sitemaps = []
-                    
-                    # Check if it's a sitemap index
-                    if root.tag.endswith('sitemapindex'):
-                        # Extract nested sitemaps
-                        for sitemap in root:
-                            if sitemap.tag.endswith('sitemap'):
-                                loc = sitemap.find('.//{http://www.sitemaps.org/schemas/sitemap/0.9}loc')
-                                if loc is not None:
-                                    sitemaps.append(loc.text)
-                        
-                        # Fetch and parse nested sitemaps
-                        for nested_url in sitemaps[:10]:  # Limit to 10 sitemaps
-                            try:
-                                nested_data = await self._fetch_sitemap_data(nested_url)
-                                urls.extend(nested_data.get("urls", []))
-                            except Exception as e:
-                                logger.warning(f"Failed to fetch nested sitemap {nested_url}: {e}")
-                    
-                    else:
-                        # Regular sitemap with URLs
-                        for url_element in root:
-                            if url_element.tag.endswith('url'):
-                                url_data = {}
-                                
-                                for child in url_element:
-                                    tag_name = child.tag.split('}')[-1]  # Remove namespace
-                                    url_data[tag_name] = child.text
-                                
-                                if 'loc' in url_data:
-                                    urls.append(url_data)
-                    
-                    return {
-                        "urls": urls,
-                        "sitemaps": sitemaps,
-                        "total_urls": len(urls)
-                    }
-                    
+            async with semaphore:
+                child_urls = await self._stream_sitemap(sitemap_url, aggregates)
         except ET.ParseError as e:
             raise Exception(f"Failed to parse sitemap XML: {e}")
         except Exception as e:
             logger.error(f"Error fetching sitemap data: {e}")
             raise
-    
-    def _analyze_sitemap_structure(self, sitemap_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze the structure of the sitemap"""
         
-        urls = sitemap_data.get("urls", [])
+        if child_urls:
+            await ingest_children(child_urls, 1)
         
-        if not urls:
-            return {"error": "No URLs found in sitemap"}
-        
-        # Analyze URL patterns
-        url_patterns = {}
-        file_types = {}
-        path_levels = []
+        return {
+            "aggregates": aggregates,
+            "sitemaps": sitemaps,
+            "failed_sitemaps": failed_sitemaps,
+            "total_urls": aggregates.total_urls
+        }
+    
+    async def _stream_sitemap(
+        self,
+        sitemap_url: str,
+        aggregates: SitemapAggregates
+    ) -> List[str]:
+        """
+        Incrementally parse one sitemap, folding <url> records into the aggregates
         
-        for url_info in urls:
-            url = url_info.get("loc", "")
-            parsed_url = urlparse(url)
+        Returns:
+            Child sitemap URLs if the document is a sitemap index, otherwise []
+        """
+        registry = get_http_client_registry()
+        async with registry.stream('GET', sitemap_url, timeout=60, max_bytes=SITEMAP_MAX_BYTES) as response:
+            if response.status != 200:
+                raise Exception(f"Failed to fetch sitemap: HTTP {response.status}")
+            
+            parser = ET.XMLPullParser(events=('start', 'end'))
+            decompressor = None
+            root = None
+            child_sitemaps: List[str] = []
+            first_chunk = True
+            parsed_bytes = 0
             
-            # Analyze path patterns
-            path_parts = parsed_url.path.strip('/').split('/')
-            path_levels.append(len(path_parts))
+            def drain():
+                nonlocal root
+                for event, element in parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = element
+                        continue
+                    name = _local_name(element.tag)
+                    if name == 'url':
+                        url_data = {_local_name(child.tag): child.text for child in element}
+                        if url_data.get('loc'):
+                            aggregates.add(url_data)
+                        # Drop processed records so memory stays flat
+                        root.clear()
+                    elif name == 'sitemap':
+                        for child in element:
+                            if _local_name(child.tag) == 'loc' and child.text:
+                                child_sitemaps.append(child.text.strip())
+                        root.clear()
+            
+            def feed(data: bytes):
+                nonlocal parsed_bytes
+                parsed_bytes += len(data)
+                if parsed_bytes > SITEMAP_MAX_BYTES:
+                    raise ResponseTooLargeError(f"Sitemap {sitemap_url} exceeded {SITEMAP_MAX_BYTES} bytes uncompressed")
+                parser.feed(data)
+                drain()
+            
+            async for chunk in registry.iter_body(response, max_bytes=SITEMAP_MAX_BYTES):
+                if first_chunk:
+                    first_chunk = False
+                    if chunk[:2] == GZIP_MAGIC:
+                        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if decompressor is None:
+                    feed(chunk)
+                    continue
+                # Inflate in bounded steps so a gzip bomb is stopped at the cap
+                while chunk:
+                    feed(decompressor.decompress(chunk, SITEMAP_INFLATE_CHUNK_SIZE))
+                    chunk = decompressor.unconsumed_tail
             
-            # Categorize by first path segment
-            if len(path_parts) > 0 and path_parts[0]:
-                category = path_parts[0]
-                url_patterns[category] = url_patterns.get(category, 0) + 1
+            if decompressor is not None:
+                feed(decompressor.flush())
+            parser.close()
+            drain()
             
-            # Analyze file types
-            if '.' in parsed_url.path:
-                extension = parsed_url.path.split('.')[-1].lower()
-                file_types[extension] = file_types.get(extension, 0) + 1
+            return child_sitemaps
+    
+    def _analyze_sitemap_structure(self, aggregates: SitemapAggregates) -> Dict[str, Any]:
+        """Analyze the structure of the sitemap"""
+        
+        if not aggregates.total_urls:
+            return {"error": "No URLs found in sitemap"}
         
-        # Calculate statistics
-        avg_path_depth = sum(path_levels) / len(path_levels) if path_levels else 0
+        url_patterns = aggregates.url_patterns
+        avg_path_depth = aggregates.average_path_depth
         
         return {
-            "total_urls": len(urls),
+            "total_urls": aggregates.total_urls,
             "url_patterns": dict(sorted(url_patterns.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "file_types": dict(sorted(file_types.items(), key=lambda x: x[1], reverse=True)),
+            "file_types": dict(sorted(aggregates.file_types.items(), key=lambda x: x[1], reverse=True)),
             "average_path_depth": round(avg_path_depth, 2),
-            "max_path_depth": max(path_levels) if path_levels else 0,
+            "max_path_depth": aggregates.max_path_depth,
             "structure_quality": self._assess_structure_quality(url_patterns, avg_path_depth)
         }
     
-    def _analyze_content_trends(self, urls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_content_trends(self, aggregates: SitemapAggregates) -> Dict[str, Any]:
         """Analyze content publishing trends"""
         
-        # Extract dates from lastmod
-        dates = []
-        for url_info in urls:
-            lastmod = url_info.get("lastmod")
-            if lastmod:
-                try:
-                    # Parse various date formats
-                    date_str = lastmod.split('T')[0]  # Remove time component
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-                    dates.append(date_obj)
-                except ValueError:
-                    continue
-        
-        if not dates:
+        if not aggregates.total_dated_urls:
             return {"message": "No valid dates found for trend analysis"}
         
-        # Analyze trends
-        dates.sort()
-        
-        # Monthly distribution
-        monthly_counts = {}
-        yearly_counts = {}
-        
-        for date in dates:
-            month_key = date.strftime("%Y-%m")
-            year_key = date.strftime("%Y")
-            
-            monthly_counts[month_key] = monthly_counts.get(month_key, 0) + 1
-            yearly_counts[year_key] = yearly_counts.get(year_key, 0) + 1
+        monthly_counts = dict(sorted(aggregates.monthly_counts.items()))
+        yearly_counts = dict(sorted(aggregates.yearly_counts.items()))
         
         # Calculate publishing velocity
-        date_range = (dates[-1] - dates[0]).days
-        publishing_velocity = len(dates) / max(date_range, 1) if date_range > 0 else 0
+        date_range = (aggregates.latest_date - aggregates.earliest_date).days
+        publishing_velocity = aggregates.total_dated_urls / max(date_range, 1) if date_range > 0 else 0
         
         return {
             "date_range": {
-                "earliest": dates[0].isoformat(),
-                "latest": dates[-1].isoformat(),
+                "earliest": aggregates.earliest_date.isoformat(),
+                "latest": aggregates.latest_date.isoformat(),
                 "span_days": date_range
             },
-            "monthly_distribution": dict(sorted(monthly_counts.items())[-12:]),  # Last 12 months
+            "monthly_distribution": dict(list(monthly_counts.items())[-12:]),  # Last 12 months
             "yearly_distribution": yearly_counts,
             "publishing_velocity": round(publishing_velocity, 3),
-            "total_dated_urls": len(dates),
+            "total_dated_urls": aggregates.total_dated_urls,
             "trends": self._identify_publishing_trends(monthly_counts)
         }
     
-    def _analyze_publishing_patterns(self, urls: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_publishing_patterns(self, aggregates: SitemapAggregates) -> Dict[str, Any]:
         """Analyze publishing patterns and frequency"""
         
-        # Extract and analyze priority and changefreq
-        priority_distribution = {}
-        changefreq_distribution = {}
-        
-        for url_info in urls:
-            priority = url_info.get("priority")
-            if priority:
-                try:
-                    priority_float = float(priority)
-                    priority_range = f"{int(priority_float * 10)}/10"
-                    priority_distribution[priority_range] = priority_distribution.get(priority_range, 0) + 1
-                except ValueError:
-                    pass
-            
-            changefreq = url_info.get("changefreq")
-            if changefreq:
-                changefreq_distribution[changefreq] = changefreq_distribution.get(changefreq, 0) + 1
-        
         return {
-            "priority_distribution": priority_distribution,
-            "changefreq_distribution": changefreq_distribution,
+            "priority_distribution": aggregates.priority_distribution,
+            "changefreq_distribution": aggregates.changefreq_distribution,
             "optimization_opportunities": self._identify_optimization_opportunities(
-                priority_distribution, changefreq_distribution, len(urls)
+                aggregates.priority_distribution, aggregates.changefreq_distribution, aggregates.total_urls
             )
         }
     
@@ -321,7 +419,7 @@ class SitemapService:
             )
             
             # Generate AI insights
-            ai_response = llm_text_gen(
+            ai_response = await get_llm_gateway().generate(
                 prompt=prompt,
                 system_prompt=self._get_system_prompt()
             )
@@ -214,6 +214,41 @@ def setup_environment():
     
     print("✅ Environment setup complete")
 
+def import_report(top=15):
+    """Print the modules that make importing app.py slow (python -X importtime)."""
+    print("⏱️  Measuring import time of app.py...")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print("❌ Importing app.py failed:")
+        print(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error")
+        return False
+
+    # Lines look like "import time:  self [us] | cumulative | <indent>module"
+    total_us = 0
+    direct_imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        cumulative_us = int(parts[1])
+        module = parts[2].rstrip()
+        depth = (len(module) - len(module.lstrip())) // 2
+        if module.strip() == "app" and depth == 0:
+            total_us = cumulative_us
+        elif depth == 1:
+            direct_imports.append((cumulative_us, module.strip()))
+
+    print(f"   Total: {total_us / 1e6:.2f}s")
+    for cumulative_us, module in sorted(direct_imports, reverse=True)[:top]:
+        print(f"   {cumulative_us / 1e6:7.2f}s  {module}")
+    print("   Routers load on their first request; set ALWRITY_LAZY_ROUTERS=false to import them here.")
+    return True
+
 def start_backend(enable_reload=False):
     """Start the backend server."""
     print("🚀 Starting ALwrity Backend...")
@@ -254,6 +289,8 @@ def start_backend(enable_reload=False):
         print("   Production mode (default): python start_alwrity_backend.py")
         print("   Development mode: python start_alwrity_backend.py --dev")
         print("   With auto-reload: python start_alwrity_backend.py --reload")
+        print("   Load routers after startup: python start_alwrity_backend.py --warm-up")
+        print("   Import time report: python start_alwrity_backend.py --import-report")
         print("=" * 60)
         
         uvicorn.run(
@@ -309,6 +346,8 @@ def main():
     parser = argparse.ArgumentParser(description="ALwrity Backend Server")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
     parser.add_argument("--dev", action="store_true", help="Enable development mode (auto-reload)")
+    parser.add_argument("--warm-up", action="store_true", help="Load all routers in the background after startup")
+    parser.add_argument("--import-report", action="store_true", help="Show what makes importing app.py slow, then exit")
     args = parser.parse_args()
     
     print("🎯 ALwrity Backend Server")
@@ -321,6 +360,12 @@ def main():
         print("   Expected files:", [f for f in os.listdir('.') if f.endswith('.py')])
         return False
     
+    if args.import_report:
+        return import_report()
+    
+    if args.warm_up:
+        os.environ["ALWRITY_WARM_UP_ROUTERS"] = "true"
+    
     # Check and install dependencies
     if not check_dependencies():
         print("❌ Failed to install dependencies")
@@ -0,0 +1,77 @@
+"""
+Test script for the AI response cache.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ai_response_cache import AIResponseCache, SQLiteCacheBackend, make_cache_key
+
+
+def test_cache_key_is_content_addressed():
+    """Identical requests share a key; any field change produces a new one."""
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}}
+    key = make_cache_key("gemini", "gemini-2.5-flash", "prompt", None, schema, 0.3)
+    assert key == make_cache_key("gemini", "gemini-2.5-flash", "prompt", None, dict(schema), 0.3)
+    assert key != make_cache_key("gemini", "gemini-2.5-flash", "prompt", None, schema, 0.7)
+    assert key != make_cache_key("gemini", "gemini-2.5-flash", "other prompt", None, schema, 0.3)
+
+
+def test_memory_tier_lru_and_counters():
+    """The memory tier evicts least recently used entries and counts hits/misses."""
+    cache = AIResponseCache(max_memory_entries=2)
+    cache.set("a", {"v": 1}, 60)
+    cache.set("b", {"v": 2}, 60)
+    assert cache.get("a") == {"v": 1}
+    cache.set("c", {"v": 3}, 60)  # evicts "b"
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"v": 3}
+
+    stats = cache.get_stats()
+    assert stats['hits'] == 2
+    assert stats['misses'] == 1
+    assert stats['evictions'] == 1
+
+
+def test_persistent_tier_survives_new_memory_tier():
+    """A fresh process (new memory tier) is served from the SQLite tier."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "cache.db")
+        AIResponseCache(backend=SQLiteCacheBackend(path)).set("k", {"v": 1}, 60)
+
+        cache = AIResponseCache(backend=SQLiteCacheBackend(path))
+        assert cache.get("k") == {"v": 1}
+        assert cache.get_stats()['persistent_hits'] == 1
+
+
+def test_zero_ttl_is_not_cached():
+    cache = AIResponseCache()
+    cache.set("k", {"v": 1}, 0)
+    assert cache.get("k") is None
+
+
+def test_memory_hits_are_isolated_from_caller_mutation():
+    """Mutating a stored or returned response does not change the cached entry."""
+    cache = AIResponseCache()
+    response = {"items": [1, 2]}
+    cache.set("k", response, 60)
+    response["items"].append(3)
+
+    hit = cache.get("k")
+    assert hit == {"items": [1, 2]}
+    hit["items"].clear()
+    assert cache.get("k") == {"items": [1, 2]}
+
+
+def test_cache_policy_covers_gap_analysis_and_strategic_intelligence():
+    """Gap analysis and strategic intelligence are cached; refresh flows pass force_refresh."""
+    from services.ai_service_manager import AIServiceManager, AIServiceType
+
+    manager = AIServiceManager.__new__(AIServiceManager)
+    manager.config = AIServiceManager._load_ai_configuration(manager)
+    assert manager._get_cache_ttl_seconds(AIServiceType.STRATEGIC_INTELLIGENCE) == 3600
+    assert manager._get_cache_ttl_seconds(AIServiceType.CONTENT_GAP_ANALYSIS) == 3600
+    assert manager._get_cache_ttl_seconds(AIServiceType.KEYWORD_ANALYSIS) == 3600
@@ -0,0 +1,69 @@
+"""
+Test script for field-level repair in structured autofill.
+"""
+
+import sys
+import os
+import asyncio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.content_planning.services.content_strategy.autofill.ai_structured_autofill import (
+    AIStructuredAutofillService, CORE_FIELDS
+)
+
+_CONTEXT = {
+    "website_analysis": {
+        "website_url": "https://example.com",
+        "writing_style": {"tone": "professional"},
+        "target_audience": {"demographics": ["developers"], "industry_focus": "software", "expertise_level": "advanced"},
+        "content_type": {"primary_type": "blog"},
+    },
+    "research_preferences": {"research_depth": "Comprehensive"},
+}
+
+
+class _StubAI:
+    """Returns every field except a few on the full call, then answers narrowed requests."""
+
+    def __init__(self, dropped):
+        self.dropped = set(dropped)
+        self.calls = []
+
+    async def execute_structured_json_call(self, service_type, prompt, schema, force_refresh=False):
+        requested = list(schema["properties"])
+        self.calls.append(requested)
+        await asyncio.sleep(0.01)
+        values = {}
+        for key in requested:
+            if len(requested) == len(CORE_FIELDS) and key in self.dropped:
+                values[key] = "" if key != "team_size" else "a few"
+            elif schema["properties"][key]["type"] == "NUMBER":
+                values[key] = 3
+            elif schema["properties"][key]["type"] == "BOOLEAN":
+                values[key] = True
+            else:
+                values[key] = f"value for {key}"
+        return {"success": True, "data": values}
+
+
+def test_only_missing_fields_are_requested_per_group():
+    dropped = ["team_size", "market_gaps", "content_mix", "emerging_trends"]
+    service = AIStructuredAutofillService.__new__(AIStructuredAutofillService)
+    service.ai = _StubAI(dropped)
+    service.max_retries = 2
+
+    result = asyncio.run(service.generate_autofill_fields(1, _CONTEXT))
+
+    full_call, *repair_calls = service.ai.calls
+    assert len(full_call) == len(CORE_FIELDS)
+    # One narrowed request per affected group, containing only the missing fields
+    assert sorted(map(sorted, repair_calls)) == sorted([
+        ["team_size"], ["emerging_trends", "market_gaps"], ["content_mix"]
+    ])
+
+    meta = result["meta"]
+    assert meta["missing_fields"] == []
+    assert sorted(meta["repaired_fields"]) == sorted(dropped)
+    assert meta["repair_rounds"] == 1
+    assert meta["attempts"] == 2
+    assert result["fields"]["team_size"]["value"] == 3
@@ -0,0 +1,157 @@
+"""
+Test script for the calendar generation session store.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.content_planning.services.calendar_session_store import (
+    CalendarSessionStore, MemorySessionBackend, SQLiteSessionBackend
+)
+
+
+def test_sqlite_sessions_are_shared_between_store_instances(tmp_path):
+    """Two stores over one SQLite file (e.g. two workers) see the same sessions."""
+    path = str(tmp_path / "sessions.db")
+    writer = CalendarSessionStore(SQLiteSessionBackend(path))
+    reader = CalendarSessionStore(SQLiteSessionBackend(path))
+
+    writer.create("s1", {"user_id": 7, "status": "initializing"})
+    writer.update("s1", {"status": "running"})
+
+    session = reader.get("s1")
+    assert session["status"] == "running"
+    assert session["version"] == 2
+    assert [s["session_id"] for s in reader.list(user_id=7, statuses=("running",))] == ["s1"]
+    assert reader.list(user_id=8) == []
+
+    assert reader.delete("s1")
+    assert writer.get("s1") is None
+
+
+def test_watch_pushes_updates_until_terminal_status():
+    store = CalendarSessionStore(MemorySessionBackend(), poll_interval=5.0)
+    store.create("s1", {"user_id": 1, "status": "running"})
+
+    async def run():
+        seen = []
+
+        async def consume():
+            async for session in store.watch("s1", heartbeat_seconds=5.0):
+                seen.append(session["status"] if session else None)
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.sleep(0.01)
+        store.update("s1", {"progress": {"current_step": 3}})
+        await asyncio.sleep(0.01)
+        store.update("s1", {"status": "completed"})
+        # Local updates wake the watcher without waiting for the poll interval
+        await asyncio.wait_for(consumer, timeout=1.0)
+        return seen
+
+    assert asyncio.run(run()) == ["running", "running", "completed"]
+
+
+def test_sqlite_updates_from_two_workers_do_not_lose_changes(tmp_path):
+    """Concurrent read-merge-writes through separate connections keep every change."""
+    path = str(tmp_path / "sessions.db")
+    worker_a = CalendarSessionStore(SQLiteSessionBackend(path))
+    worker_b = CalendarSessionStore(SQLiteSessionBackend(path))
+    worker_a.create("s1", {"user_id": 1, "status": "running"})
+
+    def write(store, prefix):
+        for i in range(25):
+            store.update("s1", {f"{prefix}{i}": i})
+
+    threads = [threading.Thread(target=write, args=(worker_a, "a")), threading.Thread(target=write, args=(worker_b, "b"))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    session = worker_b.get("s1")
+    assert session["version"] == 51
+    assert all(f"a{i}" in session and f"b{i}" in session for i in range(25))
+
+
+def test_progress_update_does_not_undo_cancel_from_another_worker(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    owner = CalendarSessionStore(SQLiteSessionBackend(path))
+    other = CalendarSessionStore(SQLiteSessionBackend(path))
+    owner.create("s1", {"user_id": 1, "status": "running"})
+
+    other.update("s1", {"status": "cancelled"})
+    owner.update("s1", {"progress": {"current_step": 4}}, heartbeat=True)
+
+    session = other.get("s1")
+    assert session["status"] == "cancelled"
+    assert session["progress"] == {"current_step": 4}
+    assert session["version"] == 3
+
+
+def test_orphaned_sessions_are_failed_instead_of_reported_active(tmp_path):
+    """A running session whose owner stopped heartbeating no longer blocks new runs."""
+    path = str(tmp_path / "sessions.db")
+    restarted = CalendarSessionStore(SQLiteSessionBackend(path), stale_after_seconds=60)
+    restarted.create("orphan", {"user_id": 1, "status": "running"})
+    restarted.create("live", {"user_id": 2, "status": "running"})
+    restarted.backend.update("orphan", lambda s: {**s, "heartbeat_at": s["heartbeat_at"] - 120})
+
+    assert [s["session_id"] for s in restarted.list_active()] == ["live"]
+    orphan = restarted.get("orphan")
+    assert orphan["status"] == "failed"
+    assert orphan["version"] == 2
+    # Heartbeats leave terminal sessions alone and do not bump the version
+    assert restarted.heartbeat("orphan")["status"] == "failed"
+    assert restarted.heartbeat("live")["version"] == 1
+
+
+def test_watch_ends_when_session_is_orphaned():
+    store = CalendarSessionStore(MemorySessionBackend(), poll_interval=0.01, stale_after_seconds=0.05)
+    store.create("s1", {"user_id": 1, "status": "running"})
+
+    async def run():
+        statuses = []
+        async for session in store.watch("s1", heartbeat_seconds=0.02):
+            statuses.append(session["status"] if session else None)
+        return statuses
+
+    statuses = asyncio.run(asyncio.wait_for(run(), timeout=2.0))
+    assert statuses[0] == "running"
+    assert statuses[-1] == "failed"
+
+
+def test_generation_stores_latest_progress_and_surfaces_errors():
+    """Orchestrator progress reaches the store off the event loop; failures keep their error message."""
+    from api.content_planning.services.calendar_generation_service import CalendarGenerationService
+
+    class FakeOrchestrator:
+        def __init__(self, fail):
+            self.fail = fail
+
+        async def generate_calendar(self, progress_callback, **kwargs):
+            for step in (1, 2, 3):
+                progress_callback({"current_step": step, "progress_percentage": step * 10, "step_details": {}})
+            await asyncio.sleep(0)
+            if self.fail:
+                raise RuntimeError("step 4 exploded")
+            return {"calendar": "ok"}
+
+    service = CalendarGenerationService.__new__(CalendarGenerationService)
+    service.session_store = CalendarSessionStore(MemorySessionBackend())
+
+    for session_id, fail in (("ok", False), ("broken", True)):
+        service.orchestrator = FakeOrchestrator(fail)
+        service.session_store.create(session_id, {"user_id": 1, "status": "initializing"})
+        asyncio.run(service.start_orchestrator_generation(session_id, {"user_id": 1}))
+
+    done = service.session_store.get("ok")
+    assert done["status"] == "completed"
+    assert done["progress"]["current_step"] == 3
+
+    failed = CalendarGenerationService.format_progress(service.session_store.get("broken"))
+    assert failed["status"] == "error"
+    assert failed["error"] == "step 4 exploded"
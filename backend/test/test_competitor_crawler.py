@@ -0,0 +1,114 @@
+"""
+Test script for the competitor crawler.
+"""
+
+import sys
+import os
+import json
+import asyncio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.content_gap_analyzer.competitor_crawler import (
+    CompetitorCrawler, CompetitorCrawlAggregates
+)
+
+
+class _FakeStdout:
+    def __init__(self, lines):
+        self._lines = list(lines)
+
+    async def readline(self):
+        return self._lines.pop(0) if self._lines else b""
+
+
+class _FakeProcess:
+    """Stands in for an asyncio subprocess whose stdout is a JSON-lines feed."""
+
+    def __init__(self, lines, returncode=0):
+        self.stdout = _FakeStdout(lines)
+        self._exit_code = returncode
+        self.returncode = None
+
+    async def wait(self):
+        self.returncode = self._exit_code
+        return self.returncode
+
+
+def _record(url, **fields):
+    return (json.dumps({"url": url, **fields}) + "\n").encode()
+
+
+def test_consume_folds_records_into_aggregates():
+    crawler = CompetitorCrawler(page_limit=10)
+    aggregates = CompetitorCrawlAggregates("example.com")
+    process = _FakeProcess([
+        _record("https://example.com/blog/a", status=200, size=1000, title="Hello", meta_desc="Desc"),
+        b"not json\n",
+        _record("https://example.com/product/b", status=404, size=3000),
+    ])
+
+    asyncio.run(crawler._consume(process, aggregates))
+
+    result = aggregates.to_crawl_result()
+    assert result["total_pages"] == 2
+    assert result["status_codes"] == {200: 1, 404: 1}
+    assert result["page_types"]["blog_posts"] == 1
+    assert result["page_types"]["product_pages"] == 1
+    assert result["content_length_stats"] == {"mean": 2000, "median": 2000}
+    assert aggregates.to_content_structure()["avg_title_length"] == 5
+    assert not aggregates.truncated
+
+
+def test_consume_stops_at_page_limit_and_reports_failed_exits():
+    crawler = CompetitorCrawler(page_limit=2)
+    aggregates = CompetitorCrawlAggregates("example.com")
+    process = _FakeProcess([_record(f"https://example.com/{i}") for i in range(5)])
+
+    asyncio.run(crawler._consume(process, aggregates))
+    assert aggregates.total_pages == 2
+    assert aggregates.truncated
+
+    failed = CompetitorCrawlAggregates("example.com")
+    try:
+        asyncio.run(crawler._consume(_FakeProcess([], returncode=1), failed))
+    except RuntimeError as e:
+        assert "status 1" in str(e)
+    else:
+        raise AssertionError("a crawler exiting non-zero with no pages should fail")
+
+
+def test_build_command_streams_feed_to_stdout_with_budgets():
+    crawler = CompetitorCrawler(depth_limit=3, page_limit=25, per_domain_concurrency=2, timeout_seconds=60)
+    command = crawler._build_command("https://example.com:8080/start", "example.com:8080")
+
+    assert command[:5] == [sys.executable, "-u", "-m", "scrapy", "runspider"]
+    assert command[command.index("-o") + 1] == "stdout::jsonlines"
+    spider_args = [command[i + 1] for i, part in enumerate(command) if part == "-a"]
+    settings = [command[i + 1] for i, part in enumerate(command) if part == "-s"]
+    assert "url_list=https://example.com:8080/start" in spider_args
+    assert "allowed_domains=example.com" in spider_args
+    assert {"DEPTH_LIMIT=3", "CLOSESPIDER_PAGECOUNT=25", "CLOSESPIDER_TIMEOUT=60",
+            "CONCURRENT_REQUESTS_PER_DOMAIN=2"} <= set(settings)
+
+
+def test_reader_waits_past_scrapy_timeout_for_the_flushed_feed(monkeypatch):
+    """Records flushed by Scrapy's graceful close after CLOSESPIDER_TIMEOUT are kept."""
+
+    class _LateStdout(_FakeStdout):
+        async def readline(self):
+            if self._lines:
+                await asyncio.sleep(0.3)  # feed arrives only once the spider closes
+            return await super().readline()
+
+    async def fake_exec(*args, **kwargs):
+        process = _FakeProcess([])
+        process.stdout = _LateStdout([_record("https://example.com/blog/a", status=200)])
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_exec)
+    crawler = CompetitorCrawler(timeout_seconds=0.1, shutdown_grace_seconds=1)
+
+    aggregates = asyncio.run(crawler.crawl("https://example.com"))
+    assert aggregates.total_pages == 1
+    assert not aggregates.truncated
+    assert aggregates.errors == []
@@ -0,0 +1,47 @@
+"""
+Test script for the concurrent comprehensive user data gather.
+"""
+
+import sys
+import os
+import asyncio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.calendar_generation_datasource_framework.data_processing.comprehensive_user_data import (
+    ComprehensiveUserDataProcessor
+)
+
+
+def test_first_failed_source_cancels_the_others():
+    """A failing required source stops the gather before slower (AI-backed) sources finish."""
+    processor = ComprehensiveUserDataProcessor.__new__(ComprehensiveUserDataProcessor)
+    finished = []
+
+    async def slow_source(*args):
+        await asyncio.sleep(1)
+        finished.append(args)
+        return {}
+
+    async def failing_source(*args):
+        await asyncio.sleep(0.01)
+        raise ValueError("no active strategy")
+
+    processor._get_onboarding_data = slow_source
+    processor._get_ai_analysis_results = slow_source
+    processor._get_gap_analysis_data = slow_source
+    processor._get_strategy_data = failing_source
+    processor._get_recommendations_data = slow_source
+    processor._get_performance_data = slow_source
+
+    async def run():
+        try:
+            await asyncio.wait_for(processor.get_comprehensive_user_data(1, None), timeout=0.5)
+        except asyncio.TimeoutError:
+            raise AssertionError("gather waited for the remaining sources")
+        except Exception as e:
+            return str(e)
+        raise AssertionError("a failed source should fail the gather")
+
+    error = asyncio.run(run())
+    assert "strategy_data: no active strategy" in error
+    assert finished == []
@@ -0,0 +1,57 @@
+"""
+Test script for ETag / Last-Modified handling on polled endpoints.
+"""
+
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from api.content_planning.utils.conditional_responses import ResourceValidators
+
+
+def _client(state):
+    app = FastAPI()
+
+    @app.get("/resource")
+    async def resource(request: Request, response: Response):
+        validators = ResourceValidators.for_version(
+            "resource", state["version"], last_modified=state["updated_at"]
+        )
+        if validators.is_not_modified(request):
+            return validators.not_modified_response()
+        state["loads"] += 1
+        validators.apply(response)
+        return {"version": state["version"]}
+
+    return TestClient(app)
+
+
+def test_unchanged_resource_revalidates_to_304():
+    state = {"version": 1, "updated_at": datetime(2025, 1, 2, 3, 4, 5, 600000), "loads": 0}
+    client = _client(state)
+
+    first = client.get("/resource")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert first.headers["last-modified"] == "Thu, 02 Jan 2025 03:04:05 GMT"
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    cached = client.get("/resource", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert client.get("/resource", headers={"If-Modified-Since": first.headers["last-modified"]}).status_code == 304
+    # A strong copy of a weak tag still matches (weak comparison)
+    assert client.get("/resource", headers={"If-None-Match": f'"x", {etag[2:]}'}).status_code == 304
+    assert state["loads"] == 1
+
+    state["version"] = 2
+    changed = client.get("/resource", headers={"If-None-Match": etag, "If-Modified-Since": first.headers["last-modified"]})
+    # If-None-Match wins over an unchanged Last-Modified
+    assert changed.status_code == 200
+    assert changed.json() == {"version": 2}
+    assert changed.headers["etag"] != etag
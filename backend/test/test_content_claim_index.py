@@ -0,0 +1,57 @@
+"""
+Test script for the single-pass citation/claim index used by content quality scoring.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.quality.content_analyzer import ContentClaimIndex, CLAIM_SUPPORT_WINDOW
+
+
+def _claim_texts(content):
+    index = ContentClaimIndex(content)
+    return [content[start:end] for start, end in index.claims]
+
+
+def test_claims_are_counted_once_per_position():
+    """Earlier alternatives win, so overlapping indicators are one claim."""
+    content = "In 2024, 50 companies spent $2025 and 30% more on AI tools [1] (Source 2)."
+
+    assert _claim_texts(content) == ['2024', '50 companies', '$2025', '30%', 'AI', 'tools']
+    assert ContentClaimIndex(content).citation_count == 2
+
+
+def test_citation_count_covers_every_format_without_double_counting():
+    content = (
+        'Growth <sup class="liw-cite" data-id="1">[1]</sup> then [2], [Source 3], (Source 4), '
+        '(5), Ref. 6 and Reference 7.'
+    )
+    index = ContentClaimIndex(content)
+
+    assert index.citation_count == 7
+    assert index.claims == [(0, 6)]
+
+
+def test_is_supported_window_edges():
+    window = CLAIM_SUPPORT_WINDOW
+    claim = "50%"
+
+    # Citation after the claim: supported while it ends within the window
+    at_edge = ContentClaimIndex(claim + "." * (window - 4) + " [1]")
+    assert at_edge.claims == [(0, 3)]
+    assert at_edge.citation_ends == [3 + window]
+    assert at_edge.is_supported(0, 3)
+    past_edge = ContentClaimIndex(claim + "." * (window - 3) + " [1]")
+    assert not past_edge.is_supported(0, 3)
+
+    # Citation before the claim: supported while it starts within the window
+    before = ContentClaimIndex("[1]" + "." * (window - 3) + claim)
+    assert before.claims == [(window, window + 3)]
+    assert before.is_supported(*before.claims[0])
+    too_far_before = ContentClaimIndex("[1]" + "." * (window - 2) + claim)
+    assert not too_far_before.is_supported(*too_far_before.claims[0])
+
+    # A citation only partly inside the window does not count
+    assert not at_edge.is_supported(0, 3, window=window - 1)
+    assert at_edge.supported_claim_count() == 1
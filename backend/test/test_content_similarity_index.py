@@ -0,0 +1,44 @@
+"""
+Test script for the MinHash/LSH content similarity index.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.calendar_generation_datasource_framework.quality_gates.similarity_index import ContentSimilarityIndex
+
+
+def test_near_duplicates_are_candidates_with_exact_similarity():
+    """Reworded titles are found through LSH and scored with exact Jaccard."""
+    index = ContentSimilarityIndex()
+    index.add("a", "10 ways to grow your SEO traffic in 2025")
+    index.add("b", "Ten ways to grow your SEO traffic in 2025!")
+    index.add("c", "Quarterly product launch checklist")
+
+    assert "b" in index.candidates("a")
+    assert index.max_similarity("a") == 8 / 10
+    assert index.similar("c", threshold=0.5) == []
+
+
+def test_incremental_insert_and_remove():
+    """Pieces can be added as they are produced and removed again."""
+    index = ContentSimilarityIndex()
+    index.add(1, "email marketing automation guide")
+    assert index.max_similarity(1) == 0.0
+
+    index.add(2, "email marketing automation guide for beginners")
+    assert index.max_similarity(1) == 4 / 6
+
+    index.remove(2)
+    assert 2 not in index
+    assert index.candidates(1) == set()
+
+
+def test_near_duplicate_pairs_reports_each_pair_once():
+    index = ContentSimilarityIndex()
+    for key, title in enumerate(["social media calendar tips", "Social media calendar tips!", "podcast growth"]):
+        index.add(key, title)
+
+    pairs = index.near_duplicate_pairs(0.8)
+    assert [(set(pair[:2]), pair[2]) for pair in pairs] == [({0, 1}, 1.0)]
@@ -0,0 +1,173 @@
+"""
+Test script for the shared HTTP client registry.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from services.http_client_registry import HTTPClientRegistry, ResponseTooLargeError
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    flaky_hits = 0
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        if self.path == "/flaky":
+            _Handler.flaky_hits += 1
+            if _Handler.flaky_hits < 3:
+                self._reply(503, b"")
+                return
+        with _Handler.lock:
+            _Handler.active += 1
+            _Handler.max_active = max(_Handler.max_active, _Handler.active)
+        if self.path == "/slow":
+            time.sleep(0.05)
+        with _Handler.lock:
+            _Handler.active -= 1
+        self._reply(200, b"x" * (5000 if self.path == "/big" else 10))
+
+    def _reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    _Handler.flaky_hits = 0
+    _Handler.max_active = 0
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_retries_reuse_and_size_cap(base_url):
+    """Transient 5xx are retried, connections are reused and oversized bodies rejected."""
+    registry = HTTPClientRegistry(retry_backoff=0.01, max_response_bytes=1000)
+
+    async def run():
+        try:
+            response = await registry.request("GET", f"{base_url}/flaky")
+            assert response.status == 200
+            assert response.text() == "x" * 10
+            await registry.request("GET", f"{base_url}/ok")
+            with pytest.raises(ResponseTooLargeError):
+                await registry.request("GET", f"{base_url}/big")
+        finally:
+            await registry.close()
+
+    asyncio.run(run())
+
+    metrics = registry.get_metrics()
+    assert _Handler.flaky_hits == 3
+    assert metrics["pool"]["connections_reused"] > 0
+    host = base_url.split("//", 1)[1]
+    assert metrics["hosts"][host]["retries"] == 2
+
+
+def test_per_host_concurrency_limit(base_url):
+    registry = HTTPClientRegistry(max_per_host=2)
+
+    async def run():
+        try:
+            await asyncio.gather(*(registry.request("GET", f"{base_url}/slow") for _ in range(6)))
+        finally:
+            await registry.close()
+
+    asyncio.run(run())
+    assert _Handler.max_active <= 2
+
+
+def test_stream_applies_retry_and_size_policy(base_url):
+    """Streamed responses are retried while opening and capped while reading."""
+    registry = HTTPClientRegistry(retry_backoff=0.01, max_response_bytes=1000)
+
+    async def run():
+        try:
+            async with registry.stream("GET", f"{base_url}/flaky") as response:
+                assert response.status == 200
+                body = b"".join([chunk async for chunk in registry.iter_body(response)])
+            assert body == b"x" * 10
+
+            # Declared Content-Length over the cap is rejected before reading
+            with pytest.raises(ResponseTooLargeError):
+                async with registry.stream("GET", f"{base_url}/big"):
+                    pass
+            # A caller-supplied cap is enforced on the bytes actually read
+            async with registry.stream("GET", f"{base_url}/big", max_bytes=10_000) as response:
+                with pytest.raises(ResponseTooLargeError):
+                    async for _ in registry.iter_body(response, max_bytes=100):
+                        pass
+        finally:
+            await registry.close()
+
+    asyncio.run(run())
+    assert _Handler.flaky_hits == 3
+
+
+def test_sync_sessions_are_per_thread_over_one_adapter():
+    registry = HTTPClientRegistry()
+    sessions = []
+
+    def grab():
+        sessions.append((registry.get_sync_session(), registry.get_sync_session()))
+
+    threads = [threading.Thread(target=grab) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    (first, first_again), (second, _) = sessions
+    assert first is first_again
+    assert first is not second
+    assert first.get_adapter("https://example.com") is second.get_adapter("https://example.com")
+
+
+def test_sessions_of_closed_loops_are_evicted_and_close_covers_every_loop():
+    registry = HTTPClientRegistry()
+
+    async def open_session():
+        return registry.get_session()
+
+    # Short-lived loops (asyncio.run) leave their session behind until the next one is created
+    first = asyncio.run(open_session())
+    second = asyncio.run(open_session())
+    assert first is not second
+    assert len(registry._loops) == 1
+
+    # A session owned by a loop running in another thread is closed on that loop
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+    other = asyncio.run_coroutine_threadsafe(open_session(), other_loop).result()
+
+    async def close_from_main():
+        current = registry.get_session()
+        await registry.close()
+        return current
+
+    current = asyncio.run(close_from_main())
+    assert current.closed and other.closed
+    assert registry._loops == {}
+
+    other_loop.call_soon_threadsafe(other_loop.stop)
+    thread.join()
+    other_loop.close()
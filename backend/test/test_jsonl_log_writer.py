@@ -0,0 +1,106 @@
+"""
+Test script for the buffered JSONL log writer.
+"""
+
+import sys
+import os
+import gzip
+import json
+import time
+import asyncio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from middleware.logging_middleware import JSONLLogWriter
+
+
+def _read_lines(path):
+    with open(path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_records_are_queued_and_written_per_file_on_stop(tmp_path):
+    writer = JSONLLogWriter(flush_interval=60, rotate_interval=0)
+    calls, metrics = tmp_path / "api_calls" / "successful.jsonl", tmp_path / "performance" / "metrics.jsonl"
+
+    async def log_requests():
+        for i in range(3):
+            writer.write(str(calls), {"operation": "op", "i": i})
+            writer.write(str(metrics), {"operation": "op", "duration_seconds": i})
+        assert not calls.exists()
+        await writer.stop()
+
+    asyncio.run(log_requests())
+
+    assert [record["i"] for record in _read_lines(calls)] == [0, 1, 2]
+    assert len(_read_lines(metrics)) == 3
+    assert writer.get_stats()["written"] == 6
+    assert writer.get_stats()["flushes"] == 1
+
+
+def test_full_files_rotate_into_compressed_segments(tmp_path):
+    writer = JSONLLogWriter(max_bytes=64, rotate_interval=0, compress=True)
+    path = tmp_path / "usage.jsonl"
+
+    for i in range(3):
+        writer.write(str(path), {"tool": "sitemap", "payload": "x" * 40, "i": i})
+        writer.flush_sync()
+
+    segments = sorted(tmp_path.glob("usage.*.jsonl.gz"))
+    assert len(segments) == 2
+    with gzip.open(segments[0], "rt", encoding="utf-8") as file:
+        assert json.loads(file.read())["i"] == 0
+    assert [record["i"] for record in _read_lines(path)] == [2]
+    assert writer.get_stats()["rotations"] == 2
+
+
+def test_full_queue_drops_oldest_records(tmp_path):
+    writer = JSONLLogWriter(max_size=2, rotate_interval=0)
+    path = tmp_path / "crawling.jsonl"
+
+    for i in range(5):
+        writer.write(str(path), {"i": i})
+    writer.flush_sync()
+
+    assert [record["i"] for record in _read_lines(path)] == [3, 4]
+    assert writer.get_stats()["dropped"] == 3
+
+
+def test_stop_waits_for_the_batch_the_flusher_is_writing(tmp_path):
+    """Stopping mid-write keeps the batch the flusher already took from the queue."""
+    writer = JSONLLogWriter(batch_size=2, flush_interval=60, rotate_interval=0)
+    path = tmp_path / "api_calls.jsonl"
+    write_batch = writer._write_batch
+
+    def slow_write_batch(batch):
+        time.sleep(0.1)
+        write_batch(batch)
+
+    writer._write_batch = slow_write_batch
+
+    async def log_requests():
+        for i in range(3):
+            writer.write(str(path), {"i": i})
+        await asyncio.sleep(0.02)  # flusher has taken the first batch and is writing it
+        await writer.stop()
+
+    asyncio.run(log_requests())
+
+    assert [record["i"] for record in _read_lines(path)] == [0, 1, 2]
+    assert writer.get_stats()["queued"] == 0
+
+
+def test_writer_built_outside_a_loop_flushes_on_successive_loops(tmp_path):
+    # Like the module-level writer: constructed at import, then used by separate loops
+    writer = JSONLLogWriter(batch_size=1, flush_interval=60, rotate_interval=0)
+    path = tmp_path / "loops.jsonl"
+
+    async def write_and_flush_concurrently(start):
+        for i in range(start, start + 3):
+            writer.write(str(path), {"i": i})
+        await asyncio.gather(*(writer.flush() for _ in range(3)))
+
+    asyncio.run(write_and_flush_concurrently(0))
+    asyncio.run(write_and_flush_concurrently(3))
+
+    assert sorted(record["i"] for record in _read_lines(path)) == list(range(6))
+    assert writer.get_stats()["written"] == 6
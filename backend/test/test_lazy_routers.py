@@ -0,0 +1,60 @@
+"""
+Test script for lazily mounted API routers.
+"""
+
+import sys
+import os
+import asyncio
+import textwrap
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from services.lazy_routers import LazyRouter, mount_router, warm_up
+
+_ROUTER_MODULE = textwrap.dedent('''
+    from fastapi import APIRouter
+
+    router = APIRouter(prefix="/api/things")
+
+    @router.get("/{thing_id}")
+    async def get_thing(thing_id: str):
+        return {"thing": thing_id}
+''')
+
+
+def _app(tmp_path, monkeypatch, module_name):
+    (tmp_path / f"{module_name}.py").write_text(_ROUTER_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    app = FastAPI()
+    mount_router(app, f"{module_name}:router", ["/api/things"])
+
+    # Registered after the lazy router, so it must keep losing to it
+    @app.get("/api/things/{thing_id}")
+    async def shadowed(thing_id: str):
+        return {"shadowed": thing_id}
+
+    return app
+
+
+def test_router_is_imported_on_first_request(tmp_path, monkeypatch):
+    app = _app(tmp_path, monkeypatch, "lazy_things_first_request")
+    assert "lazy_things_first_request" not in sys.modules
+
+    client = TestClient(app)
+    assert client.get("/api/things/a").json() == {"thing": "a"}
+    assert "lazy_things_first_request" in sys.modules
+    assert not any(isinstance(route, LazyRouter) for route in app.router.routes)
+    assert client.get("/api/things/b").json() == {"thing": "b"}
+    assert client.get("/api/other").status_code == 404
+
+
+def test_openapi_and_warm_up_load_pending_routers(tmp_path, monkeypatch):
+    app = _app(tmp_path, monkeypatch, "lazy_things_openapi")
+    assert "/api/things/{thing_id}" in TestClient(app).get("/openapi.json").json()["paths"]
+
+    app = _app(tmp_path, monkeypatch, "lazy_things_warm_up")
+    timings = asyncio.run(warm_up(app))
+    assert list(timings) == ["lazy_things_warm_up:router"]
+    assert TestClient(app).get("/api/things/c").json() == {"thing": "c"}
@@ -0,0 +1,117 @@
+"""
+Test script for the buffered API request telemetry writer.
+"""
+
+import sys
+import os
+from datetime import datetime
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
+
+import middleware.monitoring_middleware as monitoring_middleware
+from middleware.monitoring_middleware import RequestTelemetryBuffer
+from models.api_monitoring import Base, APIRequest, APIEndpointStats
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    # Only the tables the buffer writes (index names repeat across the other monitoring tables)
+    Base.metadata.create_all(engine, tables=[APIRequest.__table__, APIEndpointStats.__table__])
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(monitoring_middleware, "get_db_session", factory)
+    yield factory
+    engine.dispose()
+
+
+def _record(buffer, path="/api/a", status_code=200, duration=0.1, cache_hit=None):
+    buffer.record(path=path, method="GET", status_code=status_code, duration=duration, cache_hit=cache_hit)
+
+
+def test_full_buffer_drops_oldest_records(session_factory):
+    buffer = RequestTelemetryBuffer(max_size=2, batch_size=10, flush_interval=60)
+
+    for i in range(5):
+        _record(buffer, duration=float(i))
+
+    stats = buffer.get_stats()
+    assert stats["dropped"] == 3
+    assert stats["buffered"] == 2
+
+    buffer.flush_sync()
+    db = session_factory()
+    assert sorted(row.duration for row in db.query(APIRequest).all()) == [3.0, 4.0]
+    db.close()
+
+
+def test_batch_is_inserted_and_endpoint_stats_aggregated(session_factory):
+    buffer = RequestTelemetryBuffer(max_size=100, batch_size=3, flush_interval=60)
+
+    _record(buffer, duration=0.2, cache_hit=True)
+    _record(buffer, duration=0.4, status_code=500, cache_hit=False)
+    _record(buffer, duration=0.6, cache_hit=True)
+    _record(buffer, path="/api/b", duration=1.0)
+    buffer.flush_sync()
+
+    db = session_factory()
+    assert db.query(APIRequest).count() == 4
+    stats = {row.endpoint: row for row in db.query(APIEndpointStats).all()}
+    a = stats["GET /api/a"]
+    assert a.total_requests == 3
+    assert a.total_errors == 1
+    assert a.avg_duration == pytest.approx(0.4)
+    assert (a.min_duration, a.max_duration) == (0.2, 0.6)
+    assert (a.cache_hits, a.cache_misses) == (2, 1)
+    assert stats["GET /api/b"].total_requests == 1
+    db.close()
+
+    assert buffer.get_stats()["flushed"] == 4
+    assert buffer.get_stats()["flushes"] == 2
+    assert buffer.get_stats()["write_errors"] == 0
+
+
+def test_stats_upsert_retries_when_another_worker_created_the_endpoint(session_factory, monkeypatch):
+    """An IntegrityError on commit is retried once, merging into the row the other worker wrote."""
+    attempts = []
+
+    class RacingSession(Session):
+        def commit(self):
+            if not attempts:
+                attempts.append("conflict")
+                self.rollback()
+                other = session_factory()
+                other.add(APIEndpointStats(
+                    endpoint="GET /api/a", total_requests=5, total_errors=0, total_duration=5.0,
+                    min_duration=1.0, max_duration=1.0, last_called=datetime(2020, 1, 1)
+                ))
+                other.commit()
+                other.close()
+                raise IntegrityError("INSERT INTO api_endpoint_stats", {}, Exception("UNIQUE constraint failed"))
+            attempts.append("commit")
+            super().commit()
+
+    bind = session_factory.kw["bind"]
+    monkeypatch.setattr(monitoring_middleware, "get_db_session", sessionmaker(bind=bind, class_=RacingSession))
+
+    buffer = RequestTelemetryBuffer(max_size=100, batch_size=10, flush_interval=60)
+    _record(buffer, duration=0.5)
+    buffer.flush_sync()
+
+    assert attempts == ["conflict", "commit"]
+    db = session_factory()
+    assert db.query(APIRequest).count() == 1
+    row = db.query(APIEndpointStats).filter_by(endpoint="GET /api/a").one()
+    assert row.total_requests == 6
+    assert row.min_duration == 0.5
+    assert row.avg_duration == pytest.approx(5.5 / 6)
+    db.close()
+    assert buffer.get_stats()["write_errors"] == 0
@@ -0,0 +1,69 @@
+"""
+Test script for the concurrent batch SEO analyzer.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+from datetime import datetime
+from urllib.parse import urlparse
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.seo_analyzer import BatchSEOAnalyzer, SEOAnalysisResult
+
+
+class _FakeAnalyzer:
+    """Records peak concurrency overall and per host."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak_total = 0
+        self.peak_per_host = 0
+        self.started = []
+
+    def analyze_url_progressive(self, url, target_keywords=None):
+        host = urlparse(url).netloc
+        with self.lock:
+            self.started.append(url)
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+            self.peak_per_host = max(self.peak_per_host, self.active[host])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[host] -= 1
+        status = 'error' if 'broken' in url else 'good'
+        return SEOAnalysisResult(url=url, timestamp=datetime.now(), overall_score=70, health_status=status,
+                                 critical_issues=[], warnings=[], recommendations=[], data={})
+
+
+def test_batch_respects_limits_and_keeps_input_order():
+    analyzer = _FakeAnalyzer()
+    engine = BatchSEOAnalyzer(analyzer, max_concurrency=4, per_host_limit=2, queue_size=2)
+    urls = [f"site{i % 3}.com/page{i}" for i in range(12)] + ["broken.com"]
+
+    result = asyncio.run(engine.analyze(urls))
+
+    assert [r['url'] for r in result['results']] == [f"https://{u}" for u in urls]
+    assert result['successful_analyses'] == 12
+    assert result['failed_analyses'] == 1
+    assert analyzer.peak_total <= 4
+    assert analyzer.peak_per_host <= 2
+    engine.shutdown()
+
+
+def test_host_at_its_limit_does_not_block_other_hosts():
+    """URLs for other hosts start while the busy host waits for its own capacity."""
+    analyzer = _FakeAnalyzer()
+    engine = BatchSEOAnalyzer(analyzer, max_concurrency=4, per_host_limit=1, queue_size=16)
+    urls = [f"busy.com/page{i}" for i in range(6)] + ["a.com", "b.com", "c.com"]
+
+    result = asyncio.run(engine.analyze(urls))
+
+    assert result['successful_analyses'] == 9
+    assert analyzer.peak_per_host == 1
+    first_wave = analyzer.started[:4]
+    assert sorted(first_wave) == sorted(["https://busy.com/page0", "https://a.com", "https://b.com", "https://c.com"])
+    engine.shutdown()
@@ -0,0 +1,53 @@
+"""
+Test script for the shared SEO analyzer HTML document.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.seo_analyzer import HTMLDocument, MetaDataAnalyzer, ContentAnalyzer
+
+SAMPLE_HTML = """
+<html>
+<head>
+  <title>Example Page Title</title>
+  <meta name="Description" content="An example description">
+  <meta property="og:title" content="OG Title">
+  <meta charset="utf-8">
+  <link rel="canonical" href="https://example.com/page">
+  <script>var hidden = "not visible text";</script>
+</head>
+<body>
+  <h1>Heading</h1><h2>Sub</h2>
+  <p>Visible words here</p>
+  <a href="/about">About</a>
+  <a href="https://example.com/blog">Blog</a>
+  <a href="https://other.com/">Other</a>
+  <a href="mailto:info@example.com">Mail</a>
+  <a href="#top">Top</a>
+</body>
+</html>
+"""
+
+
+def test_indexes():
+    document = HTMLDocument(SAMPLE_HTML, "https://example.com/page")
+    assert document.title == "Example Page Title"
+    assert document.meta("description").get("content") == "An example description"
+    assert document.meta_property("og:title").get("content") == "OG Title"
+    assert document.meta_charset is not None
+    assert document.link_rel("canonical") is not None
+    assert [h.name for h in document.headings] == ["h1", "h2"]
+    assert [a.get("href") for a in document.internal_links] == ["/about", "https://example.com/blog"]
+    assert [a.get("href") for a in document.external_links] == ["https://other.com/"]
+    assert "Visible words here" in document.visible_text
+    assert "not visible text" not in document.visible_text
+
+
+def test_analyzers_accept_document_or_raw_html():
+    url = "https://example.com/page"
+    document = HTMLDocument(SAMPLE_HTML, url)
+    assert MetaDataAnalyzer().analyze(document, url) == MetaDataAnalyzer().analyze(SAMPLE_HTML, url)
+    assert ContentAnalyzer().analyze(document, url) == ContentAnalyzer().analyze(SAMPLE_HTML, url)
+    assert HTMLDocument.ensure(document) is document
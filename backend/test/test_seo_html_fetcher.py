@@ -0,0 +1,100 @@
+"""
+Test script for the SEO analyzer single-fetch page record.
+"""
+
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.seo_analyzer import HTMLFetcher, PerformanceAnalyzer, SecurityHeadersAnalyzer
+
+BODY = b"<html><head><title>Cached page</title></head><body><p>Hello</p></body></html>"
+ETAG = '"v1"'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        _Handler.requests_seen.append(self.path)
+        if self.path == "/old":
+            self.send_response(301)
+            self.send_header("Location", "/page")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("ETag", ETAG)
+        self.send_header("X-Frame-Options", "DENY")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def test_fetch_records_redirects_and_revalidates_with_etag():
+    server, base = _serve()
+    try:
+        fetcher = HTMLFetcher()
+        first = fetcher.fetch(f"{base}/old")
+        assert first.final_url == f"{base}/page"
+        assert [hop['status_code'] for hop in first.redirect_chain] == [301]
+        assert not first.not_modified
+
+        second = fetcher.fetch(f"{base}/old")
+        assert second.not_modified
+        assert second.html == BODY.decode()
+        # Only the raw body is cached; the page is re-parsed and timed afresh
+        assert second.document is not first.document
+        assert second.load_time == second.revalidation_time
+        assert second.headers.get("X-Frame-Options") == "DENY"
+    finally:
+        server.shutdown()
+
+
+def test_analyzers_reuse_fetched_page():
+    server, base = _serve()
+    try:
+        page = HTMLFetcher().fetch(f"{base}/page")
+        _Handler.requests_seen.clear()
+
+        performance = PerformanceAnalyzer().analyze(page.url, page)
+        security = SecurityHeadersAnalyzer().analyze(page.url, page)
+
+        assert _Handler.requests_seen == []
+        assert performance['load_time'] == page.load_time
+        assert 'X-Frame-Options' in security['present_headers']
+    finally:
+        server.shutdown()
+
+
+def test_revalidation_cache_is_bounded_by_bytes():
+    server, base = _serve()
+    try:
+        fetcher = HTMLFetcher(max_cached_bytes=len(BODY) * 2)
+        for i in range(3):
+            fetcher.fetch(f"{base}/page?{i}")
+        assert list(fetcher._page_cache) == [f"{base}/page?1", f"{base}/page?2"]
+        assert fetcher._cached_bytes == len(BODY) * 2
+
+        # A body larger than the whole budget is served but not cached
+        small = HTMLFetcher(max_cached_bytes=len(BODY) - 1)
+        assert small.fetch(f"{base}/page").html == BODY.decode()
+        assert not small._page_cache
+    finally:
+        server.shutdown()
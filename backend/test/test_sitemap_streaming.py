@@ -0,0 +1,99 @@
+"""
+Test script for streaming sitemap ingestion.
+"""
+
+import sys
+import os
+import gzip
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import services.seo_tools.sitemap_service as sitemap_service
+from services.seo_tools.sitemap_service import SitemapService, SitemapAggregates
+from services.http_client_registry import ResponseTooLargeError
+
+NS = 'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"'
+
+
+def _urlset(paths, lastmod):
+    entries = "".join(
+        f"<url><loc>https://example.com{p}</loc><lastmod>{lastmod}</lastmod><changefreq>weekly</changefreq></url>"
+        for p in paths
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><urlset {NS}>{entries}</urlset>'.encode()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    base = ""
+
+    def do_GET(self):
+        if self.path == "/sitemap_index.xml":
+            children = "".join(
+                f"<sitemap><loc>{_Handler.base}{c}</loc></sitemap>"
+                for c in ("/posts.xml.gz", "/pages.xml", "/missing.xml", "/posts.xml.gz")
+            )
+            body = f'<?xml version="1.0"?><sitemapindex {NS}>{children}</sitemapindex>'.encode()
+        elif self.path == "/posts.xml.gz":
+            body = gzip.compress(_urlset([f"/blog/post-{i}" for i in range(3000)], "2024-05-01"))
+        elif self.path == "/bomb.xml.gz":
+            body = gzip.compress(_urlset([f"/p/{i}" for i in range(20000)], "2024-05-01"))
+        elif self.path == "/pages.xml":
+            body = _urlset(["/about", "/contact"], "2024-06-15T10:00:00+00:00")
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_index_fan_out_with_gzip_child():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    _Handler.base = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        service = SitemapService()
+        data = asyncio.run(service._fetch_sitemap_data(f"{_Handler.base}/sitemap_index.xml"))
+    finally:
+        server.shutdown()
+
+    aggregates = data["aggregates"]
+    assert data["total_urls"] == 3002
+    assert len(data["sitemaps"]) == 3  # duplicate child skipped
+    assert data["failed_sitemaps"] == [f"{_Handler.base}/missing.xml"]
+
+    structure = service._analyze_sitemap_structure(aggregates)
+    assert structure["url_patterns"]["blog"] == 3000
+
+    trends = service._analyze_content_trends(aggregates)
+    assert trends["monthly_distribution"] == {"2024-05": 3000, "2024-06": 2}
+    assert service._analyze_publishing_patterns(aggregates)["changefreq_distribution"] == {"weekly": 3002}
+
+
+def test_gzip_sitemap_is_capped_on_inflated_size(monkeypatch):
+    """A small .xml.gz that inflates past the cap is rejected while decompressing."""
+    body = gzip.compress(_urlset([f"/p/{i}" for i in range(20000)], "2024-05-01"))
+    monkeypatch.setattr(sitemap_service, "SITEMAP_MAX_BYTES", 100_000)
+    monkeypatch.setattr(sitemap_service, "SITEMAP_INFLATE_CHUNK_SIZE", 4096)
+    assert len(body) < 100_000
+
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    _Handler.base = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    aggregates = SitemapAggregates()
+    try:
+        with pytest.raises(ResponseTooLargeError):
+            asyncio.run(SitemapService()._stream_sitemap(f"{_Handler.base}/bomb.xml.gz", aggregates))
+    finally:
+        server.shutdown()
+
+    assert 0 < aggregates.total_urls < 20000
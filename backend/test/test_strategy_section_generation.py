@@ -0,0 +1,56 @@
+"""
+Test script for concurrent strategy section generation.
+"""
+
+import sys
+import os
+import asyncio
+import logging
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.content_planning.services.content_strategy.ai_generation.strategy_generator import (
+    AIStrategyGenerator, StrategyGenerationConfig, STRATEGY_SECTIONS
+)
+
+
+def _generator(max_parallel_sections: int) -> AIStrategyGenerator:
+    # Skip __init__: no AI services are needed for stubbed sections
+    generator = AIStrategyGenerator.__new__(AIStrategyGenerator)
+    generator.config = StrategyGenerationConfig(max_parallel_sections=max_parallel_sections)
+    generator.logger = logging.getLogger(__name__)
+    return generator
+
+
+def test_sections_run_concurrently_and_publish_as_they_land():
+    generator = _generator(max_parallel_sections=2)
+    delays = {
+        "strategic_insights": 0.05,
+        "competitive_analysis": 0.01,
+        "performance_predictions": 0.03,
+        "implementation_roadmap": 0.01,
+        "risk_assessment": 0.01,
+    }
+    running = {"now": 0, "max": 0}
+
+    def stub(name):
+        async def generate(base_strategy, context):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(delays[name])
+            running["now"] -= 1
+            return {"section": name}
+        return generate
+
+    for name in STRATEGY_SECTIONS:
+        setattr(generator, f"_generate_{name}", stub(name))
+
+    published = []
+    sections = asyncio.run(generator.generate_strategy_sections(
+        {}, {}, on_section_complete=lambda name, result: published.append(name)
+    ))
+
+    assert list(sections) == STRATEGY_SECTIONS
+    assert all(sections[name] == {"section": name} for name in STRATEGY_SECTIONS)
+    assert running["max"] == 2
+    assert sorted(published) == sorted(STRATEGY_SECTIONS)
+    assert published[0] == "competitive_analysis"
@@ -0,0 +1,40 @@
+"""
+Test script for the strategy generation status stream.
+"""
+
+import sys
+import os
+import json
+import asyncio
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.content_planning.api.content_strategy.endpoints import ai_generation_endpoints as endpoints
+
+
+def test_update_during_pending_yield_is_not_missed():
+    task_id = "task-stream"
+    endpoints.generate_comprehensive_strategy_polling._task_status = {
+        task_id: {"task_id": task_id, "status": "running", "progress": 10, "version": 1}
+    }
+
+    async def scenario():
+        response = await endpoints.stream_strategy_generation_status(task_id)
+        stream = response.body_iterator
+        first = json.loads((await stream.__anext__())[len("data: "):])
+        assert first["progress"] == 10
+
+        # The subscriber is suspended at its yield while the task moves on
+        endpoints._update_task_status(task_id, {"progress": 50})
+        second = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        assert json.loads(second[len("data: "):])["progress"] == 50
+
+        endpoints._update_task_status(task_id, {"status": "completed", "progress": 100})
+        last = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        assert json.loads(last[len("data: "):])["status"] == "completed"
+        await stream.aclose()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        endpoints._task_status_events.pop(task_id, None)
+        del endpoints.generate_comprehensive_strategy_polling._task_status
@@ -42,6 +42,7 @@ import {
   StepResultsPanel,
   EducationalPanel,
   useCalendarGenerationPolling,
+  TERMINAL_STATUSES,
   type CalendarGenerationProgress,
   type QualityScores
 } from './calendarGenerationModalPanels';
@@ -305,11 +306,12 @@ const CalendarGenerationModal: React.FC<CalendarGenerationModalProps> = ({
     if (currentProgress?.status === 'completed') {
       // Handle completion
       console.log('🎉 Calendar generation completed');
-    } else if (currentProgress?.status === 'error') {
-      console.log('❌ Calendar generation error:', currentProgress.errors);
-      onError(currentProgress.errors[0]?.message || 'Unknown error');
+    } else if (currentProgress && TERMINAL_STATUSES.includes(currentProgress.status)) {
+      // error, failed (worker stopped responding) or cancelled
+      console.log('❌ Calendar generation ended with status:', currentProgress.status, currentProgress.errors);
+      onError(error || currentProgress.errors[0]?.message || 'Unknown error');
     }
-  }, [currentProgress?.status, currentProgress?.errors, onError]);
+  }, [currentProgress?.status, currentProgress?.errors, error, onError]);
 
   const handleTabChange = (event: React.SyntheticEvent, newValue: number) => {
     setActiveTab(newValue);
@@ -688,7 +690,7 @@ const CalendarGenerationModal: React.FC<CalendarGenerationModalProps> = ({
       
       <DialogActions>
         <Box display="flex" gap={1}>
-          {currentProgress && currentProgress.status !== 'completed' && currentProgress.status !== 'error' && (
+          {currentProgress && !TERMINAL_STATUSES.includes(currentProgress.status) && (
             <motion.div
               whileHover={hoverScale}
               whileTap={tapScale}
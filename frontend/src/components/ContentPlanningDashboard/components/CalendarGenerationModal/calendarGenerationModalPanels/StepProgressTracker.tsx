@@ -51,7 +51,8 @@ import {
   type CalendarGenerationProgress, 
   type QualityScores, 
   type StepResult,
-  STEP_INFO 
+  STEP_INFO,
+  TERMINAL_STATUSES
 } from './useCalendarGenerationPolling';
 
 // Import styles
@@ -159,7 +160,7 @@ const StepProgressTracker: React.FC<StepProgressTrackerProps> = ({
     return Object.values(progress.stepResults).filter(result => result.status === 'running').length;
   }, [progress.stepResults]);
 
-  const isGenerationActive = progress.status !== 'completed' && progress.status !== 'error';
+  const isGenerationActive = !TERMINAL_STATUSES.includes(progress.status);
 
   const renderStepCard = (stepNumber: number) => {
     const stepResult = progress.stepResults[stepNumber];
@@ -3,5 +3,5 @@ export { default as QualityGatesPanel } from './QualityGatesPanel';
 export { default as DataSourcePanel } from './DataSourcePanel';
 export { default as StepResultsPanel } from './StepResultsPanel';
 export { default as EducationalPanel } from './EducationalPanel';
-export { default as useCalendarGenerationPolling } from './useCalendarGenerationPolling';
+export { default as useCalendarGenerationPolling, TERMINAL_STATUSES } from './useCalendarGenerationPolling';
 export type { CalendarGenerationProgress, QualityScores } from './useCalendarGenerationPolling';
@@ -1,4 +1,4 @@
-import { useState, useCallback } from 'react';
+import { useState, useCallback, useRef } from 'react';
 
 // Enhanced types for 12-step support
 interface StepResult {
@@ -37,7 +37,7 @@ interface QualityScores {
 
 interface CalendarGenerationProgress {
   // Enhanced status to support all 12 steps
-  status: 'initializing' | 'step1' | 'step2' | 'step3' | 'step4' | 'step5' | 'step6' | 'step7' | 'step8' | 'step9' | 'step10' | 'step11' | 'step12' | 'completed' | 'error';
+  status: 'initializing' | 'step1' | 'step2' | 'step3' | 'step4' | 'step5' | 'step6' | 'step7' | 'step8' | 'step9' | 'step10' | 'step11' | 'step12' | 'completed' | 'error' | 'failed' | 'cancelled';
   currentStep: number;
   stepProgress: number;
   overallProgress: number;
@@ -100,12 +100,17 @@ export const STEP_INFO = {
   12: { name: 'Final Calendar Assembly', description: 'Assembling final calendar with all components' }
 } as const;
 
-// Polling hook for calendar generation progress with enhanced 12-step support
+// Session statuses after which the backend stops updating progress
+export const TERMINAL_STATUSES: ReadonlyArray<string> = ['completed', 'error', 'failed', 'cancelled'];
+
+// Progress hook for calendar generation with enhanced 12-step support.
+// Progress is pushed over Server-Sent Events; polling is the fallback.
 const useCalendarGenerationPolling = (sessionId: string) => {
   const [progress, setProgress] = useState<CalendarGenerationProgress | null>(null);
   const [isPolling, setIsPolling] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [retryCount, setRetryCount] = useState(0);
+  const eventSourceRef = useRef<EventSource | null>(null);
   
   const startPolling = useCallback(async () => {
     console.log('🎯 Starting polling for session:', sessionId);
@@ -113,6 +118,76 @@ const useCalendarGenerationPolling = (sessionId: string) => {
     setError(null);
     setRetryCount(0);
     
+    // Apply one progress payload; returns true once generation has finished
+    const applyProgress = (data: any): boolean => {
+      console.log('📊 Received progress data:', data);
+      
+      // Transform backend data to frontend format
+      const transformedProgress: CalendarGenerationProgress = {
+        status: data.status,
+        currentStep: data.current_step || 0,
+        stepProgress: data.step_progress || 0,
+        overallProgress: data.overall_progress || 0,
+        
+        // Transform step results - handle both formats
+        stepResults: data.step_results || {},
+        
+        // Transform quality scores - calculate overall from individual steps
+        qualityScores: {
+          overall: calculateOverallQualityScore(data.quality_scores || {}),
+          step1: Number(data.quality_scores?.step_01 || data.quality_scores?.step1 || 0),
+          step2: Number(data.quality_scores?.step_02 || data.quality_scores?.step2 || 0),
+          step3: Number(data.quality_scores?.step_03 || data.quality_scores?.step3 || 0),
+          step4: Number(data.quality_scores?.step_04 || data.quality_scores?.step4 || 0),
+          step5: Number(data.quality_scores?.step_05 || data.quality_scores?.step5 || 0),
+          step6: Number(data.quality_scores?.step_06 || data.quality_scores?.step6 || 0),
+          step7: Number(data.quality_scores?.step_07 || data.quality_scores?.step7 || 0),
+          step8: Number(data.quality_scores?.step_08 || data.quality_scores?.step8 || 0),
+          step9: Number(data.quality_scores?.step_09 || data.quality_scores?.step9 || 0),
+          step10: Number(data.quality_scores?.step_10 || data.quality_scores?.step10 || 0),
+          step11: Number(data.quality_scores?.step_11 || data.quality_scores?.step11 || 0),
+          step12: Number(data.quality_scores?.step_12 || data.quality_scores?.step12 || 0)
+        },
+        transparencyMessages: data.transparency_messages || [],
+        educationalContent: data.educational_content || [],
+        
+        // Enhanced error handling
+        errors: data.errors || [],
+        warnings: data.warnings || [],
+        
+        // Enhanced metadata
+        metadata: {
+          sessionId,
+          startTime: data.start_time || new Date().toISOString(),
+          estimatedCompletionTime: data.estimated_completion_time,
+          totalSteps: 12,
+          completedSteps: calculateCompletedSteps(data.step_results || {}),
+          failedSteps: calculateFailedSteps(data.step_results || {}),
+          skippedSteps: 0,
+          averageStepDuration: data.average_step_duration,
+          performanceMetrics: data.performance_metrics
+        }
+      };
+      
+      console.log('✅ Transformed progress:', transformedProgress);
+      setProgress(transformedProgress);
+      setRetryCount(0); // Reset retry count on successful response
+      
+      // Check for completion, error, orphaned (failed) or cancelled sessions
+      if (TERMINAL_STATUSES.includes(data.status)) {
+        console.log('🏁 Process completed with status:', data.status);
+        setIsPolling(false);
+        if (data.status === 'cancelled') {
+          setError(data.error || 'Calendar generation was cancelled');
+        } else if (data.status !== 'completed') {
+          const errorMessage = data.error || data.errors?.[0]?.message || 'Unknown error occurred';
+          setError(errorMessage);
+        }
+        return true;
+      }
+      return false;
+    };
+    
     const poll = async () => {
       try {
         console.log('🔄 Polling session:', sessionId);
@@ -123,67 +198,7 @@ const useCalendarGenerationPolling = (sessionId: string) => {
         }
         
         const data = await response.json();
-        console.log('📊 Received progress data:', data);
-        
-        // Transform backend data to frontend format
-        const transformedProgress: CalendarGenerationProgress = {
-          status: data.status,
-          currentStep: data.current_step || 0,
-          stepProgress: data.step_progress || 0,
-          overallProgress: data.overall_progress || 0,
-          
-          // Transform step results - handle both formats
-          stepResults: data.step_results || {},
-          
-          // Transform quality scores - calculate overall from individual steps
-          qualityScores: {
-            overall: calculateOverallQualityScore(data.quality_scores || {}),
-            step1: Number(data.quality_scores?.step_01 || data.quality_scores?.step1 || 0),
-            step2: Number(data.quality_scores?.step_02 || data.quality_scores?.step2 || 0),
-            step3: Number(data.quality_scores?.step_03 || data.quality_scores?.step3 || 0),
-            step4: Number(data.quality_scores?.step_04 || data.quality_scores?.step4 || 0),
-            step5: Number(data.quality_scores?.step_05 || data.quality_scores?.step5 || 0),
-            step6: Number(data.quality_scores?.step_06 || data.quality_scores?.step6 || 0),
-            step7: Number(data.quality_scores?.step_07 || data.quality_scores?.step7 || 0),
-            step8: Number(data.quality_scores?.step_08 || data.quality_scores?.step8 || 0),
-            step9: Number(data.quality_scores?.step_09 || data.quality_scores?.step9 || 0),
-            step10: Number(data.quality_scores?.step_10 || data.quality_scores?.step10 || 0),
-            step11: Number(data.quality_scores?.step_11 || data.quality_scores?.step11 || 0),
-            step12: Number(data.quality_scores?.step_12 || data.quality_scores?.step12 || 0)
-          },
-          transparencyMessages: data.transparency_messages || [],
-          educationalContent: data.educational_content || [],
-          
-          // Enhanced error handling
-          errors: data.errors || [],
-          warnings: data.warnings || [],
-          
-          // Enhanced metadata
-          metadata: {
-            sessionId,
-            startTime: data.start_time || new Date().toISOString(),
-            estimatedCompletionTime: data.estimated_completion_time,
-            totalSteps: 12,
-            completedSteps: calculateCompletedSteps(data.step_results || {}),
-            failedSteps: calculateFailedSteps(data.step_results || {}),
-            skippedSteps: 0,
-            averageStepDuration: data.average_step_duration,
-            performanceMetrics: data.performance_metrics
-          }
-        };
-        
-        console.log('✅ Transformed progress:', transformedProgress);
-        setProgress(transformedProgress);
-        setRetryCount(0); // Reset retry count on successful response
-        
-        // Check for completion or error
-        if (data.status === 'completed' || data.status === 'error') {
-          console.log('🏁 Process completed with status:', data.status);
-          setIsPolling(false);
-          if (data.status === 'error') {
-            const errorMessage = data.errors?.[0]?.message || 'Unknown error occurred';
-            setError(errorMessage);
-          }
+        if (applyProgress(data)) {
           return;
         }
         
@@ -210,14 +225,44 @@ const useCalendarGenerationPolling = (sessionId: string) => {
       }
     };
     
+    // Prefer server-pushed progress; fall back to polling if the stream is unavailable
+    if (typeof EventSource !== 'undefined') {
+      const source = new EventSource(`/api/content-planning/calendar-generation/progress/${sessionId}/stream`);
+      eventSourceRef.current = source;
+      
+      source.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+        if (data.type === 'progress') {
+          if (applyProgress(data)) {
+            source.close();
+          }
+        } else if (data.type === 'complete') {
+          source.close();
+          setIsPolling(false);
+        } else if (data.type === 'error') {
+          source.close();
+          poll();
+        }
+      };
+      
+      source.onerror = () => {
+        console.warn('⚠️ Progress stream unavailable, falling back to polling');
+        source.close();
+        poll();
+      };
+      return;
+    }
+    
     poll();
   }, [sessionId, retryCount]);
   
   const stopPolling = useCallback(() => {
+    eventSourceRef.current?.close();
     setIsPolling(false);
   }, []);
   
   const resetPolling = useCallback(() => {
+    eventSourceRef.current?.close();
     setIsPolling(false);
     setError(null);
     setRetryCount(0);